@@ -0,0 +1,89 @@
+"""Benchmark fll-maestro's --pipeline against a serial build.
+
+Builds the same tournaments twice with the openpyxl writer: once with
+loading (a clone of the prepared template), populating and saving one
+tournament after another, and once with BuildPipeline running the three
+stages on their own threads. Each workbook is saved to a temporary folder.
+The report gives both wall times and the pipeline's per-stage timings.
+
+Usage:
+    python benchmarks/bench_build_pipeline.py [--tournaments 10] [--teams 40]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+
+def stages(template, award_def, tournament, assignees, folder: str):
+    """The load, populate and write steps of one tournament."""
+    from modules import worksheet_setup as setup
+
+    config = {"tournament_folder": "tournaments", "season_yr": 2025, "season_name": "Benchmark"}
+    teams = len(assignees)
+
+    def load(index):
+        return index, template.clone()
+
+    def populate(state):
+        index, book = state
+        setup.set_up_tapi_worksheet(tournament, book, assignees, False)
+        setup.set_up_award_worksheet(tournament, book, award_def, False)
+        setup.set_up_meta_worksheet(tournament, book, config, "tournaments", False)
+        setup.copy_award_def(tournament, book, template.award_def)
+        setup.resize_worksheets(tournament, book, assignees)
+        setup.add_essential_conditional_formats(book, teams)
+        setup.fix_named_ranges(book)
+        return index, book
+
+    def write(state):
+        index, book = state
+        book.save(os.path.join(folder, f"bench-{index}.xlsm"))
+        book.close()
+        return index
+
+    return load, populate, write
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tournaments", type=int, default=10)
+    parser.add_argument("--teams", type=int, default=40)
+    args = parser.parse_args()
+
+    import logging
+    logging.getLogger("ojs_builder").setLevel(logging.ERROR)
+
+    from bench_patch_writer import TEMPLATE_FILE, build_inputs
+    from modules.build_pipeline import BuildPipeline
+    from modules.prepared_template import PreparedTemplate
+
+    award_def, tournament, assignees = build_inputs(args.teams)
+    template = PreparedTemplate(TEMPLATE_FILE, award_def)
+
+    print(f"{args.tournaments} tournaments of {args.teams} teams, {os.cpu_count()} CPU(s)")
+    with tempfile.TemporaryDirectory() as folder:
+        load, populate, write = stages(template, award_def, tournament, assignees, folder)
+
+        start = time.perf_counter()
+        for index in range(args.tournaments):
+            write(populate(load(index)))
+        serial = time.perf_counter() - start
+        print(f"  serial    {serial:6.2f}s")
+
+        pipeline = BuildPipeline(load, populate, write)
+        pipeline.run(range(args.tournaments))
+        wall = pipeline.timings.wall
+        print(f"  pipeline  {wall:6.2f}s ({(serial - wall) / serial:+.0%} vs serial)")
+        for line in pipeline.timings.report():
+            print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Micro-benchmark the cleanup applied to every table read.
+
+Builds synthetic 10k x 40 tables (text, whole-number, fractional and mixed
+columns, with blanks and padded strings) and times _normalize_table_frame
+against the previous column-by-column implementation, checking that both
+produce identical frames and dtypes.
+
+Usage:
+    python benchmarks/bench_normalize.py [--rows 10000] [--cols 40] [--repeat 20]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.excel_operations import _normalize_table_frame
+
+
+def build_table(rows: int, cols: int, seed: int = 2025) -> pd.DataFrame:
+    """A raw table frame shaped like the ones the table readers produce."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for c in range(cols):
+        kind = c % 4
+        if kind == 0:
+            # Text with padding and blanks (str dtype)
+            text = pd.Series([f"  Team {i} " for i in rng.integers(0, 1000, rows)], dtype="str")
+            text[rng.random(rows) < 0.1] = np.nan
+            data[f" Text {c} "] = text
+        elif kind == 1:
+            # Whole-number scores with blanks (float64 that becomes Int64)
+            scores = rng.integers(0, 6, rows).astype(float)
+            scores[rng.random(rows) < 0.2] = np.nan
+            data[f"Score {c}"] = scores
+        elif kind == 2:
+            # Fractional values (stays float64)
+            data[f"Average {c}"] = rng.random(rows) * 100
+        else:
+            # Mixed numbers and text (object)
+            mixed = np.empty(rows, dtype=object)
+            mixed[:] = [f" x{i}" if i % 3 else i for i in range(rows)]
+            data[f"Mixed {c}"] = mixed
+    return pd.DataFrame(data)
+
+
+def normalize_per_column(df: pd.DataFrame, convert_integer_floats: bool = True) -> pd.DataFrame:
+    """The previous implementation, kept as the reference for timing and output."""
+    df.columns = df.columns.str.strip()
+
+    def _trim_series(s: pd.Series) -> pd.Series:
+        if pd.api.types.is_string_dtype(s):
+            return s.str.strip()
+        if s.dtype == object:
+            return s.map(lambda v: v.strip() if isinstance(v, str) else v)
+        return s
+
+    df = df.apply(_trim_series)
+
+    if convert_integer_floats:
+        float_cols = df.select_dtypes(include=["float"]).columns
+        for col in float_cols:
+            non_na = df[col].dropna()
+            if non_na.empty:
+                continue
+            try:
+                if ((non_na % 1) == 0).all():
+                    df[col] = df[col].astype("Int64")
+            except Exception:
+                continue
+
+    return df
+
+
+def best_time(func, df: pd.DataFrame, repeat: int) -> float:
+    """Best CPU time over `repeat` runs, each on a fresh copy of df."""
+    times = []
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.process_time()
+        func(frame)
+        times.append(time.process_time() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per table")
+    parser.add_argument("--cols", type=int, default=40, help="Columns per table")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per implementation")
+    args = parser.parse_args()
+
+    df = build_table(args.rows, args.cols)
+    pd.testing.assert_frame_equal(_normalize_table_frame(df.copy()), normalize_per_column(df.copy()))
+    print(f"{args.rows} x {args.cols} table: outputs and dtypes identical\n")
+
+    print(f"{'implementation':<16}{'best (ms)':>12}")
+    per_column = best_time(normalize_per_column, df, args.repeat)
+    vectorized = best_time(_normalize_table_frame, df, args.repeat)
+    print(f"{'per-column':<16}{per_column * 1000:>12.1f}")
+    print(f"{'vectorized':<16}{vectorized * 1000:>12.1f}")
+    print(f"\nspeedup: {per_column / vectorized:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
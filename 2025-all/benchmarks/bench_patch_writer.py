@@ -0,0 +1,102 @@
+"""Benchmark the OJS writers on a full per-tournament build.
+
+Runs the fll-maestro set-up steps for a tournament with the openpyxl writer
+(clone the prepared workbook, populate, save) and with the patch writer
+(open the prepared package, patch, save), and reports the time per file.
+
+Usage:
+    python benchmarks/bench_patch_writer.py [--tournaments 10] [--teams 40]
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+TEMPLATE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "2025-Qualifier-Template.xlsm"
+)
+
+
+def build_inputs(teams: int):
+    import pandas as pd
+    from modules.constants import (
+        COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME, COL_SHORT_NAME, COL_LONG_NAME,
+        COL_OJS_FILENAME,
+    )
+
+    award_def = pd.DataFrame({
+        "ColumnName": ["J_Champ", "J_RD", "J_IP", "J_CV", "P_AWD_RG"],
+        "Label1": ["Champion's", "Robot Design", "Innovation Project", "Core Values", "1st Place"],
+        "Label2": [0, 0, 0, 0, "2nd Place"],
+        "Label3": [0, 0, 0, 0, "3rd Place"],
+        "LabelFull": ["Champion's Award", "Robot Design Award", "Innovation Project Award",
+                      "Core Values Award", "Robot Game Award"],
+        "AwardGroup": ["Champ", "Judged", "Judged", "Judged", "Robot Game"],
+        "DivAward": [1, 1, 1, 1, 0],
+    })
+    tournament = pd.Series({
+        COL_SHORT_NAME: "Bench", COL_LONG_NAME: "Benchmark Qualifier", COL_OJS_FILENAME: "bench.xlsm",
+        "J_Champ": 1, "J_RD": 1, "J_IP": 1, "J_CV": 1, "P_AWD_RG": 3, "ADV": 4,
+    })
+    assignees = pd.DataFrame({
+        COL_TEAM_NUMBER: range(1001, 1001 + teams),
+        COL_TEAM_NAME: [f"Team {i}" for i in range(teams)],
+        COL_COACH_NAME: [f"Coach {i}" for i in range(teams)],
+    })
+    return award_def, tournament, assignees
+
+
+def run(writer: str, tournaments: int, teams: int) -> tuple[float, float]:
+    from modules import worksheet_setup, xlsm_patch
+    from modules.constants import OJS_WRITER_PATCH
+    from modules.prepared_template import PreparedTemplate
+
+    award_def, tournament, assignees = build_inputs(teams)
+    config = {"tournament_folder": "tournaments", "season_yr": 2025, "season_name": "Benchmark"}
+
+    start = time.perf_counter()
+    template = PreparedTemplate(TEMPLATE_FILE, award_def, writer)
+    prepared = time.perf_counter() - start
+    setup = xlsm_patch if writer == OJS_WRITER_PATCH else worksheet_setup
+
+    start = time.perf_counter()
+    for _ in range(tournaments):
+        book = template.clone()
+        setup.set_up_tapi_worksheet(tournament, book, assignees, False)
+        setup.set_up_award_worksheet(tournament, book, award_def, False)
+        setup.set_up_meta_worksheet(tournament, book, config, "tournaments", False)
+        setup.copy_award_def(tournament, book, template.award_def)
+        setup.resize_worksheets(tournament, book, assignees)
+        setup.add_essential_conditional_formats(book, teams)
+        setup.fix_named_ranges(book)
+        book.save(io.BytesIO())
+        book.close()
+    return prepared, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tournaments", type=int, default=10)
+    parser.add_argument("--teams", type=int, default=40)
+    args = parser.parse_args()
+
+    import logging
+    logging.getLogger("ojs_builder").setLevel(logging.ERROR)
+
+    from modules.constants import OJS_WRITERS
+
+    print(f"{args.tournaments} tournaments of {args.teams} teams")
+    for writer in OJS_WRITERS:
+        prepared, total = run(writer, args.tournaments, args.teams)
+        print(f"  {writer:9s} prepare {prepared * 1000:5.0f} ms, "
+              f"{total / args.tournaments * 1000:5.0f} ms per tournament ({total:.2f}s total)")
+
+
+if __name__ == "__main__":
+    main()
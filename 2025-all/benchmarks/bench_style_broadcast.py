@@ -0,0 +1,99 @@
+"""Benchmark copying template-row formatting down the resized tables.
+
+Compares the per-attribute copies resize_worksheets and set_up_tapi_worksheet
+used to make (copy font, fill, alignment, border and protection of each
+cell) with the StyleArray broadcast in modules/style_broadcast.py, on the
+five resized tables plus the team list of a prepared OJS workbook.
+
+Usage:
+    python benchmarks/bench_style_broadcast.py [--teams 24 60 200] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+import warnings
+from copy import copy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+TEMPLATE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "2025-Qualifier-Template.xlsm"
+)
+
+
+def table_regions(book):
+    """(worksheet, template row, first col, last col) of each table formatted per tournament."""
+    from openpyxl.utils.cell import range_boundaries
+    from modules.constants import SHEET_TEAM_INFO, TABLE_TEAM_LIST
+    from modules.worksheet_setup import RESIZED_TABLES
+
+    regions = []
+    for sheet, table, _ in RESIZED_TABLES + [(SHEET_TEAM_INFO, TABLE_TEAM_LIST, 0)]:
+        ws = book[sheet]
+        min_col, min_row, max_col, _ = range_boundaries(ws.tables[table].ref)
+        regions.append((ws, min_row + 1, min_col, max_col))
+    return regions
+
+
+def per_attribute(book, teams: int) -> None:
+    for ws, first_row, min_col, max_col in table_regions(book):
+        for col_idx in range(min_col, max_col + 1):
+            template_cell = ws.cell(row=first_row, column=col_idx)
+            for row_idx in range(first_row, first_row + teams):
+                target = ws.cell(row=row_idx, column=col_idx)
+                target.protection = copy(template_cell.protection)
+                target._style = copy(template_cell._style)
+                target.number_format = template_cell.number_format
+                target.font = copy(template_cell.font)
+                target.fill = copy(template_cell.fill)
+                target.alignment = copy(template_cell.alignment)
+                target.border = copy(template_cell.border)
+        height = ws.row_dimensions[first_row].height
+        if height is not None:
+            for row_idx in range(first_row, first_row + teams):
+                ws.row_dimensions[row_idx].height = height
+
+
+def broadcast(book, teams: int) -> None:
+    from modules.style_broadcast import broadcast_row_styles, broadcast_row_height
+
+    for ws, first_row, min_col, max_col in table_regions(book):
+        rows = range(first_row, first_row + teams)
+        broadcast_row_styles(ws, first_row, rows, min_col, max_col)
+        broadcast_row_height(ws, first_row, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, nargs="+", default=[24, 60, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    import logging
+    import pandas as pd
+    logging.getLogger("ojs_builder").setLevel(logging.WARNING)
+    from modules.prepared_template import PreparedTemplate
+
+    template = PreparedTemplate(TEMPLATE_FILE, pd.DataFrame({"ColumnName": []}))
+
+    print(f"{'teams':>6} {'per-attribute':>14} {'broadcast':>10} {'speedup':>8}")
+    for teams in args.teams:
+        timings = {}
+        for name, run in (("per-attribute", per_attribute), ("broadcast", broadcast)):
+            best = None
+            for _ in range(args.repeat):
+                book = template.clone()
+                start = time.perf_counter()
+                run(book, teams)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+        print(f"{teams:>6} {timings['per-attribute'] * 1000:>11.1f} ms {timings['broadcast'] * 1000:>7.1f} ms "
+              f"{timings['per-attribute'] / timings['broadcast']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark table reads from a large master workbook.
+
+Builds a synthetic TournamentList-style workbook with a 20k-row Assignments
+table, then reads it with each WorkbookSession mode in a fresh process and
+reports wall time and peak RSS.
+
+Usage:
+    python benchmarks/bench_table_reads.py [--rows 20000] [--keep]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import warnings
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+
+def build_master_workbook(path: str, rows: int) -> None:
+    """Write a master workbook with SeasonInfo, TournamentList and Assignments tables."""
+    from openpyxl import Workbook
+    from openpyxl.worksheet.table import Table
+
+    random.seed(2025)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "SeasonInfo"
+    ws.append(["Key", "Value"])
+    ws.append(["Divisions", False])
+    ws.add_table(Table(displayName="SeasonInfo", ref="A1:B2"))
+
+    tournaments = [f"Qual_{i:02d}" for i in range(60)]
+    ws = wb.create_sheet("Tournaments")
+    ws.append(["Short Name", "Long Name", "OJS_FileName", "ADV"])
+    for name in tournaments:
+        ws.append([name, f"{name} Qualifier", f"{name}.xlsm", 4])
+    ws.add_table(Table(displayName="TournamentList", ref=f"A1:D{len(tournaments) + 1}"))
+
+    ws = wb.create_sheet("Assignments")
+    ws.append(["Team #", "Team Name", "Coach Name", "Short Name", "Div"])
+    for i in range(rows):
+        ws.append([
+            10000 + i,
+            f"Team {10000 + i}",
+            f"Coach {random.randint(1, 5000)}",
+            random.choice(tournaments),
+            random.choice(["D1", "D2"]),
+        ])
+    ws.add_table(Table(displayName="Assignments", ref=f"A1:E{rows + 1}"))
+    wb.save(path)
+
+
+def _read(path: str, read_only: bool, queue) -> None:
+    import resource
+    from modules.excel_operations import WorkbookSession
+
+    def peak_kib() -> int:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
+
+    baseline = peak_kib()
+    start = time.perf_counter()
+    with WorkbookSession(path, read_only=read_only) as session:
+        df = session.read_table_as_df("Assignments", "Assignments")
+    elapsed = time.perf_counter() - start
+
+    queue.put((len(df), elapsed, baseline, peak_kib()))
+
+
+def run_in_fresh_process(path: str, read_only: bool) -> tuple[int, float, int, int]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_read, args=(path, read_only, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="Assignments rows to generate")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated workbook")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx", prefix="bench_master_")
+    os.close(fd)
+    try:
+        print(f"Building master workbook with {args.rows} assignments...")
+        build_master_workbook(path, args.rows)
+        print(f"  {path} ({os.path.getsize(path) / 1024:.0f} KiB)\n")
+
+        print(f"{'mode':<12}{'rows':>8}{'time (s)':>12}{'peak RSS (MiB)':>18}{'read growth (MiB)':>20}")
+        for label, read_only in [("full", False), ("read_only", True)]:
+            rows, elapsed, baseline, peak = run_in_fresh_process(path, read_only)
+            print(
+                f"{label:<12}{rows:>8}{elapsed:>12.2f}{peak / 1024:>18.1f}"
+                f"{(peak - baseline) / 1024:>20.1f}"
+            )
+    finally:
+        if args.keep:
+            print(f"\nWorkbook kept at {path}")
+        else:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark writing the team list into a prepared OJS workbook.
+
+Compares the row-by-row writes add_table_dataframe used to make (a blank
+check per table row, df.iloc per DataFrame row, a `col_name in df.columns`
+lookup per cell) with the columnar writer that replaced it.
+
+Usage:
+    python benchmarks/bench_table_upsert.py [--teams 24 60 200] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+TEMPLATE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "2025-Qualifier-Template.xlsm"
+)
+
+
+def row_by_row(book, df) -> None:
+    from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+    from modules.constants import SHEET_TEAM_INFO, TABLE_TEAM_LIST
+
+    ws = book[SHEET_TEAM_INFO]
+    table = ws.tables[TABLE_TEAM_LIST]
+    headers = [c.value for c in ws[table.ref][0]]
+    start_cell, end_cell = table.ref.split(":")
+    start_col_idx = column_index_from_string(coordinate_from_string(start_cell)[0])
+    df_iter_index = 0
+    for row_tuple in ws[table.ref][1:]:
+        if df_iter_index < len(df) and all(cell.value is None for cell in row_tuple):
+            row_values = df.iloc[df_iter_index]
+            for j, col_name in enumerate(headers):
+                val = row_values[col_name] if col_name in df.columns else None
+                ws.cell(row=row_tuple[0].row, column=start_col_idx + j).value = val
+            df_iter_index += 1
+    current_row = coordinate_from_string(end_cell)[1]
+    while df_iter_index < len(df):
+        current_row += 1
+        row_values = df.iloc[df_iter_index]
+        for j, col_name in enumerate(headers):
+            val = row_values[col_name] if col_name in df.columns else None
+            ws.cell(row=current_row, column=start_col_idx + j).value = val
+        df_iter_index += 1
+
+
+def columnar(book, df) -> None:
+    from modules.constants import COL_TEAM_NUMBER, SHEET_TEAM_INFO, TABLE_TEAM_LIST
+    from modules.excel_operations import add_table_dataframe
+
+    add_table_dataframe(book, SHEET_TEAM_INFO, TABLE_TEAM_LIST, df, key=COL_TEAM_NUMBER)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, nargs="+", default=[24, 60, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    import logging
+    import pandas as pd
+    logging.getLogger("ojs_builder").setLevel(logging.WARNING)
+    from modules.constants import COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME, COL_POD_NUMBER
+    from modules.prepared_template import PreparedTemplate
+
+    template = PreparedTemplate(TEMPLATE_FILE, pd.DataFrame({"ColumnName": []}))
+
+    print(f"{'teams':>6} {'row-by-row':>11} {'columnar':>9} {'speedup':>8}")
+    for teams in args.teams:
+        df = pd.DataFrame({
+            COL_TEAM_NUMBER: range(1001, 1001 + teams),
+            COL_TEAM_NAME: [f"Team {i}" for i in range(teams)],
+            COL_COACH_NAME: [f"Coach {i}" for i in range(teams)],
+            COL_POD_NUMBER: 0,
+        })
+        timings = {}
+        for name, run in (("row-by-row", row_by_row), ("columnar", columnar)):
+            best = None
+            for _ in range(args.repeat):
+                book = template.clone()
+                start = time.perf_counter()
+                run(book, df)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+        print(f"{teams:>6} {timings['row-by-row'] * 1000:>8.1f} ms {timings['columnar'] * 1000:>6.1f} ms "
+              f"{timings['row-by-row'] / timings['columnar']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark starting a tournament workbook from the OJS template.
+
+Compares the old per-tournament path (copy the template, load the copy and
+apply the season-invariant steps) with cloning a PreparedTemplate.
+
+Usage:
+    python benchmarks/bench_template_clone.py [--tournaments 20]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+TEMPLATE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "2025-Qualifier-Template.xlsm"
+)
+
+
+def copy_and_load(tournaments: int, workdir: str) -> float:
+    from openpyxl import load_workbook
+    from modules.worksheet_setup import hide_worksheets, protect_worksheets, remove_external_links
+
+    start = time.perf_counter()
+    for i in range(tournaments):
+        path = os.path.join(workdir, f"t{i}.xlsm")
+        shutil.copy(TEMPLATE_FILE, path)
+        book = load_workbook(path, keep_vba=True)
+        hide_worksheets(book)
+        protect_worksheets(book)
+        remove_external_links(book)
+    return time.perf_counter() - start
+
+
+def clone_prepared(tournaments: int) -> tuple[float, float]:
+    import pandas as pd
+    from modules.prepared_template import PreparedTemplate
+
+    start = time.perf_counter()
+    template = PreparedTemplate(TEMPLATE_FILE, pd.DataFrame({"ColumnName": []}))
+    prepared = time.perf_counter() - start
+    for _ in range(tournaments):
+        template.clone()
+    return prepared, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tournaments", type=int, default=20)
+    args = parser.parse_args()
+
+    import logging
+    logging.getLogger("ojs_builder").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline = copy_and_load(args.tournaments, workdir)
+    prepared, total = clone_prepared(args.tournaments)
+
+    print(f"{args.tournaments} tournaments")
+    print(f"  copy + load + sanitize: {baseline:7.2f}s ({baseline / args.tournaments * 1000:.0f} ms each)")
+    print(f"  prepare once + clone:   {total:7.2f}s "
+          f"(prepare {prepared * 1000:.0f} ms, "
+          f"{(total - prepared) / args.tournaments * 1000:.0f} ms per clone)")
+
+
+if __name__ == "__main__":
+    main()
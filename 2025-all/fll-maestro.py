@@ -10,11 +10,19 @@ Usage:
     python build-tournament-folders.py --quiet       # Minimal output, no confirmations
     python build-tournament-folders.py --verbose     # Maximum output with debug logging
 """
+import io
 import os
 import sys
+import logging
 import warnings
 import argparse
-from openpyxl import load_workbook
+import traceback
+import contextlib
+import multiprocessing
+from typing import Any, Callable
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
+from concurrent.futures import ProcessPoolExecutor
 from colorama import init, Fore, Style
 import pandas as pd
 import json
@@ -28,20 +36,17 @@ from modules.file_operations import (
     copy_files, 
     generate_tournament_config
 )
-from modules.excel_operations import read_table_as_df, read_table_as_dict, verify_workbooks_closed
-from modules.worksheet_setup import (
-    set_up_tapi_worksheet,
-    set_up_award_worksheet,
-    set_up_meta_worksheet,
-    resize_worksheets,
-    add_essential_conditional_formats,  # Changed from add_conditional_formats
-    copy_award_def,
-    protect_worksheets,
-    hide_worksheets,
-    remove_external_links,
-    fix_named_ranges,
+from modules.excel_operations import frame_to_dict, verify_workbooks_closed
+from modules.table_cache import read_tables_cached
+from modules.assignment_index import AssignmentIndex
+from modules.prepared_template import PreparedTemplate
+from modules.build_pipeline import BuildPipeline, StageTimings, ReplayBuffer, replay_events
+from modules.build_manifest import (
+    season_fingerprint, tournament_fingerprint, up_to_date_results, write_manifest, clear_manifest
 )
+from modules import worksheet_setup, xlsm_patch
 from modules.ceremony_renderer import CeremonyRenderer
+from modules.score_rules import check_template, PROBLEM_MISSING_TABLE, PROBLEM_MISSING_COLUMN
 from modules.user_feedback import (
     ValidationSummary,
     ProgressTracker,
@@ -89,6 +94,12 @@ Examples:
   %(prog)s --verbose          Run with INFO-level logging
   %(prog)s --debug            Run with DEBUG-level logging (most detailed)
   %(prog)s --tournament ABC   Build only tournament with short name 'ABC'
+  %(prog)s --no-cache         Re-read the tournament workbook even if it is unchanged
+  %(prog)s --jobs 4           Build four tournaments at a time
+  %(prog)s --force            Rebuild tournaments even if their inputs are unchanged
+  %(prog)s --writer patch     Write OJS files by patching the template package
+  %(prog)s --pipeline         Save each tournament while the next one is being built
+  %(prog)s --shared-formulas  Write table formula columns as Excel shared formulas
         """
     )
     
@@ -129,6 +140,46 @@ Examples:
         help='Skip cleanup of existing OJS and config files (not recommended)'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Build tournaments on N worker processes (0 = one per CPU, default 1)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Always re-read the tournament workbook instead of using the {TABLE_CACHE_DIRNAME} table cache'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild every selected tournament, even if its inputs have not changed since the last build'
+    )
+    
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Load, populate and save consecutive tournaments concurrently and report per-stage timings'
+    )
+    
+    parser.add_argument(
+        '--writer',
+        choices=OJS_WRITERS,
+        default=OJS_WRITER_OPENPYXL,
+        help='How OJS files are written: load and save through openpyxl (default), '
+             'or patch only the edited parts of the template package'
+    )
+    
+    parser.add_argument(
+        '--shared-formulas',
+        action='store_true',
+        help='Write each table formula column as one Excel shared formula instead of a copy per row'
+    )
+    
     return parser.parse_args()
 
 def validate_environment(
@@ -183,8 +234,22 @@ def validate_environment(
     # Check template file
     if not os.path.exists(template_file):
         summary.add_error(f"Template file not found: {template_file}")
-    elif not quiet:
-        summary.add_info(f"Template file found: {os.path.basename(template_file)}")
+    else:
+        if not quiet:
+            summary.add_info(f"Template file found: {os.path.basename(template_file)}")
+        # Check the template has the score tables and columns fll-toast validates
+        try:
+            for issue in check_template(template_file):
+                if issue.problem == PROBLEM_MISSING_TABLE:
+                    summary.add_error(f"Template is missing table {issue.table} ({issue.sheet})")
+                elif issue.problem == PROBLEM_MISSING_COLUMN:
+                    summary.add_error(f"Template table {issue.table} is missing column: {issue.column}")
+                else:
+                    summary.add_error(
+                        f"Template {issue.sheet} row {issue.row}: {issue.column} has invalid score {issue.value!r}"
+                    )
+        except Exception as e:
+            summary.add_warning(f"Could not check template score tables: {e}")
     
     # Check extra files - combine all file lists and extract source filenames
     all_files = common_files + divisions_only_files + no_divisions_only_files
@@ -201,6 +266,561 @@ def validate_environment(
     
     return summary
 
+def get_master_table(master_tables: dict, table_name: str, tournament_file: str) -> pd.DataFrame:
+    """Return a table read from the master workbook, or raise if it was missing.
+    
+    Args:
+        master_tables: Tables returned by read_tables for the master workbook
+        table_name: Name of the table to return
+        tournament_file: Path of the master workbook (for the error message)
+        
+    Returns:
+        The table's DataFrame
+        
+    Raises:
+        KeyError: If the table was not found in the workbook
+    """
+    df = master_tables[table_name]
+    if df.columns.empty:
+        raise KeyError(f"Table {table_name!r} not found in {tournament_file}")
+    return df
+
+@dataclass
+class BuildContext:
+    """Settings shared by every tournament build in a run."""
+    config: dict
+    dir_path: str
+    template: PreparedTemplate
+    common_files: list
+    divisions_only_files: list
+    no_divisions_only_files: list
+    tournament_folder: str
+    using_divisions: bool
+    dfAwardDef: pd.DataFrame
+    assignment_index: AssignmentIndex
+    quiet: bool
+    shared_formulas: bool = False
+
+
+@dataclass
+class TournamentBuild:
+    """A tournament on its way through the build stages.
+
+    load_tournament creates it, populate_tournament fills in the workbook and
+    write_tournament saves it. A skipped tournament passes through untouched.
+    """
+    row: pd.Series
+    tournament_name: str
+    newpath: str
+    ojs_path: str | None = None
+    ojs_book: Any = None
+    assignees: pd.DataFrame | None = None
+    progress: ProgressTracker | None = None
+    skipped: bool = False
+
+
+def build_tournament(row: pd.Series, ctx: BuildContext) -> tuple[str, bool, list] | None:
+    """Build one tournament (or one division of it).
+
+    Creates the folder, copies the files, populates and saves the OJS
+    workbook, writes tournament_config.json and renders the fill-in form.
+
+    Args:
+        row: The tournament row from TournamentList/DivTournamentList
+        ctx: Settings shared by every tournament build
+
+    Returns:
+        (tournament name, division mismatch detected, award count mismatches)
+        from generate_tournament_config, or None if the tournament was skipped
+    """
+    return write_tournament(populate_tournament(load_tournament(row, ctx), ctx), ctx)
+
+
+def load_tournament(row: pd.Series, ctx: BuildContext) -> TournamentBuild:
+    """First build stage: create the folder, copy the files and clone the OJS template.
+
+    Args:
+        row: The tournament row from TournamentList/DivTournamentList
+        ctx: Settings shared by every tournament build
+
+    Returns:
+        The tournament with its fresh workbook (skipped if it has no OJS filename)
+    """
+    quiet = ctx.quiet
+    config = ctx.config
+    dir_path = ctx.dir_path
+    template = ctx.template
+    common_files = ctx.common_files
+    divisions_only_files = ctx.divisions_only_files
+    no_divisions_only_files = ctx.no_divisions_only_files
+    tournament_folder = ctx.tournament_folder
+    using_divisions = ctx.using_divisions
+    assignment_index = ctx.assignment_index
+
+    tournament_name = f"{row[COL_SHORT_NAME]} {row.get(COL_DIVISION, '')}".strip()
+    
+    if not quiet:
+        print(f"\n{Fore.YELLOW}{'═' * 60}{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}  {tournament_name}  {Style.RESET_ALL}".center(70))
+        print(f"{Fore.YELLOW}{'═' * 60}{Style.RESET_ALL}\n")
+        progress = ProgressTracker(8, f"Setting up {row[COL_SHORT_NAME]}")
+    else:
+        progress = None
+        logger.info(f"Processing {tournament_name}")
+    
+    # Create folder
+    newpath = os.path.join(tournament_folder, row[COL_SHORT_NAME])
+    create_folder(newpath)
+    if not quiet:
+        progress.update("Folder created")
+    
+    # Copy files
+    copy_files(
+        row, dir_path, None,
+        common_files, divisions_only_files, no_divisions_only_files,
+        tournament_folder, using_divisions
+    )
+    if not quiet:
+        progress.update("Files copied")
+
+    # Render fill-in awards form (paper backup) directly into the tournament folder
+    try:
+        renderer = CeremonyRenderer(newpath)
+        fillin_template_file = 'fillin_template.html.jinja'
+        fillin_output = os.path.join(newpath, 'fillin_form.html')
+
+        template_data = {
+            'tournament_name': row.get(COL_LONG_NAME, row.get(COL_SHORT_NAME, '')),
+            'awards_config': config.get('AWARDS', [])
+        }
+
+        errors, warnings = renderer.validate_template_variables(fillin_template_file, template_data, set())
+        if errors:
+            logger.error(f"Fill-in template missing critical variables: {errors}")
+        if warnings and not quiet:
+            print_warning(f"Fill-in form missing optional variables: {', '.join(warnings)}")
+
+        if renderer.render(fillin_template_file, template_data, fillin_output):
+            if not quiet:
+                print_success("Fill-in awards form created")
+        else:
+            print_warning("Fill-in awards form could not be generated")
+            logger.warning(f"Fill-in form render failed for {newpath}")
+    except Exception as e:
+        print_warning("Unable to generate fill-in awards form")
+        logger.warning(f"Fill-in form generation failed for {newpath}: {e}")
+
+    build = TournamentBuild(row, tournament_name, newpath, progress=progress)
+
+    # Process OJS file
+    ojs_name = row.get(COL_OJS_FILENAME)
+    if ojs_name is None or (isinstance(ojs_name, float) and pd.isna(ojs_name)):
+        if not quiet:
+            print_warning(f"No OJS filename for {row[COL_SHORT_NAME]}, skipping")
+        logger.warning(f"No OJS filename for {row[COL_SHORT_NAME]}, skipping")
+        build.skipped = True
+        return build
+        
+    build.ojs_path = os.path.join(tournament_folder, row[COL_SHORT_NAME], ojs_name)
+    build.ojs_book = template.clone()
+    build.assignees = assignment_index.teams(
+        row[COL_SHORT_NAME], row[COL_DIVISION] if using_divisions else None
+    )
+    return build
+
+
+def populate_tournament(build: TournamentBuild, ctx: BuildContext) -> TournamentBuild:
+    """Second build stage: add the tournament's teams, awards and metadata to its workbook.
+
+    If a step fails, the workbook is saved as far as it got before the
+    exception propagates.
+
+    Args:
+        build: The tournament from load_tournament
+        ctx: Settings shared by every tournament build
+
+    Returns:
+        The same tournament (skipped if no teams are assigned to it)
+    """
+    if build.skipped:
+        return build
+
+    quiet = ctx.quiet
+    config = ctx.config
+    template = ctx.template
+    tournament_folder = ctx.tournament_folder
+    using_divisions = ctx.using_divisions
+    dfAwardDef = ctx.dfAwardDef
+    assignment_index = ctx.assignment_index
+    row, ojs_book, ojs_path, assignees = build.row, build.ojs_book, build.ojs_path, build.assignees
+    tournament_name, progress = build.tournament_name, build.progress
+    setup = xlsm_patch if template.writer == OJS_WRITER_PATCH else worksheet_setup
+    
+    # Check if there are teams assigned; skip if not
+    has_teams = setup.set_up_tapi_worksheet(row, ojs_book, assignees, using_divisions)
+    
+    if not has_teams:
+        ojs_book.close()
+        # Nothing is saved for a tournament without teams; remove any OJS file
+        # left over from an earlier run
+        if os.path.exists(ojs_path):
+            os.remove(ojs_path)
+        if not quiet:
+            print_warning(f"No teams assigned to {tournament_name}, OJS file removed")
+        logger.warning(f"Skipped {tournament_name} - no teams assigned")
+        build.skipped = True
+        return build
+    
+    # Process the tournament (only reached if has_teams is True)
+    try:
+        if not quiet:
+            progress.update("Team info added")
+        
+        setup.set_up_award_worksheet(row, ojs_book, dfAwardDef, using_divisions)
+        if not quiet:
+            progress.update("Awards configured")
+        
+        setup.set_up_meta_worksheet(row, ojs_book, config, tournament_folder, using_divisions)
+        if not quiet:
+            progress.update("Metadata added")
+        
+        setup.copy_award_def(row, ojs_book, template.award_def)
+        if not quiet:
+            progress.update("Formatting applied")
+        
+        setup.resize_worksheets(row, ojs_book, assignees, shared_formulas=ctx.shared_formulas)
+        if not quiet:
+            progress.update("Tables resized")
+        
+        # Add essential conditional formatting AFTER resize
+        setup.add_essential_conditional_formats(ojs_book, assignment_index.team_count(row[COL_SHORT_NAME]))
+        
+        # Fix named ranges (especially "Awards" range). Hiding, protection
+        # and external link removal were applied once to the prepared template.
+        setup.fix_named_ranges(ojs_book)
+        if not quiet:
+            progress.update("Named ranges fixed")
+        
+    except BaseException:
+        save_ojs_workbook(build)
+        raise
+
+    return build
+
+
+def save_ojs_workbook(build: TournamentBuild) -> None:
+    """Save and close a tournament's OJS workbook."""
+    build.ojs_book.save(build.ojs_path)
+    build.ojs_book.close()
+    logger.info(f"OJS workbook saved to: {build.ojs_path}")
+
+
+def write_tournament(build: TournamentBuild, ctx: BuildContext) -> tuple[str, bool, list] | None:
+    """Last build stage: save the workbook, write tournament_config.json and render the fill-in form.
+
+    Args:
+        build: The tournament from populate_tournament
+        ctx: Settings shared by every tournament build
+
+    Returns:
+        (tournament name, division mismatch detected, award count mismatches)
+        from generate_tournament_config, or None if the tournament was skipped
+    """
+    if build.skipped:
+        return None
+
+    quiet = ctx.quiet
+    config = ctx.config
+    tournament_folder = ctx.tournament_folder
+    using_divisions = ctx.using_divisions
+    dfAwardDef = ctx.dfAwardDef
+    row, newpath, tournament_name, progress = build.row, build.newpath, build.tournament_name, build.progress
+
+    save_ojs_workbook(build)
+        
+    # Generate tournament config file
+    mismatch_detected, tourn_name, award_mismatches = generate_tournament_config(
+        row, config, dfAwardDef, using_divisions, tournament_folder, quiet=quiet
+    )
+    
+
+    # Render fill-in awards form (paper backup) into the tournament folder
+    try:
+        config_path = os.path.join(newpath, 'tournament_config.json')
+        if not os.path.exists(config_path):
+            logger.warning(f"Fill-in form skipped; config not found: {config_path}")
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                tourn_config = json.load(f)
+
+            renderer = CeremonyRenderer(newpath)
+            fillin_template_file = 'fillin_template.html.jinja'
+            fillin_output = os.path.join(newpath, 'fillin_form.html')
+
+            # Prepare fill-in rows grouped by award type
+            info_section = tourn_config.get('INFO', {})
+            awards_cfg = tourn_config.get('AWARDS', [])
+            using_divs = info_section.get('using_divisions', False)
+
+            def ordinal(n: int) -> str:
+                n = int(n)
+                mod100, mod10 = n % 100, n % 10
+                if mod100 in (11, 12, 13):
+                    suffix = "th"
+                elif mod10 == 1:
+                    suffix = "st"
+                elif mod10 == 2:
+                    suffix = "nd"
+                elif mod10 == 3:
+                    suffix = "rd"
+                else:
+                    suffix = "th"
+                return f"{n}{suffix}"
+
+            def build_label(base: str, idx: int, labels: list[str]) -> str:
+                if labels and len(labels) > idx and labels[idx]:
+                    return f"{base}, {labels[idx]}"
+                return f"{base}, {ordinal(idx + 1)} Place"
+
+            def expand_award(award: dict) -> list[str]:
+                labels = award.get('Labels', [])
+                rows: list[str] = []
+                if using_divs and award.get('DivAwd', False):
+                    d1 = int(award.get('D1_count', 0))
+                    d2 = int(award.get('D2_count', 0))
+                    for i in range(d1):
+                        rows.append(build_label(f"Division 1 {award.get('Name', '')}", i, labels))
+                    for i in range(d2):
+                        rows.append(build_label(f"Division 2 {award.get('Name', '')}", i, labels))
+                else:
+                    count = int(award.get('TournCount', 0))
+                    for i in range(count):
+                        rows.append(build_label(award.get('Name', ''), i, labels))
+                return rows
+
+            # Group awards
+            rows_robot: list[str] = []
+            rows_core: list[str] = []      # IP / RD / CV
+            rows_judges: list[str] = []    # J_AWD_Judges*
+            rows_other: list[str] = []     # Other J_AWD_* (non-champ, non-core, non-judges)
+            rows_champs: list[str] = []    # Champions
+
+            for award in awards_cfg:
+                award_id = award.get('ID', '')
+                if not award_id:
+                    continue
+
+                if award_id == 'P_AWD_RG':
+                    rows_robot.extend(expand_award(award))
+                elif award_id in {'J_AWD_IP', 'J_AWD_RD', 'J_AWD_CV'}:
+                    rows_core.extend(expand_award(award))
+                elif award_id.startswith('J_AWD_Judges'):
+                    rows_judges.extend(expand_award(award))
+                elif award_id.startswith('J_AWD_CHAMP'):
+                    rows_champs.extend(expand_award(award))
+                elif award_id.startswith('J_AWD_'):
+                    rows_other.extend(expand_award(award))
+
+            template_data = {
+                'tournament_name': info_section.get('tournament_long_name', ''),
+                'rows_robot': rows_robot,
+                'rows_core': rows_core,
+                'rows_judges': rows_judges,
+                'rows_other': rows_other,
+                'rows_champs': rows_champs,
+                'adv_count': row.get(COL_ADVANCING, 0),
+                'division_label': row.get(COL_DIVISION, ''),
+                'using_divisions': using_divs,
+            }
+
+            errors, warnings = renderer.validate_template_variables(fillin_template_file, template_data, set())
+            if errors:
+                logger.error(f"Fill-in template missing critical variables: {errors}")
+            if warnings and not quiet:
+                print_warning(f"Fill-in form missing optional variables: {', '.join(warnings)}")
+
+            if renderer.render(fillin_template_file, template_data, fillin_output):
+                if not quiet:
+                    print_success("Fill-in awards form created")
+            else:
+                print_warning("Fill-in awards form could not be generated")
+                logger.warning(f"Fill-in form render failed for {newpath}")
+    except Exception as e:
+        print_warning("Unable to generate fill-in awards form")
+        logger.warning(f"Fill-in form generation failed for {newpath}: {e}")
+        
+    if not quiet:
+        progress.complete(f"✓ {tournament_name} complete!")
+    else:
+        logger.info(f"✓ Completed: {tournament_name}")
+
+    return tourn_name, mismatch_detected, award_mismatches
+
+
+def group_tournament_rows(dfTournaments: pd.DataFrame) -> list[list[tuple[int, pd.Series]]]:
+    """Group tournament rows by Short Name as (position, row) pairs.
+
+    The D1/D2 rows of a tournament share a folder and merge into one
+    tournament_config.json, so a group is always built by one worker, in order.
+    Groups are ordered by their first row.
+    """
+    groups: dict = {}
+    for position, (_, row) in enumerate(dfTournaments.iterrows()):
+        groups.setdefault(row[COL_SHORT_NAME], []).append((position, row))
+    return list(groups.values())
+
+
+# Set in each worker process by _init_build_worker
+_worker_ctx: BuildContext | None = None
+
+
+def _init_build_worker(ctx: BuildContext, log_level: int) -> None:
+    """Process pool initializer: keep the shared build settings and reset logging.
+
+    Worker log records are collected and replayed by the parent (see
+    _build_tournament_group), so handlers inherited from the parent are dropped.
+    """
+    global _worker_ctx, logger
+    _worker_ctx = ctx
+    logger = logging.getLogger("ojs_builder")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.setLevel(log_level)
+    warnings.simplefilter(action="ignore", category=UserWarning)
+
+
+def _build_tournament_group(
+    rows: list[tuple[int, pd.Series]]
+) -> tuple[list, list, BaseException | None, str]:
+    """Build a group of tournament rows in a worker process.
+
+    Console output and log records are captured rather than written, so the
+    parent can replay them in tournament order and the run reads exactly as a
+    serial one would.
+
+    Returns:
+        ((position, build_tournament result) pairs, captured output and log
+        records, exception that stopped the group or None, its traceback)
+    """
+    buffer = ReplayBuffer()
+    # Records of every logger (e.g. ceremony_generator from the renderer) reach the root
+    handler = QueueHandler(buffer)
+    logging.getLogger().addHandler(handler)
+    # print_error waits for ENTER before exiting; the parent asks instead
+    sys.stdin = io.StringIO("\n")
+
+    results = []
+    error = None
+    error_traceback = ""
+    try:
+        with contextlib.redirect_stdout(buffer):
+            for position, row in rows:
+                results.append((position, build_tournament(row, _worker_ctx)))
+    except BaseException as e:
+        error = e
+        error_traceback = traceback.format_exc()
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    return results, buffer.events, error, error_traceback
+
+
+def report_stage_timings(timings: StageTimings, quiet: bool) -> None:
+    """Report where a pipelined build spent its time."""
+    for line in timings.report():
+        if quiet:
+            logger.info(f"Build stage {line}")
+        else:
+            print_info(f"Build stage {line}")
+
+
+def run_tournament_builds(
+    dfTournaments: pd.DataFrame,
+    ctx: BuildContext,
+    jobs: int,
+    on_group_built: Callable[[str, list], None] | None = None,
+    pipeline: bool = False,
+) -> list[tuple[str, bool, list]]:
+    """Build every tournament row, serially or on a pool of worker processes.
+
+    With jobs > 1, each group of rows sharing a Short Name is built in one
+    worker. Console output and log records are replayed group by group, and
+    results come back in the order the rows are listed, so the summary is the
+    same as a serial run.
+
+    Args:
+        dfTournaments: Tournament rows to build
+        ctx: Settings shared by every build
+        jobs: Number of worker processes (0 = one per CPU, 1 = build in this process)
+        on_group_built: Called with (Short Name, build_tournament results) as soon
+            as every row of a tournament has been built
+        pipeline: When building in this process, overlap loading, populating and
+            writing of consecutive tournaments (see modules/build_pipeline.py)
+
+    Returns:
+        build_tournament results of the tournaments that were not skipped, in order
+    """
+    groups = group_tournament_rows(dfTournaments)
+    workers = min(jobs or os.cpu_count() or 1, len(groups))
+
+    if workers <= 1:
+        remaining = {group[0][1][COL_SHORT_NAME]: len(group) for group in groups}
+        group_results: dict[str, list] = {}
+
+        def record(row: pd.Series, result) -> None:
+            short_name = row[COL_SHORT_NAME]
+            group_results.setdefault(short_name, []).append(result)
+            remaining[short_name] -= 1
+            if remaining[short_name] == 0 and on_group_built is not None:
+                on_group_built(short_name, group_results[short_name])
+
+        if pipeline:
+            builder = BuildPipeline(
+                lambda row: load_tournament(row, ctx),
+                lambda build: populate_tournament(build, ctx),
+                lambda build: write_tournament(build, ctx),
+                depth=PIPELINE_QUEUE_DEPTH,
+            )
+            results = builder.run(
+                (row for _, row in dfTournaments.iterrows()),
+                on_finished=lambda index, row, result: record(row, result),
+            )
+            report_stage_timings(builder.timings, ctx.quiet)
+        else:
+            results = []
+            for _, row in dfTournaments.iterrows():
+                result = build_tournament(row, ctx)
+                results.append(result)
+                record(row, result)
+        return [result for result in results if result is not None]
+
+    if pipeline:
+        logger.info("--pipeline applies to builds in a single process; using worker processes instead")
+
+    logger.info(f"Building {len(groups)} tournament(s) with {workers} worker processes")
+    results: dict[int, tuple[str, bool, list] | None] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_build_worker,
+        initargs=(ctx, logger.getEffectiveLevel()),
+    ) as executor:
+        futures = [executor.submit(_build_tournament_group, group) for group in groups]
+        for group, future in zip(groups, futures):
+            group_results, events, error, error_traceback = future.result()
+            replay_events(events)
+            if error is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+                if isinstance(error, SystemExit):
+                    input()  # print_error's "Press enter to quit..." prompt is in the output
+                    raise error
+                logger.debug(f"Worker traceback:\n{error_traceback}")
+                raise error
+            results.update(group_results)
+            if on_group_built is not None:
+                on_group_built(group[0][1][COL_SHORT_NAME], [result for _, result in group_results])
+    return [results[p] for p in sorted(results) if results[p] is not None]
+
+
 def cleanup_tournament_folders(tournament_folder: str, tournaments_to_process: list[str], quiet: bool = False) -> dict:
     """Remove existing OJS and config files from tournament folders.
     
@@ -390,7 +1010,14 @@ def main():
     
     try:
         logger.info(f"Opening {os.path.basename(tournament_file)}...")
-        _ = load_workbook(tournament_file, data_only=True)
+        # Read every master table in one pass over the workbook (streamed, since the
+        # Assignments sheet can be large), or from the table cache if the workbook is
+        # unchanged since the last run. Only one of the two tournament lists exists,
+        # so missing tables come back empty here and are reported per table below.
+        cache_dir = None if args.no_cache else os.path.join(dir_path, TABLE_CACHE_DIRNAME)
+        master_tables = read_tables_cached(
+            tournament_file, MASTER_TABLES, cache_dir, require_table=False
+        )
         if not quiet:
             print_success("Tournament file opened successfully")
     except Exception as e:
@@ -404,7 +1031,9 @@ def main():
 
     # Read season info
     try:
-        dictSeasonInfo = read_table_as_dict(tournament_file, "SeasonInfo", "SeasonInfo")
+        dictSeasonInfo = frame_to_dict(
+            get_master_table(master_tables, "SeasonInfo", tournament_file), "SeasonInfo", "SeasonInfo"
+        )
         divisions_value = dictSeasonInfo["Divisions"]
         
         # Convert to boolean (handle string, bool, int)
@@ -424,12 +1053,12 @@ def main():
     # Read tournaments
     try:
         if using_divisions:
-            dfTournaments = read_table_as_df(
-                tournament_file, "DivTournaments", "DivTournamentList"
+            dfTournaments = get_master_table(
+                master_tables, "DivTournamentList", tournament_file
             ).fillna(0)
         else:
-            dfTournaments = read_table_as_df(
-                tournament_file, "Tournaments", "TournamentList"
+            dfTournaments = get_master_table(
+                master_tables, "TournamentList", tournament_file
             ).fillna(0)
         logger.info(f"Loaded {len(dfTournaments)} tournament(s)")
     except Exception as e:
@@ -437,14 +1066,15 @@ def main():
 
     # Read award definitions
     try:
-        dfAwardDef = read_table_as_df(tournament_file, "AwardDef", "AwardDef").fillna(0)
+        dfAwardDef = get_master_table(master_tables, "AwardDef", tournament_file).fillna(0)
         logger.info(f"Loaded {len(dfAwardDef)} award definitions")
     except Exception as e:
         print_error(logger, "Could not read the AwardDef worksheet", e)
 
     # Read assignments
     try:
-        dfAssignments = read_table_as_df(tournament_file, "Assignments", "Assignments").fillna(0)
+        dfAssignments = get_master_table(master_tables, "Assignments", tournament_file).fillna(0)
+        assignment_index = AssignmentIndex(dfAssignments)
         tourn_array = dfTournaments[COL_SHORT_NAME].tolist()
         if not quiet:
             print_success(f"Loaded {len(dfAssignments)} team assignments")
@@ -457,7 +1087,10 @@ def main():
             context={
                 'workbook': os.path.basename(tournament_file),
                 'sheet_name': 'Assignments',
-                'available_sheets': []
+                'available_sheets': [
+                    sheet for sheet, table in MASTER_TABLES
+                    if not master_tables[table].columns.empty
+                ]
             }
         )
 
@@ -519,8 +1152,44 @@ def main():
                     }
                 )
 
+    # Skip tournaments whose inputs have not changed since they were last built
+    # (or that finished before an interrupted run stopped)
+    asset_files = [
+        os.path.join(dir_path, mapping.get("source", ""))
+        for mapping in common_files + (divisions_only_files if using_divisions else no_divisions_only_files)
+    ]
+    season = season_fingerprint(
+        config, dfAwardDef, template_file, asset_files, using_divisions, args.writer,
+        args.shared_formulas,
+    )
+    fingerprints = {}  # Short Name -> fingerprint, in Tournaments table order
+    stored_results = {}
+    up_to_date = []
+    for short_name, rows in dfTournaments.groupby(COL_SHORT_NAME, sort=False):
+        fingerprints[short_name] = tournament_fingerprint(
+            season, rows, assignment_index.teams(short_name)
+        )
+        if args.force:
+            continue
+        results = up_to_date_results(
+            os.path.join(tournament_folder, short_name), fingerprints[short_name]
+        )
+        if results is not None:
+            up_to_date.append(short_name)
+            stored_results[short_name] = results
+
+    if up_to_date:
+        dfTournaments = dfTournaments.loc[~dfTournaments[COL_SHORT_NAME].isin(up_to_date)]
+        message = (
+            f"Skipping {len(up_to_date)} up-to-date tournament(s): {', '.join(up_to_date)} "
+            f"(use --force to rebuild)"
+        )
+        print_info(message)
+
     # Cleanup existing files (unless skipped)
-    if not args.no_cleanup:
+    if dfTournaments.empty:
+        logger.info("No tournaments to rebuild")
+    elif not args.no_cleanup:
         if not quiet:
             print_section_header("CLEANUP")
             print_info("Removing existing OJS and config files...")
@@ -580,7 +1249,7 @@ def main():
         logger.info("Cleanup skipped (--no-cleanup flag)")
 
     # Confirm before processing (unless quiet)
-    if not quiet:
+    if not quiet and not dfTournaments.empty:
         print_section_header("READY TO PROCESS")
         print_info(f"Tournaments to process: {len(dfTournaments)}")
         if not confirm_action("Proceed with tournament folder creation?", default=True):
@@ -594,253 +1263,56 @@ def main():
     else:
         logger.info(f"Processing {len(dfTournaments)} tournament(s)...")
     
-    # Track division mismatches and award count mismatches for final summary
-    division_mismatches = []
-    award_count_issues = {}  # tournament_name -> list of mismatch messages
-    
-    for index, row in dfTournaments.iterrows():
-        tournament_name = f"{row[COL_SHORT_NAME]} {row.get(COL_DIVISION, '')}".strip()
-        
-        if not quiet:
-            print(f"\n{Fore.YELLOW}{'═' * 60}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}  {tournament_name}  {Style.RESET_ALL}".center(70))
-            print(f"{Fore.YELLOW}{'═' * 60}{Style.RESET_ALL}\n")
-            progress = ProgressTracker(8, f"Setting up {row[COL_SHORT_NAME]}")
-        else:
-            logger.info(f"Processing {tournament_name}")
-        
-        # Create folder
-        newpath = os.path.join(tournament_folder, row[COL_SHORT_NAME])
-        create_folder(newpath)
-        if not quiet:
-            progress.update("Folder created")
-        
-        # Copy files
-        copy_files(
-            row, dir_path, template_file,
-            common_files, divisions_only_files, no_divisions_only_files,
-            tournament_folder, using_divisions
+    built_results = {}
+    if not dfTournaments.empty:
+        build_ctx = BuildContext(
+            config=config,
+            dir_path=dir_path,
+            template=PreparedTemplate(template_file, dfAwardDef, args.writer),
+            common_files=common_files,
+            divisions_only_files=divisions_only_files,
+            no_divisions_only_files=no_divisions_only_files,
+            tournament_folder=tournament_folder,
+            using_divisions=using_divisions,
+            dfAwardDef=dfAwardDef,
+            assignment_index=assignment_index,
+            quiet=quiet,
+            shared_formulas=args.shared_formulas,
         )
-        if not quiet:
-            progress.update("Files copied")
-
-        # Render fill-in awards form (paper backup) directly into the tournament folder
-        try:
-            renderer = CeremonyRenderer(newpath)
-            fillin_template_file = 'fillin_template.html.jinja'
-            fillin_output = os.path.join(newpath, 'fillin_form.html')
 
-            template_data = {
-                'tournament_name': row.get(COL_LONG_NAME, row.get(COL_SHORT_NAME, '')),
-                'awards_config': config.get('AWARDS', [])
-            }
+        # A manifest is only written once a tournament is completely rebuilt
+        for short_name in dfTournaments[COL_SHORT_NAME].unique():
+            clear_manifest(os.path.join(tournament_folder, short_name))
 
-            errors, warnings = renderer.validate_template_variables(fillin_template_file, template_data, set())
-            if errors:
-                logger.error(f"Fill-in template missing critical variables: {errors}")
-            if warnings and not quiet:
-                print_warning(f"Fill-in form missing optional variables: {', '.join(warnings)}")
-
-            if renderer.render(fillin_template_file, template_data, fillin_output):
-                if not quiet:
-                    print_success("Fill-in awards form created")
-            else:
-                print_warning("Fill-in awards form could not be generated")
-                logger.warning(f"Fill-in form render failed for {newpath}")
-        except Exception as e:
-            print_warning("Unable to generate fill-in awards form")
-            logger.warning(f"Fill-in form generation failed for {newpath}: {e}")
+        def record_build(short_name: str, results: list) -> None:
+            built_results[short_name] = results
+            write_manifest(
+                os.path.join(tournament_folder, short_name), fingerprints[short_name], results
+            )
 
-        # Process OJS file
-        ojs_name = row.get(COL_OJS_FILENAME)
-        if ojs_name is None or (isinstance(ojs_name, float) and pd.isna(ojs_name)):
-            if not quiet:
-                print_warning(f"No OJS filename for {row[COL_SHORT_NAME]}, skipping")
-            logger.warning(f"No OJS filename for {row[COL_SHORT_NAME]}, skipping")
-            continue
-            
-        ojs_path = os.path.join(tournament_folder, row[COL_SHORT_NAME], ojs_name)
-        
-        ojs_book = load_workbook(ojs_path, read_only=False, keep_vba=True)
-        
-        # Check if there are teams assigned; skip if not
-        has_teams = set_up_tapi_worksheet(row, ojs_book, dfAssignments, using_divisions)
-        
-        if not has_teams:
-            ojs_book.close()
-            # Delete the OJS file we just created since there are no teams
-            if os.path.exists(ojs_path):
-                os.remove(ojs_path)
-            if not quiet:
-                print_warning(f"No teams assigned to {tournament_name}, OJS file removed")
-            logger.warning(f"Skipped {tournament_name} - no teams assigned")
-            continue
-        
-        # Process the tournament (only reached if has_teams is True)
-        try:
-            if not quiet:
-                progress.update("Team info added")
-            
-            set_up_award_worksheet(row, ojs_book, dfAwardDef, using_divisions)
-            if not quiet:
-                progress.update("Awards configured")
-            
-            set_up_meta_worksheet(row, ojs_book, config, tournament_folder, using_divisions)
-            if not quiet:
-                progress.update("Metadata added")
-            
-            copy_award_def(row, ojs_book, dfAwardDef)
-            if not quiet:
-                progress.update("Formatting applied")
-            
-            hide_worksheets(row, ojs_book)
-            if not quiet:
-                progress.update("Worksheets hidden")
-            
-            resize_worksheets(row, ojs_book, dfAssignments, using_divisions)
-            if not quiet:
-                progress.update("Tables resized")
-            
-            # Add essential conditional formatting AFTER resize
-            add_essential_conditional_formats(ojs_book, len(dfAssignments[dfAssignments[COL_SHORT_NAME] == row[COL_SHORT_NAME]]))
-            
-            protect_worksheets(row, ojs_book)
-            if not quiet:
-                progress.update("Protection applied")
-            
-            # Fix named ranges (especially "Awards" range)
-            fix_named_ranges(ojs_book)
-            
-            # Remove any external workbook links before saving
-            remove_external_links(ojs_book)
-            if not quiet:
-                progress.update("Links removed")
-            
-        finally:
-            ojs_book.save(ojs_path)
-            ojs_book.close()
-            
-        # Generate tournament config file
-        mismatch_detected, tourn_name, award_mismatches = generate_tournament_config(
-            row, config, dfAwardDef, using_divisions, tournament_folder, quiet=quiet
+        run_tournament_builds(
+            dfTournaments, build_ctx, args.jobs, on_group_built=record_build,
+            pipeline=args.pipeline,
         )
-        
+    
+    # Track division mismatches and award count mismatches for final summary
+    division_mismatches = []
+    award_count_issues = {}  # tournament_name -> list of mismatch messages
+    
+    # Skipped and rebuilt tournaments are reported together, in Tournaments table order
+    summary_results = [
+        result
+        for short_name in fingerprints
+        for result in stored_results.get(short_name, built_results.get(short_name, []))
+        if result is not None
+    ]
+    for tourn_name, mismatch_detected, award_mismatches in summary_results:
         if mismatch_detected:
             division_mismatches.append(tourn_name)
         
         if award_mismatches:
             award_count_issues[tourn_name] = award_mismatches
 
-        # Render fill-in awards form (paper backup) into the tournament folder
-        try:
-            config_path = os.path.join(newpath, 'tournament_config.json')
-            if not os.path.exists(config_path):
-                logger.warning(f"Fill-in form skipped; config not found: {config_path}")
-            else:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    tourn_config = json.load(f)
-
-                renderer = CeremonyRenderer(newpath)
-                fillin_template_file = 'fillin_template.html.jinja'
-                fillin_output = os.path.join(newpath, 'fillin_form.html')
-
-                # Prepare fill-in rows grouped by award type
-                info_section = tourn_config.get('INFO', {})
-                awards_cfg = tourn_config.get('AWARDS', [])
-                using_divs = info_section.get('using_divisions', False)
-
-                def ordinal(n: int) -> str:
-                    n = int(n)
-                    mod100, mod10 = n % 100, n % 10
-                    if mod100 in (11, 12, 13):
-                        suffix = "th"
-                    elif mod10 == 1:
-                        suffix = "st"
-                    elif mod10 == 2:
-                        suffix = "nd"
-                    elif mod10 == 3:
-                        suffix = "rd"
-                    else:
-                        suffix = "th"
-                    return f"{n}{suffix}"
-
-                def build_label(base: str, idx: int, labels: list[str]) -> str:
-                    if labels and len(labels) > idx and labels[idx]:
-                        return f"{base}, {labels[idx]}"
-                    return f"{base}, {ordinal(idx + 1)} Place"
-
-                def expand_award(award: dict) -> list[str]:
-                    labels = award.get('Labels', [])
-                    rows: list[str] = []
-                    if using_divs and award.get('DivAwd', False):
-                        d1 = int(award.get('D1_count', 0))
-                        d2 = int(award.get('D2_count', 0))
-                        for i in range(d1):
-                            rows.append(build_label(f"Division 1 {award.get('Name', '')}", i, labels))
-                        for i in range(d2):
-                            rows.append(build_label(f"Division 2 {award.get('Name', '')}", i, labels))
-                    else:
-                        count = int(award.get('TournCount', 0))
-                        for i in range(count):
-                            rows.append(build_label(award.get('Name', ''), i, labels))
-                    return rows
-
-                # Group awards
-                rows_robot: list[str] = []
-                rows_core: list[str] = []      # IP / RD / CV
-                rows_judges: list[str] = []    # J_AWD_Judges*
-                rows_other: list[str] = []     # Other J_AWD_* (non-champ, non-core, non-judges)
-                rows_champs: list[str] = []    # Champions
-
-                for award in awards_cfg:
-                    award_id = award.get('ID', '')
-                    if not award_id:
-                        continue
-
-                    if award_id == 'P_AWD_RG':
-                        rows_robot.extend(expand_award(award))
-                    elif award_id in {'J_AWD_IP', 'J_AWD_RD', 'J_AWD_CV'}:
-                        rows_core.extend(expand_award(award))
-                    elif award_id.startswith('J_AWD_Judges'):
-                        rows_judges.extend(expand_award(award))
-                    elif award_id.startswith('J_AWD_CHAMP'):
-                        rows_champs.extend(expand_award(award))
-                    elif award_id.startswith('J_AWD_'):
-                        rows_other.extend(expand_award(award))
-
-                template_data = {
-                    'tournament_name': info_section.get('tournament_long_name', ''),
-                    'rows_robot': rows_robot,
-                    'rows_core': rows_core,
-                    'rows_judges': rows_judges,
-                    'rows_other': rows_other,
-                    'rows_champs': rows_champs,
-                    'adv_count': row.get(COL_ADVANCING, 0),
-                    'division_label': row.get(COL_DIVISION, ''),
-                    'using_divisions': using_divs,
-                }
-
-                errors, warnings = renderer.validate_template_variables(fillin_template_file, template_data, set())
-                if errors:
-                    logger.error(f"Fill-in template missing critical variables: {errors}")
-                if warnings and not quiet:
-                    print_warning(f"Fill-in form missing optional variables: {', '.join(warnings)}")
-
-                if renderer.render(fillin_template_file, template_data, fillin_output):
-                    if not quiet:
-                        print_success("Fill-in awards form created")
-                else:
-                    print_warning("Fill-in awards form could not be generated")
-                    logger.warning(f"Fill-in form render failed for {newpath}")
-        except Exception as e:
-            print_warning("Unable to generate fill-in awards form")
-            logger.warning(f"Fill-in form generation failed for {newpath}: {e}")
-            
-        if not quiet:
-            progress.complete(f"✓ {tournament_name} complete!")
-        else:
-            logger.info(f"✓ Completed: {tournament_name}")
-
     if not quiet:
         print(f"\n{Fore.GREEN}{'═' * 60}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}  ALL TOURNAMENTS PROCESSED SUCCESSFULLY!  {Style.RESET_ALL}".center(70))
@@ -911,4 +1383,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -12,8 +12,14 @@ Usage:
 
 import os
 import sys
+import io
 import json
+import time
 import logging
+import contextlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import warnings
 import argparse
 from colorama import init, Fore, Style
@@ -28,6 +34,11 @@ from modules.logger import setup_logger, print_error
 from modules.ceremony_validator import OJSValidator
 from modules.ceremony_data_collector import CeremonyDataCollector
 from modules.ceremony_renderer import CeremonyRenderer
+from modules.ceremony_divisions import capture_output, prepare_divisions, validate_divisions
+from modules.build_pipeline import replay_events
+from modules.ceremony_watch import OJSWatcher, winner_changes
+from modules.toast_cache import StepCache, context_hash
+from modules.constants import SHEET_TEAM_INFO, CELL_DUAL_EMCEE, TOAST_RENDER_CACHE_FILENAME
 
 # Initialize colorama
 init()
@@ -124,65 +135,45 @@ def parse_arguments():
         action='store_true',
         help='Enable debug logging (DEBUG level, implies --verbose)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for reading and validating the OJS files (default: one per file, up to the CPU count)'
+    )
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help='Keep running and re-render the script and summary whenever an OJS file is saved'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-read every OJS sheet and re-render every output instead of reusing unchanged results'
+    )
     
     return parser.parse_args()
 
 
-def main():
-    """Main execution function."""
-    # Parse arguments first
-    args = parse_arguments()
+def read_dual_emcee(ojs_filenames: list, script_dir: str, snapshots: dict) -> bool:
+    """Read the dual emcee flag (cell F2 of Team and Program Information).
     
-    # Determine logging level
-    if args.debug:
-        log_debug = True
-    elif args.verbose:
-        log_debug = False  # INFO level
-    else:
-        log_debug = False  # Default (WARNING level in setup_logger when debug=False)
-    
-    # Print splash screen
-    print_splash()
-    
-    # Get directory where THIS script is located
-    if getattr(sys, 'frozen', False):
-        # Running as compiled executable
-        script_dir = os.path.dirname(sys.executable)
-    else:
-        # Running as Python script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+    OR logic: TRUE if ANY OJS file has it set.
     
-    # Set up logger with appropriate level
-    global logger
-    logger = setup_logger("ceremony_generator", debug=log_debug, log_dir=script_dir)
-    
-    if args.debug:
-        logger.info("Debug logging enabled")
-    elif args.verbose:
-        logger.info("Verbose logging enabled")
-    
-    logger.info(f"Script location: {script_dir}")
-    
-    # Load configuration
-    config_path = os.path.join(script_dir, 'tournament_config.json')
-    config = load_config(config_path)
-    
-    # Extract configuration
-    info = config['INFO']
-    using_divisions = info['using_divisions']
-    ojs_filenames = info['ojs_filenames']
-    
-    # Read dual_emcee flag from OJS files at runtime (OR logic: TRUE if ANY OJS has it set)
+    Args:
+        ojs_filenames: OJS filenames from config
+        script_dir: Folder the OJS files are in
+        snapshots: OJSSnapshot of each readable OJS file, by path
+        
+    Returns:
+        True if dual emcee highlighting is enabled
+    """
     dual_emcee = False
     for ojs_file in ojs_filenames:
         ojs_path = os.path.join(script_dir, ojs_file)
-        if os.path.exists(ojs_path):
+        if ojs_path in snapshots:
             try:
-                from openpyxl import load_workbook
-                wb = load_workbook(ojs_path, data_only=True)
-                ws = wb["Team and Program Information"]
-                dual_emcee_value = ws["F2"].value
-                wb.close()
+                dual_emcee_value = snapshots[ojs_path].cell(SHEET_TEAM_INFO, CELL_DUAL_EMCEE)
                 
                 # Convert to boolean
                 if isinstance(dual_emcee_value, bool):
@@ -203,66 +194,50 @@ def main():
             except Exception as e:
                 logger.debug(f"Could not read dual_emcee from {ojs_file}: {e}")
     
-    print(f"{Fore.CYAN}Tournament:{Style.RESET_ALL} {info['tournament_long_name']}")
-    print(f"{Fore.CYAN}Using divisions:{Style.RESET_ALL} {using_divisions}")
-    print(f"{Fore.CYAN}OJS files:{Style.RESET_ALL} {len(ojs_filenames)}")
-    print(f"{Fore.CYAN}Dual emcee:{Style.RESET_ALL} {dual_emcee}")
-    
-    # Validate OJS files exist
-    print_header("VALIDATING OJS FILES")
-    for ojs_file in ojs_filenames:
-        ojs_path = os.path.join(script_dir, ojs_file)
-        if os.path.exists(ojs_path):
-            print_success(f"Found: {ojs_file}")
-        else:
-            print_error(logger, f"OJS file not found: {ojs_file}")
+    return dual_emcee
+
+
+def merge_validation(ojs_filenames: list, divisions: list) -> OJSValidator:
+    """Show each OJS file's validation, in file order, and gather the results.
     
-    # Validate OJS data
-    print_header("VALIDATING OJS DATA")
+    Args:
+        ojs_filenames: OJS filenames from config
+        divisions: DivisionData of each file (see modules/ceremony_divisions.py)
+        
+    Returns:
+        OJSValidator holding the errors and warnings of every file
+    """
     validator = OJSValidator()
     
-    for idx, ojs_file in enumerate(ojs_filenames):
-        ojs_path = os.path.join(script_dir, ojs_file)
-        division = f"Division {idx + 1}" if using_divisions else ""
-        
+    for ojs_file, data in zip(ojs_filenames, divisions):
         print(f"\n{Fore.YELLOW}Validating {ojs_file}...{Style.RESET_ALL}")
-        validator.validate_all_sheets(ojs_path, division)
+        replay_events(data.events)
+        validator.errors.extend(data.errors)
+        validator.warnings.extend(data.warnings)
     
-    # Display validation results
-    if validator.has_errors():
-        print(f"\n{Fore.RED}{'═' * 70}{Style.RESET_ALL}")
-        print(f"{Fore.RED}VALIDATION FAILED{Style.RESET_ALL}".center(78))
-        print(f"{Fore.RED}{'═' * 70}{Style.RESET_ALL}\n")
-        
-        print(f"{Fore.RED}Errors found:{Style.RESET_ALL}")
-        for error in validator.errors:
-            print(f"  {error}")
-        
-        if validator.warnings:
-            print(f"\n{Fore.YELLOW}Warnings:{Style.RESET_ALL}")
-            for warning in validator.warnings:
-                print(f"  {warning}")
-        
-        print(f"\n{Fore.RED}Please fix the errors above and run the script again.{Style.RESET_ALL}")
-        input("\nPress ENTER to exit...")
-        sys.exit(1)
+    return validator
+
+
+def collect_template_data(
+    collector: CeremonyDataCollector, config: dict, script_dir: str, dual_emcee: bool
+) -> tuple[dict, dict]:
+    """Collect the team lists and award winners the ceremony templates use.
     
-    if validator.warnings:
-        print(f"\n{Fore.YELLOW}Warnings found:{Style.RESET_ALL}")
-        for warning in validator.warnings:
-            print(f"  {warning}")
+    Args:
+        collector: Collector for the tournament's OJS files
+        config: Tournament configuration
+        script_dir: Folder the OJS files are in
+        dual_emcee: Whether dual emcee highlighting is enabled
         
-        response = input(f"\n{Fore.YELLOW}Continue despite warnings? [Y/n]: {Style.RESET_ALL}").strip().lower()
-        if response and response not in ['y', 'yes']:
-            print("Operation cancelled by user")
-            sys.exit(0)
-    
-    print_success("All validations passed!")
-    
-    # Collect data
-    print_header("COLLECTING AWARD DATA")
-    collector = CeremonyDataCollector(config, dual_emcee=dual_emcee)
+    Returns:
+        (template_data, award_winners): the template variables, and the
+        AwardWinner list of each award, by award name (with its division)
+    """
+    info = config['INFO']
+    using_divisions = info['using_divisions']
+    ojs_filenames = info['ojs_filenames']
     template_data = {}
+    award_winners = {}
     
     # Basic info
     template_data['tournament_name'] = info['tournament_long_name']
@@ -315,6 +290,7 @@ def main():
                     rg_d1 = collector.collect_robot_game_awards(
                         os.path.join(script_dir, ojs_filenames[0]), d1_count, "Division 1"
                     )
+                    award_winners[f"{award_name} (Division 1)"] = rg_d1
                     tag = award.get('ScriptTagD1', '')
                     if tag:
                         template_data[tag] = collector.format_winners_as_html(rg_d1, include_score=True)
@@ -325,6 +301,7 @@ def main():
                         rg_d2 = collector.collect_robot_game_awards(
                             os.path.join(script_dir, ojs_filenames[1]), d2_count, "Division 2"
                         )
+                        award_winners[f"{award_name} (Division 2)"] = rg_d2
                         tag = award.get('ScriptTagD2', '')
                         if tag:
                             template_data[tag] = collector.format_winners_as_html(rg_d2, include_score=True)
@@ -335,6 +312,7 @@ def main():
                     rg_winners = collector.collect_robot_game_awards(
                         os.path.join(script_dir, ojs_filenames[0]), tourn_count, ""
                     )
+                    award_winners[award_name] = rg_winners
                     tag = award.get('ScriptTagNoDiv', '')
                     if tag:
                         template_data[tag] = collector.format_winners_as_html(rg_winners, include_score=True)
@@ -352,6 +330,7 @@ def main():
                         os.path.join(script_dir, ojs_filenames[0]), award, d1_labels, "Division 1",
                         ojs_filenames[0]
                     )
+                    award_winners[f"{award_name} (Division 1)"] = winners_d1
                     tag = award.get('ScriptTagD1', '')
                     if tag:
                         template_data[tag] = collector.format_winners_as_html(winners_d1)
@@ -370,6 +349,7 @@ def main():
                             os.path.join(script_dir, ojs_filenames[1]), award, d2_labels, "Division 2",
                             ojs_filenames[1]
                         )
+                        award_winners[f"{award_name} (Division 2)"] = winners_d2
                         tag = award.get('ScriptTagD2', '')
                         if tag:
                             template_data[tag] = collector.format_winners_as_html(winners_d2)
@@ -402,6 +382,7 @@ def main():
                             f"{award_name} tournament award: {len(all_winners)} selected, {tourn_count} allocated ({extra_count} OVER-allocated)"
                         )
                     
+                    award_winners[award_name] = all_winners
                     tag = award.get('ScriptTagNoDiv', '')
                     if tag:
                         template_data[tag] = collector.format_winners_as_html(all_winners)
@@ -420,16 +401,59 @@ def main():
     
     print_success(f"Collected data for {len(template_data)} template variables")
     
-    # Display collector warnings
-    if collector.warnings:
-        print(f"\n{Fore.YELLOW}Data collection warnings:{Style.RESET_ALL}")
-        for warning in collector.warnings:
-            print(f"  {warning}")
+    return template_data, award_winners
+
+
+def render_if_changed(
+    renderer: CeremonyRenderer, cache: StepCache | None, template_file: str, template_data: dict, output_path: str
+) -> tuple[bool, bool]:
+    """Render a template, unless the output is already there from the same data and template.
     
-    # Render templates
+    Args:
+        renderer: Renderer for the script folder
+        cache: The outputs' StepCache (None always renders)
+        template_file: Template filename
+        template_data: Template variables
+        output_path: Where the output is written
+        
+    Returns:
+        (success, rendered): rendered is False if the existing output was kept
+    """
+    key = context_hash(template_data, os.path.join(renderer.template_dir, template_file))
+    step = os.path.basename(output_path)
+    if cache is not None and os.path.exists(output_path) and cache.lookup(step, key) is not None:
+        logger.info(f"{step} is up to date; not rendered again")
+        return True, False
+    
+    if not renderer.render(template_file, template_data, output_path):
+        return False, True
+    if cache is not None:
+        cache.store(step, key, ())
+    return True, True
+
+
+def render_outputs(
+    script_dir: str, ojs_filenames: list, template_data: dict, use_cache: bool = True
+) -> tuple[bool, list, list, list] | None:
+    """Render the ceremony script and summary next to the OJS files.
+    
+    Args:
+        script_dir: Folder the outputs are written to
+        ojs_filenames: OJS filenames from config (the outputs are named after them)
+        template_data: Template variables from collect_template_data
+        use_cache: Keep outputs whose template data and template are unchanged
+            since they were last rendered
+        
+    Returns:
+        (all_success, output_files, summary template warnings, output files
+        kept as they were), or None if critical script variables are missing
+        (nothing is rendered)
+    """
     print_header("RENDERING CEREMONY OUTPUTS")
     
     renderer = CeremonyRenderer(script_dir)
+    cache = StepCache(os.path.join(script_dir, TOAST_RENDER_CACHE_FILENAME), script_dir) if use_cache else None
+    unchanged = []
     
     # Track overall success
     all_success = True
@@ -448,8 +472,7 @@ def main():
         for err in errors:
             print(f"  {err}")
         print(f"\n{Fore.RED}Cannot generate ceremony script with missing critical variables.{Style.RESET_ALL}")
-        input("\nPress ENTER to exit...")
-        sys.exit(1)
+        return None
     
     if warnings:
         print(f"{Fore.YELLOW}Missing script template variables (will be empty):{Style.RESET_ALL}")
@@ -460,9 +483,12 @@ def main():
     script_filename = generate_output_filename(ojs_filenames, "closing-ceremony")
     script_path = os.path.join(script_dir, script_filename)
     
-    if renderer.render(script_template_file, template_data, script_path):
-        print_success(f"Ceremony script: {script_filename}")
+    success, rendered = render_if_changed(renderer, cache, script_template_file, template_data, script_path)
+    if success:
+        print_success(f"Ceremony script: {script_filename}" + ("" if rendered else " (unchanged)"))
         output_files.append(script_path)
+        if not rendered:
+            unchanged.append(script_path)
     else:
         print_error_msg(f"Failed to render ceremony script")
         all_success = False
@@ -483,13 +509,262 @@ def main():
     summary_filename = generate_output_filename(ojs_filenames, "summary")
     summary_path = os.path.join(script_dir, summary_filename)
     
-    if renderer.render(summary_template_file, template_data, summary_path):
-        print_success(f"Ceremony summary: {summary_filename}")
+    success, rendered = render_if_changed(renderer, cache, summary_template_file, template_data, summary_path)
+    if success:
+        print_success(f"Ceremony summary: {summary_filename}" + ("" if rendered else " (unchanged)"))
         output_files.append(summary_path)
+        if not rendered:
+            unchanged.append(summary_path)
     else:
         print_error_msg(f"Failed to render ceremony summary")
         all_success = False
+    
+    if cache is not None:
+        cache.save()
+    return all_success, output_files, warnings, unchanged
+
 
+def watch_ojs_files(
+    config: dict, script_dir: str, divisions: list, award_winners: dict,
+    jobs: int | None = None, use_cache: bool = True,
+) -> None:
+    """Re-validate and re-render the ceremony outputs whenever an OJS file is saved.
+    
+    Only the saved files are read again; the other files keep the data they
+    were prepared with. Runs until Ctrl+C.
+    
+    Args:
+        config: Tournament configuration
+        script_dir: Folder the OJS files and outputs are in
+        divisions: DivisionData of each OJS file, as last prepared
+        award_winners: Award winners of the last render (empty if nothing was rendered)
+        jobs: Worker processes for preparing several saved files at once
+        use_cache: Reuse the results of unchanged sheets and outputs (see modules/toast_cache.py)
+    """
+    ojs_filenames = config['INFO']['ojs_filenames']
+    watcher = OJSWatcher([data.ojs_path for data in divisions])
+    
+    print_header("WATCHING OJS FILES")
+    print("The ceremony script and summary are re-rendered whenever an OJS file is saved.")
+    print("Press Ctrl+C to stop.")
+    
+    try:
+        while True:
+            changed = watcher.wait()
+            started = time.perf_counter()
+            saved = ", ".join(os.path.basename(path) for path in changed)
+            print(f"\n{Fore.CYAN}[{datetime.now():%H:%M:%S}] Saved: {saved}{Style.RESET_ALL}")
+            
+            refreshed = iter(prepare_divisions(
+                [(data.ojs_path, data.division) for data in divisions if data.ojs_path in changed],
+                jobs, use_cache,
+            ))
+            divisions = [next(refreshed) if data.ojs_path in changed else data for data in divisions]
+            
+            # The full progress output is only shown if rendering fails
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                validator = merge_validation(ojs_filenames, divisions)
+            if validator.has_errors():
+                print_error_msg("Validation failed - outputs not updated")
+                for error in validator.errors:
+                    print(f"  {error}")
+                continue
+            
+            snapshots = {data.ojs_path: data.snapshot for data in divisions if data.snapshot is not None}
+            dual_emcee = read_dual_emcee(ojs_filenames, script_dir, snapshots)
+            collector = CeremonyDataCollector(
+                config, dual_emcee=dual_emcee, snapshots=snapshots,
+                award_indexes={data.ojs_path: data.award_index for data in divisions if data.snapshot is not None},
+            )
+            with contextlib.redirect_stdout(output):
+                template_data, winners = collect_template_data(collector, config, script_dir, dual_emcee)
+                rendered = render_outputs(script_dir, ojs_filenames, template_data, use_cache)
+            if rendered is None or not rendered[0]:
+                print(output.getvalue())
+                print_error_msg("Failed to render ceremony outputs")
+                continue
+            
+            for warning in validator.warnings + collector.warnings:
+                print_warning(str(warning))
+            elapsed = time.perf_counter() - started
+            _, output_files, _, unchanged = rendered
+            if len(unchanged) < len(output_files):
+                print_success(f"Re-rendered {len(output_files) - len(unchanged)} file(s) in {elapsed:.1f}s")
+            else:
+                print_success(f"Outputs unchanged ({elapsed:.1f}s)")
+            changes = winner_changes(award_winners, winners)
+            for line in changes:
+                print(f"  {line}")
+            if not changes:
+                print("  No award winners changed")
+            award_winners = winners
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def main():
+    """Main execution function."""
+    # Parse arguments first
+    args = parse_arguments()
+    
+    # Determine logging level
+    if args.debug:
+        log_debug = True
+    elif args.verbose:
+        log_debug = False  # INFO level
+    else:
+        log_debug = False  # Default (WARNING level in setup_logger when debug=False)
+    
+    # Print splash screen
+    print_splash()
+    
+    # Get directory where THIS script is located
+    if getattr(sys, 'frozen', False):
+        # Running as compiled executable
+        script_dir = os.path.dirname(sys.executable)
+    else:
+        # Running as Python script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # Set up logger with appropriate level
+    global logger
+    logger = setup_logger("ceremony_generator", debug=log_debug, log_dir=script_dir)
+    
+    if args.debug:
+        logger.info("Debug logging enabled")
+    elif args.verbose:
+        logger.info("Verbose logging enabled")
+    
+    logger.info(f"Script location: {script_dir}")
+    
+    # Load configuration
+    config_path = os.path.join(script_dir, 'tournament_config.json')
+    config = load_config(config_path)
+    
+    # Extract configuration
+    info = config['INFO']
+    using_divisions = info['using_divisions']
+    ojs_filenames = info['ojs_filenames']
+    
+    # Read, index and validate each division's OJS file concurrently, once;
+    # the dual emcee check, validation results and data collection below all
+    # work from what this returns, in file order
+    divisions = prepare_divisions(
+        [
+            (os.path.join(script_dir, ojs_file), f"Division {idx + 1}" if using_divisions else "")
+            for idx, ojs_file in enumerate(ojs_filenames)
+        ],
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+        defer_validation=True,
+    )
+    # Files prepared in this process (e.g. a single OJS file) are validated
+    # while the award data is collected; the results are shown before anything
+    # is rendered
+    validation_pool = ThreadPoolExecutor(max_workers=1)
+    validation = validation_pool.submit(validate_divisions, divisions)
+    snapshots = {data.ojs_path: data.snapshot for data in divisions if data.snapshot is not None}
+    
+    # Read dual_emcee flag from OJS files at runtime (OR logic: TRUE if ANY OJS has it set)
+    dual_emcee = read_dual_emcee(ojs_filenames, script_dir, snapshots)
+    
+    print(f"{Fore.CYAN}Tournament:{Style.RESET_ALL} {info['tournament_long_name']}")
+    print(f"{Fore.CYAN}Using divisions:{Style.RESET_ALL} {using_divisions}")
+    print(f"{Fore.CYAN}OJS files:{Style.RESET_ALL} {len(ojs_filenames)}")
+    print(f"{Fore.CYAN}Dual emcee:{Style.RESET_ALL} {dual_emcee}")
+    
+    # Validate OJS files exist
+    print_header("VALIDATING OJS FILES")
+    for ojs_file in ojs_filenames:
+        ojs_path = os.path.join(script_dir, ojs_file)
+        if os.path.exists(ojs_path):
+            print_success(f"Found: {ojs_file}")
+        else:
+            print_error(logger, f"OJS file not found: {ojs_file}")
+    
+    # Collect data; its output is held back until the validation results
+    # have been shown. A collection failure is only reported if validation
+    # found nothing wrong (invalid data is the likelier cause, and its
+    # errors say what to fix)
+    collection_error = None
+    with capture_output() as collection_output:
+        print_header("COLLECTING AWARD DATA")
+        collector = CeremonyDataCollector(
+            config, dual_emcee=dual_emcee, snapshots=snapshots,
+            award_indexes={data.ojs_path: data.award_index for data in divisions if data.snapshot is not None},
+        )
+        try:
+            template_data, winners = collect_template_data(collector, config, script_dir, dual_emcee)
+        except Exception as e:
+            collection_error = e
+    
+    # Wait for validation to finish
+    validation.result()
+    validation_pool.shutdown()
+    
+    # Validate OJS data
+    print_header("VALIDATING OJS DATA")
+    validator = merge_validation(ojs_filenames, divisions)
+    
+    # Display validation results
+    if validator.has_errors():
+        print(f"\n{Fore.RED}{'═' * 70}{Style.RESET_ALL}")
+        print(f"{Fore.RED}VALIDATION FAILED{Style.RESET_ALL}".center(78))
+        print(f"{Fore.RED}{'═' * 70}{Style.RESET_ALL}\n")
+        
+        print(f"{Fore.RED}Errors found:{Style.RESET_ALL}")
+        for error in validator.errors:
+            print(f"  {error}")
+        
+        if validator.warnings:
+            print(f"\n{Fore.YELLOW}Warnings:{Style.RESET_ALL}")
+            for warning in validator.warnings:
+                print(f"  {warning}")
+        
+        if args.watch:
+            print(f"\n{Fore.RED}Please fix the errors above and save the OJS file.{Style.RESET_ALL}")
+            watch_ojs_files(config, script_dir, divisions, {}, args.jobs, not args.no_cache)
+            return
+        print(f"\n{Fore.RED}Please fix the errors above and run the script again.{Style.RESET_ALL}")
+        input("\nPress ENTER to exit...")
+        sys.exit(1)
+    
+    if validator.warnings and not args.watch:
+        print(f"\n{Fore.YELLOW}Warnings found:{Style.RESET_ALL}")
+        for warning in validator.warnings:
+            print(f"  {warning}")
+        
+        response = input(f"\n{Fore.YELLOW}Continue despite warnings? [Y/n]: {Style.RESET_ALL}").strip().lower()
+        if response and response not in ['y', 'yes']:
+            print("Operation cancelled by user")
+            sys.exit(0)
+    
+    print_success("All validations passed!")
+    
+    replay_events(collection_output.events)
+    if collection_error is not None:
+        raise collection_error
+    
+    # Display collector warnings
+    if collector.warnings:
+        print(f"\n{Fore.YELLOW}Data collection warnings:{Style.RESET_ALL}")
+        for warning in collector.warnings:
+            print(f"  {warning}")
+    
+    # Render templates
+    rendered = render_outputs(script_dir, ojs_filenames, template_data, not args.no_cache)
+    if args.watch:
+        watch_ojs_files(
+            config, script_dir, divisions, winners if rendered and rendered[0] else {},
+            args.jobs, not args.no_cache,
+        )
+        return
+    if rendered is None:
+        input("\nPress ENTER to exit...")
+        sys.exit(1)
+    all_success, output_files, warnings, _ = rendered
+    
     # Final status
     if all_success:
         print(f"\n{Fore.GREEN}{'═' * 70}{Style.RESET_ALL}")
@@ -522,4 +797,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
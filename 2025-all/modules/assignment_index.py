@@ -0,0 +1,74 @@
+"""Team assignments partitioned by tournament and division.
+
+fll-maestro builds one OJS file per tournament (or per tournament division),
+and each one needs the teams assigned to it. AssignmentIndex groups the
+Assignments table once, so every lookup is a dict access instead of a
+boolean mask over the whole table.
+"""
+
+import logging
+
+import pandas as pd
+
+from .constants import COL_TEAM_NUMBER, COL_SHORT_NAME, COL_DIVISION
+
+logger = logging.getLogger("ojs_builder")
+
+
+class AssignmentIndex:
+    """Assignments grouped by (Short Name, Div), each group sorted by Team #.
+
+    Short Name and Div are stored as categoricals, so grouping compares codes
+    rather than strings. The frames handed out are shared; callers that add
+    columns must work on a copy (selecting columns already makes one).
+
+    Example:
+        index = AssignmentIndex(dfAssignments)
+        teams = index.teams("Norfolk", "D1")
+    """
+
+    def __init__(self, dfAssignments: pd.DataFrame):
+        """Partition the assignments table.
+
+        Args:
+            dfAssignments: DataFrame containing team assignments
+        """
+        df = dfAssignments.copy()
+        df[COL_SHORT_NAME] = df[COL_SHORT_NAME].astype("category")
+        if COL_TEAM_NUMBER in df.columns:
+            df = df.sort_values(by=COL_TEAM_NUMBER, kind="stable")
+
+        self._empty = df.iloc[0:0]
+        self._by_tournament: dict = dict(
+            iter(df.groupby(COL_SHORT_NAME, observed=True, sort=False))
+        )
+        self._by_division: dict = {}
+        if COL_DIVISION in df.columns:
+            df[COL_DIVISION] = df[COL_DIVISION].astype("category")
+            self._by_division = dict(
+                iter(df.groupby([COL_SHORT_NAME, COL_DIVISION], observed=True, sort=False))
+            )
+
+        logger.debug(
+            f"Indexed {len(df)} assignments into {len(self._by_tournament)} tournament(s) "
+            f"and {len(self._by_division)} division(s)"
+        )
+
+    def teams(self, short_name, division=None) -> pd.DataFrame:
+        """Teams assigned to a tournament, or to one division of it.
+
+        Args:
+            short_name: Tournament Short Name
+            division: Division (e.g. "D1"), or None for every team in the tournament
+
+        Returns:
+            DataFrame of the matching assignment rows sorted by Team #
+            (empty, with the table's columns, if there are none)
+        """
+        if division is None:
+            return self._by_tournament.get(short_name, self._empty)
+        return self._by_division.get((short_name, division), self._empty)
+
+    def team_count(self, short_name, division=None) -> int:
+        """Number of teams assigned to a tournament, or to one division of it."""
+        return len(self.teams(short_name, division))
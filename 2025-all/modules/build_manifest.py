@@ -0,0 +1,175 @@
+"""Per-tournament build manifests for incremental fll-maestro runs.
+
+After a tournament folder is built, fll-maestro writes a small manifest into
+it: a fingerprint of everything the build read (the tournament rows, the teams
+assigned to it, AwardDef, season.json, the OJS template and the copied
+assets) plus the build's results and the files it left in the folder. On the
+next run a tournament whose fingerprint and files still match is skipped.
+
+Manifests are written as each tournament finishes, so they double as resume
+checkpoints: after an interrupted run only the unfinished tournaments are
+rebuilt.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Any
+
+import pandas as pd
+
+from .constants import BUILD_MANIFEST_FILENAME, BUILD_MANIFEST_VERSION, OJS_WRITER_OPENPYXL
+from .table_cache import hash_file
+
+logger = logging.getLogger("ojs_builder")
+
+
+def _hash_frame(df: pd.DataFrame) -> str:
+    """SHA-256 of a DataFrame's columns and values (the index is ignored)."""
+    return hashlib.sha256(df.to_csv(index=False).encode("utf-8")).hexdigest()
+
+
+def season_fingerprint(
+    config: dict,
+    dfAwardDef: pd.DataFrame,
+    template_file: str,
+    asset_files: list[str],
+    using_divisions: bool,
+    writer: str = OJS_WRITER_OPENPYXL,
+    shared_formulas: bool = False,
+) -> str:
+    """Fingerprint of the inputs shared by every tournament in a season.
+
+    Args:
+        config: Parsed season.json
+        dfAwardDef: DataFrame containing award definitions
+        template_file: Path to the OJS template workbook
+        asset_files: Paths of the extra files copied into each tournament folder
+        using_divisions: Whether the season uses divisions
+        writer: The OJS writer in use (files from the other writer are rebuilt)
+        shared_formulas: Whether formula columns are written as shared formulas
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    parts = {
+        "version": BUILD_MANIFEST_VERSION,
+        "config": json.dumps(config, sort_keys=True, default=str),
+        "award_def": _hash_frame(dfAwardDef),
+        "template": hash_file(template_file) if os.path.exists(template_file) else None,
+        "assets": {
+            os.path.basename(path): hash_file(path) if os.path.exists(path) else None
+            for path in asset_files
+        },
+        "using_divisions": bool(using_divisions),
+        "writer": writer,
+        "shared_formulas": bool(shared_formulas),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def tournament_fingerprint(season: str, rows: pd.DataFrame, assignees: pd.DataFrame) -> str:
+    """Fingerprint of one tournament folder's inputs.
+
+    Args:
+        season: season_fingerprint of the run
+        rows: The tournament's row(s) from TournamentList/DivTournamentList
+        assignees: Every team assigned to the tournament
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(season.encode("utf-8"))
+    digest.update(_hash_frame(rows).encode("utf-8"))
+    digest.update(_hash_frame(assignees).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _manifest_path(folder: str) -> str:
+    return os.path.join(folder, BUILD_MANIFEST_FILENAME)
+
+
+def _folder_files(folder: str) -> list[str]:
+    """Files in a tournament folder, excluding the manifest itself."""
+    return sorted(
+        name for name in os.listdir(folder)
+        if name != BUILD_MANIFEST_FILENAME and os.path.isfile(os.path.join(folder, name))
+    )
+
+
+def load_manifest(folder: str) -> dict[str, Any] | None:
+    """Load a tournament folder's manifest, or None if it is missing or unreadable."""
+    path = _manifest_path(folder)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and "fingerprint" in manifest:
+            return manifest
+        logger.debug(f"Ignoring malformed build manifest {path}")
+    except Exception as e:
+        logger.debug(f"Could not load build manifest {path}: {e}")
+    return None
+
+
+def up_to_date_results(folder: str, fingerprint: str) -> list | None:
+    """Results recorded by the last build of a folder, if it is still current.
+
+    A folder is current if its manifest has the same fingerprint and every
+    file the build left behind still exists.
+
+    Args:
+        folder: Tournament folder
+        fingerprint: tournament_fingerprint of the inputs this run would use
+
+    Returns:
+        The stored build_tournament results (lists), or None if the folder
+        needs rebuilding
+    """
+    manifest = load_manifest(folder)
+    if manifest is None or manifest["fingerprint"] != fingerprint:
+        return None
+    missing = [
+        name for name in manifest.get("files", [])
+        if not os.path.exists(os.path.join(folder, name))
+    ]
+    if missing:
+        logger.debug(f"Rebuilding {folder}: missing {', '.join(missing)}")
+        return None
+    return manifest.get("results", [])
+
+
+def write_manifest(folder: str, fingerprint: str, results: list) -> None:
+    """Record a finished build; failures are logged and otherwise ignored.
+
+    Args:
+        folder: Tournament folder that was just built
+        fingerprint: tournament_fingerprint of the inputs used
+        results: build_tournament results of the folder's rows (None entries are dropped)
+    """
+    path = _manifest_path(folder)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    manifest = {
+        "version": BUILD_MANIFEST_VERSION,
+        "fingerprint": fingerprint,
+        "files": _folder_files(folder) if os.path.isdir(folder) else [],
+        "results": [list(result) for result in results if result is not None],
+    }
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+        logger.debug(f"Saved build manifest {path}")
+    except Exception as e:
+        logger.warning(f"Could not write build manifest {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def clear_manifest(folder: str) -> None:
+    """Remove a folder's manifest before it is rebuilt, so a partial build is never trusted."""
+    path = _manifest_path(folder)
+    if os.path.exists(path):
+        os.remove(path)
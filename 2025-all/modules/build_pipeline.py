@@ -0,0 +1,325 @@
+"""Pipelined tournament builds for fll-maestro.
+
+Building a tournament has three parts: loading (folder, copied files, a clone
+of the prepared OJS template), populating the workbook, and writing (saving
+the workbook, tournament_config.json and the fill-in form). BuildPipeline
+runs the three parts as stages on their own threads: while one tournament is
+written, the next is populated and the one after that is loaded. The stages
+are joined by queues of at most `depth` tournaments, which bounds how many
+workbooks are held in memory at once.
+
+The threads share the GIL. An openpyxl save is mostly pure-Python XML
+serialization; only its zip compression and file writes (about a tenth of a
+save) release the GIL, so the stages largely take turns. On one CPU,
+benchmarks/bench_build_pipeline.py builds 10 tournaments of 40 teams in
+3.0-3.2s serially and 3.5-4.0s pipelined. The pipeline shows where a build
+spends its time, and overlaps only work that waits on the disk (e.g. a slow
+network share); --jobs is the way to use more CPUs.
+
+Console output and log records of each tournament are captured as its stages
+run and replayed, tournament by tournament, once it is written, so a
+pipelined run reads the same as a serial one.
+"""
+
+import io
+import sys
+import math
+import time
+import queue
+import logging
+import threading
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+logger = logging.getLogger("ojs_builder")
+
+PIPELINE_STAGES = ("load", "populate", "write")
+
+
+class ReplayBuffer:
+    """Console output and log records of a worker, in the order they happened.
+
+    Stands in for sys.stdout (write) and for a QueueHandler's queue (put_nowait).
+    """
+
+    def __init__(self):
+        self.events: list = []
+
+    def write(self, text: str) -> int:
+        self.events.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        self.events.append(record)
+
+
+def replay_events(events: list) -> None:
+    """Write a worker's captured output and hand its log records to this process's loggers."""
+    for event in events:
+        if isinstance(event, str):
+            sys.stdout.write(event)
+        else:
+            logging.getLogger(event.name).handle(event)
+
+
+class _CaptureHandler(logging.Handler):
+    """Stands in for a logger's handlers while a pipeline runs.
+
+    Records logged on a pipeline thread go to that thread's current buffer
+    (once, however many loggers they propagate through); any other record,
+    including replayed ones, is passed on to the original handlers.
+    """
+
+    def __init__(self, capture: "_ThreadCapture", handlers: list[logging.Handler]):
+        super().__init__()
+        self.capture = capture
+        self.handlers = handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        buffer = self.capture.buffer()
+        if buffer is None:
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        elif not getattr(record, "_pipeline_captured", False):
+            record._pipeline_captured = True
+            buffer.put_nowait(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+class _ThreadCapture:
+    """Routes sys.stdout and logging to per-thread buffers while active."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._stdout = None
+        self._stdin = None
+        self._handlers: dict[logging.Logger, list[logging.Handler]] = {}
+
+    def buffer(self) -> ReplayBuffer | None:
+        return getattr(self._local, "buffer", None)
+
+    def set_buffer(self, buffer: ReplayBuffer | None) -> None:
+        self._local.buffer = buffer
+
+    # sys.stdout stand-in
+    def write(self, text: str) -> int:
+        buffer = self.buffer()
+        return (buffer or self._stdout).write(text)
+
+    def flush(self) -> None:
+        if self.buffer() is None:
+            self._stdout.flush()
+
+    def __enter__(self) -> "_ThreadCapture":
+        self._stdout, self._stdin = sys.stdout, sys.stdin
+        sys.stdout = self
+        # print_error waits for ENTER before exiting; the pipeline asks once the
+        # failed tournament's output has been replayed
+        sys.stdin = io.StringIO("\n")
+        loggers = [logging.getLogger()] + [
+            item for item in logging.Logger.manager.loggerDict.values()
+            if isinstance(item, logging.Logger)
+        ]
+        for item in loggers:
+            if item.handlers:
+                self._handlers[item] = list(item.handlers)
+                item.handlers = [_CaptureHandler(self, self._handlers[item])]
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for item, handlers in self._handlers.items():
+            item.handlers = handlers
+        self._handlers = {}
+        sys.stdout, sys.stdin = self._stdout, self._stdin
+
+
+@dataclass
+class StageTimings:
+    """Where the wall-clock time of a pipelined run went.
+
+    Attributes:
+        busy: Seconds each stage spent working
+        waiting: Seconds each stage spent blocked on its neighbours' queues
+        wall: Seconds from start to finish of the run
+        items: Number of items that went through the pipeline
+    """
+    busy: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PIPELINE_STAGES, 0.0))
+    waiting: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PIPELINE_STAGES, 0.0))
+    wall: float = 0.0
+    items: int = 0
+
+    def report(self) -> list[str]:
+        """Human-readable summary lines, one per stage plus a total."""
+        lines = [
+            f"{stage:<9} {self.busy[stage]:7.2f}s busy, {self.waiting[stage]:7.2f}s waiting"
+            for stage in PIPELINE_STAGES
+        ]
+        serial = sum(self.busy.values())
+        lines.append(
+            f"{'total':<9} {self.wall:7.2f}s wall for {self.items} tournament(s) "
+            f"({serial:.2f}s of stage work)"
+        )
+        return lines
+
+
+@dataclass
+class _Job:
+    index: int
+    item: Any
+    state: Any = None
+    error: BaseException | None = None
+    error_traceback: str = ""
+    buffer: ReplayBuffer = field(default_factory=ReplayBuffer)
+
+
+class BuildPipeline:
+    """Run items through load -> populate -> write stages on three threads.
+
+    Example:
+        pipeline = BuildPipeline(load_tournament, populate_tournament, write_tournament)
+        results = pipeline.run(rows, on_finished=record)
+        for line in pipeline.timings.report():
+            logger.info(line)
+    """
+
+    def __init__(
+        self,
+        load: Callable[[Any], Any],
+        populate: Callable[[Any], Any],
+        write: Callable[[Any], Any],
+        depth: int = 2,
+    ):
+        """Set up the stages.
+
+        Args:
+            load: Called with each item; its return value is passed to populate
+            populate: Called with load's result; its return value is passed to write
+            write: Called with populate's result; returns the item's result
+            depth: Largest number of items waiting between two stages
+        """
+        self._stages = dict(zip(PIPELINE_STAGES, (load, populate, write)))
+        self.depth = max(1, depth)
+        self.timings = StageTimings()
+        self._lock = threading.Lock()
+        self._failed_index: float = math.inf
+
+    def _fail(self, index: float) -> None:
+        """Stop work on every item after `index` (an earlier failure wins)."""
+        with self._lock:
+            self._failed_index = min(self._failed_index, index)
+
+    def _timed(self, kind: dict[str, float], stage: str, call: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            kind[stage] += time.perf_counter() - start
+
+    def _work(self, stage: str, job: _Job, capture: _ThreadCapture) -> None:
+        """Run one stage on a job, recording its output, time and any exception."""
+        capture.set_buffer(job.buffer)
+        start = time.perf_counter()
+        try:
+            job.state = self._stages[stage](job.item if stage == PIPELINE_STAGES[0] else job.state)
+        except BaseException as e:
+            job.error = e
+            job.error_traceback = traceback.format_exc()
+            self._fail(job.index)
+        finally:
+            self.timings.busy[stage] += time.perf_counter() - start
+            capture.set_buffer(None)
+
+    def _load_stage(self, items, target: queue.Queue, capture: _ThreadCapture) -> None:
+        stage = PIPELINE_STAGES[0]
+        for index, item in enumerate(items):
+            if index > self._failed_index:
+                break
+            job = _Job(index, item)
+            self._work(stage, job, capture)
+            self._timed(self.timings.waiting, stage, lambda: target.put(job))
+        target.put(None)
+
+    def _stage(self, stage: str, source: queue.Queue, target: queue.Queue, capture: _ThreadCapture) -> None:
+        """Work on jobs from the previous stage until it is done.
+
+        Jobs that failed upstream are passed on untouched; jobs after a failed
+        one are dropped, so the run stops where a serial run would have.
+        """
+        while True:
+            job = self._timed(self.timings.waiting, stage, source.get)
+            if job is None:
+                break
+            if job.index > self._failed_index:
+                continue
+            if job.error is None:
+                self._work(stage, job, capture)
+            self._timed(self.timings.waiting, stage, lambda: target.put(job))
+        target.put(None)
+
+    def run(self, items, on_finished: Callable[[int, Any, Any], None] | None = None) -> list:
+        """Build every item.
+
+        Args:
+            items: Iterable of items, each passed to the load stage
+            on_finished: Called in this thread with (index, item, result) after
+                each item is written and its output replayed, in item order
+
+        Returns:
+            The write stage's result for each item, in order
+
+        Raises:
+            The first exception raised by a stage, after the output of every
+            item before it (and of the failed item) has been replayed
+        """
+        loaded, populated = queue.Queue(maxsize=self.depth), queue.Queue(maxsize=self.depth)
+        written = queue.Queue()
+        results = []
+        failed = None
+        start = time.perf_counter()
+        with _ThreadCapture() as capture:
+            threads = [
+                threading.Thread(target=self._load_stage, args=(items, loaded, capture)),
+                threading.Thread(target=self._stage, args=(PIPELINE_STAGES[1], loaded, populated, capture)),
+                threading.Thread(target=self._stage, args=(PIPELINE_STAGES[2], populated, written, capture)),
+            ]
+            for stage, thread in zip(PIPELINE_STAGES, threads):
+                thread.name = f"pipeline-{stage}"
+                thread.daemon = True
+                thread.start()
+
+            try:
+                while (job := written.get()) is not None:
+                    replay_events(job.buffer.events)
+                    if job.error is not None:
+                        failed = job
+                        continue
+                    results.append(job.state)
+                    self.timings.items += 1
+                    if on_finished is not None:
+                        on_finished(job.index, job.item, job.state)
+            except BaseException:
+                # Stop the stages and let them drain before giving up
+                self._fail(-1)
+                while written.get() is not None:
+                    pass
+                raise
+            finally:
+                for thread in threads:
+                    thread.join()
+        self.timings.wall = time.perf_counter() - start
+
+        if failed is not None:
+            if isinstance(failed.error, SystemExit):
+                input()  # print_error's "Press enter to quit..." prompt was replayed above
+            else:
+                logger.debug(f"Pipeline traceback:\n{failed.error_traceback}")
+            raise failed.error
+        return results
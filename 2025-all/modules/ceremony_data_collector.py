@@ -1,19 +1,83 @@
 """Collects data from OJS files for ceremony script generation."""
 
+import os
 import logging
-from typing import List, Tuple, Dict
-from openpyxl import load_workbook
+from typing import Any, List, Optional, Tuple, Dict
 from dataclasses import dataclass
+import pandas as pd
 
 from .constants import (
-    SHEET_RESULTS, TABLE_TOURNAMENT_DATA,
-    SHEET_TEAM_INFO, TABLE_TEAM_LIST,
+    TABLE_TOURNAMENT_DATA, TABLE_TEAM_LIST,
     COL_TEAM_NUMBER, COL_TEAM_NAME
 )
+from .ojs_snapshot import OJSSnapshot
 
 logger = logging.getLogger("ceremony_generator")
 
 
+def _find_column(df: pd.DataFrame, *names: str) -> Optional[str]:
+    """Return the first of `names` that is a column of df, or None."""
+    for name in names:
+        if name in df.columns:
+            return name
+    return None
+
+
+def _table_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Rows of a table as dicts, with blank cells as None (like empty worksheet cells)."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+@dataclass
+class AwardIndex:
+    """The teams given each award label in one OJS file."""
+    teams: Dict[str, List[Tuple[int, str]]]
+    duplicates: List[str]  # Warnings for labels given to more than one team
+
+
+def index_awards(df: pd.DataFrame, ojs_path: str) -> Optional[AwardIndex]:
+    """Index the Award column of a TournamentData table in one pass.
+    
+    Args:
+        df: The TournamentData table (empty with no columns if it is missing)
+        ojs_path: Path of the OJS file it was read from (for messages)
+        
+    Returns:
+        AwardIndex with award label -> [(team_number, team_name)] in table
+        order, or None if the table or its columns are missing
+    """
+    if df.columns.empty:
+        logger.error(f"Table {TABLE_TOURNAMENT_DATA} not found in {ojs_path}")
+        return None
+    
+    team_num_col = _find_column(df, COL_TEAM_NUMBER, "Team Number")
+    team_name_col = _find_column(df, COL_TEAM_NAME)
+    award_col = _find_column(df, "Award")
+    
+    if team_num_col is None or team_name_col is None or award_col is None:
+        logger.error(f"Required columns not found in {TABLE_TOURNAMENT_DATA}")
+        return None
+    
+    teams: Dict[str, List[Tuple[int, str]]] = {}
+    for label, team_num, team_name in zip(
+        df[award_col].astype(object), df[team_num_col].astype(object), df[team_name_col].astype(object)
+    ):
+        if pd.isna(label) or pd.isna(team_num) or pd.isna(team_name) or not team_num or not team_name:
+            continue
+        teams.setdefault(label, []).append((int(team_num), str(team_name)))
+    
+    duplicates = []
+    for label, label_teams in teams.items():
+        if len(label_teams) > 1:
+            team_list = ", ".join(f"Team {team_num}" for team_num, _ in label_teams)
+            duplicates.append(
+                f"{os.path.basename(ojs_path)}: '{label}' assigned to {len(label_teams)} teams ({team_list})"
+            )
+    
+    logger.debug(f"Indexed {sum(len(t) for t in teams.values())} awards from {ojs_path}")
+    return AwardIndex(teams, duplicates)
+
+
 @dataclass
 class AwardWinner:
     """Represents an award winner."""
@@ -66,21 +130,80 @@ class HighlightTracker:
 class CeremonyDataCollector:
     """Collects award and team data from OJS files for ceremony script."""
     
-    def __init__(self, config: dict, dual_emcee: bool = False):
+    def __init__(
+        self,
+        config: dict,
+        dual_emcee: bool = False,
+        snapshots: Optional[Dict[str, OJSSnapshot]] = None,
+        award_indexes: Optional[Dict[str, Optional[AwardIndex]]] = None,
+    ):
         """Initialize data collector.
         
         Args:
             config: Tournament configuration dictionary
             dual_emcee: Whether to enable dual emcee highlighting
+            snapshots: OJS files already read, by path (others are read on first use)
+            award_indexes: index_awards() results already built, by path
         """
         self.config = config
         self.warnings = []
+        self._snapshots: Dict[str, OJSSnapshot] = dict(snapshots or {})
+        self._award_indexes: Dict[str, Optional[AwardIndex]] = dict(award_indexes or {})
+        self._reported_indexes: set = set()
         
         # Initialize highlight tracker
         self.highlight_tracker = HighlightTracker(enabled=dual_emcee)
         
         logger.debug(f"Highlight tracker initialized (enabled={dual_emcee})")
     
+    def _ojs_tables(self, ojs_path: str) -> Dict[str, pd.DataFrame]:
+        """The team list and tournament data tables of an OJS file.
+        
+        Come from the file's OJSSnapshot, so the collect_* calls for one OJS
+        file (and the validation before them) share a single read.
+        
+        Args:
+            ojs_path: Path to OJS file
+            
+        Returns:
+            Dict mapping table name -> DataFrame (empty with no columns if the table is missing)
+        """
+        if ojs_path not in self._snapshots:
+            self._snapshots[ojs_path] = OJSSnapshot(ojs_path)
+        snapshot = self._snapshots[ojs_path]
+        tables = {}
+        for table_name in (TABLE_TEAM_LIST, TABLE_TOURNAMENT_DATA):
+            df = snapshot.get(table_name)
+            tables[table_name] = df if df is not None else pd.DataFrame()
+        return tables
+    
+    def _award_index(self, ojs_path: str) -> Optional[Dict[str, List[Tuple[int, str]]]]:
+        """The teams given each award label in an OJS file.
+        
+        Indexed (see index_awards) the first time an award is collected from
+        the file, unless fll-toast passed the index in, then reused for every
+        other award and label. Labels given to more than one team are added
+        to self.warnings on first use.
+        
+        Args:
+            ojs_path: Path to OJS file
+            
+        Returns:
+            Dict mapping award label -> [(team_number, team_name)] in table
+            order, or None if the table or its columns are missing
+        """
+        if ojs_path not in self._award_indexes:
+            self._award_indexes[ojs_path] = index_awards(
+                self._ojs_tables(ojs_path)[TABLE_TOURNAMENT_DATA], ojs_path
+            )
+        index = self._award_indexes[ojs_path]
+        if index is None:
+            return None
+        if ojs_path not in self._reported_indexes:
+            self._reported_indexes.add(ojs_path)
+            self.warnings.extend(index.duplicates)
+        return index.teams
+    
     def collect_team_list(self, ojs_path: str, division: str = "") -> List[Tuple[int, str]]:
         """Collect list of teams from OJS file.
         
@@ -96,44 +219,22 @@ class CeremonyDataCollector:
         teams = []
         
         try:
-            wb = load_workbook(ojs_path, data_only=True)
-            ws = wb[SHEET_TEAM_INFO]
-            
-            # Find the table
-            table = ws.tables.get(TABLE_TEAM_LIST)
-            if not table:
+            df = self._ojs_tables(ojs_path)[TABLE_TEAM_LIST]
+            if df.columns.empty:
                 logger.error(f"Table {TABLE_TEAM_LIST} not found in {ojs_path}")
                 return teams
             
-            # Get table range
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-            
-            # Read header row to find column indices
-            header_row = min_row
-            team_num_col = None
-            team_name_col = None
-            
-            for col_idx in range(min_col, max_col + 1):
-                header_val = ws.cell(row=header_row, column=col_idx).value
-                if header_val == COL_TEAM_NUMBER:
-                    team_num_col = col_idx
-                elif header_val == COL_TEAM_NAME:
-                    team_name_col = col_idx
-            
-            if team_num_col is None or team_name_col is None:
+            if COL_TEAM_NUMBER not in df.columns or COL_TEAM_NAME not in df.columns:
                 logger.error(f"Required columns not found in {TABLE_TEAM_LIST}")
                 return teams
             
-            # Read data rows
-            for row_idx in range(min_row + 1, max_row + 1):
-                team_num = ws.cell(row=row_idx, column=team_num_col).value
-                team_name = ws.cell(row=row_idx, column=team_name_col).value
+            for row in _table_records(df):
+                team_num = row[COL_TEAM_NUMBER]
+                team_name = row[COL_TEAM_NAME]
                 
                 if team_num and team_name:
                     teams.append((int(team_num), str(team_name)))
             
-            wb.close()
             logger.info(f"Collected {len(teams)} teams from {division if division else 'tournament'}")
             
         except Exception as e:
@@ -158,50 +259,27 @@ class CeremonyDataCollector:
         advancing = []
         
         try:
-            wb = load_workbook(ojs_path, data_only=True)
-            ws = wb[SHEET_RESULTS]
-            
-            # Find the table
-            table = ws.tables.get(TABLE_TOURNAMENT_DATA)
-            if not table:
+            df = self._ojs_tables(ojs_path)[TABLE_TOURNAMENT_DATA]
+            if df.columns.empty:
                 logger.error(f"Table {TABLE_TOURNAMENT_DATA} not found in {ojs_path}")
                 return advancing
             
-            # Get table range
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-            
-            # Read header row to find column indices
-            header_row = min_row
-            team_num_col = None
-            team_name_col = None
-            advance_col = None
-            
-            for col_idx in range(min_col, max_col + 1):
-                header_val = ws.cell(row=header_row, column=col_idx).value
-                if header_val == COL_TEAM_NUMBER or header_val == "Team Number":
-                    team_num_col = col_idx
-                elif header_val == COL_TEAM_NAME:
-                    team_name_col = col_idx
-                elif header_val == "Advance?":
-                    advance_col = col_idx
+            team_num_col = _find_column(df, COL_TEAM_NUMBER, "Team Number")
+            team_name_col = _find_column(df, COL_TEAM_NAME)
+            advance_col = _find_column(df, "Advance?")
             
             if team_num_col is None or team_name_col is None or advance_col is None:
                 logger.error(f"Required columns not found in {TABLE_TOURNAMENT_DATA}")
                 return advancing
             
-            # Read data rows
-            for row_idx in range(min_row + 1, max_row + 1):
-                advance_val = ws.cell(row=row_idx, column=advance_col).value
-                
-                if advance_val == "Yes":
-                    team_num = ws.cell(row=row_idx, column=team_num_col).value
-                    team_name = ws.cell(row=row_idx, column=team_name_col).value
+            for row in _table_records(df):
+                if row[advance_col] == "Yes":
+                    team_num = row[team_num_col]
+                    team_name = row[team_name_col]
                     
                     if team_num and team_name:
                         advancing.append((int(team_num), str(team_name)))
             
-            wb.close()
             logger.info(f"Collected {len(advancing)} advancing teams from {division if division else 'tournament'}")
             
         except Exception as e:
@@ -227,69 +305,41 @@ class CeremonyDataCollector:
         winners = []
         
         try:
-            wb = load_workbook(ojs_path, data_only=True)
-            ws = wb[SHEET_RESULTS]
-            
-            # Find the table
-            table = ws.tables.get(TABLE_TOURNAMENT_DATA)
-            if not table:
+            df = self._ojs_tables(ojs_path)[TABLE_TOURNAMENT_DATA]
+            if df.columns.empty:
                 logger.error(f"Table {TABLE_TOURNAMENT_DATA} not found in {ojs_path}")
                 return winners
             
-            # Get table range
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-            
-            # Read header row
-            header_row = min_row
-            team_num_col = None
-            team_name_col = None
-            rg_rank_col = None
-            rg_score_col = None
-            
-            # Read all headers for debugging
-            all_headers = []
-            for col_idx in range(min_col, max_col + 1):
-                header_val = ws.cell(row=header_row, column=col_idx).value
-                all_headers.append(header_val)
-                if header_val == COL_TEAM_NUMBER or header_val == "Team Number":
-                    team_num_col = col_idx
-                elif header_val == COL_TEAM_NAME:
-                    team_name_col = col_idx
-                elif header_val == "Robot Game Rank":
-                    rg_rank_col = col_idx
-                elif header_val == "Max Robot Game Score":
-                    rg_score_col = col_idx
-            
-            logger.debug(f"Table columns: {all_headers}")
+            team_num_col = _find_column(df, COL_TEAM_NUMBER, "Team Number")
+            team_name_col = _find_column(df, COL_TEAM_NAME)
+            rg_rank_col = _find_column(df, "Robot Game Rank")
+            rg_score_col = _find_column(df, "Max Robot Game Score")
+            
+            logger.debug(f"Table columns: {list(df.columns)}")
             logger.debug(f"Found columns - Team#: {team_num_col}, Name: {team_name_col}, RG Rank: {rg_rank_col}, RG Score: {rg_score_col}")
             
             # Validate that all required columns were found
             if team_num_col is None:
                 logger.error(f"Column '{COL_TEAM_NUMBER}' or 'Team Number' not found in {TABLE_TOURNAMENT_DATA}")
-                wb.close()
                 return winners
             if team_name_col is None:
                 logger.error(f"Column '{COL_TEAM_NAME}' not found in {TABLE_TOURNAMENT_DATA}")
-                wb.close()
                 return winners
             if rg_rank_col is None:
                 logger.error(f"Column 'Robot Game Rank' not found in {TABLE_TOURNAMENT_DATA}")
-                wb.close()
                 return winners
             if rg_score_col is None:
                 logger.error(f"Column 'Max Robot Game Score' not found in {TABLE_TOURNAMENT_DATA}")
-                wb.close()
                 return winners
             
             # Collect teams with ranks 1 through count
-            for row_idx in range(min_row + 1, max_row + 1):
-                rank = ws.cell(row=row_idx, column=rg_rank_col).value
+            for row in _table_records(df):
+                rank = row[rg_rank_col]
                 
                 if rank and 1 <= int(rank) <= count:
-                    team_num = ws.cell(row=row_idx, column=team_num_col).value
-                    team_name = ws.cell(row=row_idx, column=team_name_col).value
-                    score = ws.cell(row=row_idx, column=rg_score_col).value
+                    team_num = row[team_num_col]
+                    team_name = row[team_name_col]
+                    score = row[rg_score_col]
                     
                     # Determine label based on rank
                     rank_labels = {1: "1st Place", 2: "2nd Place", 3: "3rd Place"}
@@ -303,7 +353,6 @@ class CeremonyDataCollector:
                             score=int(score) if score else None
                         ))
             
-            wb.close()
             logger.info(f"Collected {len(winners)} robot game winners")
             
         except Exception as e:
@@ -327,7 +376,6 @@ class CeremonyDataCollector:
         Returns:
             List of AwardWinner objects
         """
-        award_id = award['ID']
         award_name = award['Name']
         
         logger.info(f"Collecting {award_name} from {ojs_path}")
@@ -335,59 +383,22 @@ class CeremonyDataCollector:
         winners = []
         
         try:
-            wb = load_workbook(ojs_path, data_only=True)
-            ws = wb[SHEET_RESULTS]
-            
-            # Find the table
-            table = ws.tables.get(TABLE_TOURNAMENT_DATA)
-            if not table:
-                logger.error(f"Table {TABLE_TOURNAMENT_DATA} not found in {ojs_path}")
+            index = self._award_index(ojs_path)
+            if index is None:
                 return winners
             
-            # Get table range
-            from openpyxl.utils import range_boundaries
-            min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-            
-            # Read header row
-            header_row = min_row
-            team_num_col = None
-            team_name_col = None
-            award_col = None
-            
-            for col_idx in range(min_col, max_col + 1):
-                header_val = ws.cell(row=header_row, column=col_idx).value
-                if header_val == COL_TEAM_NUMBER or header_val == "Team Number":
-                    team_num_col = col_idx
-                elif header_val == COL_TEAM_NAME:
-                    team_name_col = col_idx
-                elif header_val == "Award":
-                    award_col = col_idx
-            
-            # Collect teams with matching awards
+            # The first team given each label wins it (duplicates were reported
+            # when the index was built)
             for label in labels:
-                found = False
-                for row_idx in range(min_row + 1, max_row + 1):
-                    award_val = ws.cell(row=row_idx, column=award_col).value
-                    
-                    if award_val == label:
-                        team_num = ws.cell(row=row_idx, column=team_num_col).value
-                        team_name = ws.cell(row=row_idx, column=team_name_col).value
-                        
-                        if team_num and team_name:
-                            winners.append(AwardWinner(
-                                team_number=int(team_num),
-                                team_name=str(team_name),
-                                label=label
-                            ))
-                            found = True
-                            break
-                
-                if not found and division:  # Only warn for division awards
+                teams = index.get(label)
+                if teams:
+                    team_num, team_name = teams[0]
+                    winners.append(AwardWinner(team_number=team_num, team_name=team_name, label=label))
+                elif division:  # Only warn for division awards
                     self.warnings.append(
                         f"{ojs_filename}: {award_name} '{label}' not assigned"
                     )
             
-            wb.close()
             logger.info(f"Collected {len(winners)} winners for {award_name}")
             
         except Exception as e:
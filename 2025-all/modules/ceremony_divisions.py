@@ -0,0 +1,278 @@
+"""Per-division OJS processing for fll-toast, one worker process per file.
+
+Everything fll-toast needs from an OJS file can be worked out without the
+other divisions' files: reading it (an OJSSnapshot), validating its scores
+and indexing its awards. prepare_divisions() does that for every file at
+once in a process pool and returns the results in file order. The log
+records of each worker are captured rather than written, so fll-toast can
+replay them where a one-at-a-time run would have logged them and the output
+reads the same whichever finished first.
+
+With a single file there is nothing to spread over processes. Instead,
+prepare_divisions(defer_validation=True) leaves validation out, and
+fll-toast runs validate_divisions() on a thread while it assembles the
+template data. Only that thread's log records are captured, and the
+collection's own output is held back with capture_output() and shown after
+the validation results, as it would be if the two ran one after the other.
+
+Each step is cached next to the OJS file (see modules/toast_cache.py): a
+step whose sheets are unchanged since the last run reuses its results and
+log records instead of running again.
+
+Example:
+    divisions = prepare_divisions([(path1, "Division 1"), (path2, "Division 2")], defer_validation=True)
+    validation = executor.submit(validate_divisions, divisions)
+    ...
+    validation.result()
+    for data in divisions:
+        replay_events(data.events)
+        validator.errors.extend(data.errors)
+"""
+
+import os
+import time
+import logging
+import warnings
+import threading
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .constants import TABLE_TOURNAMENT_DATA, SHEET_RESULTS
+from .build_pipeline import ReplayBuffer
+from .ceremony_validator import OJSValidator, ValidationError
+from .ceremony_data_collector import AwardIndex, index_awards
+from .ojs_snapshot import OJSSnapshot
+from .score_rules import SCORE_RULES
+from .toast_cache import StepCache, toast_cache_path
+
+logger = logging.getLogger("ceremony_generator")
+
+
+@dataclass
+class DivisionData:
+    """What one OJS file contributes to the ceremony script.
+
+    Attributes:
+        ojs_path: Path to the OJS file
+        division: Division label for messages ("" without divisions)
+        snapshot: The file's tables and cells, or None if it could not be read
+        errors: Validation errors, in the order they were found
+        warnings: Validation warnings
+        award_index: The file's awards (None if its results table is unusable
+            or the file could not be read)
+        events: Log records captured while the file was processed
+        validated: Whether errors and warnings have been filled in yet
+        cache: The file's step cache, until the file has been validated
+    """
+    ojs_path: str
+    division: str
+    snapshot: OJSSnapshot | None = None
+    errors: list[ValidationError] = field(default_factory=list)
+    warnings: list[ValidationError] = field(default_factory=list)
+    award_index: AwardIndex | None = None
+    events: list = field(default_factory=list)
+    validated: bool = False
+    cache: StepCache | None = field(default=None, repr=False, compare=False)
+
+
+class _ThreadRecords(logging.Filter):
+    """Diverts the records one thread logs into a ReplayBuffer.
+
+    Records of other threads pass through to the logger's handlers as usual.
+    """
+
+    def __init__(self, buffer: ReplayBuffer):
+        super().__init__()
+        self.thread = threading.get_ident()
+        self.handler = QueueHandler(buffer)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.thread != self.thread:
+            return True
+        self.handler.handle(record)
+        return False
+
+
+@contextmanager
+def _capture_records(buffer: ReplayBuffer):
+    """Capture the calling thread's records on the logger instead of writing them."""
+    capture = _ThreadRecords(buffer)
+    logger.addFilter(capture)
+    try:
+        yield
+    finally:
+        logger.removeFilter(capture)
+
+
+@contextmanager
+def capture_output():
+    """Hold back the calling thread's console output and log records.
+
+    sys.stdout is redirected for the whole process, so this is only meant
+    for the main thread while other threads log without printing (as
+    validate_divisions() does). Replay the buffer's events with
+    replay_events() to show the output where it would have appeared.
+
+    Yields:
+        The ReplayBuffer the output is captured in
+    """
+    buffer = ReplayBuffer()
+    with redirect_stdout(buffer), _capture_records(buffer):
+        yield buffer
+
+
+def _cached_step(cache: StepCache | None, step: str, key, buffer: ReplayBuffer, run) -> tuple:
+    """Run a step, or reuse its results and log records from the cache.
+
+    Args:
+        cache: The file's StepCache (None disables caching)
+        step: Step name
+        key: What the step's results depend on (None: always run, never cache)
+        buffer: The records captured so far; the step's records are added
+        run: Runs the step and returns its results as a tuple
+
+    Returns:
+        The step's results
+    """
+    if cache is None or key is None:
+        return run()
+    # Records below the log level were never captured, so a run at a lower level runs the step again
+    key = (logger.getEffectiveLevel(), key)
+    cached = cache.lookup(step, key)
+    if cached is not None:
+        results, events = cached
+        now = time.time()
+        for record in events:
+            record.created, record.msecs = now, (now % 1) * 1000
+        buffer.events.extend(events)
+        return results
+    start = len(buffer.events)
+    results = run()
+    cache.store(step, key, (results, buffer.events[start:]))
+    return results
+
+
+def prepare_division(
+    ojs_path: str, division: str = "", use_cache: bool = True, validate: bool = True
+) -> DivisionData:
+    """Read, index and validate one OJS file, capturing its log records.
+
+    Args:
+        ojs_path: Path to the OJS file
+        division: Division label for messages
+        use_cache: Reuse the results of steps whose sheets are unchanged since
+            the last run, and record this run's for the next one
+        validate: If False, leave validation to validate_division()
+
+    Returns:
+        DivisionData for the file
+    """
+    data = DivisionData(ojs_path, division)
+    if use_cache and os.path.exists(ojs_path):
+        data.cache = StepCache(toast_cache_path(ojs_path), ojs_path)
+    buffer = ReplayBuffer()
+    with _capture_records(buffer):
+        try:
+            data.snapshot = OJSSnapshot(ojs_path, cache=data.cache)
+        except Exception as e:
+            logger.debug(f"Could not read {os.path.basename(ojs_path)}: {e}")
+
+        if data.snapshot is not None:
+            def index() -> tuple:
+                results = data.snapshot.get(TABLE_TOURNAMENT_DATA)
+                return (index_awards(results if results is not None else pd.DataFrame(), ojs_path),)
+
+            parts = data.snapshot.parts
+            key = parts.get(SHEET_RESULTS) if parts is not None else None
+            data.award_index, = _cached_step(data.cache, "award index", key, buffer, index)
+    data.events = buffer.events
+
+    if validate:
+        validate_division(data)
+    return data
+
+
+def validate_division(data: DivisionData) -> None:
+    """Validate a prepared file's scores, adding the results and log records to it.
+
+    Only the calling thread's log records are captured, so this can run on a
+    thread while the caller goes on logging. Saves the file's step cache.
+
+    Args:
+        data: DivisionData from prepare_division(validate=False)
+    """
+    def validate() -> tuple:
+        validator = OJSValidator()
+        validator.validate_all_sheets(data.ojs_path, data.division, data.snapshot)
+        return validator.errors, validator.warnings
+
+    # The messages name the division, and change with the rules
+    parts = data.snapshot.parts if data.snapshot is not None else None
+    sheets = [rule.sheet for rule in SCORE_RULES]
+    key = None
+    if parts is not None and all(sheet in parts for sheet in sheets):
+        key = (data.division, repr(SCORE_RULES), [parts[sheet] for sheet in sheets])
+
+    buffer = ReplayBuffer()
+    buffer.events = data.events
+    with _capture_records(buffer):
+        data.errors, data.warnings = _cached_step(data.cache, "validation", key, buffer, validate)
+        if data.cache is not None:
+            data.cache.save()
+    data.validated, data.cache = True, None
+
+
+def validate_divisions(divisions: list[DivisionData]) -> None:
+    """Validate, in order, the files prepare_divisions() left unvalidated."""
+    for data in divisions:
+        if not data.validated:
+            validate_division(data)
+
+
+def _init_division_worker(log_level: int) -> None:
+    """Process pool initializer: match the parent's log level."""
+    logger.setLevel(log_level)
+    warnings.simplefilter(action="ignore", category=UserWarning)
+
+
+def prepare_divisions(
+    files: list[tuple[str, str]],
+    jobs: int | None = None,
+    use_cache: bool = True,
+    defer_validation: bool = False,
+) -> list[DivisionData]:
+    """Prepare several OJS files concurrently.
+
+    Args:
+        files: (ojs_path, division) pairs
+        jobs: Worker processes to use (default: one per file, up to the CPU
+            count); with one, the files are prepared in this process
+        use_cache: Passed on to prepare_division
+        defer_validation: When the files are prepared in this process, leave
+            their validation to validate_divisions(), so the caller can run
+            it alongside other work (worker processes always validate)
+
+    Returns:
+        DivisionData per file, in the order given
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return [
+            prepare_division(ojs_path, division, use_cache, validate=not defer_validation)
+            for ojs_path, division in files
+        ]
+
+    logger.info(f"Preparing {len(files)} OJS files with {workers} worker processes")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_division_worker,
+        initargs=(logger.getEffectiveLevel(),),
+    ) as executor:
+        futures = [
+            executor.submit(prepare_division, ojs_path, division, use_cache) for ojs_path, division in files
+        ]
+        return [future.result() for future in futures]
@@ -1,27 +1,43 @@
 """Validation logic for OJS spreadsheets in closing ceremony script generation."""
 
 import logging
+from itertools import groupby
 import pandas as pd
-from openpyxl.workbook import Workbook
-from typing import List, Tuple
+from typing import Dict, List, Optional
 
-from .constants import (
-    SHEET_ROBOT_GAME, SHEET_INNOVATION, SHEET_ROBOT_DESIGN, SHEET_CORE_VALUES,
-    TABLE_ROBOT_GAME, TABLE_INNOVATION, TABLE_ROBOT_DESIGN, TABLE_CORE_VALUES,
-    COL_TEAM_NUMBER
-)
+from .constants import TABLE_ROBOT_GAME, TABLE_CORE_VALUES
 from .excel_operations import read_table_as_df
+from .ojs_snapshot import OJSSnapshot
+from .score_rules import (
+    SCORE_RULES, ScoreRule, CellIssue, check_rules,
+    PROBLEM_MISSING_TABLE, PROBLEM_MISSING_COLUMN, PROBLEM_BLANK,
+)
 
 logger = logging.getLogger("ceremony_generator")
 
+# Cells listed in an error message before the rest are counted ("and 3 more")
+MAX_LISTED_CELLS = 5
+
+
+def _cell_list(cells: List[CellIssue]) -> str:
+    """Where the cells of an issue are, e.g. "row 5 (Team 1234), row 9 (Team 1240)"."""
+    listed = [
+        f"row {cell.row} (Team {cell.team_number})" if cell.team_number is not None else f"row {cell.row}"
+        for cell in cells[:MAX_LISTED_CELLS]
+    ]
+    if len(cells) > MAX_LISTED_CELLS:
+        listed.append(f"and {len(cells) - MAX_LISTED_CELLS} more")
+    return ", ".join(listed)
+
 
 class ValidationError:
     """Represents a validation error with context."""
     
-    def __init__(self, severity: str, sheet: str, message: str):
+    def __init__(self, severity: str, sheet: str, message: str, cells: Optional[List[CellIssue]] = None):
         self.severity = severity  # "ERROR" or "WARNING"
         self.sheet = sheet
         self.message = message
+        self.cells = cells or []  # The cells it was found in (row, team #, column)
     
     def __str__(self):
         return f"[{self.severity}] {self.sheet}: {self.message}"
@@ -34,15 +50,15 @@ class OJSValidator:
         self.errors: List[ValidationError] = []
         self.warnings: List[ValidationError] = []
     
-    def add_error(self, sheet: str, message: str):
+    def add_error(self, sheet: str, message: str, cells: Optional[List[CellIssue]] = None):
         """Add a validation error."""
-        error = ValidationError("ERROR", sheet, message)
+        error = ValidationError("ERROR", sheet, message, cells)
         self.errors.append(error)
         logger.error(str(error))
     
-    def add_warning(self, sheet: str, message: str):
+    def add_warning(self, sheet: str, message: str, cells: Optional[List[CellIssue]] = None):
         """Add a validation warning."""
-        warning = ValidationError("WARNING", sheet, message)
+        warning = ValidationError("WARNING", sheet, message, cells)
         self.warnings.append(warning)
         logger.warning(str(warning))
     
@@ -50,46 +66,79 @@ class OJSValidator:
         """Check if there are any errors."""
         return len(self.errors) > 0
     
-    def validate_robot_game_scores(self, ojs_path: str, division: str = "") -> bool:
-        """Validate Robot Game scores are within valid range and no blanks.
+    def add_issues(self, issues: List[CellIssue], rules: List[ScoreRule]):
+        """Report the issues check_rules() found, one error or warning per column and problem.
+        
+        Args:
+            issues: Issues returned by check_rules()
+            rules: The rules that were checked (for the valid scores of each table)
+        """
+        rules_by_table = {rule.table: rule for rule in rules}
+        for (sheet, table, column, problem, severity), group in groupby(
+            issues, key=lambda issue: (issue.sheet, issue.table, issue.column, issue.problem, issue.severity)
+        ):
+            cells = list(group)
+            if problem == PROBLEM_MISSING_TABLE:
+                message = f"Missing table: {table}"
+            elif problem == PROBLEM_MISSING_COLUMN:
+                message = f"Missing column: {column}"
+            elif problem == PROBLEM_BLANK:
+                message = f"{column} has {len(cells)} blank cell(s) at {_cell_list(cells)}"
+            else:
+                message = f"{column} has {rules_by_table[table].describe_invalid(len(cells))} at {_cell_list(cells)}"
+            if severity == "WARNING":
+                self.add_warning(sheet, message, cells)
+            else:
+                self.add_error(sheet, message, cells)
+    
+    def validate_tables(
+        self,
+        ojs_path: str,
+        rules: List[ScoreRule],
+        division: str = "",
+        tables: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> bool:
+        """Check tables of an OJS workbook against score rules.
         
         Args:
             ojs_path: Path to OJS workbook
+            rules: Rules to check (see modules/score_rules.py)
             division: Division label for error messages
+            tables: Tables already read from the workbook, by name (others are read from ojs_path)
             
         Returns:
             True if validation passed, False otherwise
         """
-        logger.info(f"Validating Robot Game scores{' for ' + division if division else ''}")
-        
-        try:
-            df = read_table_as_df(ojs_path, SHEET_ROBOT_GAME, TABLE_ROBOT_GAME)
-        except Exception as e:
-            self.add_error(SHEET_ROBOT_GAME, f"Could not read table: {e}")
-            return False
-        
-        score_columns = ["Robot Game 1 Score", "Robot Game 2 Score", "Robot Game 3 Score"]
+        tables = dict(tables or {})
+        readable = []
+        for rule in rules:
+            logger.info(f"Validating {rule.sheet} scores{' for ' + division if division else ''}")
+            if rule.table not in tables:
+                try:
+                    tables[rule.table] = read_table_as_df(ojs_path, rule.sheet, rule.table)
+                except Exception as e:
+                    self.add_error(rule.sheet, f"Could not read table: {e}")
+                    continue
+            readable.append(rule)
+        
+        self.add_issues(check_rules(tables, readable), readable)
+        return not self.has_errors()
+    
+    def validate_robot_game_scores(
+        self, ojs_path: str, division: str = "", df: Optional[pd.DataFrame] = None
+    ) -> bool:
+        """Validate Robot Game scores are within valid range and no blanks.
         
-        for col in score_columns:
-            if col not in df.columns:
-                self.add_error(SHEET_ROBOT_GAME, f"Missing column: {col}")
-                continue
-            
-            # Check for blanks
-            blank_count = df[col].isna().sum()
-            if blank_count > 0:
-                self.add_error(SHEET_ROBOT_GAME, f"{col} has {blank_count} blank cell(s)")
+        Args:
+            ojs_path: Path to OJS workbook
+            division: Division label for error messages
+            df: Table already read from the workbook (read from ojs_path if None)
             
-            # Check range (0-545)
-            valid_scores = df[col].dropna()
-            out_of_range = valid_scores[(valid_scores < 0) | (valid_scores > 545)]
-            if len(out_of_range) > 0:
-                self.add_error(
-                    SHEET_ROBOT_GAME,
-                    f"{col} has {len(out_of_range)} score(s) outside valid range (0-545)"
-                )
-        
-        return not self.has_errors()
+        Returns:
+            True if validation passed, False otherwise
+        """
+        rules = [rule for rule in SCORE_RULES if rule.table == TABLE_ROBOT_GAME]
+        return self.validate_tables(ojs_path, rules, division, None if df is None else {TABLE_ROBOT_GAME: df})
     
     def validate_rubric_scores(
         self, 
@@ -97,7 +146,8 @@ class OJSValidator:
         sheet_name: str, 
         table_name: str,
         columns: List[str],
-        division: str = ""
+        division: str = "",
+        df: Optional[pd.DataFrame] = None
     ) -> bool:
         """Validate rubric scores are 0-5 and no blanks.
         
@@ -107,124 +157,58 @@ class OJSValidator:
             table_name: Name of table
             columns: List of column names to validate
             division: Division label for error messages
+            df: Table already read from the workbook (read from ojs_path if None)
             
         Returns:
             True if validation passed, False otherwise
         """
-        logger.info(f"Validating {sheet_name} scores{' for ' + division if division else ''}")
-        
-        try:
-            df = read_table_as_df(ojs_path, sheet_name, table_name)
-        except Exception as e:
-            self.add_error(sheet_name, f"Could not read table: {e}")
-            return False
-        
-        for col in columns:
-            if col not in df.columns:
-                self.add_error(sheet_name, f"Missing column: {col}")
-                continue
-            
-            # Check for blanks
-            blank_count = df[col].isna().sum()
-            if blank_count > 0:
-                self.add_error(sheet_name, f"{col} has {blank_count} blank cell(s)")
-            
-            # Check range (0-5)
-            valid_scores = df[col].dropna()
-            out_of_range = valid_scores[(valid_scores < 0) | (valid_scores > 5)]
-            if len(out_of_range) > 0:
-                self.add_error(
-                    sheet_name,
-                    f"{col} has {len(out_of_range)} score(s) outside valid range (0-5)"
-                )
-        
-        return not self.has_errors()
+        rule = ScoreRule(sheet_name, table_name, tuple(columns), minimum=0, maximum=5)
+        return self.validate_tables(ojs_path, [rule], division, None if df is None else {table_name: df})
     
-    def validate_core_values_scores(self, ojs_path: str, division: str = "") -> bool:
+    def validate_core_values_scores(
+        self, ojs_path: str, division: str = "", df: Optional[pd.DataFrame] = None
+    ) -> bool:
         """Validate Core Values scores are in [0, 2, 3, 4] and no blanks.
         
         Args:
             ojs_path: Path to OJS workbook
             division: Division label for error messages
+            df: Table already read from the workbook (read from ojs_path if None)
             
         Returns:
             True if validation passed, False otherwise
         """
-        logger.info(f"Validating Core Values scores{' for ' + division if division else ''}")
-        
-        try:
-            df = read_table_as_df(ojs_path, SHEET_CORE_VALUES, TABLE_CORE_VALUES)
-        except Exception as e:
-            self.add_error(SHEET_CORE_VALUES, f"Could not read table: {e}")
-            return False
-        
-        cv_columns = [
-            "Gracious Professionalism 1",
-            "Gracious Professionalism 2",
-            "Gracious Professionalism 3"
-        ]
-        
-        valid_values = {0, 2, 3, 4}
-        
-        for col in cv_columns:
-            if col not in df.columns:
-                self.add_error(SHEET_CORE_VALUES, f"Missing column: {col}")
-                continue
-            
-            # Check for blanks
-            blank_count = df[col].isna().sum()
-            if blank_count > 0:
-                self.add_error(SHEET_CORE_VALUES, f"{col} has {blank_count} blank cell(s)")
-            
-            # Check valid values
-            scores = df[col].dropna()
-            invalid = scores[~scores.isin(valid_values)]
-            if len(invalid) > 0:
-                self.add_error(
-                    SHEET_CORE_VALUES,
-                    f"{col} has {len(invalid)} invalid score(s). Must be one of: {sorted(valid_values)}"
-                )
-        
-        return not self.has_errors()
+        rules = [rule for rule in SCORE_RULES if rule.table == TABLE_CORE_VALUES]
+        return self.validate_tables(ojs_path, rules, division, None if df is None else {TABLE_CORE_VALUES: df})
     
-    def validate_all_sheets(self, ojs_path: str, division: str = "") -> bool:
+    def validate_all_sheets(
+        self, ojs_path: str, division: str = "", snapshot: Optional[OJSSnapshot] = None
+    ) -> bool:
         """Run all validations on an OJS workbook.
         
         Args:
             ojs_path: Path to OJS workbook
             division: Division label for error messages
+            snapshot: The workbook already read by fll-toast (read from ojs_path if None)
             
         Returns:
             True if all validations passed, False otherwise
         """
         logger.info(f"Starting complete validation{' for ' + division if division else ''}")
         
-        # Robot Game
-        self.validate_robot_game_scores(ojs_path, division)
-        
-        # Innovation Project
-        ip_columns = [
-            "Identify - Define", "Identify - Research (CV)", "Design - Plan",
-            "Design - Teamwork (CV)", "Create - Innovation (CV)", "Create - Model",
-            "Iterate - Sharing", "Iterate - Improvement", "Communicate - Impact (CV)",
-            "Communicate - Fun (CV)"
-        ]
-        self.validate_rubric_scores(
-            ojs_path, SHEET_INNOVATION, TABLE_INNOVATION, ip_columns, division
-        )
-        
-        # Robot Design
-        rd_columns = [
-            "Identify - Strategy", "Identify - Research (CV)", "Design - Ideas (CV)",
-            "Design - Building/Coding", "Create - Attachments", "Create - Code/ Sensors",
-            "Iterate - Testing", "Iterate - Improvements (CV)", "Communicate - Impact (CV)",
-            "Communicate - Fun (CV)"
-        ]
-        self.validate_rubric_scores(
-            ojs_path, SHEET_ROBOT_DESIGN, TABLE_ROBOT_DESIGN, rd_columns, division
-        )
-        
-        # Core Values
-        self.validate_core_values_scores(ojs_path, division)
-        
-        return not self.has_errors()
+        # All score tables come from one read of the workbook and are checked
+        # together. A table the snapshot could not read is read again on its
+        # own, which reports the problem for its sheet.
+        tables: Dict[str, pd.DataFrame] = {}
+        if snapshot is None:
+            try:
+                snapshot = OJSSnapshot(ojs_path)
+            except Exception as e:
+                logger.debug(f"Could not read score tables together: {e}")
+        if snapshot is not None:
+            for rule in SCORE_RULES:
+                df = snapshot.get(rule.table)
+                if df is not None:
+                    tables[rule.table] = df
+        
+        return self.validate_tables(ojs_path, SCORE_RULES, division, tables)
@@ -0,0 +1,136 @@
+"""Notice OJS saves for fll-toast --watch and report changed award winners.
+
+On tournament day the OJS files are saved over and over. OJSWatcher polls
+their size and modification time; a file counts as saved once it has
+stopped changing for WATCH_SETTLE_SECONDS and is a complete zip again, so
+fll-toast never reads a workbook Excel is still writing. Excel's "~$" owner
+files are never watched.
+
+Example:
+    watcher = OJSWatcher(ojs_paths)
+    while True:
+        changed = watcher.wait()
+        ...
+        for line in winner_changes(last_winners, award_winners):
+            print(line)
+"""
+
+import os
+import time
+import logging
+import zipfile
+from collections import Counter
+from typing import Callable
+
+from .constants import WATCH_POLL_SECONDS, WATCH_SETTLE_SECONDS, EXCEL_LOCK_FILE_PREFIX
+from .ceremony_data_collector import AwardWinner
+
+logger = logging.getLogger("ceremony_generator")
+
+
+def is_lock_file(path: str) -> bool:
+    """Whether a path is one of Excel's "~$" owner files."""
+    return os.path.basename(path).startswith(EXCEL_LOCK_FILE_PREFIX)
+
+
+def file_signature(path: str) -> tuple[int, int] | None:
+    """(modification time in ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class OJSWatcher:
+    """Polls OJS files and reports the ones whose saves have settled."""
+
+    def __init__(
+        self,
+        paths: list[str],
+        settle_seconds: float = WATCH_SETTLE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Remember the files as they are now.
+
+        Args:
+            paths: OJS files to watch ("~$" owner files are skipped)
+            settle_seconds: How long a changed file must stay unchanged
+            clock: Monotonic time source (for tests)
+        """
+        self.paths = [path for path in paths if not is_lock_file(path)]
+        self.settle_seconds = settle_seconds
+        self.clock = clock
+        self._seen = {path: file_signature(path) for path in self.paths}
+        self._pending: dict[str, tuple[tuple[int, int] | None, float]] = {}
+
+    def poll(self) -> list[str]:
+        """Check the files once.
+
+        Returns:
+            Files that changed and have since settled, in the order watched
+        """
+        now = self.clock()
+        settled = []
+        for path in self.paths:
+            signature = file_signature(path)
+            if signature == self._seen[path]:
+                self._pending.pop(path, None)
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != signature:
+                # Still being written (or just started): wait for it to settle
+                self._pending[path] = (signature, now)
+                continue
+            if now - pending[1] < self.settle_seconds or signature is None:
+                continue
+            if not zipfile.is_zipfile(path):
+                logger.debug(f"{os.path.basename(path)} is not a complete workbook yet")
+                continue
+            self._seen[path] = signature
+            del self._pending[path]
+            settled.append(path)
+        return settled
+
+    def wait(self, poll_seconds: float = WATCH_POLL_SECONDS) -> list[str]:
+        """Block until at least one file has been saved and settled.
+
+        Returns:
+            The saved files, in the order watched
+        """
+        while True:
+            changed = self.poll()
+            if changed:
+                return changed
+            time.sleep(poll_seconds)
+
+
+def _winner_text(winner: AwardWinner) -> str:
+    team = f"Team {winner.team_number}, {winner.team_name}"
+    return f"{winner.label}: {team}" if winner.label else team
+
+
+def winner_changes(
+    before: dict[str, list[AwardWinner]], after: dict[str, list[AwardWinner]]
+) -> list[str]:
+    """Compact diff of two collect_template_data award winner lists.
+
+    Args:
+        before: Award winners at the last render, by award name
+        after: Award winners now
+
+    Returns:
+        One "award: - old / + new" line per award whose winners changed,
+        in award order
+    """
+    lines = []
+    for award in list(after) + [award for award in before if award not in after]:
+        old = [_winner_text(winner) for winner in before.get(award, [])]
+        new = [_winner_text(winner) for winner in after.get(award, [])]
+        if old == new:
+            continue
+        removed = list((Counter(old) - Counter(new)).elements())
+        added = list((Counter(new) - Counter(old)).elements())
+        changes = [f"- {text}" for text in removed] + [f"+ {text}" for text in added]
+        lines.append(f"{award}: {' / '.join(changes) if changes else 'reordered'}")
+    return lines
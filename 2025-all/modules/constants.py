@@ -44,6 +44,9 @@ TABLE_ROBOT_DESIGN: str = "RobotDesignResults"
 TABLE_CORE_VALUES: str = "CoreValuesResults"
 TABLE_TOURNAMENT_DATA: str = "TournamentData"
 
+# Cells
+CELL_DUAL_EMCEE: str = "F2"  # Dual emcee flag, on the Team and Program Information sheet
+
 # File structure
 FILE_CLOSING_CEREMONY: str = "closing_ceremony.html"
 
@@ -66,3 +69,41 @@ REQUIRED_COLUMNS = {
     "CoreValuesResults": ["Team #"],
     "TournamentData": ["Team #"],  # Changed from "Team Number"
 }
+
+# Table reading
+STREAM_CHUNK_ROWS: int = 5000  # Rows parsed per chunk by streamed table reads
+
+# Tables read from the master tournament workbook at startup, as (sheet, table)
+MASTER_TABLES: list[tuple[str, str]] = [
+    ("SeasonInfo", "SeasonInfo"),
+    ("Tournaments", "TournamentList"),
+    ("DivTournaments", "DivTournamentList"),
+    ("AwardDef", "AwardDef"),
+    ("Assignments", "Assignments"),
+]
+
+# Master table cache (see modules/table_cache.py)
+TABLE_CACHE_DIRNAME: str = ".maestro-cache"
+TABLE_CACHE_VERSION: int = 1  # Bump when the cached table format changes
+
+# Per-tournament build manifest (see modules/build_manifest.py)
+BUILD_MANIFEST_FILENAME: str = ".maestro-build.json"
+BUILD_MANIFEST_VERSION: int = 1  # Bump when the OJS build output changes
+
+# OJS workbook writers (see modules/xlsm_patch.py)
+OJS_WRITER_OPENPYXL: str = "openpyxl"  # Load and save the workbook through openpyxl
+OJS_WRITER_PATCH: str = "patch"  # Patch the edited XML parts, copy the rest of the package
+OJS_WRITERS: list[str] = [OJS_WRITER_OPENPYXL, OJS_WRITER_PATCH]
+
+# Pipelined builds (see modules/build_pipeline.py)
+PIPELINE_QUEUE_DEPTH: int = 2  # Tournaments waiting between two build stages
+
+# fll-toast --watch (see modules/ceremony_watch.py)
+WATCH_POLL_SECONDS: float = 0.25  # How often the OJS files are checked for saves
+WATCH_SETTLE_SECONDS: float = 0.5  # How long a saved file must stay unchanged before it is read
+EXCEL_LOCK_FILE_PREFIX: str = "~$"  # Owner files Excel keeps next to an open workbook
+
+# fll-toast incremental cache (see modules/toast_cache.py)
+TOAST_CACHE_SUFFIX: str = ".toast-cache"  # ".<OJS file>.toast-cache" is written next to each OJS file
+TOAST_RENDER_CACHE_FILENAME: str = ".ceremony-outputs.toast-cache"  # Next to the rendered script and summary
+TOAST_CACHE_VERSION: int = 1  # Bump when a cached step's results change
@@ -2,15 +2,34 @@
 
 import os
 import logging
-from typing import Any
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Iterator
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.cell.text import Text
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS, is_date_format, is_timedelta_format,
+)
 from openpyxl.workbook import Workbook
-from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.utils.cell import (
+    coordinate_to_tuple, get_column_letter, range_boundaries,
+)
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904, WINDOWS_EPOCH, from_excel, from_ISO8601,
+)
+from pandas.io.parsers import TextParser
 
 from .logger import print_error
-from .constants import REQUIRED_COLUMNS
+from .constants import REQUIRED_COLUMNS, STREAM_CHUNK_ROWS
+from .workbook_index import workbook_index
+from .ooxml_package import NS_MAIN, NS_DOC_REL, find_workbook_part, read_relationships, rels_path
 
 
 logger = logging.getLogger("ojs_builder")
@@ -110,159 +129,441 @@ def verify_workbooks_closed(*workbook_paths: str) -> None:
     logger.debug(f"Verified {len(workbook_paths)} workbook(s) are closed")
 
 
-def read_table_as_df(
-    xlsx_path: str,
-    sheet_name: str,
-    table_name: str,
-    require_table: bool = True,
-    convert_integer_floats: bool = True,
-) -> pd.DataFrame:
-    """Read an Excel table (ListObject) by name into a pandas DataFrame.
+_ROW_TAG = f"{{{NS_MAIN}}}row"
+_CELL_TAG = f"{{{NS_MAIN}}}c"
+_VALUE_TAG = f"{{{NS_MAIN}}}v"
+_INLINE_STRING_TAG = f"{{{NS_MAIN}}}is"
+
+
+@dataclass
+class _SheetTables:
+    """Location of a worksheet part, the refs of the tables it holds and their parts."""
+    sheet_path: str
+    tables: dict[str, str]
+    table_parts: list[str] = field(default_factory=list)
+
+
+def _read_package_tables(archive: zipfile.ZipFile) -> dict[str, _SheetTables]:
+    """Find every worksheet and its tables by reading the package XML directly.
+
+    Used where openpyxl does not expose tables (read-only mode) or is not
+    loaded at all.
 
-    Args:
-        xlsx_path: Path to the Excel workbook
-        sheet_name: Name of the worksheet containing the table
-        table_name: Name of the Excel table to read
-        require_table: If True, raise an error if table is not found
-        convert_integer_floats: If True, convert float columns with whole numbers to Int64
-        
     Returns:
-        DataFrame containing the table data
-        
-    Raises:
-        RuntimeError: If workbook cannot be opened
-        KeyError: If sheet or table is not found (when require_table=True)
-        ValueError: If table reference format is invalid
+        Mapping of sheet name -> _SheetTables
     """
-    if not os.path.exists(xlsx_path):
-        raise FileNotFoundError(f"Excel file not found: {xlsx_path}")
-    
-    logger.debug(f"Reading table '{table_name}' from sheet '{sheet_name}' in {xlsx_path}")
-    
-    try:
-        wb = load_workbook(xlsx_path, data_only=True)
-    except Exception as e:
-        raise RuntimeError(f"Failed to open workbook '{xlsx_path}': {e}") from e
+    workbook_part = find_workbook_part(archive)
+    workbook_rels = read_relationships(archive, workbook_part)
+    workbook_root = ET.fromstring(archive.read(workbook_part))
 
-    if sheet_name not in wb.sheetnames:
-        if require_table:
-            raise KeyError(f"Sheet not found: {sheet_name} in {xlsx_path}")
-        return pd.DataFrame()
+    sheets: dict[str, _SheetTables] = {}
+    for sheet in workbook_root.iter(f"{{{NS_MAIN}}}sheet"):
+        rel = workbook_rels.get(sheet.get(f"{{{NS_DOC_REL}}}id"))
+        if rel is None or not rel[0].endswith("/worksheet"):
+            continue  # chartsheets and dialog sheets have no tables
 
-    ws = wb[sheet_name]
+        sheet_path = rel[1]
+        tables: dict[str, str] = {}
+        table_parts: list[str] = []
+        for rel_type, table_part in read_relationships(archive, sheet_path).values():
+            if not rel_type.endswith("/table"):
+                continue
+            table_root = ET.fromstring(archive.read(table_part))
+            table_name = table_root.get("name") or table_root.get("displayName")
+            tables[table_name] = table_root.get("ref")
+            table_parts.append(table_part)
 
-    if table_name not in ws.tables:
-        if require_table:
-            raise KeyError(
-                f"Table {table_name!r} not found on sheet {sheet_name!r} in {xlsx_path}"
-            )
-        return pd.DataFrame()
+        sheets[sheet.get("name")] = _SheetTables(sheet_path=sheet_path, tables=tables, table_parts=table_parts)
 
-    table = ws.tables[table_name]
-    ref = table.ref
+    return sheets
+
+
+def _excel_scalar(value: Any) -> Any:
+    """Convert a raw openpyxl cell value the same way pandas.read_excel does.
+
+    Empty cells become "" (treated as NaN by the parser), error values such as
+    '#DIV/0!' become NaN, and whole-number floats become ints.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        int_value = int(value)
+        if int_value == value:
+            return int_value
+        return float(value)
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+def _parse_table_ref(ref: Any, sheet_name: str, table_name: str) -> tuple[int, int, int, int]:
+    """Parse a table ref like 'A1:F20' into (min_col, min_row, max_col, max_row).
+
+    Raises:
+        ValueError: If the table reference format is invalid
+    """
     if not isinstance(ref, str) or ":" not in ref:
         raise ValueError(
             f"Unexpected table.ref for {table_name!r} on {sheet_name!r}: {ref!r}"
         )
 
     try:
-        start, end = ref.split(":")
-        start_col, start_row = coordinate_from_string(start)
-        end_col, end_row = coordinate_from_string(end)
+        return range_boundaries(ref)
     except Exception as e:
         raise ValueError(
             f"Could not parse table.ref '{ref}' for {table_name!r}: {e}"
         ) from e
 
-    header_row_idx = int(start_row) - 1
-    usecols = f"{start_col}:{end_col}"
-    nrows = int(end_row) - int(start_row)
-    
-    if nrows <= 0:
+
+def _rows_to_table_frame(rows: list[list[Any]], nrows: int) -> pd.DataFrame:
+    """Turn converted table rows (header first) into a DataFrame.
+
+    Uses the same TextParser that pandas.read_excel uses, so column naming,
+    NA handling and dtype inference match a read_excel of the same range.
+    """
+    if not rows:
+        return pd.DataFrame()
+
+    parser = TextParser(rows, header=0, skip_blank_lines=False)
+    return parser.read(nrows=nrows)
+
+
+class MissingColumnError(KeyError):
+    """A column requested with columns= is not in the table's header row.
+
+    Subclasses KeyError, like the other "not found" errors of the table
+    readers. The missing headers are available as `columns`.
+    """
+
+    def __init__(self, columns: list[str], table_name: str | None = None, sheet_name: str | None = None):
+        self.columns = columns
+        label = "Missing column" if len(columns) == 1 else "Missing columns"
+        message = f"{label}: {', '.join(columns)}"
+        if table_name is not None:
+            message += f" (table {table_name!r} on sheet {sheet_name!r})"
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+def _resolve_columns(columns: list[str] | str | None, table_name: str) -> list[str] | None:
+    """Turn a columns= argument into the headers to keep (None keeps every column).
+
+    "required" selects the table's entry in REQUIRED_COLUMNS; a table with no
+    entry is read in full.
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        if columns != "required":
+            raise ValueError(f"columns must be a list of headers or 'required', got {columns!r}")
+        return REQUIRED_COLUMNS.get(table_name)
+    return list(columns)
+
+
+def _table_columns(
+    columns: dict[str, list[str]] | str | None, table_name: str
+) -> list[str] | str | None:
+    """The columns= argument for one table of a read_tables call."""
+    if isinstance(columns, dict):
+        return columns.get(table_name)
+    return columns
+
+
+def _projected_offsets(header_row: tuple, min_col: int, max_col: int, columns: list[str]) -> list[int]:
+    """Indexes into a header sheet row of the requested table columns, in table order.
+
+    Headers are matched after stripping, as they are named once normalized.
+    If a header appears twice, the first one is used.
+
+    Raises:
+        MissingColumnError: If a requested column is not in the header row
+    """
+    offsets: dict[str, int] = {}
+    for offset in range(min_col - 1, max_col):
+        value = header_row[offset] if offset < len(header_row) else None
+        if value is not None:
+            offsets.setdefault(str(_excel_scalar(value)).strip(), offset)
+
+    missing = [col for col in columns if col not in offsets]
+    if missing:
+        raise MissingColumnError(missing)
+    return sorted({offsets[col] for col in columns})
+
+
+def _strip_text_columns(columns: list[pd.Series]) -> list[pd.Series]:
+    """Strip surrounding whitespace from every string in the given text columns.
+
+    All columns are handled in a single pass over their values (non-string
+    values in object columns pass through untouched), rather than one
+    Series.str/Series.map call per column. Each column keeps its dtype.
+    """
+    if not columns:
+        return columns
+
+    nrows = len(columns[0])
+    values = chain.from_iterable(np.asarray(col.array, dtype=object) for col in columns)
+    stripped = np.fromiter(
+        (v.strip() if type(v) is str else v for v in values),
+        dtype=object,
+        count=nrows * len(columns),
+    )
+    return [
+        pd.Series(stripped[k * nrows:(k + 1) * nrows], index=col.index, name=col.name, dtype=col.dtype)
+        for k, col in enumerate(columns)
+    ]
+
+
+def _integral_float_columns(columns: list[pd.Series]) -> np.ndarray:
+    """Flag float columns whose non-blank values are all whole numbers.
+
+    Checks every column in one NumPy pass. Columns with no values at all are
+    not flagged, and neither are columns holding inf.
+    """
+    values = np.column_stack([col.to_numpy(dtype=np.float64) for col in columns])
+    blank = np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        whole = np.mod(values, 1) == 0
+    return (whole | blank).all(axis=0) & ~blank.all(axis=0)
+
+
+def _normalize_table_frame(df: pd.DataFrame, convert_integer_floats: bool = True) -> pd.DataFrame:
+    """Strip header names and string values, and coerce whole-number float columns to Int64.
+
+    Args:
+        df: DataFrame read from an Excel table
+        convert_integer_floats: If True, convert float columns with whole numbers to Int64
+
+    Returns:
+        The normalized DataFrame
+    """
+    df.columns = df.columns.str.strip()
+    if df.shape[1] == 0:
+        return df
+
+    # Work on columns by position so duplicate header names are handled too
+    columns = [df.iloc[:, i] for i in range(df.shape[1])]
+
+    text_idx = [
+        i for i, col in enumerate(columns)
+        if col.dtype == object or pd.api.types.is_string_dtype(col.dtype)
+    ]
+    for i, col in zip(text_idx, _strip_text_columns([columns[i] for i in text_idx])):
+        columns[i] = col
+
+    if convert_integer_floats:
+        float_idx = [i for i, col in enumerate(columns) if pd.api.types.is_float_dtype(col.dtype)]
+        if float_idx:
+            integral = _integral_float_columns([columns[i] for i in float_idx])
+            for i in np.asarray(float_idx)[integral]:
+                try:
+                    columns[i] = columns[i].astype("Int64")
+                except Exception:
+                    continue
+
+    normalized = pd.concat(columns, axis=1)
+    normalized.columns = df.columns
+    return normalized
+
+
+def _worksheet_table_frame(
+    ws: Worksheet,
+    min_col: int,
+    min_row: int,
+    max_col: int,
+    max_row: int,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Materialize a table range of a loaded worksheet as a raw DataFrame.
+
+    Reads the cells inside the table bounds with iter_rows(values_only=True)
+    instead of asking pandas to parse the file again. Like read_excel, data
+    rows at the end of the table that are blank across the whole sheet row
+    are dropped. With `columns`, only those headers are converted and parsed.
+    """
+    nrows = max_row - min_row
+
+    # read_excel trims trailing rows with no data anywhere on the sheet row
+    last_row = max_row
+    while last_row > min_row:
+        sheet_row = next(ws.iter_rows(min_row=last_row, max_row=last_row, values_only=True), ())
+        if any(v is not None for v in sheet_row):
+            break
+        last_row -= 1
+
+    sheet_rows = ws.iter_rows(
+        min_row=min_row,
+        max_row=last_row,
+        min_col=min_col,
+        max_col=max_col,
+        values_only=True,
+    )
+    if columns is None:
+        rows = [[_excel_scalar(v) for v in row] for row in sheet_rows]
+    else:
+        header = next(sheet_rows)
+        offsets = _projected_offsets(header, 1, max_col - min_col + 1, columns)
+        rows = [[_excel_scalar(header[i]) for i in offsets]]
+        rows.extend([_excel_scalar(row[i]) for i in offsets] for row in sheet_rows)
+    return _rows_to_table_frame(rows, max(nrows, 0))
+
+
+def _iter_table_rows(
+    sheet_rows: Iterator[tuple],
+    min_col: int,
+    max_col: int,
+    columns: list[str] | None = None,
+) -> Iterator[list[Any]]:
+    """Yield converted table rows (header first) from whole sheet rows.
+
+    `sheet_rows` holds the values of every sheet row in the table range, in
+    order. Rows that are blank across the whole sheet row are held back until
+    a later row has data, so trailing blank rows are dropped just like
+    read_excel does. With `columns`, the header row picks out the columns to
+    keep and every other cell is skipped without being converted.
+    """
+    width = max_col - min_col + 1
+    offsets: list[int] | None = None
+    pending: list[list[Any]] = []
+
+    for sheet_row in sheet_rows:
+        if columns is None:
+            row = list(sheet_row[min_col - 1:max_col])
+            row.extend([None] * (width - len(row)))
+        else:
+            if offsets is None:
+                offsets = _projected_offsets(sheet_row, min_col, max_col, columns)
+            n = len(sheet_row)
+            row = [sheet_row[i] if i < n else None for i in offsets]
+        converted = [_excel_scalar(v) for v in row]
+
+        if any(v is not None for v in sheet_row):
+            yield from pending
+            pending.clear()
+            yield converted
+        else:
+            pending.append(converted)
+
+
+def _chunked_table_frame(
+    rows: Iterator[list[Any]],
+    has_data_rows: bool,
+    chunksize: int = STREAM_CHUNK_ROWS,
+) -> pd.DataFrame:
+    """Parse converted table rows (header first) into a DataFrame in chunks.
+
+    Only `chunksize` rows are held as Python lists at a time; each chunk is
+    parsed with the header and the chunks are concatenated at the end.
+    """
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+
+    if not has_data_rows:
+        return _rows_to_table_frame([header], 0)
+
+    chunks = []
+    chunk_rows = [header]
+    for row in rows:
+        chunk_rows.append(row)
+        if len(chunk_rows) > chunksize:
+            chunks.append(_rows_to_table_frame(chunk_rows, chunksize))
+            chunk_rows = [header]
+    if len(chunk_rows) > 1 or not chunks:
+        chunks.append(_rows_to_table_frame(chunk_rows, chunksize))
+
+    if len(chunks) == 1:
+        return chunks[0]
+
+    # Chunks infer dtypes independently (e.g. an all-blank chunk is float);
+    # re-infer so the result matches a single-pass parse
+    return pd.concat(chunks, ignore_index=True).infer_objects()
+
+
+def _streamed_table_frame(
+    ws: Any,
+    min_col: int,
+    min_row: int,
+    max_col: int,
+    max_row: int,
+    chunksize: int = STREAM_CHUNK_ROWS,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Materialize a table range of a read-only worksheet, parsing it in chunks.
+
+    Rows are pulled from the worksheet XML as they are needed and turned into
+    DataFrame chunks of `chunksize` rows, so neither Cell objects nor row lists
+    for the whole sheet are ever held in memory.
+    """
+    sheet_rows = ws.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+    rows = _iter_table_rows(sheet_rows, min_col, max_col, columns)
+    return _chunked_table_frame(rows, max_row > min_row, chunksize)
+
+
+def _table_frame_from_ref(
+    build_frame: Any,
+    ref: Any,
+    sheet_name: str,
+    table_name: str,
+    convert_integer_floats: bool,
+) -> pd.DataFrame:
+    """Build and normalize the DataFrame for a table ref.
+
+    `build_frame(min_col, min_row, max_col, max_row)` returns the raw frame
+    for the range; readers differ only in how they produce it.
+
+    Raises:
+        ValueError: If the table reference format is invalid
+        MissingColumnError: If a projected column is not in the table
+        RuntimeError: If the cells of the table cannot be read
+    """
+    min_col, min_row, max_col, max_row = _parse_table_ref(ref, sheet_name, table_name)
+
+    if max_row <= min_row:
         try:
-            df = pd.read_excel(
-                xlsx_path,
-                sheet_name=sheet_name,
-                header=header_row_idx,
-                usecols=usecols,
-                nrows=0,
-                engine="openpyxl",
-            )
+            df = build_frame(min_col, min_row, max_col, max_row)
             df.columns = df.columns.str.strip()
             return df
+        except MissingColumnError as e:
+            raise MissingColumnError(e.columns, table_name, sheet_name) from None
         except Exception:
             return pd.DataFrame()
 
     try:
-        df = pd.read_excel(
-            xlsx_path,
-            sheet_name=sheet_name,
-            header=header_row_idx,
-            usecols=usecols,
-            nrows=nrows,
-            engine="openpyxl",
-        )
+        df = build_frame(min_col, min_row, max_col, max_row)
+    except MissingColumnError as e:
+        raise MissingColumnError(e.columns, table_name, sheet_name) from None
     except Exception as e:
         raise RuntimeError(
-            f"pandas.read_excel failed for table {table_name!r} on sheet {sheet_name!r}: {e}"
+            f"Could not read cells for table {table_name!r} on sheet {sheet_name!r}: {e}"
         ) from e
 
-    df.columns = df.columns.str.strip()
-
-    def _trim_series(s: pd.Series) -> pd.Series:
-        if pd.api.types.is_string_dtype(s):
-            return s.str.strip()
-        if s.dtype == object:
-            return s.map(lambda v: v.strip() if isinstance(v, str) else v)
-        return s
-
-    df = df.apply(_trim_series)
-
-    if convert_integer_floats:
-        float_cols = df.select_dtypes(include=["float"]).columns
-        for col in float_cols:
-            ser = df[col]
-            non_na = ser.dropna()
-            if non_na.empty:
-                continue
-            try:
-                if ((non_na % 1) == 0).all():
-                    df[col] = df[col].astype("Int64")
-            except Exception:
-                continue
+    df = _normalize_table_frame(df, convert_integer_floats)
 
     logger.debug(f"Read {len(df)} rows from table '{table_name}'")
     return df
 
 
-def read_table_as_dict(
-    xlsx_path: str,
+def frame_to_dict(
+    df: pd.DataFrame,
     sheet_name: str,
     table_name: str,
     key_col: str | None = None,
     value_col: str | None = None,
     require_unique_keys: bool = True,
 ) -> dict:
-    """Read a two-column Excel table and return a dict mapping key->value.
+    """Turn a two-column table frame into a key->value dict.
+
+    This is what read_table_as_dict does after reading the table; use it on
+    frames returned by read_tables.
 
-    Args:
-        xlsx_path: Path to the Excel workbook
-        sheet_name: Name of the worksheet containing the table
-        table_name: Name of the Excel table to read
-        key_col: Column name to use as key (defaults to first column)
-        value_col: Column name to use as value (defaults to second column)
-        require_unique_keys: If True, raise error on duplicate keys
-        
-    Returns:
-        Dictionary mapping keys to values
-        
     Raises:
-        ValueError: If table doesn't have exactly 2 columns or has duplicate keys
+        ValueError: If the frame doesn't have exactly 2 columns or has duplicate keys
         KeyError: If specified key/value columns are not found
     """
-    logger.debug(f"Reading table '{table_name}' as dictionary")
-    df = read_table_as_df(xlsx_path, sheet_name, table_name, require_table=True)
-
     if df.shape[1] != 2:
         raise ValueError(
             f"Table {table_name!r} on sheet {sheet_name!r} must have exactly 2 columns (found {df.shape[1]})"
@@ -298,6 +599,922 @@ def read_table_as_dict(
     return mapping
 
 
+class WorkbookSession:
+    """Parse a workbook once and serve table reads from memory.
+
+    Every table read through the session reuses the same parsed workbook, so
+    reading several tables from one file costs a single parse instead of one
+    (or two) per table.
+
+    With read_only=True the workbook is opened in openpyxl's streaming mode:
+    only the sheets holding requested tables are scanned, and their rows are
+    parsed in chunks, so memory stays flat however large a sheet grows. Use it
+    for large master workbooks such as the state-level TournamentList.
+
+    Example:
+        with WorkbookSession(tournament_file) as session:
+            season_info = session.read_table_as_dict("SeasonInfo", "SeasonInfo")
+            assignments = session.read_table_as_df("Assignments", "Assignments")
+    """
+
+    def __init__(self, xlsx_path: str, read_only: bool = False):
+        """Open and parse the workbook.
+
+        Args:
+            xlsx_path: Path to the Excel workbook
+            read_only: If True, stream sheets on demand instead of loading every cell
+
+        Raises:
+            FileNotFoundError: If the workbook does not exist
+            RuntimeError: If the workbook cannot be opened
+        """
+        if not os.path.exists(xlsx_path):
+            raise FileNotFoundError(f"Excel file not found: {xlsx_path}")
+
+        self.xlsx_path = xlsx_path
+        self.read_only = read_only
+        logger.debug(f"Opening workbook session for {xlsx_path} (read_only={read_only})")
+
+        try:
+            self.workbook = load_workbook(xlsx_path, read_only=read_only, data_only=True)
+            if read_only:
+                # Read-only worksheets do not expose their tables; find them in the package
+                with zipfile.ZipFile(xlsx_path) as archive:
+                    self._package_tables = _read_package_tables(archive)
+        except Exception as e:
+            raise RuntimeError(f"Failed to open workbook '{xlsx_path}': {e}") from e
+
+    def __enter__(self) -> "WorkbookSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """Names of the worksheets in the workbook."""
+        return self.workbook.sheetnames
+
+    def close(self) -> None:
+        """Release the parsed workbook."""
+        self.workbook.close()
+
+    def _table_ref(self, sheet_name: str, table_name: str) -> str | None:
+        """Return the ref of a table on a sheet, or None if the table does not exist."""
+        if self.read_only:
+            sheet_tables = self._package_tables.get(sheet_name)
+            return sheet_tables.tables.get(table_name) if sheet_tables else None
+
+        table = self.workbook[sheet_name].tables.get(table_name)
+        return table.ref if table is not None else None
+
+    def read_table_as_df(
+        self,
+        sheet_name: str,
+        table_name: str,
+        require_table: bool = True,
+        convert_integer_floats: bool = True,
+        columns: list[str] | str | None = None,
+    ) -> pd.DataFrame:
+        """Read an Excel table (ListObject) by name into a pandas DataFrame.
+
+        Args:
+            sheet_name: Name of the worksheet containing the table
+            table_name: Name of the Excel table to read
+            require_table: If True, raise an error if table is not found
+            convert_integer_floats: If True, convert float columns with whole numbers to Int64
+            columns: Headers to read, in table order; "required" for the table's
+                REQUIRED_COLUMNS; None reads every column
+
+        Returns:
+            DataFrame containing the table data
+
+        Raises:
+            KeyError: If sheet or table is not found (when require_table=True)
+            MissingColumnError: If a requested column is not in the table
+            ValueError: If table reference format is invalid
+        """
+        xlsx_path = self.xlsx_path
+        wb = self.workbook
+
+        logger.debug(f"Reading table '{table_name}' from sheet '{sheet_name}' in {xlsx_path}")
+
+        if sheet_name not in wb.sheetnames:
+            if require_table:
+                raise KeyError(f"Sheet not found: {sheet_name} in {xlsx_path}")
+            return pd.DataFrame()
+
+        ws = wb[sheet_name]
+        ref = self._table_ref(sheet_name, table_name)
+
+        if ref is None:
+            if require_table:
+                raise KeyError(
+                    f"Table {table_name!r} not found on sheet {sheet_name!r} in {xlsx_path}"
+                )
+            return pd.DataFrame()
+
+        projection = _resolve_columns(columns, table_name)
+        if self.read_only:
+            build_frame = lambda *bounds: _streamed_table_frame(ws, *bounds, columns=projection)
+        else:
+            build_frame = lambda *bounds: _worksheet_table_frame(ws, *bounds, columns=projection)
+        return _table_frame_from_ref(
+            build_frame,
+            ref,
+            sheet_name,
+            table_name,
+            convert_integer_floats,
+        )
+
+    def read_table_as_dict(
+        self,
+        sheet_name: str,
+        table_name: str,
+        key_col: str | None = None,
+        value_col: str | None = None,
+        require_unique_keys: bool = True,
+    ) -> dict:
+        """Read a two-column Excel table and return a dict mapping key->value.
+
+        Args:
+            sheet_name: Name of the worksheet containing the table
+            table_name: Name of the Excel table to read
+            key_col: Column name to use as key (defaults to first column)
+            value_col: Column name to use as value (defaults to second column)
+            require_unique_keys: If True, raise error on duplicate keys
+
+        Returns:
+            Dictionary mapping keys to values
+
+        Raises:
+            ValueError: If table doesn't have exactly 2 columns or has duplicate keys
+            KeyError: If specified key/value columns are not found
+        """
+        logger.debug(f"Reading table '{table_name}' as dictionary")
+        df = self.read_table_as_df(sheet_name, table_name, require_table=True)
+        return frame_to_dict(df, sheet_name, table_name, key_col, value_col, require_unique_keys)
+
+    def read_tables(
+        self,
+        tables: list[tuple[str, str]],
+        require_table: bool = True,
+        convert_integer_floats: bool = True,
+        columns: dict[str, list[str]] | str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Read several tables, returned as a dict keyed by table name.
+
+        The workbook is already parsed, so this reads each table in turn.
+        See PackageReader.read_tables for the single-pass version.
+        """
+        return {
+            table_name: self.read_table_as_df(
+                sheet_name, table_name, require_table, convert_integer_floats,
+                _table_columns(columns, table_name),
+            )
+            for sheet_name, table_name in tables
+        }
+
+
+# Stands in for a cell value that PackageReader skipped converting; only its
+# not being None matters (the row still counts as holding data)
+_SKIPPED_CELL = object()
+
+
+def cast_number(value: str) -> int | float:
+    """Convert a numeric cell value from the sheet XML to int or float, as openpyxl does."""
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+class PackageReader:
+    """Read tables and cells straight from the workbook's XML parts.
+
+    Pure reads (validation, ceremony data collection, dual-emcee probing) do
+    not need styles, conditional formats or data validations, so this reader
+    skips openpyxl's workbook load entirely. A table is located through the
+    sheet relationships and xl/tables/tableN.xml, and only the rows of the
+    sheet XML up to the bottom of the table are parsed. Shared strings and
+    date formats are loaded the first time a cell needs them.
+
+    Cell values match openpyxl's data_only reading, so read_table_as_df
+    returns the same DataFrame as WorkbookSession.read_table_as_df.
+
+    Example:
+        with PackageReader(ojs_path) as reader:
+            df = reader.read_table_as_df("Robot Game", "RobotGameScores")
+    """
+
+    def __init__(self, xlsx_path: str):
+        """Open the workbook package and index its sheets and tables.
+
+        Args:
+            xlsx_path: Path to the Excel workbook
+
+        Raises:
+            FileNotFoundError: If the workbook does not exist
+            RuntimeError: If the file is not a readable workbook package
+        """
+        if not os.path.exists(xlsx_path):
+            raise FileNotFoundError(f"Excel file not found: {xlsx_path}")
+
+        self.xlsx_path = xlsx_path
+        self._shared_strings_cache: list[str] | None = None
+        self._date_styles_cache: tuple[set[int], set[int]] | None = None
+
+        try:
+            self._archive = zipfile.ZipFile(xlsx_path)
+        except Exception as e:
+            raise RuntimeError(f"Failed to open workbook '{xlsx_path}': {e}") from e
+
+        try:
+            self._sheets = _read_package_tables(self._archive)
+
+            workbook_part = find_workbook_part(self._archive)
+            self._workbook_rels = {
+                rel_type.rsplit("/", 1)[-1]: target
+                for rel_type, target in read_relationships(self._archive, workbook_part).values()
+            }
+            workbook_pr = ET.fromstring(self._archive.read(workbook_part)).find(
+                f"{{{NS_MAIN}}}workbookPr"
+            )
+            date1904 = workbook_pr is not None and workbook_pr.get("date1904") in ("1", "true")
+            self._epoch = CALENDAR_MAC_1904 if date1904 else WINDOWS_EPOCH
+        except Exception as e:
+            self._archive.close()
+            raise RuntimeError(f"Failed to open workbook '{xlsx_path}': {e}") from e
+
+    def __enter__(self) -> "PackageReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """Names of the worksheets in the workbook."""
+        return list(self._sheets)
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._archive.close()
+
+    def part_crcs(self, sheet_name: str) -> dict[str, int]:
+        """CRC-32 of every package part a read from a sheet depends on.
+
+        The CRCs come from the zip's central directory, so nothing is
+        decompressed. Besides the sheet's own part, its relationships and its
+        table parts, the workbook part, shared strings and styles are shared
+        by every sheet and always included. A sheet that does not exist has
+        only those shared parts.
+
+        Args:
+            sheet_name: Name of the worksheet
+
+        Returns:
+            Mapping of part path -> CRC-32, for the parts present in the package
+        """
+        workbook_part = find_workbook_part(self._archive)
+        parts = [
+            workbook_part,
+            rels_path(workbook_part),
+            self._workbook_rels.get("sharedStrings"),
+            self._workbook_rels.get("styles"),
+        ]
+        sheet = self._sheets.get(sheet_name)
+        if sheet is not None:
+            parts += [sheet.sheet_path, rels_path(sheet.sheet_path), *sheet.table_parts]
+        members = self._archive.NameToInfo
+        return {part: members[part].CRC for part in parts if part in members}
+
+    @property
+    def _shared_strings(self) -> list[str]:
+        """Shared string table, parsed on first use."""
+        if self._shared_strings_cache is None:
+            part = self._workbook_rels.get("sharedStrings")
+            if part is None or part not in self._archive.NameToInfo:
+                self._shared_strings_cache = []
+            else:
+                with self._archive.open(part) as source:
+                    self._shared_strings_cache = read_string_table(source)
+        return self._shared_strings_cache
+
+    @property
+    def _date_styles(self) -> tuple[set[int], set[int]]:
+        """Cell style ids whose number format is a date, and those that are a duration."""
+        if self._date_styles_cache is None:
+            date_styles: set[int] = set()
+            timedelta_styles: set[int] = set()
+            part = self._workbook_rels.get("styles")
+            if part is not None and part in self._archive.NameToInfo:
+                root = ET.fromstring(self._archive.read(part))
+                custom = {
+                    int(fmt.get("numFmtId")): fmt.get("formatCode")
+                    for fmt in root.iter(f"{{{NS_MAIN}}}numFmt")
+                }
+                cell_xfs = root.find(f"{{{NS_MAIN}}}cellXfs")
+                for idx, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+                    fmt_id = int(xf.get("numFmtId", 0))
+                    fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+                    if is_date_format(fmt):
+                        date_styles.add(idx)
+                    if is_timedelta_format(fmt):
+                        timedelta_styles.add(idx)
+            self._date_styles_cache = (date_styles, timedelta_styles)
+        return self._date_styles_cache
+
+    def _cell_value(self, cell: ET.Element) -> Any:
+        """Value of a <c> element, converted the way openpyxl does with data_only=True."""
+        data_type = cell.get("t", "n")
+
+        if data_type == "inlineStr":
+            child = cell.find(_INLINE_STRING_TAG)
+            return Text.from_tree(child).content if child is not None else None
+
+        value = cell.findtext(_VALUE_TAG) or None
+        if value is None:
+            return None
+
+        if data_type == "n":
+            value = cast_number(value)
+            style_id = int(cell.get("s", 0))
+            date_styles, timedelta_styles = self._date_styles
+            if style_id in date_styles:
+                try:
+                    return from_excel(value, self._epoch, timedelta=style_id in timedelta_styles)
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return value
+        if data_type == "s":
+            return self._shared_strings[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+        return value  # "str" (formula result) and "e" (error code)
+
+    def _row_values(self, row: ET.Element, wanted: set[int] | None = None) -> tuple:
+        """Values of a <row> element, indexed from column A.
+
+        If `wanted` is given, only cells in those (1-based) columns are
+        converted; other cells holding a value come back as _SKIPPED_CELL.
+        """
+        values: dict[int, Any] = {}
+        col = 0
+        for cell in row.iter(_CELL_TAG):
+            coordinate = cell.get("r")
+            col = coordinate_to_tuple(coordinate)[1] if coordinate else col + 1
+            if wanted is None or col in wanted:
+                values[col] = self._cell_value(cell)
+            elif cell.findtext(_VALUE_TAG) or cell.find(_INLINE_STRING_TAG) is not None:
+                values[col] = _SKIPPED_CELL
+
+        if not values:
+            return ()
+        return tuple(values.get(c) for c in range(1, max(values) + 1))
+
+    def _iter_sheet_rows(
+        self, sheet_path: str, min_row: int, max_row: int, wanted: set[int] | None = None
+    ) -> Iterator[tuple]:
+        """Yield one tuple of values per sheet row from min_row to max_row.
+
+        Rows missing from the XML come back as empty tuples. Parsing stops as
+        soon as max_row has been passed. `wanted` is passed on to _row_values.
+        """
+        next_row = min_row
+        row_counter = 0
+
+        with self._archive.open(sheet_path) as source:
+            for _, element in ET.iterparse(source, events=("end",)):
+                if element.tag != _ROW_TAG:
+                    continue
+
+                r = element.get("r")
+                row_counter = int(r) if r else row_counter + 1
+                if row_counter > max_row:
+                    break
+                if row_counter >= min_row:
+                    while next_row < row_counter:
+                        yield ()
+                        next_row += 1
+                    yield self._row_values(element, wanted)
+                    next_row = row_counter + 1
+                element.clear()
+
+        while next_row <= max_row:
+            yield ()
+            next_row += 1
+
+    def read_table_as_df(
+        self,
+        sheet_name: str,
+        table_name: str,
+        require_table: bool = True,
+        convert_integer_floats: bool = True,
+        columns: list[str] | str | None = None,
+    ) -> pd.DataFrame:
+        """Read an Excel table (ListObject) by name into a pandas DataFrame.
+
+        Args:
+            sheet_name: Name of the worksheet containing the table
+            table_name: Name of the Excel table to read
+            require_table: If True, raise an error if table is not found
+            convert_integer_floats: If True, convert float columns with whole numbers to Int64
+            columns: Headers to read, in table order; "required" for the table's
+                REQUIRED_COLUMNS; None reads every column
+
+        Returns:
+            DataFrame containing the table data
+
+        Raises:
+            KeyError: If sheet or table is not found (when require_table=True)
+            MissingColumnError: If a requested column is not in the table
+            ValueError: If table reference format is invalid
+        """
+        xlsx_path = self.xlsx_path
+
+        logger.debug(f"Reading table '{table_name}' from sheet '{sheet_name}' in {xlsx_path} (package XML)")
+
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            if require_table:
+                raise KeyError(f"Sheet not found: {sheet_name} in {xlsx_path}")
+            return pd.DataFrame()
+
+        ref = sheet.tables.get(table_name)
+        if ref is None:
+            if require_table:
+                raise KeyError(
+                    f"Table {table_name!r} not found on sheet {sheet_name!r} in {xlsx_path}"
+                )
+            return pd.DataFrame()
+
+        projection = _resolve_columns(columns, table_name)
+
+        def build_frame(min_col: int, min_row: int, max_col: int, max_row: int) -> pd.DataFrame:
+            wanted = None
+            if projection is not None:
+                # Look the columns up in the header first so other cells are never converted
+                header_row = next(self._iter_sheet_rows(sheet.sheet_path, min_row, min_row))
+                wanted = {i + 1 for i in _projected_offsets(header_row, min_col, max_col, projection)}
+            sheet_rows = self._iter_sheet_rows(sheet.sheet_path, min_row, max_row, wanted)
+            rows = _iter_table_rows(sheet_rows, min_col, max_col, projection)
+            return _chunked_table_frame(rows, max_row > min_row)
+
+        return _table_frame_from_ref(build_frame, ref, sheet_name, table_name, convert_integer_floats)
+
+    def read_tables(
+        self,
+        tables: list[tuple[str, str]],
+        require_table: bool = True,
+        convert_integer_floats: bool = True,
+        columns: dict[str, list[str]] | str | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Read several tables, parsing each sheet's XML at most once.
+
+        Requests are grouped by sheet. A sheet holding one requested table is
+        streamed exactly as read_table_as_df does; for a sheet holding several,
+        the rows spanning all of them are read in a single pass and handed to
+        each table.
+
+        Args:
+            tables: (sheet_name, table_name) pairs to read
+            require_table: If True, raise an error if a table is not found
+            convert_integer_floats: If True, convert float columns with whole numbers to Int64
+            columns: Headers to read per table name (tables not listed are read
+                in full), or "required" to read each table's REQUIRED_COLUMNS
+
+        Returns:
+            Dict mapping table name -> DataFrame, in the order requested
+
+        Raises:
+            KeyError: If a sheet or table is not found (when require_table=True)
+            MissingColumnError: If a requested column is not in its table
+            ValueError: If a table reference format is invalid
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        by_sheet: dict[str, list[tuple[str, str]]] = {}
+
+        for sheet_name, table_name in tables:
+            sheet = self._sheets.get(sheet_name)
+            if sheet is None or table_name not in sheet.tables:
+                # Raises, or returns an empty frame, exactly like a single read
+                frames[table_name] = self.read_table_as_df(
+                    sheet_name, table_name, require_table, convert_integer_floats,
+                    _table_columns(columns, table_name),
+                )
+                continue
+            by_sheet.setdefault(sheet_name, []).append((table_name, sheet.tables[table_name]))
+
+        for sheet_name, sheet_tables in by_sheet.items():
+            if len(sheet_tables) == 1:
+                table_name = sheet_tables[0][0]
+                frames[table_name] = self.read_table_as_df(
+                    sheet_name, table_name, require_table, convert_integer_floats,
+                    _table_columns(columns, table_name),
+                )
+                continue
+
+            logger.debug(
+                f"Reading {len(sheet_tables)} tables from sheet '{sheet_name}' in one pass"
+            )
+            bounds = {
+                table_name: _parse_table_ref(ref, sheet_name, table_name)
+                for table_name, ref in sheet_tables
+            }
+            first_row = min(b[1] for b in bounds.values())
+            last_row = max(b[3] for b in bounds.values())
+
+            sheet_rows: dict[str, list[tuple]] = {table_name: [] for table_name in bounds}
+            sheet_path = self._sheets[sheet_name].sheet_path
+            for row_idx, values in enumerate(
+                self._iter_sheet_rows(sheet_path, first_row, last_row), start=first_row
+            ):
+                for table_name, (_, min_row, _, max_row) in bounds.items():
+                    if min_row <= row_idx <= max_row:
+                        sheet_rows[table_name].append(values)
+
+            for table_name, ref in sheet_tables:
+                def build_frame(
+                    min_col: int, min_row: int, max_col: int, max_row: int,
+                    buffered: list[tuple] = sheet_rows[table_name],
+                    projection: list[str] | None = _resolve_columns(
+                        _table_columns(columns, table_name), table_name
+                    ),
+                ) -> pd.DataFrame:
+                    rows = _iter_table_rows(iter(buffered), min_col, max_col, projection)
+                    return _chunked_table_frame(rows, max_row > min_row)
+
+                frames[table_name] = _table_frame_from_ref(
+                    build_frame, ref, sheet_name, table_name, convert_integer_floats
+                )
+
+        return {table_name: frames[table_name] for _, table_name in tables}
+
+    def read_table_as_dict(
+        self,
+        sheet_name: str,
+        table_name: str,
+        key_col: str | None = None,
+        value_col: str | None = None,
+        require_unique_keys: bool = True,
+    ) -> dict:
+        """Read a two-column Excel table and return a dict mapping key->value.
+
+        Args:
+            sheet_name: Name of the worksheet containing the table
+            table_name: Name of the Excel table to read
+            key_col: Column name to use as key (defaults to first column)
+            value_col: Column name to use as value (defaults to second column)
+            require_unique_keys: If True, raise error on duplicate keys
+
+        Returns:
+            Dictionary mapping keys to values
+
+        Raises:
+            ValueError: If table doesn't have exactly 2 columns or has duplicate keys
+            KeyError: If specified key/value columns are not found
+        """
+        logger.debug(f"Reading table '{table_name}' as dictionary")
+        df = self.read_table_as_df(sheet_name, table_name, require_table=True)
+        return frame_to_dict(df, sheet_name, table_name, key_col, value_col, require_unique_keys)
+
+    def read_cell_value(self, sheet_name: str, coordinate: str) -> Any:
+        """Return the (cached) value of a single cell, e.g. read_cell_value(sheet, "F2").
+
+        Raises:
+            KeyError: If the sheet is not found
+        """
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            raise KeyError(f"Sheet not found: {sheet_name} in {self.xlsx_path}")
+
+        row, col = coordinate_to_tuple(coordinate)
+        values = next(self._iter_sheet_rows(sheet.sheet_path, row, row))
+        return values[col - 1] if col <= len(values) else None
+
+
+def read_table_as_df(
+    xlsx_path: str,
+    sheet_name: str,
+    table_name: str,
+    require_table: bool = True,
+    convert_integer_floats: bool = True,
+    columns: list[str] | str | None = None,
+) -> pd.DataFrame:
+    """Read an Excel table (ListObject) by name into a pandas DataFrame.
+
+    Reads the table straight from the package XML with a PackageReader, and
+    falls back to openpyxl (a one-off WorkbookSession) if the package cannot
+    be parsed that way. When reading several tables from the same file, use a
+    PackageReader or WorkbookSession directly so the file is opened once.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+        sheet_name: Name of the worksheet containing the table
+        table_name: Name of the Excel table to read
+        require_table: If True, raise an error if table is not found
+        convert_integer_floats: If True, convert float columns with whole numbers to Int64
+        columns: Headers to read, in table order; "required" for the table's
+            REQUIRED_COLUMNS; None reads every column
+        
+    Returns:
+        DataFrame containing the table data
+        
+    Raises:
+        RuntimeError: If workbook cannot be opened
+        KeyError: If sheet or table is not found (when require_table=True)
+        MissingColumnError: If a requested column is not in the table
+        ValueError: If table reference format is invalid
+    """
+    try:
+        with PackageReader(xlsx_path) as reader:
+            return reader.read_table_as_df(
+                sheet_name,
+                table_name,
+                require_table=require_table,
+                convert_integer_floats=convert_integer_floats,
+                columns=columns,
+            )
+    except (FileNotFoundError, KeyError):
+        raise
+    except Exception as e:
+        logger.debug(f"Package read of {table_name!r} failed ({e}); falling back to openpyxl")
+
+    with WorkbookSession(xlsx_path) as session:
+        return session.read_table_as_df(
+            sheet_name,
+            table_name,
+            require_table=require_table,
+            convert_integer_floats=convert_integer_floats,
+            columns=columns,
+        )
+
+
+def read_table_as_dict(
+    xlsx_path: str,
+    sheet_name: str,
+    table_name: str,
+    key_col: str | None = None,
+    value_col: str | None = None,
+    require_unique_keys: bool = True,
+) -> dict:
+    """Read a two-column Excel table and return a dict mapping key->value.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+        sheet_name: Name of the worksheet containing the table
+        table_name: Name of the Excel table to read
+        key_col: Column name to use as key (defaults to first column)
+        value_col: Column name to use as value (defaults to second column)
+        require_unique_keys: If True, raise error on duplicate keys
+        
+    Returns:
+        Dictionary mapping keys to values
+        
+    Raises:
+        ValueError: If table doesn't have exactly 2 columns or has duplicate keys
+        KeyError: If specified key/value columns are not found
+    """
+    df = read_table_as_df(xlsx_path, sheet_name, table_name, require_table=True)
+    return frame_to_dict(df, sheet_name, table_name, key_col, value_col, require_unique_keys)
+
+
+def read_tables(
+    xlsx_path: str,
+    tables: list[tuple[str, str]],
+    require_table: bool = True,
+    convert_integer_floats: bool = True,
+    columns: dict[str, list[str]] | str | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Read several Excel tables from one workbook in a single pass.
+
+    The package is opened once and each sheet's XML is parsed at most once
+    (see PackageReader.read_tables). Falls back to openpyxl if the package
+    cannot be parsed directly.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+        tables: (sheet_name, table_name) pairs to read
+        require_table: If True, raise an error if a table is not found
+        convert_integer_floats: If True, convert float columns with whole numbers to Int64
+        columns: Headers to read per table name (tables not listed are read
+            in full), or "required" to read each table's REQUIRED_COLUMNS
+
+    Returns:
+        Dict mapping table name -> DataFrame, in the order requested
+
+    Raises:
+        FileNotFoundError: If the workbook does not exist
+        KeyError: If a sheet or table is not found (when require_table=True)
+        MissingColumnError: If a requested column is not in its table
+        ValueError: If a table reference format is invalid
+    """
+    try:
+        with PackageReader(xlsx_path) as reader:
+            return reader.read_tables(tables, require_table, convert_integer_floats, columns)
+    except (FileNotFoundError, KeyError):
+        raise
+    except Exception as e:
+        logger.debug(f"Package read of {len(tables)} tables failed ({e}); falling back to openpyxl")
+
+    with WorkbookSession(xlsx_path, read_only=True) as session:
+        return session.read_tables(tables, require_table, convert_integer_floats, columns)
+
+
+def read_cell_value(xlsx_path: str, sheet_name: str, coordinate: str) -> Any:
+    """Read the cached value of a single cell, e.g. the dual-emcee flag in F2.
+
+    Uses a PackageReader, falling back to openpyxl if the package cannot be
+    parsed directly.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+        sheet_name: Name of the worksheet containing the cell
+        coordinate: Cell coordinate such as 'F2'
+
+    Returns:
+        The cell value (None for an empty cell)
+
+    Raises:
+        FileNotFoundError: If the workbook does not exist
+        KeyError: If the sheet is not found
+    """
+    try:
+        with PackageReader(xlsx_path) as reader:
+            return reader.read_cell_value(sheet_name, coordinate)
+    except (FileNotFoundError, KeyError):
+        raise
+    except Exception as e:
+        logger.debug(f"Package read of {sheet_name}!{coordinate} failed ({e}); falling back to openpyxl")
+
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        return wb[sheet_name][coordinate].value
+    finally:
+        wb.close()
+
+
+def match_table_columns(
+    data: pd.DataFrame,
+    headers: list,
+    table_name: str,
+    sheet_name: str,
+    require_all_columns: bool = False,
+) -> pd.DataFrame:
+    """Check a DataFrame's columns against a table's headers before writing it.
+
+    Validates REQUIRED_COLUMNS and logs columns that are only in the DataFrame
+    (ignored) or only in the table (left empty).
+
+    Returns:
+        A copy of data with surrounding whitespace stripped from the column names
+
+    Raises:
+        ValueError: If required columns are missing, or the columns differ
+            from the headers when require_all_columns is set
+    """
+    df = data.copy()
+    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
+    
+    # Validate required columns
+    if table_name in REQUIRED_COLUMNS:
+        required_cols = REQUIRED_COLUMNS[table_name]
+        missing_required = [col for col in required_cols if col not in df.columns]
+        if missing_required:
+            raise ValueError(
+                f"DataFrame is missing required columns for table {table_name!r}: {missing_required}\n"
+                f"Required: {required_cols}\n"
+                f"DataFrame has: {list(df.columns)}"
+            )
+        logger.debug(f"✓ DataFrame has all required columns for {table_name}")
+    
+    # Check for column mismatches (more forgiving approach)
+    df_cols_set = set(df.columns)
+    table_cols_set = set(headers)
+    
+    extra_in_df = df_cols_set - table_cols_set
+    missing_in_df = table_cols_set - df_cols_set
+    matching_cols = df_cols_set & table_cols_set
+    
+    if extra_in_df:
+        logger.warning(
+            f"DataFrame has {len(extra_in_df)} column(s) not in OJS table '{table_name}': {sorted(extra_in_df)}"
+        )
+        logger.warning("These columns will be ignored")
+    
+    if missing_in_df:
+        logger.info(
+            f"OJS table '{table_name}' has {len(missing_in_df)} column(s) not in DataFrame: {sorted(missing_in_df)}"
+        )
+        logger.info("These columns will be filled with None")
+
+    # Legacy strict mode
+    if require_all_columns:
+        if list(df.columns) != headers:
+            raise ValueError(
+                f"DataFrame columns do not match table headers for {table_name!r} on sheet {sheet_name!r}.\n"
+                f"Table headers: {headers}\nDataFrame columns: {list(df.columns)}"
+            )
+
+    return df
+
+
+def _blank_row(values: tuple) -> bool:
+    """True if every value of a table row is empty or whitespace."""
+    return all(
+        value is None or (isinstance(value, str) and value.strip() == "")
+        for value in values
+    )
+
+
+def _blank_key(value: Any) -> bool:
+    """True if a key cell is empty, whitespace or NaN, so it cannot match a row."""
+    if isinstance(value, str):
+        return value.strip() == ""
+    return value is None or bool(pd.isna(value))
+
+
+def _upsert_key(value: Any) -> Any:
+    """Normalize a key cell so 1234, 1234.0 and " 1234 " match."""
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def table_row_writes(
+    df: pd.DataFrame,
+    headers: list[str],
+    existing_rows: list[tuple],
+    first_row: int,
+    key: str | None = None,
+) -> tuple[list[tuple[int, tuple]], int]:
+    """Work out which sheet row each DataFrame row goes to.
+
+    The DataFrame is turned into one tuple per row, in header order, with
+    None for headers it has no column for. Without a key, rows fill the
+    table's blank data rows and the rest are appended below it. With a key,
+    a row whose key matches a data row already in the table updates that row
+    instead. Keys are only matched against the table, never against other
+    rows of df: a row with a blank key is always added, and a key repeated
+    in df is logged and the repeat added as a new row, so no row is dropped.
+
+    Args:
+        df: Rows to write (columns already matched to the headers)
+        headers: Table headers, left to right
+        existing_rows: Values of the table's current data rows
+        first_row: Sheet row of existing_rows[0]
+        key: Header to upsert by (e.g. "Team #"), or None to only add rows
+
+    Returns:
+        (row index, values) pairs in sheet-row order, and the table's new last row
+    """
+    total_rows = len(df)
+    columns = [
+        df[col_name].tolist() if col_name in df.columns else [None] * total_rows
+        for col_name in headers
+    ]
+    records = list(zip(*columns))
+    last_row = first_row + len(existing_rows) - 1
+
+    targets: dict[int, tuple] = {}
+    blank_rows = iter([
+        first_row + i for i, values in enumerate(existing_rows) if _blank_row(values)
+    ])
+    key_rows: dict[Any, int] = {}
+    if key is not None:
+        key_col = headers.index(key)
+        for i, values in enumerate(existing_rows):
+            if not _blank_key(values[key_col]):
+                key_rows.setdefault(_upsert_key(values[key_col]), first_row + i)
+
+    seen_keys: set = set()
+    for values in records:
+        row_idx = None
+        if key is not None and not _blank_key(values[key_col]):
+            row_key = _upsert_key(values[key_col])
+            if row_key in seen_keys:
+                logger.warning(f"Duplicate {key} {row_key!r} in the rows to write; adding it as a new row")
+            else:
+                seen_keys.add(row_key)
+                row_idx = key_rows.get(row_key)
+        if row_idx is None:
+            row_idx = next(blank_rows, None)
+            if row_idx is None:
+                last_row += 1
+                row_idx = last_row
+        targets[row_idx] = values
+
+    return sorted(targets.items()), last_row
+
+
 def add_table_dataframe(
     wb: Workbook,
     sheet_name: str,
@@ -306,14 +1523,20 @@ def add_table_dataframe(
     require_all_columns: bool = False,  # Changed default to False for more forgiving behavior
     keep_vba: bool = True,
     debug: bool = False,
+    key: str | None = None,
 ) -> int:
-    """Append a pandas.DataFrame to an existing Excel table.
+    """Append (or upsert) a pandas.DataFrame to an existing Excel table.
     
     This function intelligently handles column mismatches:
     - Validates DataFrame has all required columns for the table
     - Uses only columns that exist in both DataFrame and OJS table
     - Warns about extra columns in DataFrame or missing columns in OJS
     - Fills OJS columns not in DataFrame with None
+
+    The DataFrame is converted to row tuples once and the header-to-column
+    mapping is worked out once, so each cell is a single assignment. With a
+    key (e.g. "Team #"), rows whose key is already in the table update that
+    row in place; other rows fill blank data rows, then go below the table.
     
     Args:
         wb: The Excel workbook object
@@ -323,12 +1546,13 @@ def add_table_dataframe(
         require_all_columns: If True, require exact column match (legacy mode)
         keep_vba: Placeholder for VBA preservation (not currently used)
         debug: If True, print diagnostic information
+        key: Column to upsert by, or None to only add rows
         
     Returns:
         Number of rows written to the table
         
     Raises:
-        KeyError: If sheet or table is not found
+        KeyError: If sheet or table is not found, or key is not a table column
         ValueError: If DataFrame is missing required columns
     """
     if data is None or data.empty:
@@ -365,101 +1589,28 @@ def add_table_dataframe(
     logger.debug(f"Adding {len(data)} rows to table '{table_name}' on sheet '{sheet_name}'")
     
     table = ws.tables[table_name]
-    table_range = table.ref
-
-    table_head = ws[table_range][0]
-    table_data_rows = ws[table_range][1:]
-    headers = [
-        c.value.strip() if isinstance(c.value, str) else c.value for c in table_head
-    ]
-
-    df = data.copy()
-    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
-    
-    # Validate required columns
-    if table_name in REQUIRED_COLUMNS:
-        required_cols = REQUIRED_COLUMNS[table_name]
-        missing_required = [col for col in required_cols if col not in df.columns]
-        if missing_required:
-            raise ValueError(
-                f"DataFrame is missing required columns for table {table_name!r}: {missing_required}\n"
-                f"Required: {required_cols}\n"
-                f"DataFrame has: {list(df.columns)}"
-            )
-        logger.debug(f"✓ DataFrame has all required columns for {table_name}")
-    
-    # Check for column mismatches (more forgiving approach)
-    df_cols_set = set(df.columns)
-    table_cols_set = set(headers)
-    
-    extra_in_df = df_cols_set - table_cols_set
-    missing_in_df = table_cols_set - df_cols_set
-    matching_cols = df_cols_set & table_cols_set
-    
-    if extra_in_df:
-        logger.warning(
-            f"DataFrame has {len(extra_in_df)} column(s) not in OJS table '{table_name}': {sorted(extra_in_df)}"
-        )
-        logger.warning("These columns will be ignored")
-    
-    if missing_in_df:
-        logger.info(
-            f"OJS table '{table_name}' has {len(missing_in_df)} column(s) not in DataFrame: {sorted(missing_in_df)}"
-        )
-        logger.info("These columns will be filled with None")
+    min_col, min_row, max_col, max_row = range_boundaries(table.ref)
 
-    # Legacy strict mode
-    if require_all_columns:
-        if list(df.columns) != headers:
-            raise ValueError(
-                f"DataFrame columns do not match table headers for {table_name!r} on sheet {sheet_name!r}.\n"
-                f"Table headers: {headers}\nDataFrame columns: {list(df.columns)}"
-            )
+    header_values, *existing_rows = ws.iter_rows(
+        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True
+    )
+    headers = [value.strip() if isinstance(value, str) else value for value in header_values]
 
-    start_cell, end_cell = table_range.split(":")
-    _, end_row = coordinate_from_string(end_cell)
-    start_col_letter, start_row = coordinate_from_string(start_cell)
-    start_col_idx = column_index_from_string(start_col_letter)
+    df = match_table_columns(data, headers, table_name, sheet_name, require_all_columns)
+    if key is not None and key not in headers:
+        raise KeyError(f"Upsert key {key!r} is not a column of table {table_name!r}")
 
-    rows_written = 0
-    df_iter_index = 0
-    total_rows = len(df)
+    writes, last_row = table_row_writes(df, headers, existing_rows, min_row + 1, key)
+    columns = range(min_col, max_col + 1)
+    for row_idx, values in writes:
+        for col_idx, value in zip(columns, values):
+            ws.cell(row=row_idx, column=col_idx).value = value
+    rows_written = len(writes)
 
-    # Fill existing blank rows
-    for row_tuple in table_data_rows:
-        if df_iter_index >= total_rows:
-            break
-        if all(
-            (cell.value is None)
-            or (isinstance(cell.value, str) and cell.value.strip() == "")
-            for cell in row_tuple
-        ):
-            target_row_idx = row_tuple[0].row
-            row_values = df.iloc[df_iter_index]
-            for j, col_name in enumerate(headers):
-                # Only use value if column exists in DataFrame
-                val = row_values[col_name] if col_name in df.columns else None
-                ws.cell(row=target_row_idx, column=start_col_idx + j).value = val
-            df_iter_index += 1
-            rows_written += 1
-
-    # Append remaining rows
-    current_row = int(end_row)
-    appended = False
-    while df_iter_index < total_rows:
-        current_row += 1
-        row_values = df.iloc[df_iter_index]
-        for j, col_name in enumerate(headers):
-            # Only use value if column exists in DataFrame
-            val = row_values[col_name] if col_name in df.columns else None
-            ws.cell(row=current_row, column=start_col_idx + j).value = val
-        df_iter_index += 1
-        rows_written += 1
-        appended = True
-
-    if appended:
-        end_col_letter = coordinate_from_string(end_cell)[0]
-        table.ref = f"{start_cell}:{end_col_letter}{current_row}"
+    if last_row != max_row:
+        workbook_index(wb).set_ref(
+            table_name, f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{last_row}"
+        )
 
     logger.debug(f"Wrote {rows_written} rows to table '{table_name}'")
     return rows_written
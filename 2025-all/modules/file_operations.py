@@ -6,7 +6,6 @@ import shutil
 import logging
 from typing import Any
 import pandas as pd
-from openpyxl import load_workbook
 
 from .constants import (
     COL_SHORT_NAME, 
@@ -25,6 +24,7 @@ from .constants import (
     AWARD_LABEL_PREFIX,
     SHEET_TEAM_INFO
 )
+from .excel_operations import read_cell_value
 from .logger import print_error
 
 
@@ -115,7 +115,7 @@ def create_folder(newpath: str) -> None:
 def copy_files(
     item: pd.Series,
     dir_path: str,
-    template_file: str,
+    template_file: str | None,
     common_files: list[dict],
     divisions_only_files: list[dict],
     no_divisions_only_files: list[dict],
@@ -136,7 +136,8 @@ def copy_files(
     Args:
         item: Tournament row with 'Short Name' and 'OJS_FileName'
         dir_path: Base directory containing source files
-        template_file: Path to OJS template workbook
+        template_file: Path to OJS template workbook, or None to leave the
+            OJS file to the caller (fll-maestro saves it from a PreparedTemplate)
         common_files: List of {source, dest} dicts for files always copied
         divisions_only_files: List of {source, dest} dicts for division tournaments only
         no_divisions_only_files: List of {source, dest} dicts for non-division tournaments only
@@ -208,6 +209,9 @@ def copy_files(
             
     logger.info(f"Copied {len(files_to_copy)} files successfully")
     
+    if template_file is None:
+        return
+    
     # Copy OJS template
     try:
         if not os.path.exists(template_file):
@@ -315,9 +319,7 @@ def generate_tournament_config(
     
     try:
         if os.path.exists(current_ojs_path):
-            ojs_book = load_workbook(current_ojs_path, data_only=True)
-            ws_tapi = ojs_book[SHEET_TEAM_INFO]
-            dual_emcee_value = ws_tapi["F2"].value
+            dual_emcee_value = read_cell_value(current_ojs_path, SHEET_TEAM_INFO, "F2")
             
             # Convert to boolean
             current_dual_emcee = False
@@ -332,8 +334,6 @@ def generate_tournament_config(
             if current_dual_emcee:
                 info_section["dual_emcee"] = True
                 logger.debug(f"Dual emcee enabled from {tournament[COL_OJS_FILENAME]}")
-            
-            ojs_book.close()
     except Exception as e:
         logger.debug(f"Could not read dual_emcee from {current_ojs_path}: {e}")
 
@@ -0,0 +1,177 @@
+"""Everything fll-toast reads from an OJS file, read in one go.
+
+fll-toast reads the dual-emcee flag, validates the four score tables and
+collects the team list and results of each OJS file. OJSSnapshot opens the
+file once, reads the tables and cells those steps use (cached values, as
+Excel last saved them) and closes it again, so OJSValidator and
+CeremonyDataCollector work from memory instead of each opening the file.
+Given a StepCache, tables and cells on sheets whose package parts are
+unchanged since the last run are taken from the cache instead of parsed.
+
+Example:
+    snapshot = OJSSnapshot(ojs_path)
+    dual_emcee = snapshot.cell(SHEET_TEAM_INFO, CELL_DUAL_EMCEE)
+    validator.validate_all_sheets(ojs_path, division, snapshot)
+    collector = CeremonyDataCollector(config, snapshots={ojs_path: snapshot})
+"""
+
+import logging
+from typing import Any
+
+import pandas as pd
+
+from .constants import (
+    SHEET_TEAM_INFO, SHEET_ROBOT_GAME, SHEET_INNOVATION, SHEET_ROBOT_DESIGN,
+    SHEET_CORE_VALUES, SHEET_RESULTS,
+    TABLE_TEAM_LIST, TABLE_ROBOT_GAME, TABLE_INNOVATION, TABLE_ROBOT_DESIGN,
+    TABLE_CORE_VALUES, TABLE_TOURNAMENT_DATA, CELL_DUAL_EMCEE,
+)
+from .excel_operations import PackageReader, WorkbookSession
+from .toast_cache import StepCache
+
+logger = logging.getLogger("ceremony_generator")
+
+# Tables fll-toast reads from every OJS file, as (sheet, table)
+OJS_TABLES: list[tuple[str, str]] = [
+    (SHEET_TEAM_INFO, TABLE_TEAM_LIST),
+    (SHEET_ROBOT_GAME, TABLE_ROBOT_GAME),
+    (SHEET_INNOVATION, TABLE_INNOVATION),
+    (SHEET_ROBOT_DESIGN, TABLE_ROBOT_DESIGN),
+    (SHEET_CORE_VALUES, TABLE_CORE_VALUES),
+    (SHEET_RESULTS, TABLE_TOURNAMENT_DATA),
+]
+
+# Single cells fll-toast reads from every OJS file, as (sheet, coordinate)
+OJS_CELLS: list[tuple[str, str]] = [
+    (SHEET_TEAM_INFO, CELL_DUAL_EMCEE),
+]
+
+
+class OJSSnapshot:
+    """The tables and cells of one OJS file, read once and held in memory.
+
+    A table or cell that could not be read (e.g. it is missing from the
+    file) is remembered with its error; table() and cell() raise it again,
+    so callers report it exactly as a direct read would have.
+    """
+
+    def __init__(
+        self,
+        ojs_path: str,
+        tables: list[tuple[str, str]] | None = None,
+        cells: list[tuple[str, str]] | None = None,
+        cache: StepCache | None = None,
+    ):
+        """Read the tables and cells from the file.
+
+        Reads the package XML directly, falling back to openpyxl in
+        read-only, data-only mode if the package cannot be parsed that way.
+
+        Args:
+            ojs_path: Path to the OJS workbook
+            tables: (sheet, table) pairs to read; defaults to OJS_TABLES
+            cells: (sheet, coordinate) pairs to read; defaults to OJS_CELLS
+            cache: Cache of the file's previous reads (only used when the
+                package XML can be read directly)
+
+        Raises:
+            FileNotFoundError: If the workbook does not exist
+            RuntimeError: If the workbook cannot be opened at all
+        """
+        self.ojs_path = ojs_path
+        self._tables: dict[str, pd.DataFrame] = {}
+        self._cells: dict[tuple[str, str], Any] = {}
+        self._errors: dict[Any, Exception] = {}
+        # CRCs of the package parts behind each sheet read (None after an openpyxl read)
+        self.parts: dict[str, dict[str, int]] | None = None
+        tables = OJS_TABLES if tables is None else tables
+        cells = OJS_CELLS if cells is None else cells
+
+        try:
+            with PackageReader(ojs_path) as reader:
+                sheets = dict.fromkeys(sheet_name for sheet_name, _ in tables + cells)
+                self.parts = {sheet_name: reader.part_crcs(sheet_name) for sheet_name in sheets}
+                self._read(reader, tables, cells, reader.read_cell_value, cache)
+            return
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.debug(f"Package read of {ojs_path} failed ({e}); falling back to openpyxl")
+
+        self._tables, self._cells, self._errors, self.parts = {}, {}, {}, None
+        with WorkbookSession(ojs_path, read_only=True) as session:
+            def read_cell(sheet_name: str, coordinate: str) -> Any:
+                return session.workbook[sheet_name][coordinate].value
+
+            self._read(session, tables, cells, read_cell)
+
+    def _read(self, reader, tables, cells, read_cell, cache: StepCache | None = None) -> None:
+        """Fill the snapshot from an open PackageReader or WorkbookSession."""
+        def cached_read(step: str, sheet_name: str, read: Any, errors: tuple) -> tuple[Any, Exception | None]:
+            key = self.parts[sheet_name] if cache is not None and self.parts else None
+            results = cache.lookup(step, key) if key is not None else None
+            if results is None:
+                try:
+                    results = (read(), None)
+                except errors as e:
+                    results = (None, e)
+                if key is not None:
+                    cache.store(step, key, results)
+            return results
+
+        for sheet_name, table_name in tables:
+            df, error = cached_read(
+                f"table {sheet_name}/{table_name}", sheet_name,
+                lambda: reader.read_table_as_df(sheet_name, table_name), (KeyError, ValueError),
+            )
+            if error is None:
+                self._tables[table_name] = df
+            else:
+                self._errors[table_name] = error
+        for sheet_name, coordinate in cells:
+            value, error = cached_read(
+                f"cell {sheet_name}!{coordinate}", sheet_name,
+                lambda: read_cell(sheet_name, coordinate), (KeyError,),
+            )
+            if error is None:
+                self._cells[(sheet_name, coordinate)] = value
+            else:
+                self._errors[(sheet_name, coordinate)] = error
+        logger.debug(
+            f"Snapshot of {self.ojs_path}: {len(self._tables)} tables, {len(self._cells)} cells"
+            + (f", {len(self._errors)} unreadable" if self._errors else "")
+        )
+
+    def table(self, table_name: str) -> pd.DataFrame:
+        """A table as a DataFrame (shared; copy it before changing it).
+
+        Raises:
+            KeyError: If the table was not read or is not in the file
+        """
+        if table_name in self._errors:
+            raise self._errors[table_name]
+        if table_name not in self._tables:
+            raise KeyError(f"Table {table_name!r} is not part of the snapshot of {self.ojs_path}")
+        return self._tables[table_name]
+
+    def get(self, table_name: str) -> pd.DataFrame | None:
+        """A table as a DataFrame, or None if it could not be read."""
+        return self._tables.get(table_name)
+
+    def rows(self, table_name: str) -> list[dict[str, Any]]:
+        """A table as one dict per row, with blank cells as None."""
+        df = self.table(table_name)
+        return df.astype(object).where(df.notna(), None).to_dict("records")
+
+    def cell(self, sheet_name: str, coordinate: str) -> Any:
+        """The cached value of a cell, e.g. cell(SHEET_TEAM_INFO, "F2").
+
+        Raises:
+            KeyError: If the cell was not read or its sheet is not in the file
+        """
+        key = (sheet_name, coordinate)
+        if key in self._errors:
+            raise self._errors[key]
+        if key not in self._cells:
+            raise KeyError(f"Cell {sheet_name}!{coordinate} is not part of the snapshot of {self.ojs_path}")
+        return self._cells[key]
@@ -0,0 +1,51 @@
+"""Namespaces and part lookups for reading an Excel workbook as a zip package.
+
+Shared by the package reader in modules/excel_operations.py and the patch
+writer in modules/xlsm_patch.py, which both work on the workbook's XML parts
+directly instead of loading it with openpyxl.
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+# OOXML namespaces used when reading workbook parts straight from the package
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def resolve_part(source_part: str, target: str) -> str:
+    """Resolve a relationship target relative to the part that owns it."""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def rels_path(part: str) -> str:
+    """Path of the relationships part belonging to `part`."""
+    return posixpath.join(posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels")
+
+
+def read_relationships(archive: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """Map relationship id -> (type, resolved target part) for a package part."""
+    rels_part = rels_path(part)
+    if rels_part not in archive.NameToInfo:
+        return {}
+
+    root = ET.fromstring(archive.read(rels_part))
+    rels = {}
+    for rel in root.iter(f"{{{NS_PKG_REL}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        rels[rel.get("Id")] = (rel.get("Type", ""), resolve_part(part, rel.get("Target", "")))
+    return rels
+
+
+def find_workbook_part(archive: zipfile.ZipFile) -> str:
+    """Path of the workbook part (normally xl/workbook.xml)."""
+    root_rels = read_relationships(archive, "")
+    return next(
+        (target for rel_type, target in root_rels.values() if rel_type.endswith("/officeDocument")),
+        "xl/workbook.xml",
+    )
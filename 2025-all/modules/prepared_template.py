@@ -0,0 +1,151 @@
+"""OJS template loaded and sanitized once per season.
+
+Every tournament's OJS workbook starts from the same template. Loading it,
+hiding the utility sheets, applying sheet protection and stripping external
+links gives the same result for every tournament, so PreparedTemplate does
+that work once and hands each tournament an in-memory clone to which only
+its own data is added.
+
+With the patch writer (modules/xlsm_patch.py) the prepared template is the
+sanitized package itself and each clone is an OJSPackage over its bytes.
+"""
+
+import io
+import pickle
+import copyreg
+import logging
+from zipfile import ZipFile
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet.table import TableList
+from openpyxl.worksheet.dimensions import DimensionHolder
+
+from .constants import OJS_WRITER_OPENPYXL, OJS_WRITER_PATCH
+from .worksheet_setup import (
+    prepare_award_def, hide_worksheets, protect_worksheets, remove_external_links
+)
+from .xlsm_patch import OJSPackage, PackageLayout, prepare_package
+
+logger = logging.getLogger("ojs_builder")
+
+
+def _reduce_table_list(tables: TableList):
+    # TableList.items() yields (name, ref) pairs, which is what pickle would
+    # store for a dict subclass; keep the Table objects instead.
+    return TableList, (), None, None, iter(dict.items(tables))
+
+
+def _reduce_dimension_holder(holder: DimensionHolder):
+    # defaultdict pickling drops the factory (Worksheet._add_row/_add_column)
+    # and instance attributes; without them new rows get no dimensions.
+    return (
+        DimensionHolder,
+        (holder.worksheet, holder.reference, holder.default_factory),
+        dict(vars(holder)),
+        None,
+        iter(dict.items(holder)),
+    )
+
+
+def _same_layout(book: Workbook, clone: Workbook) -> bool:
+    """Check a clone kept the sheets, tables and row/column dimension factories."""
+    if book.sheetnames != clone.sheetnames:
+        return False
+    for ws, ws_clone in zip(book.worksheets, clone.worksheets):
+        # TableList.items() yields (name, ref) pairs, so look at the Table objects
+        if {name: table.ref for name, table in dict.items(ws.tables)} != {
+            name: table.ref for name, table in dict.items(ws_clone.tables)
+        }:
+            return False
+        if ws_clone.row_dimensions.default_factory is None or ws_clone.column_dimensions.default_factory is None:
+            return False
+    return True
+
+
+def _dump_workbook(book: Workbook) -> bytes:
+    """Pickle a workbook, keeping the openpyxl containers pickle gets wrong."""
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[TableList] = _reduce_table_list
+    pickler.dispatch_table[DimensionHolder] = _reduce_dimension_holder
+    pickler.dump(book)
+    return buffer.getvalue()
+
+
+class PreparedTemplate:
+    """A sanitized OJS template that can be cloned cheaply per tournament.
+
+    The workbook is kept pickled (unpickling is several times faster than
+    parsing the xlsm again), together with the template's raw bytes, which
+    serve as the macro archive openpyxl copies the VBA project from on save.
+    The object holds only bytes and a DataFrame, so it can be passed to
+    worker processes. If the installed openpyxl does not survive the pickle
+    round trip, each clone is loaded from the template bytes instead.
+
+    Example:
+        template = PreparedTemplate(template_file, dfAwardDef)
+        book = template.clone()
+    """
+
+    def __init__(self, template_file: str, dfAwardDef: pd.DataFrame, writer: str = OJS_WRITER_OPENPYXL):
+        """Load the template and apply the season-invariant setup steps.
+
+        Args:
+            template_file: Path to the OJS template workbook (.xlsm)
+            dfAwardDef: DataFrame containing award definitions
+            writer: OJS_WRITER_OPENPYXL or OJS_WRITER_PATCH
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        logger.info(f"Preparing OJS template: {template_file}")
+        with open(template_file, "rb") as f:
+            self._package = f.read()
+
+        self.writer = writer
+        self.award_def = prepare_award_def(dfAwardDef)
+
+        if writer == OJS_WRITER_PATCH:
+            self._package = prepare_package(self._package)
+            with ZipFile(io.BytesIO(self._package)) as archive:
+                self._layout = PackageLayout.read(archive)
+            logger.debug(f"Prepared template package ({len(self._package)} bytes)")
+            return
+
+        book = self._load()
+
+        # The macro archive wraps an in-memory zip, which cannot be pickled;
+        # clone() attaches a fresh one over the template bytes instead.
+        book.vba_archive = None
+        try:
+            self._book = _dump_workbook(book)
+            if not _same_layout(book, pickle.loads(self._book)):
+                raise ValueError("tables or dimensions lost")
+            logger.debug(f"Prepared template ({len(self._book)} bytes pickled)")
+        except Exception as e:
+            # The pickle reducers rely on openpyxl internals; if this openpyxl
+            # does not round-trip, each clone loads the template instead
+            logger.warning(f"Cannot copy the prepared template in memory ({e}); loading it per tournament")
+            self._book = None
+        book.close()
+
+    def _load(self) -> Workbook:
+        """Load the template bytes and apply the season-invariant setup steps."""
+        book = load_workbook(io.BytesIO(self._package), read_only=False, keep_vba=True)
+        hide_worksheets(book)
+        protect_worksheets(book)
+        remove_external_links(book)
+        return book
+
+    def clone(self) -> Workbook | OJSPackage:
+        """Return a fresh copy of the prepared workbook, ready to populate and save."""
+        if self.writer == OJS_WRITER_PATCH:
+            return OJSPackage(self._package, self._layout)
+        if self._book is None:
+            return self._load()
+        book = pickle.loads(self._book)
+        book.vba_archive = ZipFile(io.BytesIO(self._package))
+        return book
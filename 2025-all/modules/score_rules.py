@@ -0,0 +1,229 @@
+"""Score rules for the OJS judging tables and the engine that checks them.
+
+Each ScoreRule says which columns of which table hold scores, what a valid
+score is (a range or a set of values) and whether blank cells are errors.
+check_rules() evaluates the whole rule table against tables already read
+into DataFrames: every rule's columns are checked together as one NumPy
+block, and each blank or invalid cell is reported with its worksheet row,
+team number and column.
+
+fll-toast checks a tournament's OJS files with these rules before building
+the ceremony script (see modules/ceremony_validator.py); fll-maestro checks
+that the template has every scored table and column before building OJS
+files from it.
+
+Example:
+    issues = check_rules(tables)
+    for issue in issues:
+        print(issue.sheet, issue.row, issue.team_number, issue.column, issue.problem)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    SHEET_ROBOT_GAME, SHEET_INNOVATION, SHEET_ROBOT_DESIGN, SHEET_CORE_VALUES,
+    TABLE_ROBOT_GAME, TABLE_INNOVATION, TABLE_ROBOT_DESIGN, TABLE_CORE_VALUES,
+    COL_TEAM_NUMBER,
+)
+from .excel_operations import read_tables
+
+logger = logging.getLogger("ceremony_generator")
+
+# Blank cell policies
+BLANK_ERROR = "ERROR"
+BLANK_WARNING = "WARNING"
+BLANK_ALLOWED = "ALLOWED"
+
+# Problems check_rules() reports
+PROBLEM_MISSING_TABLE = "missing table"
+PROBLEM_MISSING_COLUMN = "missing column"
+PROBLEM_BLANK = "blank"
+PROBLEM_INVALID = "invalid"
+
+
+@dataclass(frozen=True)
+class ScoreRule:
+    """The score columns of one table and the values allowed in them.
+
+    Attributes:
+        sheet: Worksheet the table is on
+        table: Table name
+        columns: Score columns the rule applies to
+        minimum: Lowest valid score (with maximum; ignored if allowed is set)
+        maximum: Highest valid score
+        allowed: The only valid scores, if they are not a range
+        blanks: BLANK_ERROR, BLANK_WARNING or BLANK_ALLOWED
+        first_row: Worksheet row of the table's first data row
+    """
+    sheet: str
+    table: str
+    columns: tuple[str, ...]
+    minimum: float | None = None
+    maximum: float | None = None
+    allowed: frozenset | None = None
+    blanks: str = BLANK_ERROR
+    first_row: int = 2
+
+    def describe_invalid(self, count: int) -> str:
+        """How a column's invalid scores are reported, e.g. "2 score(s) outside valid range (0-5)"."""
+        if self.allowed is not None:
+            return f"{count} invalid score(s). Must be one of: {sorted(self.allowed)}"
+        return f"{count} score(s) outside valid range ({self.minimum:g}-{self.maximum:g})"
+
+    def valid_mask(self, scores: np.ndarray) -> np.ndarray:
+        """Which of the (numeric, NaN for non-numbers) scores are valid."""
+        if self.allowed is not None:
+            return np.isin(scores, list(self.allowed))
+        valid = ~np.isnan(scores)
+        if self.minimum is not None:
+            valid &= scores >= self.minimum
+        if self.maximum is not None:
+            valid &= scores <= self.maximum
+        return valid
+
+
+@dataclass(frozen=True)
+class CellIssue:
+    """A problem found by check_rules().
+
+    row and team_number are None for a missing table or column.
+    """
+    severity: str
+    sheet: str
+    table: str
+    column: str | None
+    problem: str
+    row: int | None = None
+    team_number: Any = None
+    value: Any = None
+
+
+ROBOT_GAME_SCORE_COLUMNS = ("Robot Game 1 Score", "Robot Game 2 Score", "Robot Game 3 Score")
+INNOVATION_COLUMNS = (
+    "Identify - Define", "Identify - Research (CV)", "Design - Plan",
+    "Design - Teamwork (CV)", "Create - Innovation (CV)", "Create - Model",
+    "Iterate - Sharing", "Iterate - Improvement", "Communicate - Impact (CV)",
+    "Communicate - Fun (CV)",
+)
+ROBOT_DESIGN_COLUMNS = (
+    "Identify - Strategy", "Identify - Research (CV)", "Design - Ideas (CV)",
+    "Design - Building/Coding", "Create - Attachments", "Create - Code/ Sensors",
+    "Iterate - Testing", "Iterate - Improvements (CV)", "Communicate - Impact (CV)",
+    "Communicate - Fun (CV)",
+)
+CORE_VALUES_COLUMNS = (
+    "Gracious Professionalism 1",
+    "Gracious Professionalism 2",
+    "Gracious Professionalism 3",
+)
+
+# The judging tables of an OJS workbook and their valid scores
+SCORE_RULES: list[ScoreRule] = [
+    ScoreRule(SHEET_ROBOT_GAME, TABLE_ROBOT_GAME, ROBOT_GAME_SCORE_COLUMNS, minimum=0, maximum=545),
+    ScoreRule(SHEET_INNOVATION, TABLE_INNOVATION, INNOVATION_COLUMNS, minimum=0, maximum=5),
+    ScoreRule(SHEET_ROBOT_DESIGN, TABLE_ROBOT_DESIGN, ROBOT_DESIGN_COLUMNS, minimum=0, maximum=5),
+    ScoreRule(SHEET_CORE_VALUES, TABLE_CORE_VALUES, CORE_VALUES_COLUMNS, allowed=frozenset({0, 2, 3, 4})),
+]
+
+
+def _numeric_block(df: pd.DataFrame) -> np.ndarray:
+    """The columns of df as one float array, with NaN for blanks and non-numbers."""
+    return np.column_stack([
+        pd.to_numeric(df.iloc[:, i], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        for i in range(df.shape[1])
+    ])
+
+
+def _check_rule(rule: ScoreRule, df: pd.DataFrame, blanks: str) -> list[CellIssue]:
+    """Check one rule's columns of a table together."""
+    columns = [col for col in rule.columns if col in df.columns]
+    blank = invalid = values = team_numbers = None
+    if columns and not df.empty:
+        block = df[columns]
+        blank = block.isna().to_numpy()
+        invalid = ~blank & ~rule.valid_mask(_numeric_block(block))
+        if blanks == BLANK_ALLOWED:
+            blank = np.zeros_like(blank)
+        values = block.to_numpy(dtype=object)
+        if COL_TEAM_NUMBER in df.columns:
+            team_numbers = df[COL_TEAM_NUMBER].to_numpy(dtype=object)
+
+    issues = []
+    for col in rule.columns:
+        if col not in df.columns:
+            issues.append(CellIssue("ERROR", rule.sheet, rule.table, col, PROBLEM_MISSING_COLUMN))
+            continue
+        if blank is None:
+            continue
+        j = columns.index(col)
+        for problem, severity, mask in (
+            (PROBLEM_BLANK, blanks, blank[:, j]),
+            (PROBLEM_INVALID, "ERROR", invalid[:, j]),
+        ):
+            for i in np.flatnonzero(mask):
+                team = team_numbers[i] if team_numbers is not None else None
+                issues.append(CellIssue(
+                    severity, rule.sheet, rule.table, col, problem,
+                    row=rule.first_row + int(i),
+                    team_number=None if pd.isna(team) else team,
+                    value=None if problem == PROBLEM_BLANK else values[i, j],
+                ))
+    return issues
+
+
+def check_rules(
+    tables: dict[str, pd.DataFrame],
+    rules: list[ScoreRule] | None = None,
+    allow_blanks: bool = False,
+) -> list[CellIssue]:
+    """Check tables against a rule table.
+
+    Issues come back in rule order, then column order, with a column's
+    blank cells before its invalid ones, each in row order.
+
+    Args:
+        tables: DataFrames by table name
+        rules: Rules to check; defaults to SCORE_RULES
+        allow_blanks: If True, blank cells are never reported (e.g. for a template)
+
+    Returns:
+        List of CellIssue, empty if every rule passes
+    """
+    rules = SCORE_RULES if rules is None else rules
+    issues = []
+    for rule in rules:
+        df = tables.get(rule.table)
+        if df is None:
+            issues.append(CellIssue("ERROR", rule.sheet, rule.table, None, PROBLEM_MISSING_TABLE))
+            continue
+        issues.extend(_check_rule(rule, df, BLANK_ALLOWED if allow_blanks else rule.blanks))
+    logger.debug(f"Checked {len(rules)} score rules: {len(issues)} issue(s)")
+    return issues
+
+
+def check_template(template_path: str, rules: list[ScoreRule] | None = None) -> list[CellIssue]:
+    """Check that a template has every table and column of the rules.
+
+    The template's score cells are blank, so only missing tables and columns
+    and scores already filled in with invalid values are reported.
+
+    Args:
+        template_path: Path to the OJS template workbook
+        rules: Rules to check; defaults to SCORE_RULES
+
+    Returns:
+        List of CellIssue, empty if the template passes
+
+    Raises:
+        FileNotFoundError: If the template does not exist
+    """
+    rules = SCORE_RULES if rules is None else rules
+    tables = read_tables(template_path, [(rule.sheet, rule.table) for rule in rules], require_table=False)
+    return check_rules(
+        {name: df for name, df in tables.items() if not df.columns.empty}, rules, allow_blanks=True
+    )
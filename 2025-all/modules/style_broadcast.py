@@ -0,0 +1,102 @@
+"""Copy a template row's formatting down whole table columns.
+
+openpyxl keeps each cell's formatting as a StyleArray of ids into the
+workbook's shared font, fill, border, number format, protection and
+alignment lists. Assigning `cell.font = copy(template.font)` copies the
+style object, hashes it and looks it up in the shared list to get back the
+id the template cell already has - for every attribute of every cell.
+
+These helpers resolve the template's ids once per column and write them
+straight into each target cell's StyleArray, which is what the per-attribute
+copies end up doing anyway.
+
+Example:
+    broadcast_row_styles(ws, first_data_row, range(first_data_row + 1, max_row + 1), 1, 4)
+    broadcast_row_height(ws, first_data_row, range(first_data_row + 1, max_row + 1))
+"""
+
+import logging
+from copy import copy
+
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.protection import Protection
+from openpyxl.worksheet.worksheet import Worksheet
+
+logger = logging.getLogger("ojs_builder")
+
+# StyleArray fields, in openpyxl's order
+STYLE_FIELDS = (
+    "fontId", "fillId", "borderId", "numFmtId", "protectionId", "alignmentId",
+    "pivotButton", "quotePrefix", "xfId",
+)
+
+
+def broadcast_row_styles(
+    ws: Worksheet,
+    template_row: int,
+    rows: range,
+    min_col: int,
+    max_col: int,
+    fields: tuple[str, ...] | None = None,
+) -> None:
+    """Give each cell in rows x columns the formatting of the template row's cell in its column.
+
+    Args:
+        ws: The worksheet
+        template_row: Row whose cells are the template (1-based)
+        rows: Rows to format; may include template_row
+        min_col: First column (1-based)
+        max_col: Last column (inclusive)
+        fields: StyleArray fields to copy (e.g. ("fontId",)); None copies the
+            whole style - font, fill, border, number format, protection and
+            alignment
+    """
+    for col_idx in range(min_col, max_col + 1):
+        template_style = ws.cell(row=template_row, column=col_idx)._style
+        if fields is None:
+            for row_idx in rows:
+                ws.cell(row=row_idx, column=col_idx)._style = copy(template_style)
+        else:
+            values = [(field, getattr(template_style, field)) for field in fields]
+            for row_idx in rows:
+                set_style_fields(ws.cell(row=row_idx, column=col_idx), values)
+
+
+def set_style_fields(cell, values: list[tuple[str, int]]) -> None:
+    """Set StyleArray fields of one cell, e.g. [("protectionId", 2)]."""
+    style = cell._style
+    if not style:
+        style = cell._style = StyleArray()
+    for field, value in values:
+        setattr(style, field, value)
+
+
+def broadcast_protection(
+    ws: Worksheet,
+    rows: range,
+    min_col: int,
+    max_col: int,
+    protection: Protection,
+) -> None:
+    """Apply one cell protection to every cell in rows x columns.
+
+    The protection is registered with the workbook once instead of once per cell.
+    """
+    protection_id = ws.parent._protections.add(protection)
+    values = [("protectionId", protection_id)]
+    for col_idx in range(min_col, max_col + 1):
+        for row_idx in rows:
+            set_style_fields(ws.cell(row=row_idx, column=col_idx), values)
+
+
+def broadcast_row_height(ws: Worksheet, template_row: int, rows: range) -> float | None:
+    """Copy the template row's height to every row in rows.
+
+    Returns:
+        The height copied, or None if the template row has no custom height
+    """
+    height = ws.row_dimensions[template_row].height
+    if height is not None:
+        for row_idx in rows:
+            ws.row_dimensions[row_idx].height = height
+    return height
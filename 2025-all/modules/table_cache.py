@@ -0,0 +1,131 @@
+"""On-disk cache of tables read from the master tournament workbook.
+
+fll-maestro is often rerun many times against an unchanged master workbook
+(e.g. with --tournament during build week). Parsed tables are pickled into a
+cache directory together with a fingerprint of the workbook, so warm runs
+skip parsing entirely. An entry is used only if the workbook's path, size,
+modification time and content hash all still match; anything else re-reads
+the workbook and replaces the entry.
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+from typing import Any
+
+import pandas as pd
+
+from .constants import TABLE_CACHE_VERSION
+from .excel_operations import read_tables
+
+logger = logging.getLogger("ojs_builder")
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def workbook_fingerprint(xlsx_path: str) -> dict[str, Any]:
+    """Identify the current contents of a workbook.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+
+    Returns:
+        Dict with the absolute path, size, mtime (ns) and SHA-256 of the file
+    """
+    stat = os.stat(xlsx_path)
+    return {
+        "path": os.path.abspath(xlsx_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hash_file(xlsx_path),
+    }
+
+
+def _cache_path(cache_dir: str, xlsx_path: str, tables: list[tuple[str, str]], options: tuple) -> str:
+    """Cache file for one workbook path and set of requested tables."""
+    key = repr((TABLE_CACHE_VERSION, pd.__version__, os.path.abspath(xlsx_path), tables, options))
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+    return os.path.join(cache_dir, f"{name}.pkl")
+
+
+def _load_entry(cache_file: str) -> dict | None:
+    """Load a cache entry, or None if it is missing or unreadable."""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+        if isinstance(entry, dict) and "fingerprint" in entry and "tables" in entry:
+            return entry
+        logger.debug(f"Ignoring malformed cache entry {cache_file}")
+    except Exception as e:
+        logger.debug(f"Could not load cache entry {cache_file}: {e}")
+    return None
+
+
+def _save_entry(cache_file: str, entry: dict) -> None:
+    """Write a cache entry atomically; failures are logged and otherwise ignored."""
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        logger.debug(f"Saved table cache {cache_file}")
+    except Exception as e:
+        logger.warning(f"Could not write table cache {cache_file}: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def read_tables_cached(
+    xlsx_path: str,
+    tables: list[tuple[str, str]],
+    cache_dir: str | None,
+    require_table: bool = True,
+    convert_integer_floats: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Read tables with read_tables, reusing a cached copy if the workbook is unchanged.
+
+    Args:
+        xlsx_path: Path to the Excel workbook
+        tables: (sheet_name, table_name) pairs to read
+        cache_dir: Directory holding cache entries; None disables the cache
+        require_table: If True, raise an error if a table is not found
+        convert_integer_floats: If True, convert float columns with whole numbers to Int64
+
+    Returns:
+        Dict mapping table name -> DataFrame, in the order requested
+
+    Raises:
+        FileNotFoundError: If the workbook does not exist
+        KeyError: If a sheet or table is not found (when require_table=True)
+    """
+    if cache_dir is None:
+        return read_tables(xlsx_path, tables, require_table, convert_integer_floats)
+
+    if not os.path.exists(xlsx_path):
+        raise FileNotFoundError(f"Excel file not found: {xlsx_path}")
+
+    fingerprint = workbook_fingerprint(xlsx_path)
+    cache_file = _cache_path(cache_dir, xlsx_path, tables, (require_table, convert_integer_floats))
+
+    entry = _load_entry(cache_file)
+    if entry is not None and entry["fingerprint"] == fingerprint:
+        logger.info(f"Loaded {len(entry['tables'])} table(s) from cache for {os.path.basename(xlsx_path)}")
+        return entry["tables"]
+
+    if entry is not None:
+        logger.debug(f"Cache entry for {os.path.basename(xlsx_path)} is stale; re-reading workbook")
+
+    result = read_tables(xlsx_path, tables, require_table, convert_integer_floats)
+    _save_entry(cache_file, {"fingerprint": fingerprint, "tables": result})
+    return result
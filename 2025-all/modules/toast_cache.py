@@ -0,0 +1,144 @@
+"""Incremental cache of fll-toast's per-file steps and rendered outputs.
+
+An OJS file is a zip package, and the zip's central directory already holds
+a CRC-32 of every part. For each step fll-toast runs on an OJS file (reading
+a table or cell, validating the scores, indexing the awards) a StepCache
+records the CRCs of the parts the step depends on together with the step's
+results, in a small ".<OJS file>.toast-cache" file next to the workbook. On
+the next run a step whose parts are unchanged is not run again and its
+results are reused, so after an edit on one sheet only that sheet is parsed.
+
+The rendered script and summary are cached the same way, keyed by a hash of
+the template data and the template file, so they are only written again when
+they would come out different.
+
+Example:
+    cache = StepCache(toast_cache_path(ojs_path), ojs_path)
+    results = cache.lookup("award index", key)
+    if results is None:
+        results = cache.store("award index", key, (index_awards(df, ojs_path),))
+    cache.save()
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import logging
+from typing import Any
+
+import pandas as pd
+
+from .constants import TOAST_CACHE_SUFFIX, TOAST_CACHE_VERSION
+from .table_cache import hash_file
+
+logger = logging.getLogger("ceremony_generator")
+
+# Cache files written by another version of fll-toast or pandas are ignored
+_CACHE_FORMAT = (TOAST_CACHE_VERSION, pd.__version__)
+
+
+def toast_cache_path(path: str) -> str:
+    """Cache file kept next to a file, e.g. ".ojs-div1.xlsm.toast-cache"."""
+    folder, name = os.path.split(os.path.abspath(path))
+    return os.path.join(folder, f".{name}{TOAST_CACHE_SUFFIX}")
+
+
+def context_hash(template_data: dict, template_file: str) -> str:
+    """Fingerprint of a rendered output's inputs: its template data and template.
+
+    Args:
+        template_data: Variables passed to the template
+        template_file: Path to the Jinja template
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(json.dumps(template_data, sort_keys=True, default=repr).encode("utf-8"))
+    digest.update((hash_file(template_file) if os.path.exists(template_file) else "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+class StepCache:
+    """The results of the steps last run on one file, with the key each ran on.
+
+    A step's key is whatever its results depend on (for OJS steps, the CRCs
+    of the package parts it reads). Only the steps looked up or stored since
+    the cache was opened are written back by save(), so entries for steps
+    that no longer run do not pile up.
+    """
+
+    def __init__(self, cache_file: str, source: str):
+        """Load the cache file, if there is a usable one.
+
+        Args:
+            cache_file: Path of the cache file (see toast_cache_path)
+            source: The file the cached steps ran on; a cache written for
+                another path (e.g. a copied folder) is ignored
+        """
+        self.cache_file = cache_file
+        self.source = os.path.abspath(source)
+        self.hits = 0
+        self.misses = 0
+        self._cached = self._load()
+        self._steps: dict[str, tuple[Any, tuple]] = {}
+
+    def _load(self) -> dict:
+        """The steps in the cache file, or {} if it is missing, stale or unreadable."""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "rb") as f:
+                entry = pickle.load(f)
+            if (
+                isinstance(entry, dict)
+                and entry.get("format") == _CACHE_FORMAT
+                and entry.get("source") == self.source
+            ):
+                return entry["steps"]
+            logger.debug(f"Ignoring stale cache {self.cache_file}")
+        except Exception as e:
+            logger.debug(f"Could not load cache {self.cache_file}: {e}")
+        return {}
+
+    def lookup(self, step: str, key: Any) -> tuple | None:
+        """The results a step stored last time, if it ran on the same key.
+
+        Returns:
+            The stored results, or None if the step has to run again
+        """
+        cached = self._cached.get(step)
+        if cached is None or cached[0] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._steps[step] = cached
+        return cached[1]
+
+    def store(self, step: str, key: Any, results: tuple) -> tuple:
+        """Remember a step's results for the next run.
+
+        Returns:
+            results, unchanged
+        """
+        self._steps[step] = (key, results)
+        return results
+
+    def save(self) -> None:
+        """Write the cache file atomically if any step ran; failures are logged and ignored."""
+        if not self.misses and self._steps.keys() == self._cached.keys():
+            return
+        entry = {"format": _CACHE_FORMAT, "source": self.source, "steps": self._steps}
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+            logger.debug(
+                f"Saved {os.path.basename(self.cache_file)}: "
+                f"{self.hits} step(s) reused, {self.misses} run"
+            )
+        except Exception as e:
+            logger.warning(f"Could not write cache {self.cache_file}: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
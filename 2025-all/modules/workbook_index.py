@@ -0,0 +1,214 @@
+"""Tables and defined names of an openpyxl workbook, indexed by name and target.
+
+openpyxl keeps tables per worksheet and defined names in one flat dict, so
+"where is the TournamentData table", "which names point at the AwardList
+sheet" or "which names link to another workbook" means scanning every sheet
+or every name. WorkbookIndex does that scan once per workbook; the
+worksheet_setup steps look tables and names up in it and tell it when they
+resize a table or replace a name, so it stays current for the steps after
+them. Conditional formatting formulas are indexed by the sheets they refer
+to as well, the first time they are looked up.
+
+Example:
+    index = workbook_index(book)
+    entry = index.table(TABLE_TOURNAMENT_DATA)
+    min_col, min_row, max_col, max_row = entry.boundaries
+    index.set_ref(TABLE_TOURNAMENT_DATA, "A2:W42")
+"""
+
+import re
+import logging
+import weakref
+from dataclasses import dataclass
+
+from openpyxl.workbook import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.table import Table
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.utils.cell import range_boundaries
+
+logger = logging.getLogger("ojs_builder")
+
+# 'Sheet Name'!... or Sheet!... (a leading [n] marks another workbook), or Table[...]
+_TARGET_RE = re.compile(r"^=?(?:'((?:[^']|'')+)'!|([^'!\[\]\s(]*(?:\[[^\]]*\])?[^'!\[\]\s(]+)!|([A-Za-z_\\][\w.\\]*)\[)")
+
+# Every Sheet! or 'Sheet Name'! reference in a formula
+_REFERENCE_RE = re.compile(r"'((?:[^']|'')+)'!|([^\s'!\[\](),=+\-*/&<>^:;{}\"#]+)!")
+
+_indexes: "weakref.WeakKeyDictionary[Workbook, WorkbookIndex]" = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class TableEntry:
+    """A table, the worksheet it is on and its (min_col, min_row, max_col, max_row)."""
+    ws: Worksheet
+    table: Table
+    boundaries: tuple[int, int, int, int]
+
+
+def name_target(value: str | None) -> str | None:
+    """The sheet or table a defined name refers to.
+
+    Examples:
+        "'Results and Rankings'!$A$3:$A$10" -> "Results and Rankings"
+        "AwardList!$A$3" -> "AwardList"
+        "[1]Sheet1!$A$1" -> "[1]Sheet1"
+        "TournamentData[#All]" -> "TournamentData"
+        "0.5" -> None
+    """
+    if not value:
+        return None
+    match = _TARGET_RE.match(value.strip())
+    if match is None:
+        return None
+    quoted, plain, table = match.groups()
+    if quoted is not None:
+        return quoted.replace("''", "'")
+    return plain if plain is not None else table
+
+
+def name_references(value: str | None) -> list[str]:
+    """Every sheet a defined name or formula refers to, in order of appearance.
+
+    Unlike name_target this looks past the start of the value, so a formula
+    such as "=OFFSET(AwardList!$A$1,0,0)" refers to "AwardList". Only whole
+    sheet names count: "MyAwardList!A1" refers to "MyAwardList".
+
+    Examples:
+        "=OFFSET(AwardList!$A$1,0,0,COUNTA('Team List'!A:A))" -> ["AwardList", "Team List"]
+        "[1]Sheet1!$A$1" -> ["Sheet1"]
+    """
+    if not value:
+        return []
+    references = []
+    for quoted, plain in _REFERENCE_RE.findall(str(value)):
+        sheet = quoted.replace("''", "'") if quoted else plain
+        if sheet not in references:
+            references.append(sheet)
+    return references
+
+
+def _bracketed(value: str | None) -> bool:
+    """True if a defined name's value has [ ] - a table column or another workbook."""
+    return bool(value) and "[" in str(value) and "]" in str(value)
+
+
+class WorkbookIndex:
+    """Tables by name and defined names by target for one workbook.
+
+    Attributes:
+        tables: TableEntry by table name
+        names_by_target: Defined names by the sheet or table they refer to
+            (see name_target); names with no such target are under None
+        names_by_reference: Defined names by every sheet their value
+            refers to (see name_references)
+        bracketed: Defined names whose value has [ ], in workbook order
+    """
+
+    def __init__(self, book: Workbook):
+        """Scan the workbook's tables and defined names.
+
+        Args:
+            book: An open openpyxl Workbook object
+        """
+        self.book = book
+        self.tables: dict[str, TableEntry] = {}
+        for ws in book.worksheets:
+            for table in ws.tables.values():
+                self.tables[table.name] = TableEntry(ws, table, range_boundaries(table.ref))
+        self.names_by_target: dict[str | None, list[str]] = {}
+        self.names_by_reference: dict[str, list[str]] = {}
+        self.bracketed: dict[str, None] = {}
+        self._cf_by_reference: dict[str, list[tuple]] | None = None
+        for name, defn in book.defined_names.items():
+            self._add_name(name, defn)
+        logger.debug(f"Indexed {len(self.tables)} tables and {len(book.defined_names)} defined names")
+
+    def table(self, name: str, sheet_name: str | None = None) -> TableEntry | None:
+        """Look up a table, optionally only if it is on the given sheet."""
+        entry = self.tables.get(name)
+        if entry is None or (sheet_name is not None and entry.ws.title != sheet_name):
+            return None
+        return entry
+
+    def set_ref(self, name: str, ref: str) -> TableEntry:
+        """Point a table at a new range (e.g. after adding rows) and update its boundaries."""
+        entry = self.tables[name]
+        entry.table.ref = ref
+        entry.boundaries = range_boundaries(ref)
+        return entry
+
+    def names_targeting(self, target: str | None) -> list[str]:
+        """Defined names that refer to a sheet or table."""
+        return list(self.names_by_target.get(target, []))
+
+    def names_referencing(self, sheet: str) -> list[str]:
+        """Defined names whose value refers to a sheet anywhere, not only at the start."""
+        return list(self.names_by_reference.get(sheet, []))
+
+    def bracketed_names(self) -> list[str]:
+        """Defined names whose value has [ ] - a table column or another workbook."""
+        return list(self.bracketed)
+
+    def cf_formulas_referencing(self, sheet: str) -> list[tuple]:
+        """Conditional formatting formulas that refer to a sheet.
+
+        The workbook's rules are indexed on the first call; rules added after
+        that are not included.
+
+        Returns:
+            (rule, formula position) pairs, in worksheet order
+        """
+        if self._cf_by_reference is None:
+            self._cf_by_reference = {}
+            for ws in self.book.worksheets:
+                for rules in ws.conditional_formatting._cf_rules.values():
+                    for rule in rules:
+                        for i, formula in enumerate(rule.formula or []):
+                            for reference in name_references(formula):
+                                self._cf_by_reference.setdefault(reference, []).append((rule, i))
+        return list(self._cf_by_reference.get(sheet, []))
+
+    def set_name(self, defn: DefinedName) -> None:
+        """Add or replace a defined name."""
+        self.remove_name(defn.name)
+        self.book.defined_names[defn.name] = defn
+        self._add_name(defn.name, defn)
+
+    def remove_name(self, name: str) -> None:
+        """Delete a defined name if it exists."""
+        defn = self.book.defined_names.get(name)
+        if defn is None:
+            return
+        del self.book.defined_names[name]
+        self._drop_name(name, defn)
+
+    def retarget_name(self, name: str, value: str) -> None:
+        """Give an existing defined name a new value."""
+        defn = self.book.defined_names[name]
+        self._drop_name(name, defn)
+        defn.value = value
+        self._add_name(name, defn)
+
+    def _add_name(self, name: str, defn: DefinedName) -> None:
+        self.names_by_target.setdefault(name_target(defn.value), []).append(name)
+        for reference in name_references(defn.value):
+            self.names_by_reference.setdefault(reference, []).append(name)
+        if _bracketed(defn.value):
+            self.bracketed[name] = None
+
+    def _drop_name(self, name: str, defn: DefinedName) -> None:
+        for names in [self.names_by_target.get(name_target(defn.value), [])] + [
+            self.names_by_reference.get(reference, []) for reference in name_references(defn.value)
+        ]:
+            if name in names:
+                names.remove(name)
+        self.bracketed.pop(name, None)
+
+
+def workbook_index(book: Workbook) -> WorkbookIndex:
+    """The index of a workbook, built the first time it is asked for."""
+    index = _indexes.get(book)
+    if index is None:
+        index = _indexes[book] = WorkbookIndex(book)
+    return index
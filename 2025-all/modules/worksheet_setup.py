@@ -2,20 +2,24 @@
 
 import os
 import logging
+import itertools
+from typing import Any, Iterator
 import pandas as pd
 import numpy as np
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.worksheet.table import Table
-from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, get_column_letter
+from openpyxl.utils.cell import get_column_letter, range_boundaries
 from openpyxl.styles import PatternFill, Font
+from openpyxl.styles.protection import Protection
 from openpyxl.formatting.rule import Rule
 import openpyxl.styles.differential
 from openpyxl.worksheet.datavalidation import DataValidation
-from openpyxl.worksheet.cell_range import CellRange
-from copy import copy as _copy
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
 from openpyxl.workbook.external_link import ExternalLink
 from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.protection import SheetProtection
+from openpyxl.worksheet.formula import ArrayFormula
+from openpyxl.formula.translate import Translator
 
 from .constants import (
     SHEET_PASSWORD, REQUIRED_COLUMNS,
@@ -29,56 +33,62 @@ from .constants import (
 )
 from .excel_operations import add_table_dataframe, _to_int
 from .logger import print_error
+from .style_broadcast import broadcast_row_styles, broadcast_protection, broadcast_row_height
+from .workbook_index import workbook_index
 
 
 logger = logging.getLogger("ojs_builder")
 
+# Pod Number is column D of OfficialTeamList; it stays editable on the protected sheet
+POD_NUMBER_COLUMN = 4
 
-def set_up_tapi_worksheet(
+# Tables sized to the team count by resize_worksheets: (sheet, table, first data row)
+RESIZED_TABLES = [
+    (SHEET_ROBOT_GAME, TABLE_ROBOT_GAME, 2),
+    (SHEET_INNOVATION, TABLE_INNOVATION, 2),
+    (SHEET_ROBOT_DESIGN, TABLE_ROBOT_DESIGN, 2),
+    (SHEET_CORE_VALUES, TABLE_CORE_VALUES, 2),
+    (SHEET_RESULTS, TABLE_TOURNAMENT_DATA, 3),
+]
+
+# Utility worksheets hidden in every OJS workbook
+HIDDEN_SHEETS = ["Data Validation", SHEET_META, SHEET_AWARD_DROPDOWNS, SHEET_AWARD_DEF]
+
+
+def team_list_frame(
     tournament: pd.Series,
-    book: Workbook,
-    dfAssignments: pd.DataFrame,
+    assignees: pd.DataFrame,
     using_divisions: bool
-) -> bool:
-    """Populate the 'Team and Program Information' table.
+) -> pd.DataFrame | None:
+    """Build the rows of the OfficialTeamList table.
 
     Args:
         tournament: A pandas Series representing the tournament row
-        book: An open openpyxl Workbook object
-        dfAssignments: DataFrame containing team assignments
+        assignees: Assignments for this tournament (and division), sorted by
+            Team # - see AssignmentIndex.teams
         using_divisions: Boolean indicating if divisions are used
-        
+
     Returns:
-        True if successful, False if no teams assigned (should skip this tournament)
+        Team #, Team Name, Coach Name and a zero Pod Number per team, or None
+        if no teams are assigned (the tournament should be skipped)
     """
     d = ""
     logger.info(f"Setting up Team and Program Information for {tournament[COL_SHORT_NAME]}")
     
+    if isinstance(tournament[COL_OJS_FILENAME], float):
+        print_error(logger, f"Invalid OJS filename for tournament {tournament[COL_SHORT_NAME]}: "
+                   "expected string, got float (possibly missing value)")
+    
     if using_divisions:
         d = tournament[COL_DIVISION]
-        if isinstance(tournament[COL_OJS_FILENAME], float):
-            print_error(logger, f"Invalid OJS filename for tournament {tournament[COL_SHORT_NAME]}: "
-                       "expected string, got float (possibly missing value)")
-        
-        assignees: pd.DataFrame = dfAssignments[
-            (dfAssignments[COL_SHORT_NAME] == tournament[COL_SHORT_NAME])
-            & (dfAssignments[COL_DIVISION] == d)
-        ]
         logger.info(f"Found {len(assignees)} teams in {tournament[COL_SHORT_NAME]} {d}")
     else:
-        if isinstance(tournament[COL_OJS_FILENAME], float):
-            print_error(logger, f"Invalid OJS filename for tournament {tournament[COL_SHORT_NAME]}: "
-                       "expected string, got float (possibly missing value)")
-        
-        assignees: pd.DataFrame = dfAssignments[
-            (dfAssignments[COL_SHORT_NAME] == tournament[COL_SHORT_NAME])
-        ]
         logger.info(f"Found {len(assignees)} teams in {tournament[COL_SHORT_NAME]}")
 
     # Check if there are any teams assigned
     if len(assignees) == 0:
         logger.warning(f"No teams assigned to {tournament[COL_SHORT_NAME]} {d} - skipping")
-        return False
+        return None
 
     # Validate required columns exist
     keep = [COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME]
@@ -90,69 +100,70 @@ def set_up_tapi_worksheet(
     
     assignees = assignees[keep_safe]
     assignees[COL_POD_NUMBER] = 0
-    sorted_assignees = assignees.sort_values(by=COL_TEAM_NUMBER, ascending=True)
     
-    add_table_dataframe(book, SHEET_TEAM_INFO, TABLE_TEAM_LIST, sorted_assignees)
-    
-    # Now copy formatting from the template row to all data rows
-    from openpyxl.styles.protection import Protection
-    from openpyxl.utils import range_boundaries
-    
-    ws = book[SHEET_TEAM_INFO]
-    table = ws.tables[TABLE_TEAM_LIST]
+    return assignees
+
+
+def set_up_tapi_worksheet(
+    tournament: pd.Series,
+    book: Workbook,
+    assignees: pd.DataFrame,
+    using_divisions: bool
+) -> bool:
+    """Populate the 'Team and Program Information' table.
+
+    Args:
+        tournament: A pandas Series representing the tournament row
+        book: An open openpyxl Workbook object
+        assignees: Assignments for this tournament (and division), sorted by
+            Team # - see AssignmentIndex.teams
+        using_divisions: Boolean indicating if divisions are used
+        
+    Returns:
+        True if successful, False if no teams assigned (should skip this tournament)
+    """
+    team_list = team_list_frame(tournament, assignees, using_divisions)
+    if team_list is None:
+        return False
+
+    add_table_dataframe(book, SHEET_TEAM_INFO, TABLE_TEAM_LIST, team_list, key=COL_TEAM_NUMBER)
     
-    min_col, min_row, max_col, max_row = range_boundaries(table.ref)
+    entry = workbook_index(book).table(TABLE_TEAM_LIST)
+    ws = entry.ws
+    min_col, min_row, max_col, max_row = entry.boundaries
     
-    # First data row is the template
+    # First data row is the template; copy its font and row height to all other rows
     first_data_row = min_row + 1
-    
-    # Copy font and row height from first data row to all other rows
-    for col_idx in range(min_col, max_col + 1):
-        template_cell = ws.cell(row=first_data_row, column=col_idx)
-        
-        # Copy font to all data rows
-        for row_idx in range(first_data_row + 1, max_row + 1):
-            target_cell = ws.cell(row=row_idx, column=col_idx)
-            try:
-                target_cell.font = _copy(template_cell.font)
-            except Exception:
-                pass
-    
-    # Copy row height from template row to all data rows
-    try:
-        template_height = ws.row_dimensions[first_data_row].height
-        if template_height is not None:
-            for row_idx in range(first_data_row + 1, max_row + 1):
-                ws.row_dimensions[row_idx].height = template_height
-            logger.debug(f"Copied row height ({template_height}) to all data rows")
-    except Exception:
-        pass
+    other_rows = range(first_data_row + 1, max_row + 1)
+    broadcast_row_styles(ws, first_data_row, other_rows, min_col, max_col, fields=("fontId",))
+    template_height = broadcast_row_height(ws, first_data_row, other_rows)
+    if template_height is not None:
+        logger.debug(f"Copied row height ({template_height}) to all data rows")
     
     # Unlock Pod Number column (column 4/D) so users can edit it
-    pod_col_idx = 4  # D is the 4th column
-    
-    for row_idx in range(min_row + 1, max_row + 1):  # Skip header row
-        cell = ws.cell(row=row_idx, column=pod_col_idx)
-        cell.protection = Protection(locked=False)
+    broadcast_protection(
+        ws, range(min_row + 1, max_row + 1), POD_NUMBER_COLUMN, POD_NUMBER_COLUMN, Protection(locked=False)
+    )
     
     logger.debug(f"Unlocked Pod Number column (D{min_row + 1}:D{max_row})")
     
     return True
 
 
-def set_up_award_worksheet(
+def award_frames(
     tournament: pd.Series,
-    book: Workbook,
     dfAwardDef: pd.DataFrame,
     using_divisions: bool
-) -> None:
-    """Prepare award tables used by OJS dropdowns and closing scripts.
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the rows of the RobotGameAwards and AwardListDropdowns tables.
 
     Args:
         tournament: A pandas Series representing the tournament row
-        book: An open openpyxl Workbook object
         dfAwardDef: DataFrame containing award definitions
         using_divisions: Boolean indicating if divisions are used
+
+    Returns:
+        (robot game awards, judged awards with their ID column)
     """
     thisDiv = tournament[COL_DIVISION] if using_divisions else ""
     logger.info(f"Setting up awards for {tournament[COL_SHORT_NAME]} {thisDiv}")
@@ -190,8 +201,6 @@ def set_up_award_worksheet(
         
         rg_awards_df.loc[len(rg_awards_df)] = [thisValue]
 
-    add_table_dataframe(book, SHEET_AWARD_DROPDOWNS, TABLE_ROBOT_GAME_AWARDS, rg_awards_df)
-
     # Other judged awards - now with ID column
     j_cols = tournament.filter(regex=f"^{AWARD_COLUMN_PREFIX_JUDGED}")
     j_awards_df = pd.DataFrame(columns=["Award", "ID"])
@@ -215,18 +224,37 @@ def set_up_award_worksheet(
             
             j_awards_df.loc[len(j_awards_df)] = [thisValue, this_col_name]
             
+    return rg_awards_df, j_awards_df
+
+
+def set_up_award_worksheet(
+    tournament: pd.Series,
+    book: Workbook,
+    dfAwardDef: pd.DataFrame,
+    using_divisions: bool
+) -> None:
+    """Prepare award tables used by OJS dropdowns and closing scripts.
+
+    Args:
+        tournament: A pandas Series representing the tournament row
+        book: An open openpyxl Workbook object
+        dfAwardDef: DataFrame containing award definitions
+        using_divisions: Boolean indicating if divisions are used
+    """
+    rg_awards_df, j_awards_df = award_frames(tournament, dfAwardDef, using_divisions)
+
+    add_table_dataframe(book, SHEET_AWARD_DROPDOWNS, TABLE_ROBOT_GAME_AWARDS, rg_awards_df)
     add_table_dataframe(book, SHEET_AWARD_DROPDOWNS, TABLE_AWARD_DROPDOWNS, j_awards_df)
     logger.debug(f"Added {len(rg_awards_df)} robot game awards and {len(j_awards_df)} judged awards")
 
 
-def set_up_meta_worksheet(
+def meta_frame(
     tournament: pd.Series,
-    book: Workbook,
     config: dict,
     tournament_folder: str,
     using_divisions: bool
-) -> None:
-    """Populate the metadata worksheet with tournament information."""
+) -> pd.DataFrame:
+    """Build the Key/Value rows of the Meta table."""
     d = tournament[COL_DIVISION] if using_divisions else ""
     logger.info(f"Setting up metadata for {tournament[COL_SHORT_NAME]} {d}")
     
@@ -254,9 +282,34 @@ def set_up_meta_worksheet(
         dfMeta.loc[len(dfMeta)] = {"Key": "Division", "Value": d}
         
     dfMeta.loc[len(dfMeta)] = {"Key": "Advancing", "Value": tournament[COL_ADVANCING]}
+
+    return dfMeta
+
+
+def set_up_meta_worksheet(
+    tournament: pd.Series,
+    book: Workbook,
+    config: dict,
+    tournament_folder: str,
+    using_divisions: bool
+) -> None:
+    """Populate the metadata worksheet with tournament information."""
+    dfMeta = meta_frame(tournament, config, tournament_folder, using_divisions)
     
     if tournament[COL_OJS_FILENAME] is not None:
-        add_table_dataframe(book, SHEET_META, TABLE_META, dfMeta, debug=False)
+        add_table_dataframe(book, SHEET_META, TABLE_META, dfMeta, debug=False, key="Key")
+
+
+def team_number_value(cell_value: Any) -> Any:
+    """Convert a Team # read from the team list into a plain Python value."""
+    if pd.isna(cell_value):
+        return None
+    if isinstance(cell_value, (np.integer,)):
+        return int(cell_value)
+    if isinstance(cell_value, (np.floating,)):
+        fv = float(cell_value)
+        return int(fv) if fv.is_integer() else fv
+    return cell_value
 
 
 def copy_team_numbers(
@@ -301,18 +354,7 @@ def copy_team_numbers(
     copied = 0
     for r in range(source_start_row, last_row + 1):
         cell_value = source_sheet.cell(row=r, column=col).value
-        
-        if pd.isna(cell_value):
-            write_val = None
-        elif isinstance(cell_value, (np.integer,)):
-            write_val = int(cell_value)
-        elif isinstance(cell_value, (np.floating,)):
-            fv = float(cell_value)
-            write_val = int(fv) if fv.is_integer() else fv
-        else:
-            write_val = cell_value
-
-        target_sheet.cell(row=dest_row, column=col).value = write_val
+        target_sheet.cell(row=dest_row, column=col).value = team_number_value(cell_value)
         dest_row += 1
         copied += 1
 
@@ -320,28 +362,28 @@ def copy_team_numbers(
     return copied
 
 
-def _copy_data_validations_for_range(
-    ws: Worksheet,
+def template_row_validations(
+    validations: list[DataValidation],
     start_col_idx: int,
     end_col_idx: int,
     first_data_row: int,
     new_end_row: int,
-):
-    """Duplicate data validations from template row to new range.
-    
+) -> list[DataValidation]:
+    """Build copies of the template row's data validations for a resized table.
+
     Args:
-        ws: Worksheet to modify
+        validations: The worksheet's existing data validations
         start_col_idx: Starting column index
         end_col_idx: Ending column index
         first_data_row: Template data row number
         new_end_row: New ending row number
-    """
-    try:
-        existing = list(ws.data_validations.dataValidation)
-    except Exception:
-        existing = []
 
-    for dv in existing:
+    Returns:
+        One new validation per existing range that covers the template row,
+        spanning first_data_row to new_end_row within the table's columns
+    """
+    copies = []
+    for dv in validations:
         try:
             for rng in dv.ranges:
                 try:
@@ -377,61 +419,189 @@ def _copy_data_validations_for_range(
 
                 try:
                     newdv.add(new_range)
-                    ws.add_data_validation(newdv)
                 except Exception:
                     continue
+                copies.append(newdv)
         except Exception:
             continue
+    return copies
+
+
+def _copy_data_validations_for_range(
+    ws: Worksheet,
+    start_col_idx: int,
+    end_col_idx: int,
+    first_data_row: int,
+    new_end_row: int,
+):
+    """Duplicate data validations from template row to new range.
+    
+    Args:
+        ws: Worksheet to modify
+        start_col_idx: Starting column index
+        end_col_idx: Ending column index
+        first_data_row: Template data row number
+        new_end_row: New ending row number
+    """
+    try:
+        existing = list(ws.data_validations.dataValidation)
+    except Exception:
+        existing = []
+
+    for newdv in template_row_validations(existing, start_col_idx, end_col_idx, first_data_row, new_end_row):
+        try:
+            ws.add_data_validation(newdv)
+        except Exception:
+            continue
+
+
+def clip_rows(ranges: MultiCellRange | str, first_row: int, last_row: int) -> MultiCellRange:
+    """Cut rows first_row..last_row out of a set of ranges.
+
+    Parts of a range above or below the cut are kept where they are.
+
+    Args:
+        ranges: Cell ranges, e.g. a conditional format's or data validation's sqref
+        first_row: First row removed
+        last_row: Last row removed (inclusive)
+
+    Returns:
+        The remaining ranges (empty if every range was inside the cut)
+    """
+    kept = []
+    for cr in MultiCellRange(ranges).ranges:
+        if cr.max_row < first_row or cr.min_row > last_row:
+            kept.append(cr)
+            continue
+        if cr.min_row < first_row:
+            kept.append(CellRange(min_col=cr.min_col, min_row=cr.min_row, max_col=cr.max_col, max_row=first_row - 1))
+        if cr.max_row > last_row:
+            kept.append(CellRange(min_col=cr.min_col, min_row=last_row + 1, max_col=cr.max_col, max_row=cr.max_row))
+    return MultiCellRange(kept)
+
+
+def truncate_rows(ws: Worksheet, first_row: int, last_row: int) -> None:
+    """Drop rows first_row..last_row without moving the rows below them.
+
+    Unlike ws.delete_rows, which shifts every cell below the cut, only the
+    cells and row dimensions of the dropped rows are touched. Conditional
+    formatting, data validation and merged ranges are clipped to match.
+
+    Args:
+        ws: Worksheet to modify
+        first_row: First row to drop
+        last_row: Last row to drop (inclusive)
+    """
+    if last_row < first_row:
+        return
+
+    for row_idx in range(first_row, last_row + 1):
+        ws.row_dimensions.pop(row_idx, None)
+    for key in [key for key in ws._cells if first_row <= key[0] <= last_row]:
+        del ws._cells[key]
+
+    rules = ws.conditional_formatting._cf_rules
+    for cf in list(rules):
+        sqref = clip_rows(cf.sqref, first_row, last_row)
+        if sqref == cf.sqref:
+            continue
+        cf_rules = rules.pop(cf)
+        if sqref.ranges:
+            cf.sqref = sqref
+            rules.setdefault(cf, []).extend(cf_rules)
+
+    validations = []
+    for dv in ws.data_validations.dataValidation:
+        dv.sqref = clip_rows(dv.sqref, first_row, last_row)
+        if dv.sqref.ranges:
+            validations.append(dv)
+    ws.data_validations.dataValidation = validations
+
+    for merged in list(ws.merged_cells.ranges):
+        if first_row <= merged.min_row and merged.max_row <= last_row:
+            ws.merged_cells.remove(merged)
+
+
+class SharedFormula(ArrayFormula):
+    """Value of a cell in an Excel shared formula (<f t="shared">).
+
+    openpyxl writes the attributes of an ArrayFormula value onto the cell's
+    <f> element, so this only changes the attributes. The master cell holds
+    the formula text and the ref of every cell sharing it; the others only
+    hold the shared index (si) and Excel fills in their formula.
+    """
+
+    t = "shared"
+
+    def __init__(self, si: int, ref: str | None = None, text: str | None = None):
+        super().__init__(ref, text)
+        self.si = si
+
+    def __iter__(self):
+        yield "t", self.t
+        if self.ref:
+            yield "ref", self.ref
+        yield "si", str(self.si)
+
+
+def formula_column(
+    formula: str,
+    col_idx: int,
+    first_row: int,
+    last_row: int,
+    shared_ids: Iterator[int] | None = None,
+) -> list:
+    """Cell values that fill rows first_row..last_row of a formula column.
+
+    Excel shifts a shared formula's relative references row by row. Only a
+    formula that reads the same on every row (e.g. one that only uses
+    [#This Row] structured references) is shared; openpyxl's Translator
+    tells which those are. Others keep the formula text in every cell,
+    exactly as written on the first row.
+
+    Args:
+        formula: The first row's formula, e.g. "=SUM(Table[[#This Row],[A]:[C]])"
+        col_idx: The column (1-based)
+        first_row: Row holding the formula
+        last_row: Last row to fill (inclusive)
+        shared_ids: Source of unused shared formula indexes on this sheet, or
+            None to write every formula in full
+
+    Returns:
+        One value per row
+    """
+    count = last_row - first_row + 1
+    if shared_ids is None or count < 2:
+        return [formula] * count
+    column = get_column_letter(col_idx)
+    shifted = Translator(formula, f"{column}{first_row}").translate_formula(f"{column}{first_row + 1}")
+    if shifted != formula:
+        return [formula] * count
+    si = next(shared_ids)
+    master = SharedFormula(si, f"{column}{first_row}:{column}{last_row}", formula)
+    return [master] + [SharedFormula(si)] * (count - 1)
 
 
 def resize_worksheets(
     tournament: pd.Series,
     book: Workbook,
-    dfAssignments: pd.DataFrame,
-    using_divisions: bool
+    assignees: pd.DataFrame,
+    shared_formulas: bool = False,
 ) -> None:
     """Resize all tables in the workbook based on number of teams.
     
     Args:
         tournament: A pandas Series representing the tournament row
         book: An open openpyxl Workbook object
-        dfAssignments: DataFrame containing team assignments
-        using_divisions: Whether the tournament uses divisions
+        assignees: Assignments for this tournament (and division)
+        shared_formulas: Write each formula column as one Excel shared formula
+            where the formula is the same on every row (see formula_column)
     """
     logger.info(f"Resizing worksheets for {book.properties.title}")
     
-    worksheetNames = [
-        SHEET_ROBOT_GAME,
-        SHEET_INNOVATION,
-        SHEET_ROBOT_DESIGN,
-        SHEET_CORE_VALUES,
-        SHEET_RESULTS,
-    ]
-    worksheetTables = [
-        TABLE_ROBOT_GAME,
-        TABLE_INNOVATION,
-        TABLE_ROBOT_DESIGN,
-        TABLE_CORE_VALUES,
-        TABLE_TOURNAMENT_DATA,
-    ]
-    worksheet_start_row = [2, 2, 2, 2, 3]
-    
-    div = tournament.get(COL_DIVISION, None)
-    
-    if using_divisions:
-        assignees: pd.DataFrame = dfAssignments[
-            (dfAssignments[COL_SHORT_NAME] == tournament[COL_SHORT_NAME])
-            & (dfAssignments[COL_DIVISION] == div)
-        ]
-    else:
-        assignees: pd.DataFrame = dfAssignments[
-            (dfAssignments[COL_SHORT_NAME] == tournament[COL_SHORT_NAME])
-        ]
-
     # Copy team numbers to each worksheet
-    sheet_tables = zip(worksheetNames, worksheetTables, worksheet_start_row)
     copied_counts: dict[str, int] = {}
-    for s, t, r in sheet_tables:
+    for s, t, r in RESIZED_TABLES:
         if s in book.sheetnames:
             ws = book[s]
             tapi_sheet = book[SHEET_TEAM_INFO]
@@ -444,72 +614,38 @@ def resize_worksheets(
             copied_counts[s] = copied
 
     # Resize the tables
-    sheet_tables = zip(worksheetNames, worksheetTables, worksheet_start_row)
-    for s, t, r in sheet_tables:
+    index = workbook_index(book)
+    for s, t, r in RESIZED_TABLES:
         if s not in book.sheetnames:
             continue
-        ws = book[s]
-        table: Table = ws.tables[t]
-        table_range: str = table.ref
-
-        start_cell, end_cell = table_range.split(":")
-        start_col_letter, start_row_num = coordinate_from_string(start_cell)
-        end_col_letter, end_row_num = coordinate_from_string(end_cell)
+        entry = index.table(t, s)
+        ws = entry.ws
+        start_col_idx, start_row_num, end_col_idx, end_row_num = entry.boundaries
 
         rows_for_table = copied_counts.get(s, len(assignees))
         new_end_row = start_row_num + rows_for_table
 
-        table.ref = f"{start_col_letter}{start_row_num}:{end_col_letter}{new_end_row}"
-        logger.debug(f"Resized table {t}: {table.ref}")
+        index.set_ref(
+            t, f"{get_column_letter(start_col_idx)}{start_row_num}:{get_column_letter(end_col_idx)}{new_end_row}"
+        )
+        logger.debug(f"Resized table {t}: {entry.table.ref}")
 
         # Copy formulas
         first_data_row = start_row_num + 1
-        start_col_idx = column_index_from_string(start_col_letter)
-        end_col_idx = column_index_from_string(end_col_letter)
         
+        shared_ids = itertools.count() if shared_formulas else None
         for col_idx in range(start_col_idx + 1, end_col_idx + 1):
             template = ws.cell(row=first_data_row, column=col_idx).value
             if isinstance(template, str) and template.startswith("="):
-                for rr in range(first_data_row, new_end_row + 1):
-                    ws.cell(row=rr, column=col_idx).value = template
-
-        # Copy cell protection
-        for col_idx in range(start_col_idx, end_col_idx + 1):
-            template_cell = ws.cell(row=first_data_row, column=col_idx)
-            tpl_prot = getattr(template_cell, "protection", None)
-            if tpl_prot is None:
-                continue
-            for rr in range(first_data_row, new_end_row + 1):
-                tgt = ws.cell(row=rr, column=col_idx)
-                try:
-                    tgt.protection = _copy(tpl_prot)
-                except Exception:
-                    pass
+                values = formula_column(template, col_idx, first_data_row, new_end_row, shared_ids)
+                for rr, value in enumerate(values, start=first_data_row):
+                    ws.cell(row=rr, column=col_idx).value = value
 
-        # Copy cell styles
-        for col_idx in range(start_col_idx, end_col_idx + 1):
-            template_cell = ws.cell(row=first_data_row, column=col_idx)
-            for rr in range(first_data_row, new_end_row + 1):
-                tgt = ws.cell(row=rr, column=col_idx)
-                try:
-                    if hasattr(template_cell, "_style"):
-                        tgt._style = _copy(template_cell._style)
-                    tgt.number_format = template_cell.number_format
-                    tgt.font = _copy(template_cell.font)
-                    tgt.fill = _copy(template_cell.fill)
-                    tgt.alignment = _copy(template_cell.alignment)
-                    tgt.border = _copy(template_cell.border)
-                except Exception:
-                    pass
-
-        # Copy row height
-        try:
-            template_height = ws.row_dimensions[first_data_row].height
-            if template_height is not None:
-                for rr in range(first_data_row, new_end_row + 1):
-                    ws.row_dimensions[rr].height = template_height
-        except Exception:
-            pass
+        # Copy cell styles (font, fill, border, number format, protection,
+        # alignment) and row height from the template row
+        data_rows = range(first_data_row, new_end_row + 1)
+        broadcast_row_styles(ws, first_data_row, data_rows, start_col_idx, end_col_idx)
+        broadcast_row_height(ws, first_data_row, data_rows)
 
         # Copy data validations
         try:
@@ -519,22 +655,25 @@ def resize_worksheets(
         except Exception:
             pass
 
-        # Delete extra rows
-        ws.delete_rows(idx=new_end_row + 1, amount=200)
+        # Drop template rows below the new end of the table (a template may
+        # ship with more blank rows than the tournament has teams)
+        truncate_rows(ws, new_end_row + 1, end_row_num)
 
     logger.debug("Worksheet resizing complete")
 
 
-def copy_award_def(tournament: pd.Series, book: Workbook, dfAwardDef: pd.DataFrame) -> None:
-    """Add the award definitions table to the workbook with counts from tournament row.
-    
+def prepare_award_def(dfAwardDef: pd.DataFrame) -> pd.DataFrame:
+    """Clean up the AwardDef table for the OJS award definitions sheet.
+
+    This is the part of copy_award_def that is the same for every tournament,
+    so fll-maestro runs it once per season.
+
     Args:
-        tournament: A pandas Series representing the tournament row
-        book: An open openpyxl Workbook object
         dfAwardDef: DataFrame containing award definitions
+
+    Returns:
+        A cleaned copy of dfAwardDef (the original is not modified)
     """
-    logger.debug("Adding award definitions table with tournament counts")
-    
     # Make a copy to avoid modifying the original
     dfAwardDef_copy = dfAwardDef.copy()
     
@@ -562,6 +701,21 @@ def copy_award_def(tournament: pd.Series, book: Workbook, dfAwardDef: pd.DataFra
             'TRUE': 'TRUE', 'FALSE': 'FALSE'
         })
     
+    return dfAwardDef_copy
+
+
+def award_def_frame(tournament: pd.Series, award_def: pd.DataFrame) -> pd.DataFrame:
+    """Award definitions with the Count column taken from the tournament row.
+
+    Args:
+        tournament: A pandas Series representing the tournament row
+        award_def: Award definitions as returned by prepare_award_def
+
+    Returns:
+        A copy of award_def with Count filled in
+    """
+    dfAwardDef_copy = award_def.copy()
+    
     # Add Count column if it doesn't exist
     if 'Count' not in dfAwardDef_copy.columns:
         dfAwardDef_copy['Count'] = None
@@ -586,310 +740,339 @@ def copy_award_def(tournament: pd.Series, book: Workbook, dfAwardDef: pd.DataFra
             # Award column not in tournament row, default to 0
             dfAwardDef_copy.at[idx, 'Count'] = 0
             logger.debug(f"Award {column_name} not in tournament row, set Count=0")
+
+    return dfAwardDef_copy
+
+
+def copy_award_def(tournament: pd.Series, book: Workbook, award_def: pd.DataFrame) -> None:
+    """Add the award definitions table to the workbook with counts from tournament row.
+    
+    Args:
+        tournament: A pandas Series representing the tournament row
+        book: An open openpyxl Workbook object
+        award_def: Award definitions as returned by prepare_award_def
+    """
+    logger.debug("Adding award definitions table with tournament counts")
+    
+    add_table_dataframe(book, SHEET_AWARD_DEF, TABLE_AWARD_DEF, award_def_frame(tournament, award_def))
+
+
+def essential_conditional_formats(
+    data_ref: str,
+    rg_award_count: int,
+    award_list_ref: str | None
+) -> list[tuple[str, Rule]]:
+    """Build the conditional formatting rules for the Results and Rankings sheet.
+
+    Args:
+        data_ref: Ref of the resized TournamentData table
+        rg_award_count: Number of Robot Game awards
+        award_list_ref: Ref of the AwardListDropdowns table, or None if it is missing
+
+    Returns:
+        (range, rule) pairs in the order they are added to the sheet; the same
+        rule object may appear under several ranges
+    """
+    min_col, min_row, max_col, max_row = range_boundaries(data_ref)
+    formats: list[tuple[str, Rule]] = []
+
+    # Define ALL column variables at the beginning
+    # Column J (Robot Game Rank) is the 10th column
+    rg_rank_col = get_column_letter(10)
+    # Column O (Champion's Rank) is the 15th column
+    champ_rank_col = get_column_letter(15)
+    # Column P (Award) is the 16th column
+    award_col = get_column_letter(16)
+    # Column Q (Advance?) is the 17th column
+    advance_col = get_column_letter(17)
+    # Column W is the 23rd column
+    col_w = get_column_letter(23)
+    
+    # Add rules in REVERSE order of priority
+    # Excel applies CF rules from bottom to top, so add low-priority first
+    
+    # Rule 1 (LOW PRIORITY): Award column header - bright green when all selected
+    if award_list_ref:
+        list_min_col, list_min_row, list_max_col, list_max_row = range_boundaries(award_list_ref)
+        
+        bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
+        purple_italic_font = Font(color="800080", italic=True, size=12)
+        
+        # Build the formula WITHOUT the sheet name wrapper - just the range
+        # Excel formula: =COUNTA(AwardListDropdowns!$A$2:$A$7)=COUNTA($P$3:$P$7)
+        award_range = f"${award_col}${min_row + 1}:${award_col}${max_row}"
+        
+        # For the list range, check if sheet name has spaces
+        sheet_name = SHEET_AWARD_DROPDOWNS
+        if ' ' in sheet_name:
+            list_range = f"'{sheet_name}'!$A${list_min_row + 1}:$A${list_max_row}"
+        else:
+            list_range = f"{sheet_name}!$A${list_min_row + 1}:$A${list_max_row}"
+        
+        formula = f'COUNTA({list_range})=COUNTA({award_range})'
+        
+        logger.debug(f"CF Formula: {formula}")
+        
+        header_rule = Rule(type="expression", formula=[formula], stopIfTrue=False)
+        header_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill, font=purple_italic_font)
+        
+        header_cell = f"{award_col}{min_row}"
+        formats.append((header_cell, header_rule))
+        
+        logger.info(f"Added 'all awards selected' CF to {header_cell}")
+    else:
+        logger.warning(f"Table {TABLE_AWARD_DROPDOWNS} not found, skipping Award column CF")
+    
+    # Rule 2 (LOW PRIORITY): Duplicate awards - red
+    bright_red_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+    purple_italic_font = Font(color="800080", italic=True, size=11)
+    
+    award_data_range = f"{award_col}{min_row + 1}:{award_col}{max_row}"
+    duplicate_formula = f'COUNTIF(${award_col}${min_row + 1}:${award_col}${max_row},{award_col}{min_row + 1})>1'
+    
+    duplicate_rule = Rule(type="expression", formula=[duplicate_formula], stopIfTrue=False)
+    duplicate_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_red_fill, font=purple_italic_font)
+    
+    formats.append((award_data_range, duplicate_rule))
+    
+    logger.info(f"Added duplicate detection CF to {award_data_range}")
+    logger.debug(f"Duplicate CF Formula: {duplicate_formula}")
+    
+    # Rule 3 (LOW PRIORITY): Champion's Rank - blue for top N
+    medium_blue_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    white_font = Font(color="FFFFFF")
+    
+    champ_rank_range = f"{champ_rank_col}{min_row + 1}:{champ_rank_col}{max_row}"
+    champ_rank_formula = f'{champ_rank_col}{min_row + 1}<=${advance_col}$1'
+    
+    champ_rank_rule = Rule(type="expression", formula=[champ_rank_formula], stopIfTrue=False)
+    champ_rank_rule.dxf = openpyxl.styles.differential.DifferentialStyle(
+        fill=medium_blue_fill, 
+        font=white_font
+    )
+    
+    formats.append((champ_rank_range, champ_rank_rule))
+    logger.debug(f"Champion's Rank CF Formula: {champ_rank_formula}")
+    
+    # Rule 4 (LOW PRIORITY): Q1 and Q2 header - green when all advancing selected
+    bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
+    
+    # Apply to Q1 (header) and Q2 (count cell)
+    # Formula: COUNTIF($Q$3:$Q$max,"Yes")=$Q$1
+    # This counts "Yes" values and compares to the advancing count in Q1
+    advance_header_range = f"{advance_col}1:{advance_col}2"
+    advance_count_formula = f'COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Yes")=${advance_col}$1'
+    
+    advance_header_rule = Rule(type="expression", formula=[advance_count_formula], stopIfTrue=False)
+    advance_header_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill)
+    
+    formats.append((advance_header_range, advance_header_rule))
+    
+    logger.info(f"Added Advance? header highlighting CF to {advance_header_range}")
+    logger.debug(f"Advance header CF Formula: {advance_count_formula}")
+    
+    # Rule 5 (LOW PRIORITY): W1 - green when correct advancing + one Alt
+    bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
+    
+    # Apply to W1 only
+    w1_cell = f"{col_w}1"
+    
+    # Formula: Check two conditions:
+    # 1. COUNTIF($Q$3:$Q$max,"Yes")=$Q$1 (correct number of Yes)
+    # 2. COUNTIF($Q$3:$Q$max,"Alt")=1 (exactly one Alt)
+    w1_formula = f'AND(COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Yes")=${advance_col}$1,COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Alt")=1)'
+    
+    w1_rule = Rule(type="expression", formula=[w1_formula], stopIfTrue=False)
+    w1_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill)
+    
+    formats.append((w1_cell, w1_rule))
+    
+    logger.info(f"Added W1 Alt team highlighting CF to {w1_cell}")
+    logger.debug(f"W1 CF Formula: {w1_formula}")
+    
+    # Rule 6 (MEDIUM PRIORITY): Yellow row highlight when award selected
+    # Apply to entire row BUT exclude columns J (RG Rank), P (Award), Q (Advance?)
+    # We'll add the rule in multiple segments to skip those columns
+    yellow_fill = PatternFill(start_color="FFFF99", end_color="FFFF99", fill_type="solid")
+    
+    row_highlight_formula = f'${award_col}{min_row + 1}<>""'
+    row_highlight_rule = Rule(type="expression", formula=[row_highlight_formula], stopIfTrue=False)
+    row_highlight_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=yellow_fill)
+    
+    start_col_letter = get_column_letter(min_col)
+    end_col_letter = get_column_letter(max_col)
+    
+    # Apply yellow to columns A-I (before Robot Game Rank in column J)
+    range_before_j = f"{start_col_letter}{min_row + 1}:I{max_row}"
+    formats.append((range_before_j, row_highlight_rule))
+    
+    # Apply yellow to columns K-O (between RG Rank and Award)
+    range_k_to_o = f"K{min_row + 1}:O{max_row}"
+    formats.append((range_k_to_o, row_highlight_rule))
+    
+    # Apply yellow to column R onwards (after Advance?)
+    range_after_q = f"R{min_row + 1}:{end_col_letter}{max_row}"
+    formats.append((range_after_q, row_highlight_rule))
+    
+    logger.debug(f"Row highlight CF Formula: {row_highlight_formula}")
+    logger.debug(f"Applied to ranges: {range_before_j}, {range_k_to_o}, {range_after_q}")
+    
+    # Rules 7-11 (HIGH PRIORITY): Column-specific highlights
+    # Now these can be applied without competition
+    
+    # Rule 7: Robot Game Gold (Column J)
+    gold_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
+    rg_rank_range = f"{rg_rank_col}{min_row + 1}:{rg_rank_col}{max_row}"
+    
+    gold_formula = f'{rg_rank_col}{min_row + 1}=1'
+    gold_rule = Rule(type="expression", formula=[gold_formula], stopIfTrue=False)
+    gold_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=gold_fill)
+    formats.append((rg_rank_range, gold_rule))
+    logger.debug(f"Added Robot Game Gold CF: {gold_formula}")
+    
+    # Rule 8: Robot Game Silver (Column J)
+    if rg_award_count >= 2:
+        silver_fill = PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid")
+        silver_formula = f'{rg_rank_col}{min_row + 1}=2'
+        silver_rule = Rule(type="expression", formula=[silver_formula], stopIfTrue=False)
+        silver_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=silver_fill)
+        formats.append((rg_rank_range, silver_rule))
+        logger.debug(f"Added Robot Game Silver CF: {silver_formula}")
+    
+    # Rule 9: Robot Game Bronze (Column J)
+    if rg_award_count >= 3:
+        bronze_fill = PatternFill(start_color="CD7F32", end_color="CD7F32", fill_type="solid")
+        # Bronze should highlight ranks from 3 up to the total robot game award count
+        # For example: if rg_award_count=3, highlight rank 3; if rg_award_count=5, highlight ranks 3-5
+        if rg_award_count == 3:
+            bronze_formula = f'{rg_rank_col}{min_row + 1}=3'
+        else:
+            bronze_formula = f'AND({rg_rank_col}{min_row + 1}>=3,{rg_rank_col}{min_row + 1}<={rg_award_count})'
+        bronze_rule = Rule(type="expression", formula=[bronze_formula], stopIfTrue=False)
+        bronze_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bronze_fill)
+        formats.append((rg_rank_range, bronze_rule))
+        logger.debug(f"Added Robot Game Bronze CF: {bronze_formula}")
+    
+    # Rule 10: Award column duplicates (Column P) - already added above as Rule 2
+    
+    # Rule 11: Advance "Yes" - medium blue (Column Q)
+    medium_blue_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    white_font = Font(color="FFFFFF")
+    
+    advance_data_range = f"{advance_col}{min_row + 1}:{advance_col}{max_row}"
     
-    add_table_dataframe(book, SHEET_AWARD_DEF, TABLE_AWARD_DEF, dfAwardDef_copy)
+    yes_formula = f'{advance_col}{min_row + 1}="Yes"'
+    yes_rule = Rule(type="expression", formula=[yes_formula], stopIfTrue=False)
+    yes_rule.dxf = openpyxl.styles.differential.DifferentialStyle(
+        fill=medium_blue_fill,
+        font=white_font
+    )
+    formats.append((advance_data_range, yes_rule))
+    logger.debug(f"Added 'Yes' highlighting CF: {yes_formula}")
+    
+    # Rule 12: Advance "Alt" - light blue (Column Q)
+    light_blue_fill = PatternFill(start_color="9BC2E6", end_color="9BC2E6", fill_type="solid")
+    
+    alt_formula = f'{advance_col}{min_row + 1}="Alt"'
+    alt_rule = Rule(type="expression", formula=[alt_formula], stopIfTrue=False)
+    alt_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=light_blue_fill)
+    formats.append((advance_data_range, alt_rule))
+    logger.debug(f"Added 'Alt' highlighting CF: {alt_formula}")
+
+    return formats
 
 
 def add_essential_conditional_formats(book: Workbook, num_teams: int) -> None:
     """Add essential conditional formatting to Results and Rankings sheet.
-    
+
     Args:
         book: An open openpyxl Workbook object
         num_teams: Number of teams (to determine range)
     """
     logger.info("Adding essential conditional formatting")
-    
+
     try:
+        index = workbook_index(book)
         ws = book[SHEET_RESULTS]
-        
+
         # Find the TournamentData table
-        table = None
-        for tbl in ws.tables.values():
-            if tbl.name == TABLE_TOURNAMENT_DATA:
-                table = tbl
-                break
-        
-        if not table:
+        entry = index.table(TABLE_TOURNAMENT_DATA, SHEET_RESULTS)
+        if entry is None:
             logger.warning(f"Table {TABLE_TOURNAMENT_DATA} not found, skipping CF")
             return
-        
-        from openpyxl.utils import range_boundaries, get_column_letter
-        min_col, min_row, max_col, max_row = range_boundaries(table.ref)
-        
+
         # Get count of Robot Game awards from RobotGameAwards table
         rg_award_count = 0
-        try:
-            rg_ws = book[SHEET_AWARD_DROPDOWNS]
-            rg_table = None
-            for tbl in rg_ws.tables.values():
-                if tbl.name == TABLE_ROBOT_GAME_AWARDS:
-                    rg_table = tbl
-                    break
-            
-            if rg_table:
-                rg_min_col, rg_min_row, rg_max_col, rg_max_row = range_boundaries(rg_table.ref)
-                # Count rows excluding header
-                rg_award_count = rg_max_row - rg_min_row
-                logger.debug(f"Found {rg_award_count} Robot Game awards")
-        except Exception as e:
-            logger.warning(f"Could not count Robot Game awards: {e}")
-        
-        # Define ALL column variables at the beginning
-        # Column J (Robot Game Rank) is the 10th column
-        rg_rank_col = get_column_letter(10)
-        # Column O (Champion's Rank) is the 15th column
-        champ_rank_col = get_column_letter(15)
-        # Column P (Award) is the 16th column
-        award_col = get_column_letter(16)
-        # Column Q (Advance?) is the 17th column
-        advance_col = get_column_letter(17)
-        # Column W is the 23rd column
-        col_w = get_column_letter(23)
-        
-        # Add rules in REVERSE order of priority
-        # Excel applies CF rules from bottom to top, so add low-priority first
-        
-        # Rule 1 (LOW PRIORITY): Award column header - bright green when all selected
-        award_list_ws = book[SHEET_AWARD_DROPDOWNS]
-        award_list_table = None
-        for tbl in award_list_ws.tables.values():
-            if tbl.name == TABLE_AWARD_DROPDOWNS:
-                award_list_table = tbl
-                break
-        
-        if award_list_table:
-            list_min_col, list_min_row, list_max_col, list_max_row = range_boundaries(award_list_table.ref)
-            
-            bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-            purple_italic_font = Font(color="800080", italic=True, size=12)
-            
-            # Build the formula WITHOUT the sheet name wrapper - just the range
-            # Excel formula: =COUNTA(AwardListDropdowns!$A$2:$A$7)=COUNTA($P$3:$P$7)
-            award_range = f"${award_col}${min_row + 1}:${award_col}${max_row}"
-            
-            # For the list range, check if sheet name has spaces
-            sheet_name = SHEET_AWARD_DROPDOWNS
-            if ' ' in sheet_name:
-                list_range = f"'{sheet_name}'!$A${list_min_row + 1}:$A${list_max_row}"
-            else:
-                list_range = f"{sheet_name}!$A${list_min_row + 1}:$A${list_max_row}"
-            
-            formula = f'COUNTA({list_range})=COUNTA({award_range})'
-            
-            logger.debug(f"CF Formula: {formula}")
-            
-            header_rule = Rule(type="expression", formula=[formula], stopIfTrue=False)
-            header_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill, font=purple_italic_font)
-            
-            header_cell = f"{award_col}{min_row}"
-            ws.conditional_formatting.add(header_cell, header_rule)
-            
-            logger.info(f"Added 'all awards selected' CF to {header_cell}")
-        else:
-            logger.warning(f"Table {TABLE_AWARD_DROPDOWNS} not found, skipping Award column CF")
-        
-        # Rule 2 (LOW PRIORITY): Duplicate awards - red
-        bright_red_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-        purple_italic_font = Font(color="800080", italic=True, size=11)
-        
-        award_data_range = f"{award_col}{min_row + 1}:{award_col}{max_row}"
-        duplicate_formula = f'COUNTIF(${award_col}${min_row + 1}:${award_col}${max_row},{award_col}{min_row + 1})>1'
-        
-        duplicate_rule = Rule(type="expression", formula=[duplicate_formula], stopIfTrue=False)
-        duplicate_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_red_fill, font=purple_italic_font)
-        
-        ws.conditional_formatting.add(award_data_range, duplicate_rule)
-        
-        logger.info(f"Added duplicate detection CF to {award_data_range}")
-        logger.debug(f"Duplicate CF Formula: {duplicate_formula}")
-        
-        # Rule 3 (LOW PRIORITY): Champion's Rank - blue for top N
-        medium_blue_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        white_font = Font(color="FFFFFF")
-        
-        champ_rank_range = f"{champ_rank_col}{min_row + 1}:{champ_rank_col}{max_row}"
-        champ_rank_formula = f'{champ_rank_col}{min_row + 1}<=${advance_col}$1'
-        
-        champ_rank_rule = Rule(type="expression", formula=[champ_rank_formula], stopIfTrue=False)
-        champ_rank_rule.dxf = openpyxl.styles.differential.DifferentialStyle(
-            fill=medium_blue_fill, 
-            font=white_font
-        )
-        
-        ws.conditional_formatting.add(champ_rank_range, champ_rank_rule)
-        logger.debug(f"Champion's Rank CF Formula: {champ_rank_formula}")
-        
-        # Rule 4 (LOW PRIORITY): Q1 and Q2 header - green when all advancing selected
-        bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-        
-        # Apply to Q1 (header) and Q2 (count cell)
-        # Formula: COUNTIF($Q$3:$Q$max,"Yes")=$Q$1
-        # This counts "Yes" values and compares to the advancing count in Q1
-        advance_header_range = f"{advance_col}1:{advance_col}2"
-        advance_count_formula = f'COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Yes")=${advance_col}$1'
-        
-        advance_header_rule = Rule(type="expression", formula=[advance_count_formula], stopIfTrue=False)
-        advance_header_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill)
-        
-        ws.conditional_formatting.add(advance_header_range, advance_header_rule)
-        
-        logger.info(f"Added Advance? header highlighting CF to {advance_header_range}")
-        logger.debug(f"Advance header CF Formula: {advance_count_formula}")
-        
-        # Rule 5 (LOW PRIORITY): W1 - green when correct advancing + one Alt
-        bright_green_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
-        
-        # Apply to W1 only
-        w1_cell = f"{col_w}1"
-        
-        # Formula: Check two conditions:
-        # 1. COUNTIF($Q$3:$Q$max,"Yes")=$Q$1 (correct number of Yes)
-        # 2. COUNTIF($Q$3:$Q$max,"Alt")=1 (exactly one Alt)
-        w1_formula = f'AND(COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Yes")=${advance_col}$1,COUNTIF(${advance_col}${min_row + 1}:${advance_col}${max_row},"Alt")=1)'
-        
-        w1_rule = Rule(type="expression", formula=[w1_formula], stopIfTrue=False)
-        w1_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bright_green_fill)
-        
-        ws.conditional_formatting.add(w1_cell, w1_rule)
-        
-        logger.info(f"Added W1 Alt team highlighting CF to {w1_cell}")
-        logger.debug(f"W1 CF Formula: {w1_formula}")
-        
-        # Rule 6 (MEDIUM PRIORITY): Yellow row highlight when award selected
-        # Apply to entire row BUT exclude columns J (RG Rank), P (Award), Q (Advance?)
-        # We'll add the rule in multiple segments to skip those columns
-        yellow_fill = PatternFill(start_color="FFFF99", end_color="FFFF99", fill_type="solid")
-        
-        row_highlight_formula = f'${award_col}{min_row + 1}<>""'
-        row_highlight_rule = Rule(type="expression", formula=[row_highlight_formula], stopIfTrue=False)
-        row_highlight_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=yellow_fill)
-        
-        start_col_letter = get_column_letter(min_col)
-        end_col_letter = get_column_letter(max_col)
-        
-        # Apply yellow to columns A-I (before Robot Game Rank in column J)
-        range_before_j = f"{start_col_letter}{min_row + 1}:I{max_row}"
-        ws.conditional_formatting.add(range_before_j, row_highlight_rule)
-        
-        # Apply yellow to columns K-O (between RG Rank and Award)
-        range_k_to_o = f"K{min_row + 1}:O{max_row}"
-        ws.conditional_formatting.add(range_k_to_o, row_highlight_rule)
-        
-        # Apply yellow to column R onwards (after Advance?)
-        range_after_q = f"R{min_row + 1}:{end_col_letter}{max_row}"
-        ws.conditional_formatting.add(range_after_q, row_highlight_rule)
-        
-        logger.debug(f"Row highlight CF Formula: {row_highlight_formula}")
-        logger.debug(f"Applied to ranges: {range_before_j}, {range_k_to_o}, {range_after_q}")
-        
-        # Rules 7-11 (HIGH PRIORITY): Column-specific highlights
-        # Now these can be applied without competition
-        
-        # Rule 7: Robot Game Gold (Column J)
-        gold_fill = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
-        rg_rank_range = f"{rg_rank_col}{min_row + 1}:{rg_rank_col}{max_row}"
-        
-        gold_formula = f'{rg_rank_col}{min_row + 1}=1'
-        gold_rule = Rule(type="expression", formula=[gold_formula], stopIfTrue=False)
-        gold_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=gold_fill)
-        ws.conditional_formatting.add(rg_rank_range, gold_rule)
-        logger.debug(f"Added Robot Game Gold CF: {gold_formula}")
-        
-        # Rule 8: Robot Game Silver (Column J)
-        if rg_award_count >= 2:
-            silver_fill = PatternFill(start_color="C0C0C0", end_color="C0C0C0", fill_type="solid")
-            silver_formula = f'{rg_rank_col}{min_row + 1}=2'
-            silver_rule = Rule(type="expression", formula=[silver_formula], stopIfTrue=False)
-            silver_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=silver_fill)
-            ws.conditional_formatting.add(rg_rank_range, silver_rule)
-            logger.debug(f"Added Robot Game Silver CF: {silver_formula}")
-        
-        # Rule 9: Robot Game Bronze (Column J)
-        if rg_award_count >= 3:
-            bronze_fill = PatternFill(start_color="CD7F32", end_color="CD7F32", fill_type="solid")
-            # Bronze should highlight ranks from 3 up to the total robot game award count
-            # For example: if rg_award_count=3, highlight rank 3; if rg_award_count=5, highlight ranks 3-5
-            if rg_award_count == 3:
-                bronze_formula = f'{rg_rank_col}{min_row + 1}=3'
-            else:
-                bronze_formula = f'AND({rg_rank_col}{min_row + 1}>=3,{rg_rank_col}{min_row + 1}<={rg_award_count})'
-            bronze_rule = Rule(type="expression", formula=[bronze_formula], stopIfTrue=False)
-            bronze_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=bronze_fill)
-            ws.conditional_formatting.add(rg_rank_range, bronze_rule)
-            logger.debug(f"Added Robot Game Bronze CF: {bronze_formula}")
-        
-        # Rule 10: Award column duplicates (Column P) - already added above as Rule 2
-        
-        # Rule 11: Advance "Yes" - medium blue (Column Q)
-        medium_blue_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        white_font = Font(color="FFFFFF")
-        
-        advance_data_range = f"{advance_col}{min_row + 1}:{advance_col}{max_row}"
-        
-        yes_formula = f'{advance_col}{min_row + 1}="Yes"'
-        yes_rule = Rule(type="expression", formula=[yes_formula], stopIfTrue=False)
-        yes_rule.dxf = openpyxl.styles.differential.DifferentialStyle(
-            fill=medium_blue_fill,
-            font=white_font
+        rg_entry = index.table(TABLE_ROBOT_GAME_AWARDS, SHEET_AWARD_DROPDOWNS)
+        if rg_entry:
+            rg_min_col, rg_min_row, rg_max_col, rg_max_row = rg_entry.boundaries
+            # Count rows excluding header
+            rg_award_count = rg_max_row - rg_min_row
+            logger.debug(f"Found {rg_award_count} Robot Game awards")
+
+        award_list_entry = index.table(TABLE_AWARD_DROPDOWNS, SHEET_AWARD_DROPDOWNS)
+
+        formats = essential_conditional_formats(
+            entry.table.ref, rg_award_count, award_list_entry.table.ref if award_list_entry else None
         )
-        ws.conditional_formatting.add(advance_data_range, yes_rule)
-        logger.debug(f"Added 'Yes' highlighting CF: {yes_formula}")
-        
-        # Rule 12: Advance "Alt" - light blue (Column Q)
-        light_blue_fill = PatternFill(start_color="9BC2E6", end_color="9BC2E6", fill_type="solid")
-        
-        alt_formula = f'{advance_col}{min_row + 1}="Alt"'
-        alt_rule = Rule(type="expression", formula=[alt_formula], stopIfTrue=False)
-        alt_rule.dxf = openpyxl.styles.differential.DifferentialStyle(fill=light_blue_fill)
-        ws.conditional_formatting.add(advance_data_range, alt_rule)
-        logger.debug(f"Added 'Alt' highlighting CF: {alt_formula}")
-        
+        for cell_range, rule in formats:
+            ws.conditional_formatting.add(cell_range, rule)
+
         logger.info(f"Added all conditional formatting rules")
-        
+
     except Exception as e:
         logger.warning(f"Could not add conditional formatting: {e}")
         import traceback
         logger.debug(traceback.format_exc())
 
 
-def protect_worksheets(tournament: pd.Series, book: Workbook) -> None:
+def apply_sheet_protection(protection: SheetProtection) -> None:
+    """Set the OJS protection options and password on a sheet's protection settings."""
+    protection.selectLockedCells = True
+    protection.selectUnlockedCells = False
+    protection.formatCells = False
+    protection.formatColumns = False
+    protection.formatRows = False
+    protection.autoFilter = False
+    protection.sort = False
+    protection.set_password(SHEET_PASSWORD)
+    protection.enable()
+
+
+def protect_worksheets(book: Workbook) -> None:
     """Apply protection settings to every worksheet.
     
     Args:
-        tournament: Tournament row
         book: Workbook to protect
     """
-    logger.info(f"Protecting worksheets for {tournament[COL_OJS_FILENAME]}")
+    logger.info("Protecting worksheets")
     for ws in book.worksheets:
-        ws.protection.selectLockedCells = True
-        ws.protection.selectUnlockedCells = False
-        ws.protection.formatCells = False
-        ws.protection.formatColumns = False
-        ws.protection.formatRows = False
-        ws.protection.autoFilter = False
-        ws.protection.sort = False
-        ws.protection.set_password(SHEET_PASSWORD)
-        ws.protection.enable()
+        apply_sheet_protection(ws.protection)
     logger.debug("Worksheet protection applied")
 
 
-def hide_worksheets(tournament: pd.Series, book: Workbook) -> None:
+def hide_worksheets(book: Workbook) -> None:
     """Hide utility worksheets.
     
     Args:
-        tournament: Tournament row
         book: Workbook
     """
-    logger.info(f"Hiding worksheets for {tournament[COL_OJS_FILENAME]}")
-    worksheetNames = ["Data Validation", SHEET_META, SHEET_AWARD_DROPDOWNS, SHEET_AWARD_DEF]
-    
-    for sheetname in worksheetNames:
+    logger.info("Hiding worksheets")
+    for sheetname in HIDDEN_SHEETS:
         if sheetname in book.sheetnames:
             ws = book[sheetname]
             ws.sheet_state = "hidden"
             logger.debug(f"Hid worksheet: {sheetname}")
 
 
+def renamed_award_list_reference(formula: str) -> str:
+    """Point a formula that still uses the old AwardList sheet name at AwardListDropdowns."""
+    # Only replace if it has the OLD sheet name, not the new one
+    if 'AwardList!' in formula and 'AwardListDropdowns!' not in formula:
+        return formula.replace('AwardList!', 'AwardListDropdowns!')
+    return formula
+
+
 def remove_external_links(book: Workbook) -> None:
     """Remove all external workbook links from the workbook.
     
@@ -908,39 +1091,23 @@ def remove_external_links(book: Workbook) -> None:
         removed_count += original_count
     
     # Method 2: Check defined names (which can contain external references)
-    if hasattr(book, 'defined_names'):
-        names_to_remove = []
-        
-        for name_obj in book.defined_names.values():
-            if hasattr(name_obj, 'value') and name_obj.value:
-                # Check for external reference pattern: [filename.xlsx]
-                if '[' in str(name_obj.value) and ']' in str(name_obj.value):
-                    logger.debug(f"Found external reference in defined name: {name_obj.name} = {name_obj.value}")
-                    names_to_remove.append(name_obj.name)
-                    removed_count += 1
-        
-        for name in names_to_remove:
-            del book.defined_names[name]
+    index = workbook_index(book)
+    # Check for external reference pattern: [filename.xlsx]
+    for name in index.bracketed_names():
+        logger.debug(f"Found external reference in defined name: {name} = {book.defined_names[name].value}")
+        index.remove_name(name)
+        removed_count += 1
     
     # Method 3: Fix conditional formatting formulas that reference old sheet names
     # ONLY replace "AwardList!" if it's NOT already "AwardListDropdowns!"
     try:
-        for ws in book.worksheets:
-            if hasattr(ws, 'conditional_formatting'):
-                for cf_range in list(ws.conditional_formatting._cf_rules.keys()):
-                    rules = ws.conditional_formatting._cf_rules[cf_range]
-                    
-                    for rule in rules:
-                        if hasattr(rule, 'formula') and rule.formula:
-                            for i, formula in enumerate(rule.formula):
-                                if formula:
-                                    formula_str = str(formula)
-                                    # Only replace if it has the OLD sheet name, not the new one
-                                    if 'AwardList!' in formula_str and 'AwardListDropdowns!' not in formula_str:
-                                        new_formula = formula_str.replace('AwardList!', 'AwardListDropdowns!')
-                                        rule.formula[i] = new_formula
-                                        logger.debug(f"Fixed CF formula: {formula} -> {new_formula}")
-                
+        for rule, i in index.cf_formulas_referencing("AwardList"):
+            formula_str = str(rule.formula[i])
+            new_formula = renamed_award_list_reference(formula_str)
+            if new_formula != formula_str:
+                rule.formula[i] = new_formula
+                logger.debug(f"Fixed CF formula: {formula_str} -> {new_formula}")
+    
     except Exception as e:
         logger.debug(f"Could not update conditional formatting: {e}")
     
@@ -959,35 +1126,28 @@ def fix_named_ranges(book: Workbook) -> None:
     logger.debug("Fixing named ranges")
     
     try:
+        index = workbook_index(book)
+
         # Fix the "Awards" named range to point to AwardListDropdowns sheet
         
         # First, remove the old "Awards" named range if it exists
         if "Awards" in book.defined_names:
-            del book.defined_names["Awards"]
+            index.remove_name("Awards")
             logger.debug("Removed old 'Awards' named range")
         
         # Find the AwardListDropdowns table to get the correct range
         if SHEET_AWARD_DROPDOWNS in book.sheetnames:
-            ws = book[SHEET_AWARD_DROPDOWNS]
+            entry = index.table(TABLE_AWARD_DROPDOWNS, SHEET_AWARD_DROPDOWNS)
             
-            # Find the table
-            table = None
-            for tbl in ws.tables.values():
-                if tbl.name == TABLE_AWARD_DROPDOWNS:
-                    table = tbl
-                    break
-            
-            if table:
-                from openpyxl.utils import range_boundaries
-                min_col, min_row, max_col, max_row = range_boundaries(table.ref)
+            if entry:
+                min_col, min_row, max_col, max_row = entry.boundaries
                 
                 # Assuming "Award" is the first column (column A)
                 # Create named range pointing to the Award column (excluding header)
                 award_range = f"'{SHEET_AWARD_DROPDOWNS}'!$A${min_row + 1}:$A${max_row}"
                 
                 # Create the named range - use dictionary assignment, not append
-                defn = DefinedName("Awards", attr_text=award_range)
-                book.defined_names["Awards"] = defn
+                index.set_name(DefinedName("Awards", attr_text=award_range))
                 
                 logger.info(f"Created 'Awards' named range: {award_range}")
             else:
@@ -996,12 +1156,12 @@ def fix_named_ranges(book: Workbook) -> None:
             logger.warning(f"Sheet {SHEET_AWARD_DROPDOWNS} not found")
         
         # Also fix any other named ranges that reference "AwardList" (old sheet name)
-        # Iterate using the correct method for DefinedNameDict
-        for name_key, name_obj in book.defined_names.items():
-            if hasattr(name_obj, 'value') and name_obj.value and 'AwardList!' in str(name_obj.value):
-                old_value = name_obj.value
-                name_obj.value = str(name_obj.value).replace('AwardList!', 'AwardListDropdowns!')
-                logger.debug(f"Updated named range '{name_obj.name}': {old_value} -> {name_obj.value}")
+        for name in index.names_referencing("AwardList"):
+            old_value = book.defined_names[name].value
+            if 'AwardList!' not in str(old_value):
+                continue
+            index.retarget_name(name, str(old_value).replace('AwardList!', 'AwardListDropdowns!'))
+            logger.debug(f"Updated named range '{name}': {old_value} -> {book.defined_names[name].value}")
     
     except Exception as e:
         logger.warning(f"Could not fix named ranges: {e}")
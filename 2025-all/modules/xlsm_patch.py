@@ -0,0 +1,1220 @@
+"""Zip-level writer for OJS workbooks.
+
+Saving through openpyxl parses and re-serializes every part of the template:
+styles are rewritten, parts openpyxl does not model are dropped, and structured
+defined names such as `Awards` (AwardListDropdowns[Award]) are deleted by
+remove_external_links and have to be rebuilt by fix_named_ranges. The edits
+fll-maestro makes are narrow, so this writer patches only the XML parts they
+touch - the populated worksheets and their tables, styles.xml, workbook.xml -
+and copies every other part (vbaProject.bin, printer settings, sharedStrings,
+customUI) byte for byte.
+
+The module mirrors worksheet_setup step for step: each set-up function takes
+an OJSPackage where worksheet_setup takes an openpyxl Workbook, and builds its
+rows, styles and rules with the same worksheet_setup helpers, so fll-maestro
+can drive either writer:
+
+    setup = xlsm_patch if template.writer == OJS_WRITER_PATCH else worksheet_setup
+    setup.set_up_tapi_worksheet(row, book, assignees, using_divisions)
+
+Differences from the openpyxl writer, all deliberate:
+    - structured defined names are kept as written in the template, so
+      fix_named_ranges has nothing to do
+    - the calculation chain is removed and Excel recalculates on load (openpyxl
+      drops it too); cached values of untouched formulas are kept
+    - new strings are written inline; the shared string table is left as is
+"""
+
+import io
+import re
+import html
+import itertools
+import logging
+import posixpath
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any
+from xml.sax.saxutils import escape
+from zipfile import ZipFile
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.cell._writer import etree_write_cell
+from openpyxl.formatting.formatting import ConditionalFormatting
+from openpyxl.formatting.rule import Rule
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.differential import DifferentialStyle, DifferentialStyleList
+from openpyxl.utils.cell import (
+    column_index_from_string, get_column_letter, range_boundaries
+)
+from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.datavalidation import DataValidation, DataValidationList
+from openpyxl.worksheet.protection import SheetProtection
+from openpyxl.xml.functions import tostring
+
+from .constants import (
+    COL_OJS_FILENAME, COL_TEAM_NUMBER,
+    SHEET_TEAM_INFO, SHEET_AWARD_DROPDOWNS, SHEET_META, SHEET_AWARD_DEF, SHEET_RESULTS,
+    TABLE_TEAM_LIST, TABLE_ROBOT_GAME_AWARDS, TABLE_AWARD_DROPDOWNS, TABLE_META, TABLE_AWARD_DEF,
+    TABLE_TOURNAMENT_DATA,
+)
+from .excel_operations import match_table_columns, table_row_writes, cast_number
+from .ooxml_package import NS_MAIN, NS_DOC_REL, find_workbook_part, read_relationships, rels_path
+from .logger import print_error
+from .worksheet_setup import (
+    POD_NUMBER_COLUMN, RESIZED_TABLES, HIDDEN_SHEETS,
+    team_list_frame, award_frames, meta_frame, award_def_frame, team_number_value,
+    template_row_validations, essential_conditional_formats, apply_sheet_protection,
+    renamed_award_list_reference, clip_rows, formula_column,
+)
+
+logger = logging.getLogger("ojs_builder")
+
+# Start or end tag, allowing '>' inside quoted attribute values
+_TAG_RE = re.compile(r'<(/?)([\w:.-]+)(?:[^>"]|"[^"]*")*?(/?)>')
+_ATTR_RE = re.compile(r'([\w:.-]+)="([^"]*)"')
+_ROW_RE = re.compile(r'<row\b([^>]*?)(?:/>|>(.*?)</row>)', re.S)
+_CELL_RE = re.compile(r'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_CELL_REF_RE = re.compile(r'\br="([A-Z]+)(\d+)"')
+_STYLE_RE = re.compile(r'\ss="(\d+)"')
+_FORMULA_RE = re.compile(r'<f\b([^>]*?)(?:/>|>(.*?)</f>)', re.S)
+_VALUE_RE = re.compile(r'<v>(.*?)</v>', re.S)
+_TEXT_RE = re.compile(r'<t\b[^>]*?(?:/>|>(.*?)</t>)', re.S)
+_XF_RE = re.compile(r'<xf\b[^>]*?(?:/>|>.*?</xf>)', re.S)
+
+# Order of the worksheet elements that may follow sheetData (CT_Worksheet)
+_WORKSHEET_ORDER = [
+    "sheetCalcPr", "sheetProtection", "protectedRanges", "scenarios", "autoFilter",
+    "sortState", "dataConsolidate", "customSheetViews", "mergeCells", "phoneticPr",
+    "conditionalFormatting", "dataValidations", "hyperlinks", "printOptions", "pageMargins",
+    "pageSetup", "headerFooter", "rowBreaks", "colBreaks", "customProperties", "cellWatches",
+    "ignoredErrors", "smartTags", "drawing", "legacyDrawing", "legacyDrawingHF", "drawingHF",
+    "picture", "oleObjects", "controls", "webPublishItems", "tableParts", "extLst",
+]
+
+# External workbook references in a formula look like [1]Sheet1!A1
+_EXTERNAL_REF_RE = re.compile(r"\[\d+\]")
+
+
+
+def _attrs(text: str) -> dict[str, str]:
+    """Attributes of a start tag (values stay XML-escaped)."""
+    return dict(_ATTR_RE.findall(text))
+
+
+def _start_tag(name: str, attrs: dict[str, str], empty: bool = False) -> str:
+    body = "".join(f' {key}="{value}"' for key, value in attrs.items())
+    return f"<{name}{body}{'/' if empty else ''}>"
+
+
+def _tag_name(element: str) -> str:
+    return re.match(r"<([\w:.-]+)", element).group(1)
+
+
+def _split_elements(xml: str) -> list[str]:
+    """Split a run of sibling elements into one string per element."""
+    elements, depth, start = [], 0, 0
+    for match in _TAG_RE.finditer(xml):
+        closing, self_closing = match.group(1), match.group(3)
+        if not closing and depth == 0:
+            start = match.start()
+        if closing:
+            depth -= 1
+        elif not self_closing:
+            depth += 1
+        if depth == 0:
+            elements.append(xml[start:match.end()])
+    return elements
+
+
+def _namespace_declarations(root_tag: str) -> str:
+    """The xmlns declarations of a root start tag, for parsing fragments of its part."""
+    return " ".join(f'{key}="{value}"' for key, value in _attrs(root_tag).items() if key.startswith("xmlns"))
+
+
+def _parse_fragment(fragment: str, namespaces: str) -> ET.Element:
+    """Parse one element cut from a part, resolving prefixes against the part's root."""
+    return ET.fromstring(f"<wrapper {namespaces}>{fragment}</wrapper>")[0]
+
+
+def _serialize(element: ET.Element) -> str:
+    return tostring(element).decode("utf-8")
+
+
+_scratch_sheet = None
+
+
+class _ElementCollector:
+    """Stands in for the xmlfile openpyxl's cell writer writes to."""
+    element = None
+
+    def write(self, element):
+        self.element = element
+
+
+def _cell_xml(row: int, col: int, style: int, value: Any) -> str | None:
+    """XML for a cell holding `value`, converted exactly as openpyxl would.
+
+    Returns:
+        The <c> element, or None if the cell would be empty and unstyled
+    """
+    ref = f"{get_column_letter(col)}{row}"
+    s = f' s="{style}"' if style else ""
+    if value is None:
+        return f'<c r="{ref}"{s}/>' if style else None
+    if isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+        return f'<c r="{ref}"{s} t="n"><v>{int(value)}</v></c>'
+    if isinstance(value, str) and len(value) > 1 and value.startswith("="):
+        return f'<c r="{ref}"{s}><f>{escape(value[1:])}</f><v></v></c>'
+
+    global _scratch_sheet
+    if _scratch_sheet is None:
+        _scratch_sheet = Workbook().active
+    cell = Cell(_scratch_sheet, row=row, column=col, value=value)
+    collector = _ElementCollector()
+    etree_write_cell(collector, _scratch_sheet, cell, False)
+    if style:
+        collector.element.set("s", str(style))
+    return _serialize(collector.element)
+
+
+class _ArrayFormula:
+    """Value of an array formula cell; like openpyxl's ArrayFormula it is not a str."""
+
+
+class _Row:
+    """One <row> of sheetData: its attributes and its cells by column."""
+    __slots__ = ("attrs", "cells", "raw")
+
+    def __init__(self, attrs: dict[str, str], cells: dict[int, str], raw: str | None):
+        self.attrs = attrs
+        self.cells = cells
+        self.raw = raw  # original XML, None once the row is modified
+
+    def to_xml(self, row_idx: int) -> str:
+        if self.raw is not None:
+            return self.raw
+        attrs = {"r": str(row_idx)}
+        attrs.update((k, v) for k, v in self.attrs.items() if k not in ("r", "spans"))
+        if not self.cells:
+            return _start_tag("row", attrs, empty=True)
+        return _start_tag("row", attrs) + "".join(self.cells[c] for c in sorted(self.cells)) + "</row>"
+
+
+class _Sheet:
+    """A worksheet part split into head, rows and trailing elements for editing."""
+
+    def __init__(self, xml: str, shared_strings: list[str]):
+        self._shared_strings = shared_strings
+        self._values: dict[tuple[int, int], Any] = {}
+        self.dirty = False
+
+        match = re.search(r"<sheetData\b[^>]*?(/?)>", xml)
+        if match.group(1):
+            body, end = "", match.end()
+        else:
+            close = xml.index("</sheetData>", match.end())
+            body, end = xml[match.end():close], close + len("</sheetData>")
+        self._head = xml[:match.start()]
+        tail = xml[end:]
+        close = tail.rindex("</worksheet>")
+        self._tail = _split_elements(tail[:close])
+        self._closing = tail[close:]
+        self._namespaces = _namespace_declarations(re.search(r"<worksheet\b[^>]*>", self._head).group(0))
+
+        self.rows: dict[int, _Row] = {}
+        for row_match in _ROW_RE.finditer(body):
+            attrs = _attrs(row_match.group(1))
+            cells = {}
+            for cell_match in _CELL_RE.finditer(row_match.group(2) or ""):
+                ref = _CELL_REF_RE.search(cell_match.group(1))
+                cells[column_index_from_string(ref.group(1))] = cell_match.group(0)
+            self.rows[int(attrs["r"])] = _Row(attrs, cells, row_match.group(0))
+        self._shared_formulas = None
+
+    # -- cells ---------------------------------------------------------------
+
+    def _row(self, row: int) -> _Row:
+        """The row for editing, created if missing."""
+        entry = self.rows.get(row)
+        if entry is None:
+            entry = self.rows[row] = _Row({}, {}, None)
+        entry.raw = None
+        self.dirty = True
+        return entry
+
+    def style(self, row: int, col: int) -> int:
+        """Index into cellXfs of a cell (0 if the cell does not exist)."""
+        entry = self.rows.get(row)
+        raw = entry.cells.get(col) if entry else None
+        if raw is None:
+            return 0
+        match = _STYLE_RE.search(raw[:raw.find(">")])
+        return int(match.group(1)) if match else 0
+
+    def value(self, row: int, col: int) -> Any:
+        """A cell's value as openpyxl would load it; formulas start with '='."""
+        if (row, col) in self._values:
+            return self._values[(row, col)]
+        entry = self.rows.get(row)
+        raw = entry.cells.get(col) if entry else None
+        if raw is None:
+            return None
+
+        cell = _CELL_RE.match(raw)
+        attrs, inner = _attrs(cell.group(1)), cell.group(2) or ""
+        formula = _FORMULA_RE.search(inner)
+        if formula:
+            formula_attrs = _attrs(formula.group(1))
+            if formula_attrs.get("t") == "array":
+                return _ArrayFormula()
+            text = formula.group(2)
+            if text is None and formula_attrs.get("t") == "shared":
+                return self._shared_formula(formula_attrs.get("si"), f"{get_column_letter(col)}{row}")
+            return "=" + html.unescape(text or "")
+
+        data_type = attrs.get("t", "n")
+        if data_type == "inlineStr":
+            return "".join(html.unescape(t or "") for t in _TEXT_RE.findall(inner))
+        value = _VALUE_RE.search(inner)
+        if value is None:
+            return None
+        text = html.unescape(value.group(1))
+        if data_type == "s":
+            return self._shared_strings[int(text)]
+        if data_type == "b":
+            return text == "1"
+        if data_type in ("str", "e"):
+            return text
+        return cast_number(text) if text else None
+
+    def _shared_formula(self, si: str | None, coordinate: str) -> str | None:
+        """Translate a shared formula from its master cell, as openpyxl does on load."""
+        if self._shared_formulas is None:
+            self._shared_formulas = {}
+            for entry in self.rows.values():
+                for raw in entry.cells.values():
+                    formula = _FORMULA_RE.search(raw)
+                    if formula and formula.group(2):
+                        attrs = _attrs(formula.group(1))
+                        if attrs.get("t") == "shared" and "ref" in attrs:
+                            master = _CELL_REF_RE.search(raw).group(0)[3:-1]
+                            self._shared_formulas[attrs.get("si")] = (
+                                master, "=" + html.unescape(formula.group(2))
+                            )
+        if si not in self._shared_formulas:
+            return None
+        master, formula = self._shared_formulas[si]
+        return Translator(formula, origin=master).translate_formula(coordinate)
+
+    def next_shared_index(self) -> int:
+        """First shared formula index (si) not used by a cell of the sheet."""
+        used = [
+            int(si)
+            for entry in self.rows.values()
+            for raw in entry.cells.values()
+            for attrs in [_attrs(m.group(1)) for m in _FORMULA_RE.finditer(raw)]
+            if attrs.get("t") == "shared" and (si := attrs.get("si", "")).isdigit()
+        ]
+        return max(used) + 1 if used else 0
+
+    def set_value(self, row: int, col: int, value: Any) -> None:
+        """Set a cell's value, keeping its style."""
+        xml = _cell_xml(row, col, self.style(row, col), value)
+        cells = self._row(row).cells
+        if xml is None:
+            cells.pop(col, None)
+        else:
+            cells[col] = xml
+        self._values[(row, col)] = value
+
+    def set_style(self, row: int, col: int, style: int) -> None:
+        """Point a cell at a cellXfs entry, creating the cell if needed."""
+        entry = self.rows.get(row)
+        raw = entry.cells.get(col) if entry else None
+        if raw is None:
+            if style:
+                self._row(row).cells[col] = f'<c r="{get_column_letter(col)}{row}" s="{style}"/>'
+            return
+        if style == self.style(row, col):
+            return
+        end = raw.find(">")
+        if raw[end - 1] == "/":
+            end -= 1
+        start_tag = _STYLE_RE.sub("", raw[:end])
+        if style:
+            start_tag += f' s="{style}"'
+        self._row(row).cells[col] = start_tag + raw[end:]
+
+    def height(self, row: int) -> str | None:
+        """A row's height as written in the sheet, or None if it has no custom height."""
+        entry = self.rows.get(row)
+        return entry.attrs.get("ht") if entry else None
+
+    def set_height(self, row: int, height: str) -> None:
+        entry = self.rows.get(row)
+        if entry and entry.attrs.get("ht") == height and entry.attrs.get("customHeight") == "1":
+            return
+        attrs = self._row(row).attrs
+        attrs["ht"] = height
+        attrs["customHeight"] = "1"
+
+    @property
+    def max_row(self) -> int:
+        """Last row holding a cell (openpyxl's Worksheet.max_row)."""
+        return max((r for r, entry in self.rows.items() if entry.cells), default=1)
+
+    def truncate_rows(self, first_row: int, last_row: int) -> None:
+        """Drop rows first_row..last_row without moving the rows below them.
+
+        Mirrors worksheet_setup.truncate_rows: the rows' cells and attributes
+        go, and conditional formatting, data validation and merged ranges are
+        clipped to match.
+        """
+        if last_row < first_row:
+            return
+        for row_idx in [r for r in self.rows if first_row <= r <= last_row]:
+            del self.rows[row_idx]
+            self.dirty = True
+        for key in [key for key in self._values if first_row <= key[0] <= last_row]:
+            del self._values[key]
+
+        def clip(element: str) -> str:
+            """The element with its sqref clipped, or "" if nothing is left of it."""
+            sqref = _attrs(element[:element.index(">")]).get("sqref", "")
+            clipped = clip_rows(sqref, first_row, last_row)
+            if clipped == MultiCellRange(sqref):
+                return element
+            if not clipped.ranges:
+                return ""
+            return element.replace(f'sqref="{sqref}"', f'sqref="{clipped}"', 1)
+
+        def outside(element: str) -> str:
+            """The merge, unless it lies entirely inside the dropped rows."""
+            _, min_row, _, max_row = range_boundaries(_attrs(element).get("ref", "A1"))
+            return "" if first_row <= min_row and max_row <= last_row else element
+
+        for position in self._find("conditionalFormatting"):
+            clipped = clip(self._tail[position])
+            if clipped != self._tail[position]:
+                self.replace_element(position, clipped)
+        self._rewrite_children("dataValidations", clip)
+        self._rewrite_children("mergeCells", outside)
+        self._tail = [element for element in self._tail if element]
+
+    # -- trailing elements ---------------------------------------------------
+
+    def _find(self, name: str) -> list[int]:
+        return [i for i, element in enumerate(self._tail) if _tag_name(element) == name]
+
+    def _insert(self, name: str, xml: str) -> None:
+        """Insert an element after the last sibling that precedes it in the schema."""
+        rank = _WORKSHEET_ORDER.index(name)
+        position = 0
+        for i, element in enumerate(self._tail):
+            tag = _tag_name(element)
+            if tag in _WORKSHEET_ORDER and _WORKSHEET_ORDER.index(tag) <= rank:
+                position = i + 1
+        self._tail.insert(position, xml)
+        self.dirty = True
+
+    def _rewrite_children(self, name: str, rewrite) -> None:
+        """Pass each child of a container element (e.g. dataValidations) through rewrite.
+
+        Children rewritten to "" are removed, the count attribute is kept up
+        to date, and a container left empty is removed.
+        """
+        for position in self._find(name):
+            xml = self._tail[position]
+            start = xml.index(">") + 1
+            children = _split_elements(xml[start:xml.rindex("</")])
+            rewritten = [new for new in map(rewrite, children) if new]
+            if rewritten == children:
+                continue
+            if not rewritten:
+                self.replace_element(position, "")
+                continue
+            start_tag = re.sub(r'\scount="\d+"', "", xml[:start - 1])
+            self.replace_element(position, f'{start_tag} count="{len(rewritten)}">{"".join(rewritten)}</{name}>')
+
+    def protection(self) -> SheetProtection:
+        found = self._find("sheetProtection")
+        if not found:
+            return SheetProtection()
+        return SheetProtection.from_tree(_parse_fragment(self._tail[found[0]], self._namespaces))
+
+    def set_protection(self, protection: SheetProtection) -> None:
+        xml = _serialize(protection.to_tree())
+        found = self._find("sheetProtection")
+        if found:
+            self._tail[found[0]] = xml
+            self.dirty = True
+        else:
+            self._insert("sheetProtection", xml)
+
+    def data_validations(self) -> list[DataValidation]:
+        found = self._find("dataValidations")
+        if not found:
+            return []
+        element = _parse_fragment(self._tail[found[0]], self._namespaces)
+        return list(DataValidationList.from_tree(element).dataValidation)
+
+    def add_data_validations(self, validations: list[DataValidation]) -> None:
+        if not validations:
+            return
+        new = "".join(_serialize(dv.to_tree()) for dv in validations)
+        found = self._find("dataValidations")
+        if not found:
+            self._insert("dataValidations", f'<dataValidations count="{len(validations)}">{new}</dataValidations>')
+            return
+        xml = self._tail[found[0]]
+        count = len(self.data_validations()) + len(validations)
+        start = xml[:xml.index(">") + 1]
+        start = re.sub(r'\scount="\d+"', "", start).replace("<dataValidations", f'<dataValidations count="{count}"', 1)
+        self._tail[found[0]] = start + xml[len(xml[:xml.index(">") + 1]):-len("</dataValidations>")] + new + "</dataValidations>"
+        self.dirty = True
+
+    def elements(self, name: str) -> list[tuple[int, str]]:
+        """(element position, element) for each trailing element called `name`."""
+        return [(i, self._tail[i]) for i in self._find(name)]
+
+    def replace_element(self, position: int, xml: str) -> None:
+        self._tail[position] = xml
+        self.dirty = True
+
+    def add_conditional_formats(self, formats: list[tuple[str, Rule]], styles: "_Styles") -> None:
+        """Add (range, rule) pairs the way ConditionalFormattingList.add and the writer do.
+
+        Priorities continue from the number of rules already on the sheet, a
+        rule added under several ranges keeps its first priority, and each
+        rule's dxf is added to (or found in) the workbook's differential styles.
+        """
+        existing = self._find("conditionalFormatting")
+        max_priority = sum(self._tail[i].count("<cfRule") for i in existing)
+        keys = {
+            i: MultiCellRange(_attrs(self._tail[i][:self._tail[i].index(">")]).get("sqref", ""))
+            for i in existing
+        }
+        groups: list[tuple[MultiCellRange, list[Rule]]] = []
+        for cell_range, rule in formats:
+            max_priority += 1
+            if not rule.priority:
+                rule.priority = max_priority
+            key = MultiCellRange(cell_range)
+            for group_key, rules in groups:
+                if group_key == key:
+                    rules.append(rule)
+                    break
+            else:
+                groups.append((key, [rule]))
+
+        empty = DifferentialStyle()
+        for key, rules in groups:
+            for rule in rules:
+                if rule.dxf and rule.dxf != empty:
+                    rule.dxfId = styles.add_dxf(rule.dxf)
+            position = next((i for i, existing_key in keys.items() if existing_key == key), None)
+            if position is None:
+                self._insert("conditionalFormatting", _serialize(ConditionalFormatting(sqref=key, cfRule=rules).to_tree()))
+            else:
+                xml = self._tail[position]
+                new = "".join(_serialize(rule.to_tree()) for rule in rules)
+                self._tail[position] = xml[:-len("</conditionalFormatting>")] + new + "</conditionalFormatting>"
+                self.dirty = True
+
+    # -- output --------------------------------------------------------------
+
+    def _dimension(self) -> str:
+        cells = [(r, c) for r, entry in self.rows.items() for c in entry.cells]
+        if not cells:
+            return "A1:A1"
+        rows = [r for r, _ in cells]
+        cols = [c for _, c in cells]
+        return f"{get_column_letter(min(cols))}{min(rows)}:{get_column_letter(max(cols))}{max(rows)}"
+
+    def to_xml(self) -> str:
+        head = re.sub(r'(<dimension\b[^>]*?\sref=)"[^"]*"', rf'\1"{self._dimension()}"', self._head, count=1)
+        rows = "".join(self.rows[r].to_xml(r) for r in sorted(self.rows))
+        return f"{head}<sheetData>{rows}</sheetData>{''.join(self._tail)}{self._closing}"
+
+
+class _Styles:
+    """cellXfs and dxfs of styles.xml, extended as cells are restyled."""
+
+    def __init__(self, xml: str, cell_xfs: list[str], dxfs: list[DifferentialStyle]):
+        self._xml = xml
+        self._xfs = list(cell_xfs)
+        self._xf_index: dict[str, int] = {}
+        for i, xf in enumerate(self._xfs):
+            self._xf_index.setdefault(xf, i)
+        self._dxfs = list(dxfs)
+        self._template_xfs = len(self._xfs)
+        self._template_dxfs = len(self._dxfs)
+
+    def _xf(self, index: int) -> tuple[dict[str, str], str]:
+        match = re.match(r"<xf\b([^>]*?)(?:/>|>(.*)</xf>)", self._xfs[index], re.S)
+        return _attrs(match.group(1)), match.group(2) or ""
+
+    def _add_xf(self, attrs: dict[str, str], children: str) -> int:
+        xml = _start_tag("xf", attrs) + children + "</xf>" if children else _start_tag("xf", attrs, empty=True)
+        if xml not in self._xf_index:
+            self._xf_index[xml] = len(self._xfs)
+            self._xfs.append(xml)
+        return self._xf_index[xml]
+
+    def font_id(self, index: int) -> str:
+        return self._xf(index)[0].get("fontId", "0")
+
+    def with_font(self, index: int, font_id: str) -> int:
+        """Index of the style `index` with its font replaced."""
+        attrs, children = self._xf(index)
+        if attrs.get("fontId", "0") == font_id:
+            return index
+        attrs["fontId"] = font_id
+        attrs["applyFont"] = "1"
+        return self._add_xf(attrs, children)
+
+    def unlocked(self, index: int) -> int:
+        """Index of the style `index` with cell protection turned off."""
+        attrs, children = self._xf(index)
+        children = re.sub(r"<protection\b[^>]*?(?:/>|>.*?</protection>)", "", children, flags=re.S)
+        protection = '<protection locked="0"/>'
+        ext = children.find("<extLst")
+        children = children + protection if ext < 0 else children[:ext] + protection + children[ext:]
+        attrs["applyProtection"] = "1"
+        return self._add_xf(attrs, children)
+
+    def add_dxf(self, dxf: DifferentialStyle) -> int:
+        if dxf not in self._dxfs:
+            self._dxfs.append(dxf)
+        return self._dxfs.index(dxf)
+
+    @property
+    def dirty(self) -> bool:
+        return len(self._xfs) > self._template_xfs or len(self._dxfs) > self._template_dxfs
+
+    def to_xml(self) -> str:
+        xml = self._xml
+        if len(self._xfs) > self._template_xfs:
+            new = "".join(self._xfs[self._template_xfs:])
+            xml = re.sub(
+                r'(<cellXfs\b[^>]*?\scount=)"\d+"([^>]*>)(.*?)</cellXfs>',
+                lambda m: f'{m.group(1)}"{len(self._xfs)}"{m.group(2)}{m.group(3)}{new}</cellXfs>',
+                xml, count=1, flags=re.S,
+            )
+        if len(self._dxfs) > self._template_dxfs:
+            new = "".join(_serialize(dxf.to_tree()) for dxf in self._dxfs[self._template_dxfs:])
+            if re.search(r"<dxfs\b[^>]*/>", xml):
+                xml = re.sub(r"<dxfs\b[^>]*/>", f'<dxfs count="{len(self._dxfs)}">{new}</dxfs>', xml, count=1)
+            elif "<dxfs" in xml:
+                xml = re.sub(
+                    r'(<dxfs\b[^>]*?\scount=)"\d+"([^>]*>)(.*?)</dxfs>',
+                    lambda m: f'{m.group(1)}"{len(self._dxfs)}"{m.group(2)}{m.group(3)}{new}</dxfs>',
+                    xml, count=1, flags=re.S,
+                )
+            else:
+                xml = xml.replace("</cellStyles>", f'</cellStyles><dxfs count="{len(self._dxfs)}">{new}</dxfs>', 1)
+        return xml
+
+
+def _read_shared_strings(data: bytes) -> list[str]:
+    """Plain text of each shared string; phonetic runs are skipped, as in openpyxl."""
+    strings = []
+    for si in ET.fromstring(data).iter(f"{{{NS_MAIN}}}si"):
+        text = []
+        for child in si:
+            if child.tag == f"{{{NS_MAIN}}}t":
+                text.append(child.text or "")
+            elif child.tag == f"{{{NS_MAIN}}}r":
+                text.extend(t.text or "" for t in child.iter(f"{{{NS_MAIN}}}t"))
+        strings.append("".join(text))
+    return strings
+
+
+@dataclass
+class PackageLayout:
+    """Where things live in an OJS package; read once and shared by every copy."""
+    workbook_part: str
+    styles_part: str
+    sheetnames: list[str]
+    sheets: dict[str, str]                 # sheet name -> worksheet part
+    tables: dict[str, tuple[str, str]]     # table name -> (sheet name, table part)
+    shared_strings: list[str]
+    cell_xfs: list[str]
+    dxfs: list[DifferentialStyle]
+
+    @classmethod
+    def read(cls, archive: ZipFile) -> "PackageLayout":
+        workbook_part = find_workbook_part(archive)
+        workbook_rels = read_relationships(archive, workbook_part)
+        workbook_root = ET.fromstring(archive.read(workbook_part))
+
+        sheetnames, sheets, tables = [], {}, {}
+        for sheet in workbook_root.iter(f"{{{NS_MAIN}}}sheet"):
+            name = sheet.get("name")
+            sheetnames.append(name)
+            rel = workbook_rels.get(sheet.get(f"{{{NS_DOC_REL}}}id"))
+            if rel is None or not rel[0].endswith("/worksheet"):
+                continue
+            sheets[name] = rel[1]
+            for rel_type, table_part in read_relationships(archive, rel[1]).values():
+                if rel_type.endswith("/table"):
+                    table_root = ET.fromstring(archive.read(table_part))
+                    tables[table_root.get("name") or table_root.get("displayName")] = (name, table_part)
+
+        parts = {rel_type.rsplit("/", 1)[-1]: target for rel_type, target in workbook_rels.values()}
+        styles_part = parts.get("styles", "xl/styles.xml")
+        shared_strings = (
+            _read_shared_strings(archive.read(parts["sharedStrings"])) if "sharedStrings" in parts else []
+        )
+
+        styles_xml = archive.read(styles_part).decode("utf-8")
+        cell_xfs_block = re.search(r"<cellXfs\b[^>]*>(.*?)</cellXfs>", styles_xml, re.S)
+        cell_xfs = _XF_RE.findall(cell_xfs_block.group(1)) if cell_xfs_block else []
+        dxfs_element = ET.fromstring(styles_xml.encode("utf-8")).find(f"{{{NS_MAIN}}}dxfs")
+        dxfs = list(DifferentialStyleList.from_tree(dxfs_element).dxf) if dxfs_element is not None else []
+
+        return cls(workbook_part, styles_part, sheetnames, sheets, tables, shared_strings, cell_xfs, dxfs)
+
+
+class OJSPackage:
+    """An OJS workbook held as its zip parts and patched in place.
+
+    Parts are parsed only when a set-up step edits them; save() writes every
+    other part back unchanged, with the template's names, order, timestamps
+    and compression.
+    """
+
+    def __init__(self, data: bytes, layout: PackageLayout | None = None):
+        """Open a package.
+
+        Args:
+            data: The .xlsm file contents
+            layout: The package's PackageLayout, if already read
+        """
+        self._archive = ZipFile(io.BytesIO(data))
+        self.layout = layout or PackageLayout.read(self._archive)
+        self._parts: dict[str, bytes] = {}
+        self._removed: set[str] = set()
+        self._sheets: dict[str, _Sheet] = {}
+        self._tables: dict[str, str] = {}
+        self._styles: _Styles | None = None
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self.layout.sheetnames)
+
+    @property
+    def title(self) -> str | None:
+        """Title from the document properties (openpyxl's book.properties.title)."""
+        core = self.read_part("docProps/core.xml")
+        match = re.search(rb"<dc:title>(.*?)</dc:title>", core or b"", re.S)
+        return html.unescape(match.group(1).decode("utf-8")) if match else None
+
+    # -- parts ---------------------------------------------------------------
+
+    def read_part(self, name: str) -> bytes | None:
+        if name in self._removed:
+            return None
+        if name in self._parts:
+            return self._parts[name]
+        if name in self._archive.NameToInfo:
+            return self._archive.read(name)
+        return None
+
+    def write_part(self, name: str, data: bytes) -> None:
+        self._parts[name] = data
+
+    def remove_part(self, name: str) -> None:
+        self._removed.add(name)
+        self._parts.pop(name, None)
+
+    # -- sheets, tables and styles --------------------------------------------
+
+    def sheet(self, name: str) -> _Sheet:
+        if name not in self._sheets:
+            xml = self.read_part(self.layout.sheets[name]).decode("utf-8")
+            self._sheets[name] = _Sheet(xml, self.layout.shared_strings)
+        return self._sheets[name]
+
+    def _table_xml(self, name: str) -> str:
+        if name not in self._tables:
+            self._tables[name] = self.read_part(self.layout.tables[name][1]).decode("utf-8")
+        return self._tables[name]
+
+    def table_sheet(self, name: str) -> str | None:
+        """Name of the sheet holding a table, or None if there is no such table."""
+        entry = self.layout.tables.get(name)
+        return entry[0] if entry else None
+
+    def table_ref(self, name: str) -> str | None:
+        if name not in self.layout.tables:
+            return None
+        root = re.search(r"<table\b[^>]*>", self._table_xml(name)).group(0)
+        return _attrs(root).get("ref")
+
+    def set_table_ref(self, name: str, ref: str) -> None:
+        """Resize a table, keeping its autoFilter in step (openpyxl leaves it behind)."""
+        xml = self._table_xml(name)
+        root = re.search(r"<table\b[^>]*>", xml)
+        new_root = re.sub(r'(\sref=)"[^"]*"', rf'\1"{ref}"', root.group(0), count=1)
+        xml = xml[:root.start()] + new_root + xml[root.end():]
+        xml = re.sub(r'(<autoFilter\b[^>]*?\sref=)"[^"]*"', rf'\1"{ref}"', xml, count=1)
+        self._tables[name] = xml
+
+    @property
+    def styles(self) -> _Styles:
+        if self._styles is None:
+            xml = self.read_part(self.layout.styles_part).decode("utf-8")
+            self._styles = _Styles(xml, self.layout.cell_xfs, self.layout.dxfs)
+        return self._styles
+
+    # -- output --------------------------------------------------------------
+
+    def _flush(self) -> None:
+        for name, sheet in self._sheets.items():
+            if sheet.dirty:
+                self._parts[self.layout.sheets[name]] = sheet.to_xml().encode("utf-8")
+                sheet.dirty = False
+        for name, xml in self._tables.items():
+            self._parts[self.layout.tables[name][1]] = xml.encode("utf-8")
+        if self._styles is not None and self._styles.dirty:
+            self._parts[self.layout.styles_part] = self._styles.to_xml().encode("utf-8")
+
+    def save(self, filename) -> None:
+        """Write the package to a path or file object."""
+        self._flush()
+        with ZipFile(filename, "w") as out:
+            for info in self._archive.infolist():
+                if info.filename in self._removed:
+                    continue
+                data = self._parts.get(info.filename)
+                out.writestr(info, data if data is not None else self._archive.read(info.filename))
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        self.save(buffer)
+        return buffer.getvalue()
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+# -- season-invariant steps (run once by prepare_package) -------------------------
+
+
+def _workbook_xml(book: OJSPackage) -> str:
+    return book.read_part(book.layout.workbook_part).decode("utf-8")
+
+
+def hide_worksheets(book: OJSPackage) -> None:
+    """Hide utility worksheets (worksheet_setup.hide_worksheets)."""
+    logger.info("Hiding worksheets")
+    xml = _workbook_xml(book)
+
+    def hide(match):
+        attrs = _attrs(match.group(1))
+        if html.unescape(attrs.get("name", "")) not in HIDDEN_SHEETS:
+            return match.group(0)
+        attrs["state"] = "hidden"
+        logger.debug(f"Hid worksheet: {html.unescape(attrs['name'])}")
+        return _start_tag("sheet", attrs, empty=True)
+
+    xml = re.sub(r"<sheet\b([^>]*?)/>", hide, xml)
+    book.write_part(book.layout.workbook_part, xml.encode("utf-8"))
+
+
+def protect_worksheets(book: OJSPackage) -> None:
+    """Apply protection settings to every worksheet (worksheet_setup.protect_worksheets)."""
+    logger.info("Protecting worksheets")
+    for name in book.layout.sheets:
+        sheet = book.sheet(name)
+        protection = sheet.protection()
+        apply_sheet_protection(protection)
+        sheet.set_protection(protection)
+    logger.debug("Worksheet protection applied")
+
+
+def _remove_relationships(book: OJSPackage, part: str, predicate) -> list[str]:
+    """Drop the relationships of `part` matching predicate(type, target); returns their targets."""
+    rels_part = rels_path(part)
+    data = book.read_part(rels_part)
+    if data is None:
+        return []
+    xml = data.decode("utf-8")
+    removed = []
+
+    def drop(match):
+        attrs = _attrs(match.group(0))
+        target = attrs.get("Target", "")
+        if attrs.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(part), target)).lstrip("/")
+        if predicate(attrs.get("Type", ""), target):
+            removed.append(target)
+            return ""
+        return match.group(0)
+
+    xml = re.sub(r"<Relationship\b[^>]*?/>", drop, xml)
+    book.write_part(rels_part, xml.encode("utf-8"))
+    return removed
+
+
+def _remove_content_types(book: OJSPackage, parts: list[str]) -> None:
+    xml = book.read_part("[Content_Types].xml").decode("utf-8")
+    for part in parts:
+        xml = re.sub(rf'<Override\b[^>]*?PartName="/{re.escape(part)}"[^>]*?/>', "", xml)
+    book.write_part("[Content_Types].xml", xml.encode("utf-8"))
+
+
+def remove_external_links(book: OJSPackage) -> None:
+    """Remove external workbook links (worksheet_setup.remove_external_links).
+
+    Unlike the openpyxl version, which drops every defined name containing
+    square brackets, only names that point into another workbook ([1]Sheet!A1)
+    are removed, so structured references such as Awards survive.
+    """
+    logger.debug("Checking for external workbook links")
+    removed_count = 0
+
+    links = _remove_relationships(
+        book, book.layout.workbook_part, lambda rel_type, target: rel_type.endswith("/externalLink")
+    )
+    for link in links:
+        book.remove_part(link)
+        book.remove_part(rels_path(link))
+    if links:
+        _remove_content_types(book, links)
+        logger.debug(f"Found {len(links)} external link(s)")
+        removed_count += len(links)
+
+    xml = _workbook_xml(book)
+    xml = re.sub(r"<externalReferences\b.*?</externalReferences>|<externalReferences\b[^>]*/>", "", xml, flags=re.S)
+
+    def fix_name(match):
+        nonlocal removed_count
+        text = html.unescape(match.group(2))
+        if _EXTERNAL_REF_RE.search(text):
+            logger.debug(f"Found external reference in defined name: {_attrs(match.group(1)).get('name')} = {text}")
+            removed_count += 1
+            return ""
+        renamed = renamed_award_list_reference(text)
+        if renamed != text:
+            logger.debug(f"Updated named range '{_attrs(match.group(1)).get('name')}': {text} -> {renamed}")
+        return f"<definedName{match.group(1)}>{escape(renamed)}</definedName>"
+
+    xml = re.sub(r"<definedName\b([^>]*)>(.*?)</definedName>", fix_name, xml, flags=re.S)
+    xml = re.sub(r"<definedNames>\s*</definedNames>", "", xml)
+    book.write_part(book.layout.workbook_part, xml.encode("utf-8"))
+
+    # Fix conditional formatting formulas that reference the old sheet name
+    for name in book.layout.sheets:
+        sheet = book.sheet(name)
+        for position, element in sheet.elements("conditionalFormatting"):
+            def fix_formula(match):
+                formula = html.unescape(match.group(2))
+                renamed = renamed_award_list_reference(formula)
+                if renamed == formula:
+                    return match.group(0)
+                logger.debug(f"Fixed CF formula: {formula} -> {renamed}")
+                return f"<formula{match.group(1)}>{escape(renamed)}</formula>"
+
+            fixed = re.sub(r"<formula\b([^>]*)>(.*?)</formula>", fix_formula, element, flags=re.S)
+            if fixed != element:
+                sheet.replace_element(position, fixed)
+
+    if removed_count > 0:
+        logger.info(f"Removed {removed_count} external reference(s)")
+    else:
+        logger.debug("No external workbook links found")
+
+
+def remove_calc_chain(book: OJSPackage) -> None:
+    """Drop the calculation chain and have Excel recalculate when the file is opened.
+
+    New formula cells are not in the template's chain; Excel rebuilds it.
+    """
+    chains = _remove_relationships(
+        book, book.layout.workbook_part, lambda rel_type, target: rel_type.endswith("/calcChain")
+    )
+    for chain in chains:
+        book.remove_part(chain)
+    _remove_content_types(book, chains)
+
+    xml = _workbook_xml(book)
+    if re.search(r"<calcPr\b", xml):
+        xml = re.sub(
+            r"<calcPr\b([^>]*?)(/?)>",
+            lambda m: _start_tag("calcPr", dict(_attrs(m.group(1)), fullCalcOnLoad="1"), empty=bool(m.group(2))),
+            xml, count=1,
+        )
+    else:
+        xml = xml.replace("</definedNames>", '</definedNames><calcPr fullCalcOnLoad="1"/>', 1)
+    book.write_part(book.layout.workbook_part, xml.encode("utf-8"))
+
+
+def prepare_package(data: bytes) -> bytes:
+    """Apply the season-invariant steps to the template package.
+
+    Args:
+        data: The OJS template (.xlsm) contents
+
+    Returns:
+        The prepared package, ready to be opened with OJSPackage per tournament
+    """
+    book = OJSPackage(data)
+    hide_worksheets(book)
+    protect_worksheets(book)
+    remove_external_links(book)
+    remove_calc_chain(book)
+    prepared = book.to_bytes()
+    book.close()
+    return prepared
+
+
+# -- per-tournament steps --------------------------------------------------------
+
+
+def append_table_rows(
+    book: OJSPackage,
+    sheet_name: str,
+    table_name: str,
+    data: pd.DataFrame,
+    debug: bool = False,
+    key: str | None = None,
+) -> int:
+    """Append (or upsert) a DataFrame to a table (excel_operations.add_table_dataframe).
+
+    Rows whose key matches a data row already in the table update it; blank
+    data rows are filled next; the rest are added below the table and the
+    table is extended over them.
+
+    Returns:
+        Number of rows written to the table
+    """
+    if data is None or data.empty:
+        print_error(logger, "Attempting to add empty or None DataFrame to table. "
+                   f"Sheet: {sheet_name}, Table: {table_name}")
+        return 0
+
+    if sheet_name not in book.layout.sheets:
+        print_error(
+            logger,
+            f"Sheet '{sheet_name}' not found in workbook",
+            error_type='missing_sheet',
+            context={
+                'workbook': 'OJS file',
+                'sheet_name': sheet_name,
+                'available_sheets': book.sheetnames
+            }
+        )
+    if book.table_sheet(table_name) != sheet_name:
+        print_error(
+            logger,
+            f"Table '{table_name}' not found on sheet '{sheet_name}'",
+            error_type='missing_table',
+            context={'table_name': table_name, 'sheet_name': sheet_name}
+        )
+
+    logger.debug(f"Adding {len(data)} rows to table '{table_name}' on sheet '{sheet_name}'")
+
+    sheet = book.sheet(sheet_name)
+    min_col, min_row, max_col, max_row = range_boundaries(book.table_ref(table_name))
+    columns = range(min_col, max_col + 1)
+    headers = [
+        value.strip() if isinstance(value, str) else value
+        for value in (sheet.value(min_row, col) for col in columns)
+    ]
+
+    df = match_table_columns(data, headers, table_name, sheet_name)
+    if key is not None and key not in headers:
+        raise KeyError(f"Upsert key {key!r} is not a column of table {table_name!r}")
+
+    existing_rows = [
+        tuple(sheet.value(row_idx, col) for col in columns)
+        for row_idx in range(min_row + 1, max_row + 1)
+    ]
+    writes, last_row = table_row_writes(df, headers, existing_rows, min_row + 1, key)
+    for row_idx, values in writes:
+        for col, value in zip(columns, values):
+            sheet.set_value(row_idx, col, value)
+    rows_written = len(writes)
+
+    if last_row != max_row:
+        book.set_table_ref(
+            table_name,
+            f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{last_row}",
+        )
+
+    logger.debug(f"Wrote {rows_written} rows to table '{table_name}'")
+    return rows_written
+
+
+def set_up_tapi_worksheet(
+    tournament: pd.Series,
+    book: OJSPackage,
+    assignees: pd.DataFrame,
+    using_divisions: bool
+) -> bool:
+    """Populate the 'Team and Program Information' table (worksheet_setup.set_up_tapi_worksheet).
+
+    Returns:
+        True if successful, False if no teams assigned (should skip this tournament)
+    """
+    team_list = team_list_frame(tournament, assignees, using_divisions)
+    if team_list is None:
+        return False
+
+    append_table_rows(book, SHEET_TEAM_INFO, TABLE_TEAM_LIST, team_list, key=COL_TEAM_NUMBER)
+
+    sheet = book.sheet(SHEET_TEAM_INFO)
+    styles = book.styles
+    min_col, min_row, max_col, max_row = range_boundaries(book.table_ref(TABLE_TEAM_LIST))
+
+    # First data row is the template; copy its fonts and height to the other rows
+    first_data_row = min_row + 1
+    for col_idx in range(min_col, max_col + 1):
+        font_id = styles.font_id(sheet.style(first_data_row, col_idx))
+        for row_idx in range(first_data_row + 1, max_row + 1):
+            sheet.set_style(row_idx, col_idx, styles.with_font(sheet.style(row_idx, col_idx), font_id))
+
+    template_height = sheet.height(first_data_row)
+    if template_height is not None:
+        for row_idx in range(first_data_row + 1, max_row + 1):
+            sheet.set_height(row_idx, template_height)
+        logger.debug(f"Copied row height ({template_height}) to all data rows")
+
+    # Unlock Pod Number column so users can edit it
+    for row_idx in range(min_row + 1, max_row + 1):
+        sheet.set_style(row_idx, POD_NUMBER_COLUMN, styles.unlocked(sheet.style(row_idx, POD_NUMBER_COLUMN)))
+
+    logger.debug(f"Unlocked Pod Number column (D{min_row + 1}:D{max_row})")
+    return True
+
+
+def set_up_award_worksheet(
+    tournament: pd.Series,
+    book: OJSPackage,
+    dfAwardDef: pd.DataFrame,
+    using_divisions: bool
+) -> None:
+    """Prepare award tables used by OJS dropdowns and closing scripts."""
+    rg_awards_df, j_awards_df = award_frames(tournament, dfAwardDef, using_divisions)
+
+    append_table_rows(book, SHEET_AWARD_DROPDOWNS, TABLE_ROBOT_GAME_AWARDS, rg_awards_df)
+    append_table_rows(book, SHEET_AWARD_DROPDOWNS, TABLE_AWARD_DROPDOWNS, j_awards_df)
+    logger.debug(f"Added {len(rg_awards_df)} robot game awards and {len(j_awards_df)} judged awards")
+
+
+def set_up_meta_worksheet(
+    tournament: pd.Series,
+    book: OJSPackage,
+    config: dict,
+    tournament_folder: str,
+    using_divisions: bool
+) -> None:
+    """Populate the metadata worksheet with tournament information."""
+    dfMeta = meta_frame(tournament, config, tournament_folder, using_divisions)
+
+    if tournament[COL_OJS_FILENAME] is not None:
+        append_table_rows(book, SHEET_META, TABLE_META, dfMeta, debug=False, key="Key")
+
+
+def copy_award_def(tournament: pd.Series, book: OJSPackage, award_def: pd.DataFrame) -> None:
+    """Add the award definitions table to the workbook with counts from tournament row."""
+    logger.debug("Adding award definitions table with tournament counts")
+
+    append_table_rows(book, SHEET_AWARD_DEF, TABLE_AWARD_DEF, award_def_frame(tournament, award_def))
+
+
+def resize_worksheets(
+    tournament: pd.Series,
+    book: OJSPackage,
+    assignees: pd.DataFrame,
+    shared_formulas: bool = False,
+) -> None:
+    """Resize the scoring and results tables to the team count (worksheet_setup.resize_worksheets)."""
+    logger.info(f"Resizing worksheets for {book.title}")
+
+    # Team numbers from column A of the team list, up to the last non-empty one
+    tapi = book.sheet(SHEET_TEAM_INFO)
+    team_numbers = [tapi.value(r, 1) for r in range(3, tapi.max_row + 1)]
+    while team_numbers and team_numbers[-1] in (None, ""):
+        team_numbers.pop()
+    team_numbers = [team_number_value(v) for v in team_numbers]
+
+    for s, t, r in RESIZED_TABLES:
+        if s not in book.layout.sheets:
+            continue
+        sheet = book.sheet(s)
+        for offset, team_number in enumerate(team_numbers):
+            sheet.set_value(r + offset, 1, team_number)
+
+        start_col_idx, start_row_num, end_col_idx, end_row_num = range_boundaries(book.table_ref(t))
+        new_end_row = start_row_num + len(team_numbers)
+        book.set_table_ref(
+            t, f"{get_column_letter(start_col_idx)}{start_row_num}:{get_column_letter(end_col_idx)}{new_end_row}"
+        )
+        logger.debug(f"Resized table {t}: {book.table_ref(t)}")
+
+        # Copy formulas, then the template row's style, to every data row
+        first_data_row = start_row_num + 1
+        shared_ids = itertools.count(sheet.next_shared_index()) if shared_formulas else None
+        for col_idx in range(start_col_idx + 1, end_col_idx + 1):
+            template = sheet.value(first_data_row, col_idx)
+            if isinstance(template, str) and template.startswith("="):
+                values = formula_column(template, col_idx, first_data_row, new_end_row, shared_ids)
+                for rr, value in enumerate(values, start=first_data_row):
+                    sheet.set_value(rr, col_idx, value)
+
+        for col_idx in range(start_col_idx, end_col_idx + 1):
+            style = sheet.style(first_data_row, col_idx)
+            for rr in range(first_data_row, new_end_row + 1):
+                sheet.set_style(rr, col_idx, style)
+
+        template_height = sheet.height(first_data_row)
+        if template_height is not None:
+            for rr in range(first_data_row, new_end_row + 1):
+                sheet.set_height(rr, template_height)
+
+        sheet.add_data_validations(template_row_validations(
+            sheet.data_validations(), start_col_idx, end_col_idx, first_data_row, new_end_row
+        ))
+
+        sheet.truncate_rows(new_end_row + 1, end_row_num)
+
+    logger.debug("Worksheet resizing complete")
+
+
+def add_essential_conditional_formats(book: OJSPackage, num_teams: int) -> None:
+    """Add essential conditional formatting to Results and Rankings sheet."""
+    logger.info("Adding essential conditional formatting")
+
+    try:
+        data_ref = book.table_ref(TABLE_TOURNAMENT_DATA)
+        if data_ref is None or book.table_sheet(TABLE_TOURNAMENT_DATA) != SHEET_RESULTS:
+            logger.warning(f"Table {TABLE_TOURNAMENT_DATA} not found, skipping CF")
+            return
+
+        rg_award_count = 0
+        rg_ref = book.table_ref(TABLE_ROBOT_GAME_AWARDS)
+        if rg_ref:
+            _, rg_min_row, _, rg_max_row = range_boundaries(rg_ref)
+            rg_award_count = rg_max_row - rg_min_row
+            logger.debug(f"Found {rg_award_count} Robot Game awards")
+
+        formats = essential_conditional_formats(data_ref, rg_award_count, book.table_ref(TABLE_AWARD_DROPDOWNS))
+        book.sheet(SHEET_RESULTS).add_conditional_formats(formats, book.styles)
+
+        logger.info("Added all conditional formatting rules")
+
+    except Exception as e:
+        logger.warning(f"Could not add conditional formatting: {e}")
+        import traceback
+        logger.debug(traceback.format_exc())
+
+
+def fix_named_ranges(book: OJSPackage) -> None:
+    """Nothing to do: the template's defined names are kept intact by this writer."""
+    logger.debug("Named ranges kept as defined in the template")
@@ -0,0 +1,60 @@
+"""Tests for modules/assignment_index.py.
+
+Run with: python -m pytest test_assignment_index.py
+"""
+import pandas as pd
+import pytest
+
+from modules.constants import COL_TEAM_NUMBER, COL_TEAM_NAME, COL_SHORT_NAME, COL_DIVISION
+from modules.assignment_index import AssignmentIndex
+
+
+@pytest.fixture
+def assignments():
+    return pd.DataFrame({
+        COL_TEAM_NUMBER: [300, 100, 200, 500, 400, 600],
+        COL_TEAM_NAME: ["C", "A", "B", "E", "D", "F"],
+        COL_SHORT_NAME: ["Norfolk", "Norfolk", "Norfolk", "Richmond", "Richmond", "Norfolk"],
+        COL_DIVISION: ["D1", "D2", "D1", "D1", "D1", "D2"],
+    })
+
+
+def test_teams_match_boolean_masks(assignments):
+    """Each lookup returns the rows a mask over the whole table would, sorted by Team #."""
+    index = AssignmentIndex(assignments)
+    for short_name in ["Norfolk", "Richmond"]:
+        expected = assignments[assignments[COL_SHORT_NAME] == short_name]
+        actual = index.teams(short_name)
+        assert actual[COL_TEAM_NUMBER].tolist() == sorted(expected[COL_TEAM_NUMBER])
+        assert index.team_count(short_name) == len(expected)
+
+        for div in ["D1", "D2"]:
+            expected = assignments[
+                (assignments[COL_SHORT_NAME] == short_name) & (assignments[COL_DIVISION] == div)
+            ]
+            actual = index.teams(short_name, div)
+            assert actual[COL_TEAM_NUMBER].tolist() == sorted(expected[COL_TEAM_NUMBER])
+            assert actual[COL_TEAM_NAME].tolist() == (
+                expected.sort_values(COL_TEAM_NUMBER)[COL_TEAM_NAME].tolist()
+            )
+
+
+def test_unknown_tournament_is_empty(assignments):
+    index = AssignmentIndex(assignments)
+    assert index.teams("Nowhere").empty
+    assert index.teams("Richmond", "D2").empty
+    assert list(index.teams("Nowhere").columns) == list(assignments.columns)
+
+
+def test_index_without_divisions(assignments):
+    index = AssignmentIndex(assignments.drop(columns=[COL_DIVISION]))
+    assert index.team_count("Norfolk") == 4
+    assert index.teams("Norfolk", "D1").empty
+
+
+def test_selecting_columns_leaves_index_unchanged(assignments):
+    """set_up_tapi_worksheet adds a column to its slice; the index must not see it."""
+    index = AssignmentIndex(assignments)
+    teams = index.teams("Norfolk", "D1")[[COL_TEAM_NUMBER, COL_TEAM_NAME]]
+    teams["Pod Number"] = 0
+    assert "Pod Number" not in index.teams("Norfolk", "D1").columns
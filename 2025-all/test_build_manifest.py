@@ -0,0 +1,96 @@
+"""Tests for modules/build_manifest.py.
+
+Run with: python -m pytest test_build_manifest.py
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from modules.constants import BUILD_MANIFEST_FILENAME, COL_SHORT_NAME, COL_TEAM_NUMBER, OJS_WRITER_PATCH
+from modules.build_manifest import (
+    season_fingerprint, tournament_fingerprint, up_to_date_results, write_manifest,
+    clear_manifest, load_manifest,
+)
+
+
+@pytest.fixture
+def season_inputs(tmp_path):
+    template = tmp_path / "template.xlsm"
+    template.write_bytes(b"template")
+    asset = tmp_path / "instructions.pdf"
+    asset.write_bytes(b"pdf")
+    return {
+        "config": {"tournament_folder": "out", "AWARDS": []},
+        "dfAwardDef": pd.DataFrame({"ColumnName": ["Champ"], "Count": [1]}),
+        "template_file": str(template),
+        "asset_files": [str(asset)],
+        "using_divisions": False,
+    }
+
+
+@pytest.fixture
+def rows():
+    return pd.DataFrame({COL_SHORT_NAME: ["Norfolk"], "ADV": [4]})
+
+
+@pytest.fixture
+def assignees():
+    return pd.DataFrame({COL_TEAM_NUMBER: [100, 200], COL_SHORT_NAME: ["Norfolk", "Norfolk"]})
+
+
+def test_season_fingerprint_tracks_every_input(season_inputs, tmp_path):
+    base = season_fingerprint(**season_inputs)
+    assert season_fingerprint(**season_inputs) == base
+
+    (tmp_path / "template.xlsm").write_bytes(b"new template")
+    assert season_fingerprint(**season_inputs) != base
+    (tmp_path / "template.xlsm").write_bytes(b"template")
+
+    (tmp_path / "instructions.pdf").write_bytes(b"new pdf")
+    assert season_fingerprint(**season_inputs) != base
+    (tmp_path / "instructions.pdf").write_bytes(b"pdf")
+
+    changed = dict(season_inputs, config={"tournament_folder": "elsewhere", "AWARDS": []})
+    assert season_fingerprint(**changed) != base
+    changed = dict(season_inputs, dfAwardDef=season_inputs["dfAwardDef"].assign(Count=[2]))
+    assert season_fingerprint(**changed) != base
+    assert season_fingerprint(**dict(season_inputs, using_divisions=True)) != base
+    assert season_fingerprint(**dict(season_inputs, writer=OJS_WRITER_PATCH)) != base
+    assert season_fingerprint(**dict(season_inputs, shared_formulas=True)) != base
+    assert season_fingerprint(**season_inputs) == base
+
+
+def test_tournament_fingerprint_ignores_index(rows, assignees):
+    base = tournament_fingerprint("season", rows, assignees)
+    assert tournament_fingerprint("season", rows.set_axis([7]), assignees.set_axis([3, 9])) == base
+    assert tournament_fingerprint("other", rows, assignees) != base
+    assert tournament_fingerprint("season", rows.assign(ADV=[5]), assignees) != base
+    assert tournament_fingerprint("season", rows, assignees.iloc[:1]) != base
+
+
+def test_manifest_round_trip(tmp_path):
+    folder = tmp_path / "Norfolk"
+    folder.mkdir()
+    (folder / "ojs-norfolk.xlsm").write_bytes(b"ojs")
+    (folder / "tournament_config.json").write_text("{}")
+
+    assert up_to_date_results(str(folder), "abc") is None
+    write_manifest(str(folder), "abc", [("Norfolk", False, ["RG: 2 != 3"]), None])
+
+    assert load_manifest(str(folder))["files"] == ["ojs-norfolk.xlsm", "tournament_config.json"]
+    assert up_to_date_results(str(folder), "abc") == [["Norfolk", False, ["RG: 2 != 3"]]]
+    assert up_to_date_results(str(folder), "changed") is None
+
+    os.remove(folder / "ojs-norfolk.xlsm")
+    assert up_to_date_results(str(folder), "abc") is None
+
+    clear_manifest(str(folder))
+    assert not (folder / BUILD_MANIFEST_FILENAME).exists()
+    clear_manifest(str(folder))
+
+
+def test_malformed_manifest_is_ignored(tmp_path):
+    (tmp_path / BUILD_MANIFEST_FILENAME).write_text("not json")
+    assert load_manifest(str(tmp_path)) is None
+    assert up_to_date_results(str(tmp_path), "abc") is None
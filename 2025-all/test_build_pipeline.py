@@ -0,0 +1,112 @@
+"""Tests for modules/build_pipeline.py.
+
+Run with: python -m pytest test_build_pipeline.py
+"""
+import logging
+import threading
+import time
+
+import pytest
+
+from modules.build_pipeline import BuildPipeline, PIPELINE_STAGES
+
+
+def _pipeline(fail_at=None, fail_stage="populate", depth=2, log=None):
+    log = log if log is not None else []
+
+    def stage(name):
+        def run(value):
+            if name == fail_stage and value == fail_at:
+                raise ValueError(f"{name} failed on {value}")
+            print(f"{name} {value}")
+            logging.getLogger("ojs_builder").warning(f"logged {name} {value}")
+            log.append((name, value, threading.current_thread().name))
+            time.sleep(0.001)
+            return value * 10 if name == "write" else value
+        return run
+
+    return BuildPipeline(stage("load"), stage("populate"), stage("write"), depth=depth)
+
+
+def test_results_and_output_in_order(capsys, caplog):
+    finished = []
+    pipeline = _pipeline()
+    results = pipeline.run(range(5), on_finished=lambda i, item, result: finished.append((i, item, result)))
+
+    assert results == [0, 10, 20, 30, 40]
+    assert finished == [(i, i, i * 10) for i in range(5)]
+    expected = [f"{stage} {i}" for i in range(5) for stage in PIPELINE_STAGES]
+    assert capsys.readouterr().out.splitlines() == expected
+    assert [r.getMessage() for r in caplog.records] == [f"logged {line}" for line in expected]
+
+
+def test_stages_run_on_their_own_threads():
+    log = []
+    _pipeline(log=log).run(range(3))
+    threads = {name: {thread for stage, _, thread in log if stage == name} for name in PIPELINE_STAGES}
+    assert threads == {name: {f"pipeline-{name}"} for name in PIPELINE_STAGES}
+
+
+def test_queue_depth_bounds_items_in_flight():
+    in_flight, peak = set(), []
+    lock = threading.Lock()
+
+    def load(item):
+        with lock:
+            in_flight.add(item)
+            peak.append(len(in_flight))
+        return item
+
+    def write(item):
+        time.sleep(0.005)
+        with lock:
+            in_flight.discard(item)
+        return item
+
+    assert BuildPipeline(load, lambda item: item, write, depth=1).run(range(20)) == list(range(20))
+    # One item in each stage plus one in each of the two queues between them
+    assert max(peak) <= 5
+
+
+def test_failure_stops_later_items(capsys):
+    log = []
+    with pytest.raises(ValueError, match="populate failed on 2"):
+        _pipeline(fail_at=2, log=log).run(range(6), on_finished=lambda *args: None)
+
+    written = [value for stage, value, _ in log if stage == "write"]
+    assert written == [0, 1]
+    assert not any(stage == "populate" and value > 2 for stage, value, _ in log)
+    out = capsys.readouterr().out.splitlines()
+    assert out[-1] == "load 2"
+
+
+def test_failure_in_callback_stops_pipeline():
+    def on_finished(index, item, result):
+        if index == 1:
+            raise RuntimeError("callback")
+
+    with pytest.raises(RuntimeError):
+        _pipeline().run(range(10), on_finished=on_finished)
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("pipeline-")]
+
+
+def test_exit_waits_for_enter(monkeypatch):
+    prompted = []
+    monkeypatch.setattr("builtins.input", lambda *args: prompted.append(True) or "")
+
+    def fail(item):
+        raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        BuildPipeline(lambda item: item, fail, lambda item: item).run([1])
+    assert prompted == [True]
+
+
+def test_timings_cover_every_stage():
+    pipeline = _pipeline()
+    pipeline.run(range(3))
+    timings = pipeline.timings
+    assert timings.items == 3
+    assert all(timings.busy[stage] > 0 for stage in PIPELINE_STAGES)
+    assert timings.wall > 0
+    assert len(timings.report()) == len(PIPELINE_STAGES) + 1
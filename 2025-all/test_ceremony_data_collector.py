@@ -0,0 +1,63 @@
+"""Tests for modules/ceremony_data_collector.py.
+
+Run with: python -m pytest test_ceremony_data_collector.py
+"""
+import pandas as pd
+import pytest
+
+from modules.ceremony_data_collector import CeremonyDataCollector
+from modules.constants import COL_TEAM_NUMBER, COL_TEAM_NAME, TABLE_TOURNAMENT_DATA
+
+OJS_PATH = "/events/norfolk-div1.xlsm"
+AWARD = {"ID": "J_AWD_CV", "Name": "Core Values"}
+LABELS = ["Core Values 1st Place", "Core Values 2nd Place", "Core Values 3rd Place"]
+
+
+class _Snapshot:
+    """Stands in for an OJSSnapshot holding just the TournamentData table."""
+
+    def __init__(self, df):
+        self.df = df
+        self.reads = 0
+
+    def get(self, table_name):
+        if table_name != TABLE_TOURNAMENT_DATA:
+            return None
+        self.reads += 1
+        return self.df
+
+
+@pytest.fixture
+def snapshot():
+    return _Snapshot(pd.DataFrame({
+        COL_TEAM_NUMBER: [101, 102, 103, 104, None],
+        COL_TEAM_NAME: ["Alpha", "Bravo", "Charlie", "Delta", None],
+        "Award": ["Core Values 2nd Place", "Core Values 1st Place", None, "Core Values 1st Place", "Judges 1"],
+    }))
+
+
+def test_judged_awards_from_index(snapshot):
+    collector = CeremonyDataCollector({}, snapshots={OJS_PATH: snapshot})
+    winners = collector.collect_judged_awards(OJS_PATH, AWARD, LABELS, "Division 1", "norfolk-div1.xlsm")
+
+    assert [(w.label, w.team_number, w.team_name) for w in winners] == [
+        ("Core Values 1st Place", 102, "Bravo"),
+        ("Core Values 2nd Place", 101, "Alpha"),
+    ]
+    assert collector.warnings == [
+        "norfolk-div1.xlsm: 'Core Values 1st Place' assigned to 2 teams (Team 102, Team 104)",
+        "norfolk-div1.xlsm: Core Values 'Core Values 3rd Place' not assigned",
+    ]
+
+
+def test_index_built_once_per_file(snapshot):
+    collector = CeremonyDataCollector({}, snapshots={OJS_PATH: snapshot})
+    for _ in range(3):
+        collector.collect_judged_awards(OJS_PATH, AWARD, LABELS[:2], "", "norfolk-div1.xlsm")
+    judges = collector.collect_judged_awards(
+        OJS_PATH, {"ID": "J_AWD_Judges", "Name": "Judges"}, ["Judges 1"], "", "norfolk-div1.xlsm"
+    )
+
+    assert snapshot.reads == 1
+    assert judges == []  # the Judges 1 row has no team
+    assert len(collector.warnings) == 1  # the duplicate, reported once
@@ -0,0 +1,84 @@
+"""Tests for modules/ceremony_divisions.py.
+
+Run with: python -m pytest test_ceremony_divisions.py
+"""
+import logging
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from modules.build_pipeline import replay_events
+from modules.ceremony_divisions import (
+    capture_output, prepare_division, prepare_divisions, validate_divisions,
+)
+from modules.ojs_snapshot import OJS_TABLES
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FILES = [
+    (os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-Norfolk-div1.xlsm"), "Division 1"),
+    (os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-Norfolk-div2.xlsm"), "Division 2"),
+]
+
+
+def test_worker_processes_match_in_process():
+    serial = prepare_divisions(FILES, jobs=1, use_cache=False)
+    pooled = prepare_divisions(FILES, jobs=2, use_cache=False)
+
+    assert [data.ojs_path for data in pooled] == [path for path, _ in FILES]
+    for a, b in zip(serial, pooled):
+        assert [str(e) for e in a.errors] == [str(e) for e in b.errors]
+        assert [str(w) for w in a.warnings] == [str(w) for w in b.warnings]
+        assert a.award_index == b.award_index
+        for _, table_name in OJS_TABLES:
+            pd.testing.assert_frame_equal(a.snapshot.table(table_name), b.snapshot.table(table_name))
+        assert [record.getMessage() for record in a.events] == [record.getMessage() for record in b.events]
+
+
+def test_missing_file_is_reported_by_validation(caplog):
+    missing = os.path.join(HERE, "no-such-ojs.xlsm")
+    with caplog.at_level(logging.INFO, logger="ceremony_generator"):
+        data = prepare_division(missing, "Division 1")
+        assert caplog.records == []  # captured, not logged yet
+        replay_events(data.events)
+
+    assert data.snapshot is None and data.award_index is None
+    assert data.errors and all("Could not read table" in error.message for error in data.errors)
+    assert any("Could not read table" in record.getMessage() for record in caplog.records)
+
+
+def test_capture_output_holds_back_print_and_log_until_replayed(capsys, caplog):
+    main_logger = logging.getLogger("ceremony_generator")
+    with caplog.at_level(logging.INFO, logger="ceremony_generator"):
+        with capture_output() as buffer:
+            print("COLLECTING AWARD DATA")
+            main_logger.info("collected")
+        assert capsys.readouterr().out == "" and caplog.records == []
+
+        replay_events(buffer.events)
+    assert capsys.readouterr().out == "COLLECTING AWARD DATA\n"
+    assert [record.getMessage() for record in caplog.records] == ["collected"]
+
+
+def test_single_file_validates_on_a_thread_alongside_collection(caplog):
+    expected = prepare_division(*FILES[0], use_cache=False)
+    divisions = prepare_divisions(FILES[:1], jobs=1, use_cache=False, defer_validation=True)
+    assert not divisions[0].validated and divisions[0].errors == []
+
+    main_logger = logging.getLogger("ceremony_generator")
+    with caplog.at_level(logging.DEBUG, logger="ceremony_generator"):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            validation = pool.submit(validate_divisions, divisions)
+            main_logger.info("collecting award data")  # the main thread keeps logging
+            validation.result()
+
+    data = divisions[0]
+    assert data.validated and data.cache is None
+    assert [str(e) for e in data.errors] == [str(e) for e in expected.errors]
+    assert [str(w) for w in data.warnings] == [str(w) for w in expected.warnings]
+    assert [record.getMessage() for record in caplog.records] == ["collecting award data"]
+    assert "collecting award data" not in [record.getMessage() for record in data.events]
+    assert any("validation" in record.getMessage() for record in data.events)
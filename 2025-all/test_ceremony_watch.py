@@ -0,0 +1,116 @@
+"""Tests for modules/ceremony_watch.py.
+
+Run with: python -m pytest test_ceremony_watch.py
+"""
+import os
+import zipfile
+
+import pytest
+
+from modules.ceremony_data_collector import AwardWinner
+from modules.ceremony_watch import OJSWatcher, is_lock_file, winner_changes
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _save(path, text="x"):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("xl/workbook.xml", text)
+
+
+@pytest.fixture
+def ojs(tmp_path):
+    path = str(tmp_path / "ojs-div1.xlsm")
+    _save(path)
+    return path
+
+
+def _bump(path, ns):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + ns))
+
+
+def test_save_is_reported_once_settled(ojs):
+    clock = FakeClock()
+    watcher = OJSWatcher([ojs], settle_seconds=0.5, clock=clock)
+    assert watcher.poll() == []
+
+    _save(ojs, "changed")
+    _bump(ojs, 1_000_000)
+    assert watcher.poll() == []  # just changed
+    clock.now = 0.2
+    assert watcher.poll() == []  # not settled yet
+    clock.now = 0.6
+    assert watcher.poll() == [ojs]
+    clock.now = 2.0
+    assert watcher.poll() == []  # reported only once
+
+
+def test_file_still_changing_restarts_settle_time(ojs):
+    clock = FakeClock()
+    watcher = OJSWatcher([ojs], settle_seconds=0.5, clock=clock)
+    _bump(ojs, 1_000_000)
+    watcher.poll()
+    clock.now = 0.4
+    _bump(ojs, 1_000_000)
+    assert watcher.poll() == []
+    clock.now = 0.8
+    assert watcher.poll() == []
+    clock.now = 1.0
+    assert watcher.poll() == [ojs]
+
+
+def test_incomplete_workbook_stays_pending(ojs):
+    clock = FakeClock()
+    watcher = OJSWatcher([ojs], settle_seconds=0.5, clock=clock)
+    with open(ojs, "wb") as f:
+        f.write(b"PK half a workbook")
+    watcher.poll()
+    clock.now = 1.0
+    assert watcher.poll() == []
+
+    _save(ojs, "done")
+    _bump(ojs, 1_000_000)
+    watcher.poll()
+    clock.now = 2.0
+    assert watcher.poll() == [ojs]
+
+
+def test_lock_files_are_not_watched(tmp_path, ojs):
+    lock = str(tmp_path / "~$ojs-div1.xlsm")
+    _save(lock)
+    assert is_lock_file(lock) and not is_lock_file(ojs)
+    assert OJSWatcher([lock, ojs]).paths == [ojs]
+
+
+def test_winner_changes():
+    before = {
+        "Champions": [AwardWinner(101, "Alpha", "1st Place"), AwardWinner(102, "Beta", "2nd Place")],
+        "Judges": [AwardWinner(103, "Gamma"), AwardWinner(104, "Delta")],
+        "Motivate": [AwardWinner(105, "Epsilon")],
+    }
+    after = {
+        "Champions": [AwardWinner(101, "Alpha", "1st Place"), AwardWinner(106, "Zeta", "2nd Place")],
+        "Judges": [AwardWinner(104, "Delta"), AwardWinner(103, "Gamma")],
+        "Motivate": [AwardWinner(105, "Epsilon")],
+    }
+    assert winner_changes(before, after) == [
+        "Champions: - 2nd Place: Team 102, Beta / + 2nd Place: Team 106, Zeta",
+        "Judges: reordered",
+    ]
+    assert winner_changes(before, before) == []
+
+
+def test_winner_changes_counts_repeated_teams():
+    before = {"Judges": [AwardWinner(103, "Gamma"), AwardWinner(103, "Gamma")]}
+    after = {"Judges": [AwardWinner(103, "Gamma")], "Think": [AwardWinner(107, "Eta")]}
+    assert winner_changes(before, after) == [
+        "Judges: - Team 103, Gamma",
+        "Think: + Team 107, Eta",
+    ]
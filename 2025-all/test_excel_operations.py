@@ -0,0 +1,345 @@
+"""Tests for modules/excel_operations.py table readers and writers.
+
+Run with: python -m pytest test_excel_operations.py
+"""
+import glob
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from openpyxl.utils.cell import range_boundaries, get_column_letter
+from openpyxl.worksheet.table import Table
+
+from modules.constants import (
+    SHEET_TEAM_INFO, SHEET_META, SHEET_ROBOT_GAME, SHEET_RESULTS,
+    TABLE_TEAM_LIST, TABLE_META, TABLE_ROBOT_GAME, TABLE_TOURNAMENT_DATA,
+)
+import modules.excel_operations as excel_operations
+from modules.excel_operations import (
+    MissingColumnError, PackageReader, WorkbookSession, read_cell_value, read_table_as_df,
+    read_table_as_dict, read_tables, add_table_dataframe,
+    _normalize_table_frame, _streamed_table_frame,
+)
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OJS_FILE = os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-norfolk.xlsm")
+ALL_OJS_FILES = sorted(glob.glob(os.path.join(HERE, "*.xlsm")))
+
+
+def _all_tables():
+    """(path, sheet, table) for every table in every OJS workbook next to this file."""
+    params = []
+    for path in ALL_OJS_FILES:
+        with WorkbookSession(path) as session:
+            for sheet in session.sheetnames:
+                for table in session.workbook[sheet].tables:
+                    params.append(
+                        pytest.param(path, sheet, table, id=f"{os.path.basename(path)}:{table}")
+                    )
+    return params
+
+
+def test_session_matches_path_based_reads():
+    """A session read returns the same frame as the one-off path-based read."""
+    with WorkbookSession(OJS_FILE) as session:
+        for sheet, table in [
+            (SHEET_TEAM_INFO, TABLE_TEAM_LIST),
+            (SHEET_ROBOT_GAME, TABLE_ROBOT_GAME),
+            (SHEET_RESULTS, TABLE_TOURNAMENT_DATA),
+        ]:
+            expected = read_table_as_df(OJS_FILE, sheet, table)
+            actual = session.read_table_as_df(sheet, table)
+            assert actual.equals(expected)
+            assert list(actual.dtypes) == list(expected.dtypes)
+
+
+@pytest.mark.parametrize("sheet, table", [
+    (SHEET_TEAM_INFO, TABLE_TEAM_LIST),
+    (SHEET_ROBOT_GAME, TABLE_ROBOT_GAME),
+    (SHEET_RESULTS, TABLE_TOURNAMENT_DATA),
+])
+def test_cell_reader_matches_read_excel(sheet, table):
+    """Frames built from worksheet cells match pandas.read_excel over the table range."""
+    with WorkbookSession(OJS_FILE) as session:
+        actual = session.read_table_as_df(sheet, table)
+        ref = session.workbook[sheet].tables[table].ref
+
+    min_col, min_row, max_col, max_row = range_boundaries(ref)
+    expected = pd.read_excel(
+        OJS_FILE,
+        sheet_name=sheet,
+        header=min_row - 1,
+        usecols=f"{get_column_letter(min_col)}:{get_column_letter(max_col)}",
+        nrows=max_row - min_row,
+        engine="openpyxl",
+    )
+    expected = _normalize_table_frame(expected)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_read_only_session_matches_full_session():
+    """Streaming (read-only) reads return the same frames as a fully loaded workbook."""
+    with WorkbookSession(OJS_FILE) as full, WorkbookSession(OJS_FILE, read_only=True) as streamed:
+        for sheet, table in [
+            (SHEET_TEAM_INFO, TABLE_TEAM_LIST),
+            (SHEET_META, TABLE_META),
+            (SHEET_RESULTS, TABLE_TOURNAMENT_DATA),
+        ]:
+            pd.testing.assert_frame_equal(
+                streamed.read_table_as_df(sheet, table), full.read_table_as_df(sheet, table)
+            )
+
+
+def test_streamed_chunks_concatenate_like_single_pass():
+    with WorkbookSession(OJS_FILE, read_only=True) as session:
+        ws = session.workbook[SHEET_RESULTS]
+        bounds = range_boundaries(session._table_ref(SHEET_RESULTS, TABLE_TOURNAMENT_DATA))
+        single = _streamed_table_frame(ws, *bounds)
+        chunked = _streamed_table_frame(ws, *bounds, chunksize=2)
+    pd.testing.assert_frame_equal(chunked, single)
+
+
+def test_session_read_table_as_dict():
+    with WorkbookSession(OJS_FILE) as session:
+        meta = session.read_table_as_dict(SHEET_META, TABLE_META)
+    assert meta == read_table_as_dict(OJS_FILE, SHEET_META, TABLE_META)
+    assert meta["Tournament Short Name"] == "Norfolk"
+
+
+def test_session_missing_table():
+    with WorkbookSession(OJS_FILE) as session:
+        with pytest.raises(KeyError):
+            session.read_table_as_df(SHEET_META, "NoSuchTable")
+        assert session.read_table_as_df(SHEET_META, "NoSuchTable", require_table=False).empty
+
+
+def test_session_missing_file():
+    with pytest.raises(FileNotFoundError):
+        WorkbookSession(os.path.join(HERE, "does-not-exist.xlsm"))
+
+
+@pytest.mark.parametrize("path, sheet, table", _all_tables())
+def test_package_reader_matches_openpyxl(path, sheet, table):
+    """The direct XML reader returns the same frame as the openpyxl reader for every table."""
+    with WorkbookSession(path) as session:
+        expected = session.read_table_as_df(sheet, table)
+    with PackageReader(path) as reader:
+        actual = reader.read_table_as_df(sheet, table)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("path", ALL_OJS_FILES, ids=os.path.basename)
+def test_package_reader_cell_values(path):
+    with WorkbookSession(path) as session:
+        ws = session.workbook[SHEET_TEAM_INFO]
+        expected = [ws[coord].value for coord in ("A1", "F2", "B5")]
+    actual = [read_cell_value(path, SHEET_TEAM_INFO, coord) for coord in ("A1", "F2", "B5")]
+    assert actual == expected
+
+
+def test_package_reader_missing_table():
+    with PackageReader(OJS_FILE) as reader:
+        with pytest.raises(KeyError):
+            reader.read_table_as_df(SHEET_META, "NoSuchTable")
+        with pytest.raises(KeyError):
+            reader.read_table_as_df("No Such Sheet", TABLE_META)
+        assert reader.read_table_as_df(SHEET_META, "NoSuchTable", require_table=False).empty
+
+
+def test_read_table_falls_back_to_openpyxl(monkeypatch):
+    """If the package cannot be parsed directly, the openpyxl reader is used."""
+    expected = read_table_as_df(OJS_FILE, SHEET_TEAM_INFO, TABLE_TEAM_LIST)
+
+    def broken_reader(*args, **kwargs):
+        raise RuntimeError("unsupported package")
+
+    monkeypatch.setattr(excel_operations, "PackageReader", broken_reader)
+    actual = read_table_as_df(OJS_FILE, SHEET_TEAM_INFO, TABLE_TEAM_LIST)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("path", ALL_OJS_FILES, ids=os.path.basename)
+def test_read_tables_matches_single_reads(path):
+    """Batch reads (including sheets holding several tables) match one-at-a-time reads."""
+    with WorkbookSession(path) as session:
+        requested = [
+            (sheet, table) for sheet in session.sheetnames for table in session.workbook[sheet].tables
+        ]
+        expected = {table: session.read_table_as_df(sheet, table) for sheet, table in requested}
+
+    actual = read_tables(path, requested)
+    assert list(actual) == [table for _, table in requested]
+    for table, df in expected.items():
+        pd.testing.assert_frame_equal(actual[table], df)
+
+
+def test_read_tables_missing_table():
+    requested = [(SHEET_META, TABLE_META), (SHEET_META, "NoSuchTable")]
+    with pytest.raises(KeyError):
+        read_tables(OJS_FILE, requested)
+    tables = read_tables(OJS_FILE, requested, require_table=False)
+    assert tables["NoSuchTable"].empty
+    assert not tables[TABLE_META].empty
+
+
+@pytest.mark.parametrize("read_only", [False, True], ids=["full", "read_only"])
+def test_projected_reads_match_full_reads(read_only):
+    """A columns= read returns the full table's columns in table order, whichever reader is used."""
+    with WorkbookSession(OJS_FILE, read_only=read_only) as session, PackageReader(OJS_FILE) as reader:
+        for sheet, table, columns in [
+            (SHEET_TEAM_INFO, TABLE_TEAM_LIST, ["Team Name", "Team #"]),
+            (SHEET_RESULTS, TABLE_TOURNAMENT_DATA, ["Award", "Team #", "Advance?"]),
+            (SHEET_META, TABLE_META, ["Value"]),
+        ]:
+            full = session.read_table_as_df(sheet, table)
+            expected = full[[c for c in full.columns if c in columns]]
+            pd.testing.assert_frame_equal(
+                session.read_table_as_df(sheet, table, columns=columns), expected
+            )
+            pd.testing.assert_frame_equal(
+                reader.read_table_as_df(sheet, table, columns=columns), expected
+            )
+
+
+def test_projected_read_required_columns():
+    df = read_table_as_df(OJS_FILE, SHEET_TEAM_INFO, TABLE_TEAM_LIST, columns="required")
+    assert list(df.columns) == ["Team #", "Team Name", "Coach Name"]
+
+    tables = read_tables(
+        OJS_FILE,
+        [(SHEET_TEAM_INFO, TABLE_TEAM_LIST), (SHEET_RESULTS, TABLE_TOURNAMENT_DATA)],
+        columns={TABLE_TOURNAMENT_DATA: ["Team #", "Award"]},
+    )
+    assert list(tables[TABLE_TOURNAMENT_DATA].columns) == ["Team #", "Award"]
+    pd.testing.assert_frame_equal(
+        tables[TABLE_TEAM_LIST], read_table_as_df(OJS_FILE, SHEET_TEAM_INFO, TABLE_TEAM_LIST)
+    )
+
+
+def test_projected_read_missing_column():
+    with pytest.raises(MissingColumnError, match="Missing column: Robot Game 9 Score") as excinfo:
+        read_table_as_df(
+            OJS_FILE, SHEET_ROBOT_GAME, TABLE_ROBOT_GAME,
+            columns=["Team #", "Robot Game 9 Score"],
+        )
+    assert excinfo.value.columns == ["Robot Game 9 Score"]
+
+    with WorkbookSession(OJS_FILE) as session:
+        with pytest.raises(KeyError, match="Missing columns: A, B"):
+            session.read_table_as_df(SHEET_META, TABLE_META, columns=["A", "Key", "B"])
+
+
+def test_normalize_table_frame_edge_cases():
+    """Trimming and Int64 coercion keep dtypes and leave non-text values alone."""
+    df = pd.DataFrame({
+        " Name ": pd.Series([" a ", "b", np.nan], dtype="str"),
+        "Mixed": pd.Series([" x ", True, 1], dtype=object),
+        "Whole": [1.0, np.nan, 3.0],
+        "Fraction": [1.5, 2.0, np.nan],
+        "Blank": [np.nan, np.nan, np.nan],
+        "Infinite": [1.0, np.inf, 2.0],
+    })
+    name_dtype = df[" Name "].dtype
+    out = _normalize_table_frame(df)
+
+    assert list(out.columns) == ["Name", "Mixed", "Whole", "Fraction", "Blank", "Infinite"]
+    assert out["Name"].dtype == name_dtype
+    assert out["Name"].tolist()[:2] == ["a", "b"]
+    assert out["Mixed"].tolist() == ["x", True, 1]
+    assert out["Mixed"].iat[1] is True
+    assert str(out["Whole"].dtype) == "Int64"
+    assert [str(out[c].dtype) for c in ("Fraction", "Blank", "Infinite")] == ["float64"] * 3
+
+
+def test_normalize_table_frame_duplicate_headers():
+    """Headers that only differ by padding become duplicates but keep their own data."""
+    df = pd.DataFrame([[" x ", 1.0], [" y ", 2.0]], columns=["Team", "Team "])
+    out = _normalize_table_frame(df)
+    assert list(out.columns) == ["Team", "Team"]
+    assert out.iloc[:, 0].tolist() == ["x", "y"]
+    assert str(out.iloc[:, 1].dtype) == "Int64"
+
+
+def _team_table(rows):
+    """A workbook with a Team #/Team Name/Notes table holding rows (None rows stay blank)."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Teams"
+    ws.append(["Team #", "Team Name", "Notes"])
+    for row in rows:
+        ws.append(row or [None, None, None])
+    ws.add_table(Table(displayName="Teams", ref=f"A1:C{len(rows) + 1}"))
+    return wb, ws
+
+
+def _table_values(ws):
+    return [list(row) for row in ws.iter_rows(
+        min_row=2, max_row=range_boundaries(ws.tables["Teams"].ref)[3], values_only=True
+    )]
+
+
+def test_add_table_dataframe_fills_blank_rows_then_appends():
+    wb, ws = _team_table([[1001, "One", "keep"], None])
+    df = pd.DataFrame({"Team #": [1002, 1003], "Team Name": ["Two", "Three"], "Extra": [1, 2]})
+
+    assert add_table_dataframe(wb, "Teams", "Teams", df) == 2
+    assert ws.tables["Teams"].ref == "A1:C4"
+    assert _table_values(ws) == [
+        [1001, "One", "keep"], [1002, "Two", None], [1003, "Three", None],
+    ]
+
+
+def test_add_table_dataframe_upserts_by_key():
+    wb, ws = _team_table([[1001, "One", "a"], [" 1002 ", "Two", "b"], None])
+    df = pd.DataFrame({
+        "Team #": [1002, 1004, 1001.0, 1005],
+        "Team Name": ["Two!", "Four", "One!", "Five"],
+        "Notes": ["B", "D", "A", "E"],
+    })
+
+    assert add_table_dataframe(wb, "Teams", "Teams", df, key="Team #") == 4
+    assert ws.tables["Teams"].ref == "A1:C5"
+    assert _table_values(ws) == [
+        [1001.0, "One!", "A"], [1002, "Two!", "B"], [1004, "Four", "D"], [1005, "Five", "E"],
+    ]
+
+
+def test_add_table_dataframe_key_repeated_in_rows(caplog):
+    wb, ws = _team_table([[1001, "One", "a"]])
+    df = pd.DataFrame({
+        "Team #": [1001, 1001, 1002, 1002.0],
+        "Team Name": ["One!", "One?", "Two", "Two?"],
+        "Notes": ["A", "B", "C", "D"],
+    })
+
+    with caplog.at_level("WARNING", logger="ojs_builder"):
+        assert add_table_dataframe(wb, "Teams", "Teams", df, key="Team #") == 4
+    assert _table_values(ws) == [
+        [1001, "One!", "A"], [1001, "One?", "B"], [1002, "Two", "C"], [1002.0, "Two?", "D"],
+    ]
+    assert sum("Duplicate Team #" in r.message for r in caplog.records) == 2
+
+
+def test_add_table_dataframe_blank_keys_are_added():
+    wb, ws = _team_table([[None, "Blank", "x"], None])
+    df = pd.DataFrame({
+        "Team #": [1001, 1001, None, None],
+        "Team Name": ["One", "One again", "No number", "Also none"],
+    })
+
+    assert add_table_dataframe(wb, "Teams", "Teams", df, key="Team #") == 4
+    values = _table_values(ws)
+    assert len(values) == 5
+    assert values[0] == [None, "Blank", "x"]
+    assert [row[1] for row in values[1:]] == ["One", "One again", "No number", "Also none"]
+
+
+def test_add_table_dataframe_unknown_key():
+    wb, _ = _team_table([None])
+    with pytest.raises(KeyError, match="Pod"):
+        add_table_dataframe(wb, "Teams", "Teams", pd.DataFrame({"Team #": [1]}), key="Pod")
@@ -0,0 +1,76 @@
+"""Tests for modules/ojs_snapshot.py.
+
+Run with: python -m pytest test_ojs_snapshot.py
+"""
+import os
+import warnings
+
+import pandas as pd
+import pytest
+
+import modules.ceremony_validator as ceremony_validator
+import modules.ojs_snapshot as ojs_snapshot
+from modules.ceremony_data_collector import CeremonyDataCollector
+from modules.ceremony_validator import OJSValidator
+from modules.constants import CELL_DUAL_EMCEE, SHEET_TEAM_INFO, TABLE_TEAM_LIST
+from modules.excel_operations import read_cell_value, read_table_as_df
+from modules.ojs_snapshot import OJS_TABLES, OJSSnapshot
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OJS_FILE = os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-norfolk.xlsm")
+
+
+@pytest.fixture
+def count_opens(monkeypatch):
+    """Count how often an OJS file is opened by a snapshot."""
+    calls = []
+    real_reader = ojs_snapshot.PackageReader
+
+    def counting_reader(path):
+        calls.append(path)
+        return real_reader(path)
+
+    monkeypatch.setattr(ojs_snapshot, "PackageReader", counting_reader)
+    return calls
+
+
+def test_tables_match_direct_reads():
+    snapshot = OJSSnapshot(OJS_FILE)
+    for sheet_name, table_name in OJS_TABLES:
+        pd.testing.assert_frame_equal(snapshot.table(table_name), read_table_as_df(OJS_FILE, sheet_name, table_name))
+    assert snapshot.cell(SHEET_TEAM_INFO, CELL_DUAL_EMCEE) == read_cell_value(OJS_FILE, SHEET_TEAM_INFO, CELL_DUAL_EMCEE)
+
+
+def test_missing_table_and_cell_raise():
+    snapshot = OJSSnapshot(OJS_FILE, tables=[(SHEET_TEAM_INFO, "NoSuchTable")], cells=[("NoSuchSheet", "A1")])
+    with pytest.raises(KeyError):
+        snapshot.table("NoSuchTable")
+    assert snapshot.get("NoSuchTable") is None
+    with pytest.raises(KeyError):
+        snapshot.cell("NoSuchSheet", "A1")
+    with pytest.raises(KeyError):
+        snapshot.table(TABLE_TEAM_LIST)
+
+
+def test_missing_file_raises():
+    with pytest.raises(FileNotFoundError):
+        OJSSnapshot(os.path.join(HERE, "no-such-ojs.xlsm"))
+
+
+def test_validator_and_collector_share_one_read(monkeypatch, count_opens):
+    snapshot = OJSSnapshot(OJS_FILE)
+
+    def no_direct_reads(*args, **kwargs):
+        raise AssertionError("table read again")
+
+    monkeypatch.setattr(ceremony_validator, "read_table_as_df", no_direct_reads)
+    validator = OJSValidator()
+    validator.validate_all_sheets(OJS_FILE, snapshot=snapshot)
+    assert not any("Could not read" in error for error in validator.errors)
+
+    collector = CeremonyDataCollector({}, snapshots={OJS_FILE: snapshot})
+    teams = collector.collect_team_list(OJS_FILE)
+    assert len(teams) == len(snapshot.table(TABLE_TEAM_LIST).dropna(how="all"))
+    assert count_opens == [OJS_FILE]
@@ -0,0 +1,132 @@
+"""Tests for modules/prepared_template.py.
+
+Run with: python -m pytest test_prepared_template.py
+"""
+import io
+import os
+import warnings
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from modules.constants import (
+    COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME, COL_SHORT_NAME, COL_OJS_FILENAME,
+    SHEET_TEAM_INFO, TABLE_TEAM_LIST,
+)
+from modules import prepared_template
+from modules.prepared_template import PreparedTemplate
+from modules.worksheet_setup import (
+    prepare_award_def, hide_worksheets, protect_worksheets, remove_external_links,
+    set_up_tapi_worksheet, resize_worksheets,
+)
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(HERE, "2025-Qualifier-Template.xlsm")
+
+
+@pytest.fixture(scope="module")
+def award_def():
+    return pd.DataFrame({
+        "ColumnName": ["Champ", "RG"],
+        "D1Count": [1, 2],
+        "Label1": ["Champion", 0],
+        "DivAward": [1, 0],
+    })
+
+
+@pytest.fixture(scope="module")
+def template(award_def):
+    return PreparedTemplate(TEMPLATE_FILE, award_def)
+
+
+def _fresh_book():
+    """The template loaded from disk with the season-invariant steps applied."""
+    book = load_workbook(TEMPLATE_FILE, keep_vba=True)
+    hide_worksheets(book)
+    protect_worksheets(book)
+    remove_external_links(book)
+    return book
+
+
+def _saved_parts(book) -> dict:
+    buffer = io.BytesIO()
+    book.save(buffer)
+    with ZipFile(buffer) as archive:
+        # core.xml carries the save timestamp
+        return {
+            name: archive.read(name)
+            for name in archive.namelist() if name != "docProps/core.xml"
+        }
+
+
+def _populate(book, num_teams):
+    tournament = pd.Series({COL_SHORT_NAME: "Norfolk", COL_OJS_FILENAME: "norfolk.xlsm"})
+    assignees = pd.DataFrame({
+        COL_TEAM_NUMBER: range(1001, 1001 + num_teams),
+        COL_TEAM_NAME: [f"Team {i}" for i in range(num_teams)],
+        COL_COACH_NAME: [f"Coach {i}" for i in range(num_teams)],
+    })
+    assert set_up_tapi_worksheet(tournament, book, assignees, False)
+    resize_worksheets(tournament, book, assignees)
+
+
+def test_clone_saves_like_fresh_load(template):
+    assert template._book is not None  # cloned from the pickle, not reloaded
+    parts = _saved_parts(template.clone())
+    assert parts == _saved_parts(_fresh_book())
+    # The macro project is copied from the template bytes attached on clone
+    with ZipFile(TEMPLATE_FILE) as archive:
+        assert parts["xl/vbaProject.bin"] == archive.read("xl/vbaProject.bin")
+
+
+def test_clone_falls_back_to_loading_when_pickle_fails(award_def, monkeypatch):
+    def broken_dump(book):
+        raise TypeError("cannot pickle 'TableList' object")
+
+    monkeypatch.setattr(prepared_template, "_dump_workbook", broken_dump)
+    template = PreparedTemplate(TEMPLATE_FILE, award_def)
+    clone, fresh = template.clone(), _fresh_book()
+    _populate(clone, 3)
+    _populate(fresh, 3)
+    assert _saved_parts(clone) == _saved_parts(fresh)
+
+
+def test_clone_falls_back_to_loading_when_tables_are_lost(award_def, monkeypatch):
+    monkeypatch.setattr(prepared_template, "_same_layout", lambda book, clone: False)
+    template = PreparedTemplate(TEMPLATE_FILE, award_def)
+    assert _saved_parts(template.clone()) == _saved_parts(_fresh_book())
+
+
+@pytest.mark.parametrize("num_teams", [3, 40])
+def test_populated_clone_saves_like_fresh_load(template, num_teams):
+    """Per-tournament edits (new rows, resized tables) behave the same on a clone."""
+    clone, fresh = template.clone(), _fresh_book()
+    _populate(clone, num_teams)
+    _populate(fresh, num_teams)
+    assert _saved_parts(clone) == _saved_parts(fresh)
+
+
+def test_clones_are_independent(template):
+    first = template.clone()
+    _populate(first, 40)
+    second = template.clone()
+    assert second[SHEET_TEAM_INFO].tables[TABLE_TEAM_LIST].ref != (
+        first[SHEET_TEAM_INFO].tables[TABLE_TEAM_LIST].ref
+    )
+    assert _saved_parts(second) == _saved_parts(_fresh_book())
+
+
+def test_award_def_prepared_once(template, award_def):
+    pd.testing.assert_frame_equal(template.award_def, prepare_award_def(award_def))
+    assert "D1Count" not in template.award_def.columns
+    assert template.award_def["DivAward"].tolist() == ["TRUE", "FALSE"]
+    assert "D1Count" in award_def.columns
+
+
+def test_missing_template(award_def):
+    with pytest.raises(FileNotFoundError):
+        PreparedTemplate(os.path.join(HERE, "does-not-exist.xlsm"), award_def)
@@ -0,0 +1,96 @@
+"""Tests for modules/score_rules.py.
+
+Run with: python -m pytest test_score_rules.py
+"""
+import os
+import warnings
+
+import pandas as pd
+import pytest
+
+from modules.ceremony_validator import OJSValidator
+from modules.constants import COL_TEAM_NUMBER, SHEET_ROBOT_GAME, TABLE_ROBOT_GAME
+from modules.ojs_snapshot import OJSSnapshot
+from modules.score_rules import (
+    SCORE_RULES, ScoreRule, CellIssue, check_rules, check_template,
+    BLANK_WARNING, PROBLEM_BLANK, PROBLEM_INVALID, PROBLEM_MISSING_COLUMN, PROBLEM_MISSING_TABLE,
+)
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OJS_FILE = os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-norfolk.xlsm")
+TEMPLATE_FILE = os.path.join(HERE, "2025-Qualifier-Template.xlsm")
+
+RULE = ScoreRule("Scores", "ScoreTable", ("A", "B"), minimum=0, maximum=5)
+SET_RULE = ScoreRule("Scores", "ScoreTable", ("A",), allowed=frozenset({0, 2, 3, 4}))
+
+
+@pytest.fixture
+def scores():
+    return pd.DataFrame({
+        COL_TEAM_NUMBER: [101, 102, 103, None],
+        "A": [0, None, 6, 2],
+        "B": pd.Series([5, 1, "x", None], dtype=object),
+    })
+
+
+def _cells(issues):
+    return [(issue.column, issue.problem, issue.row, issue.team_number) for issue in issues]
+
+
+def test_range_rule_reports_each_cell(scores):
+    issues = check_rules({"ScoreTable": scores}, [RULE])
+    assert _cells(issues) == [
+        ("A", PROBLEM_BLANK, 3, 102),
+        ("A", PROBLEM_INVALID, 4, 103),
+        ("B", PROBLEM_BLANK, 5, None),
+        ("B", PROBLEM_INVALID, 4, 103),
+    ]
+    assert [issue.value for issue in issues if issue.problem == PROBLEM_INVALID] == [6, "x"]
+
+
+def test_set_rule_and_blank_policy(scores):
+    rule = ScoreRule("Scores", "ScoreTable", ("A",), allowed=frozenset({0, 2, 3, 4}), blanks=BLANK_WARNING)
+    issues = check_rules({"ScoreTable": scores}, [rule])
+    assert [(issue.severity, issue.problem, issue.row) for issue in issues] == [
+        ("WARNING", PROBLEM_BLANK, 3), ("ERROR", PROBLEM_INVALID, 4),
+    ]
+    assert _cells(check_rules({"ScoreTable": scores}, [SET_RULE], allow_blanks=True)) == [
+        ("A", PROBLEM_INVALID, 4, 103),
+    ]
+
+
+def test_missing_table_and_column(scores):
+    rule = ScoreRule("Scores", "ScoreTable", ("A", "Missing"), minimum=0, maximum=5)
+    issues = check_rules({"ScoreTable": scores.iloc[[0]]}, [rule, ScoreRule("Other", "OtherTable", ("A",))])
+    assert issues == [
+        CellIssue("ERROR", "Scores", "ScoreTable", "Missing", PROBLEM_MISSING_COLUMN),
+        CellIssue("ERROR", "Other", "OtherTable", None, PROBLEM_MISSING_TABLE),
+    ]
+
+
+def test_ojs_file_passes():
+    snapshot = OJSSnapshot(OJS_FILE)
+    assert check_rules({rule.table: snapshot.table(rule.table) for rule in SCORE_RULES}) == []
+
+
+def test_template_passes():
+    assert check_template(TEMPLATE_FILE) == []
+
+
+def test_validator_messages_list_cells():
+    snapshot = OJSSnapshot(OJS_FILE)
+    df = snapshot.table(TABLE_ROBOT_GAME).astype({"Robot Game 2 Score": object})
+    df.loc[range(7), "Robot Game 2 Score"] = [None, 600, 601, 602, 603, 604, 605]
+
+    validator = OJSValidator()
+    assert not validator.validate_robot_game_scores(OJS_FILE, df=df)
+    teams = df[COL_TEAM_NUMBER].tolist()
+    assert [str(error) for error in validator.errors] == [
+        f"[ERROR] {SHEET_ROBOT_GAME}: Robot Game 2 Score has 1 blank cell(s) at row 2 (Team {teams[0]})",
+        f"[ERROR] {SHEET_ROBOT_GAME}: Robot Game 2 Score has 6 score(s) outside valid range (0-545) at "
+        + ", ".join(f"row {row} (Team {team})" for row, team in zip(range(3, 8), teams[1:6]))
+        + ", and 1 more",
+    ]
+    assert [cell.row for cell in validator.errors[1].cells] == [3, 4, 5, 6, 7, 8]
@@ -0,0 +1,84 @@
+"""Tests for modules/style_broadcast.py.
+
+Run with: python -m pytest test_style_broadcast.py
+"""
+from copy import copy
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Protection, Side
+
+from modules.style_broadcast import (
+    broadcast_row_styles, broadcast_protection, broadcast_row_height,
+)
+
+
+@pytest.fixture
+def ws():
+    ws = Workbook().active
+    ws["A2"] = 1
+    ws["A2"].font = Font(bold=True, size=14)
+    ws["A2"].fill = PatternFill("solid", fgColor="FFFF00")
+    ws["A2"].number_format = "0.00"
+    ws["A2"].protection = Protection(locked=False)
+    ws["B2"].border = Border(left=Side(style="thin"))
+    ws["B2"].alignment = Alignment(horizontal="center")
+    ws["C2"].font = Font(italic=True)
+    ws["B5"].font = Font(color="FF0000")
+    ws.row_dimensions[2].height = 21
+    return ws
+
+
+def _styles(ws, rows, cols="ABC"):
+    return [
+        (repr(c.font), repr(c.fill), repr(c.border), repr(c.alignment), repr(c.protection), c.number_format)
+        for row in rows for c in (ws[f"{col}{row}"] for col in cols)
+    ]
+
+
+def test_whole_style_matches_attribute_copies(ws):
+    expected = Workbook().active
+    for coordinate in ("A2", "B2", "C2", "B5"):
+        source, target = ws[coordinate], expected[coordinate]
+        for attribute in ("font", "fill", "border", "alignment", "protection"):
+            setattr(target, attribute, copy(getattr(source, attribute)))
+        target.number_format = source.number_format
+    for col in "ABC":
+        for row in range(3, 7):
+            target = expected[f"{col}{row}"]
+            for attribute in ("font", "fill", "border", "alignment", "protection"):
+                setattr(target, attribute, copy(getattr(expected[f"{col}2"], attribute)))
+            target.number_format = expected[f"{col}2"].number_format
+
+    broadcast_row_styles(ws, 2, range(2, 7), 1, 3)
+    assert _styles(ws, range(2, 7)) == _styles(expected, range(2, 7))
+
+
+def test_cells_get_their_own_style(ws):
+    broadcast_row_styles(ws, 2, range(3, 5), 1, 1)
+    ws["A3"].font = Font(size=8)
+    assert ws["A2"].font.size == 14
+    assert ws["A4"].font.size == 14
+
+
+def test_selected_fields_only(ws):
+    broadcast_row_styles(ws, 2, range(5, 6), 1, 3, fields=("fontId",))
+    assert ws["A5"].font.b and ws["A5"].font.sz == 14
+    assert ws["A5"].fill.fgColor.rgb != "00FFFF00"
+    assert repr(ws["B5"].font) == repr(ws["B2"].font)
+    assert repr(ws["B5"].border) != repr(ws["B2"].border)
+    assert ws["C5"].font.i
+
+
+def test_protection(ws):
+    broadcast_protection(ws, range(3, 10), 4, 4, Protection(locked=False))
+    assert all(not ws.cell(row=r, column=4).protection.locked for r in range(3, 10))
+    assert ws["D2"].protection.locked
+    assert len(ws.parent._protections) == 2
+
+
+def test_row_height(ws):
+    assert broadcast_row_height(ws, 2, range(3, 6)) == 21
+    assert [ws.row_dimensions[r].height for r in range(2, 7)] == [21, 21, 21, 21, None]
+    assert broadcast_row_height(ws, 9, range(10, 12)) is None
+    assert ws.row_dimensions[10].height is None
@@ -0,0 +1,85 @@
+"""Tests for modules/table_cache.py.
+
+Run with: python -m pytest test_table_cache.py
+"""
+import os
+import shutil
+import warnings
+
+import pandas as pd
+import pytest
+
+import modules.table_cache as table_cache
+from modules.constants import SHEET_META, SHEET_TEAM_INFO, TABLE_META, TABLE_TEAM_LIST
+from modules.table_cache import read_tables_cached
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OJS_FILE = os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-norfolk.xlsm")
+TABLES = [(SHEET_TEAM_INFO, TABLE_TEAM_LIST), (SHEET_META, TABLE_META)]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "master.xlsm"
+    shutil.copy(OJS_FILE, path)
+    return str(path)
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    """Count how often the workbook is actually parsed."""
+    calls = []
+    real_read_tables = table_cache.read_tables
+
+    def counting_read_tables(*args, **kwargs):
+        calls.append(args[0])
+        return real_read_tables(*args, **kwargs)
+
+    monkeypatch.setattr(table_cache, "read_tables", counting_read_tables)
+    return calls
+
+
+def test_warm_read_uses_cache(workbook, tmp_path, count_reads):
+    cache_dir = str(tmp_path / "cache")
+    cold = read_tables_cached(workbook, TABLES, cache_dir)
+    warm = read_tables_cached(workbook, TABLES, cache_dir)
+
+    assert len(count_reads) == 1
+    assert list(warm) == list(cold)
+    for name in cold:
+        pd.testing.assert_frame_equal(warm[name], cold[name])
+
+
+def test_changed_workbook_invalidates_cache(workbook, tmp_path, count_reads):
+    cache_dir = str(tmp_path / "cache")
+    read_tables_cached(workbook, TABLES, cache_dir)
+
+    # Same contents, new mtime: fingerprint no longer matches
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    read_tables_cached(workbook, TABLES, cache_dir)
+    assert len(count_reads) == 2
+
+    read_tables_cached(workbook, TABLES, cache_dir)
+    assert len(count_reads) == 2
+
+
+def test_corrupt_cache_entry_is_replaced(workbook, tmp_path, count_reads):
+    cache_dir = str(tmp_path / "cache")
+    expected = read_tables_cached(workbook, TABLES, cache_dir)
+    for name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, name), "wb") as f:
+            f.write(b"not a pickle")
+
+    actual = read_tables_cached(workbook, TABLES, cache_dir)
+    assert len(count_reads) == 2
+    pd.testing.assert_frame_equal(actual[TABLE_META], expected[TABLE_META])
+
+
+def test_no_cache_dir_bypasses_cache(workbook, tmp_path, count_reads):
+    read_tables_cached(workbook, TABLES, None)
+    read_tables_cached(workbook, TABLES, None)
+    assert len(count_reads) == 2
+    assert not (tmp_path / "cache").exists()
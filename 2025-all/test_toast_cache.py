@@ -0,0 +1,123 @@
+"""Tests for modules/toast_cache.py.
+
+Run with: python -m pytest test_toast_cache.py
+"""
+import os
+import shutil
+import zipfile
+import warnings
+
+import pandas as pd
+import pytest
+
+from modules.ceremony_divisions import prepare_division
+from modules.constants import SHEET_ROBOT_GAME, TABLE_ROBOT_GAME
+from modules.excel_operations import PackageReader
+from modules.ojs_snapshot import OJS_TABLES
+from modules.toast_cache import StepCache, context_hash, toast_cache_path
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OJS_FILE = os.path.join(HERE, "2025-vadc-fll-challenge-Unearthed-ojs-Norfolk-div1.xlsm")
+
+
+@pytest.fixture
+def ojs(tmp_path):
+    path = str(tmp_path / os.path.basename(OJS_FILE))
+    shutil.copy(OJS_FILE, path)
+    return path
+
+
+@pytest.fixture
+def table_reads(monkeypatch):
+    reads = []
+    read_table_as_df = PackageReader.read_table_as_df
+
+    def counting(self, sheet_name, table_name, *args, **kwargs):
+        reads.append(table_name)
+        return read_table_as_df(self, sheet_name, table_name, *args, **kwargs)
+
+    monkeypatch.setattr(PackageReader, "read_table_as_df", counting)
+    return reads
+
+
+def _touch_part(path, part):
+    """Rewrite one package part with different bytes, copying the others as they are."""
+    original = f"{path}.orig"
+    os.replace(path, original)
+    with zipfile.ZipFile(original) as zin, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            data = zin.read(info)
+            zout.writestr(info, data + b"\n" if info.filename == part else data)
+    os.remove(original)
+
+
+def test_step_cache_round_trip(tmp_path):
+    source = str(tmp_path / "ojs.xlsm")
+    cache_file = toast_cache_path(source)
+    assert os.path.basename(cache_file) == ".ojs.xlsm.toast-cache"
+
+    cache = StepCache(cache_file, source)
+    assert cache.lookup("a", 1) is None
+    cache.store("a", 1, ("A",))
+    cache.store("b", 1, ("B",))
+    cache.save()
+
+    cache = StepCache(cache_file, source)
+    assert cache.lookup("a", 1) == ("A",)
+    assert cache.lookup("b", 2) is None
+    cache.save()  # "b" missed and was not stored again, so it is dropped
+
+    cache = StepCache(cache_file, source)
+    assert cache.lookup("a", 1) == ("A",) and cache.lookup("b", 1) is None
+    assert StepCache(cache_file, str(tmp_path / "other.xlsm")).lookup("a", 1) is None
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    source = str(tmp_path / "ojs.xlsm")
+    with open(toast_cache_path(source), "wb") as f:
+        f.write(b"not a cache")
+    assert StepCache(toast_cache_path(source), source).lookup("a", 1) is None
+
+
+def test_only_changed_sheets_are_read_again(ojs, table_reads):
+    first = prepare_division(ojs, "Division 1")
+    assert os.path.exists(toast_cache_path(ojs))
+    assert sorted(table_reads) == sorted(table for _, table in OJS_TABLES)
+
+    table_reads.clear()
+    second = prepare_division(ojs, "Division 1")
+    assert table_reads == []
+    assert [str(e) for e in second.errors] == [str(e) for e in first.errors]
+    assert [str(w) for w in second.warnings] == [str(w) for w in first.warnings]
+    assert second.award_index == first.award_index
+    assert [r.getMessage() for r in second.events] == [r.getMessage() for r in first.events]
+    for _, table_name in OJS_TABLES:
+        pd.testing.assert_frame_equal(second.snapshot.table(table_name), first.snapshot.table(table_name))
+
+    with PackageReader(ojs) as reader:
+        sheet_part = reader._sheets[SHEET_ROBOT_GAME].sheet_path
+    _touch_part(ojs, sheet_part)
+    table_reads.clear()
+    prepare_division(ojs, "Division 1")
+    assert table_reads == [TABLE_ROBOT_GAME]
+
+
+def test_cache_can_be_disabled(ojs, table_reads):
+    prepare_division(ojs, "Division 1", use_cache=False)
+    prepare_division(ojs, "Division 1", use_cache=False)
+    assert not os.path.exists(toast_cache_path(ojs))
+    assert len(table_reads) == 2 * len(OJS_TABLES)
+
+
+def test_context_hash(tmp_path):
+    template = tmp_path / "script.html.jinja"
+    template.write_text("{{ tournament_name }}")
+    data = {"tournament_name": "Norfolk", "awards_config": [{"ID": "CHAMP"}]}
+
+    digest = context_hash(data, str(template))
+    assert context_hash(dict(reversed(list(data.items()))), str(template)) == digest
+    assert context_hash({**data, "tournament_name": "Richmond"}, str(template)) != digest
+    template.write_text("{{ tournament_name }}!")
+    assert context_hash(data, str(template)) != digest
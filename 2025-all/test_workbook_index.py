@@ -0,0 +1,149 @@
+"""Tests for modules/workbook_index.py.
+
+Run with: python -m pytest test_workbook_index.py
+"""
+import os
+import warnings
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import PatternFill
+from openpyxl.workbook.defined_name import DefinedName
+
+from modules.constants import (
+    SHEET_AWARD_DROPDOWNS, SHEET_RESULTS, SHEET_TEAM_INFO,
+    TABLE_AWARD_DROPDOWNS, TABLE_TEAM_LIST, TABLE_TOURNAMENT_DATA,
+)
+from modules.excel_operations import add_table_dataframe
+from modules.workbook_index import WorkbookIndex, name_references, name_target, workbook_index
+from modules.worksheet_setup import fix_named_ranges, remove_external_links
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(HERE, "2025-Qualifier-Template.xlsm")
+
+
+@pytest.fixture
+def book():
+    return load_workbook(TEMPLATE_FILE, keep_vba=True)
+
+
+@pytest.mark.parametrize("value, target", [
+    ("'Results and Rankings'!$A$3:$A$10", "Results and Rankings"),
+    ("AwardList!$A$3", "AwardList"),
+    ("[1]Sheet1!$A$1", "[1]Sheet1"),
+    ("'[book.xlsx]It''s'!A1", "[book.xlsx]It's"),
+    ("TournamentData[#All]", "TournamentData"),
+    ("0.5", None),
+    ("#NAME?", None),
+    (None, None),
+])
+def test_name_target(value, target):
+    assert name_target(value) == target
+
+
+@pytest.mark.parametrize("value, references", [
+    ("=OFFSET(AwardList!$A$1,0,0,COUNTA('Team List'!A:A))", ["AwardList", "Team List"]),
+    ("AwardList!$A$1&AwardList!$B$1", ["AwardList"]),
+    ("[1]Sheet1!$A$1", ["Sheet1"]),
+    ("MyAwardList!$A$1", ["MyAwardList"]),
+    ("AwardListDropdowns[Award]", []),
+    (None, []),
+])
+def test_name_references(value, references):
+    assert name_references(value) == references
+
+
+def test_tables_indexed_once(book):
+    index = workbook_index(book)
+    assert workbook_index(book) is index
+    entry = index.table(TABLE_TOURNAMENT_DATA)
+    assert entry.ws is book[SHEET_RESULTS]
+    assert entry.table is book[SHEET_RESULTS].tables[TABLE_TOURNAMENT_DATA]
+    assert entry.boundaries == (1, 2, 23, 3)
+    assert index.table(TABLE_TOURNAMENT_DATA, SHEET_TEAM_INFO) is None
+    assert index.table("NoSuchTable") is None
+
+
+def test_set_ref_updates_table_and_boundaries(book):
+    index = workbook_index(book)
+    index.set_ref(TABLE_TOURNAMENT_DATA, "A2:W42")
+    assert book[SHEET_RESULTS].tables[TABLE_TOURNAMENT_DATA].ref == "A2:W42"
+    assert index.table(TABLE_TOURNAMENT_DATA).boundaries == (1, 2, 23, 42)
+
+
+def test_add_table_dataframe_keeps_index_current(book):
+    index = workbook_index(book)
+    teams = pd.DataFrame({"Team #": [1, 2, 3], "Team Name": ["A", "B", "C"], "Coach Name": ["x", "y", "z"]})
+    add_table_dataframe(book, SHEET_TEAM_INFO, TABLE_TEAM_LIST, teams)
+    assert index.table(TABLE_TEAM_LIST).boundaries == (1, 2, 4, 5)
+
+
+def test_names_by_target(book):
+    index = WorkbookIndex(book)
+    assert index.names_targeting(TABLE_TOURNAMENT_DATA) == ["AllData"]
+    assert sorted(index.bracketed_names()) == ["AllData", "Awards"]
+
+    index.set_name(DefinedName("Old", attr_text="AwardList!$A$1"))
+    index.retarget_name("Old", "AwardListDropdowns!$A$1")
+    assert index.names_targeting("AwardList") == []
+    # Awards refers to the AwardListDropdowns table, which shares the sheet's name
+    assert sorted(index.names_targeting(SHEET_AWARD_DROPDOWNS)) == ["Awards", "Old"]
+
+    index.remove_name("Old")
+    assert "Old" not in book.defined_names
+    assert index.names_targeting(SHEET_AWARD_DROPDOWNS) == ["Awards"]
+
+
+def test_named_range_steps_use_index(book):
+    book.defined_names["Legacy"] = DefinedName("Legacy", attr_text="AwardList!$B$2")
+    remove_external_links(book)
+    assert "AllData" not in book.defined_names and "Awards" not in book.defined_names
+
+    fix_named_ranges(book)
+    index = workbook_index(book)
+    _, min_row, _, max_row = index.table(TABLE_AWARD_DROPDOWNS).boundaries
+    assert book.defined_names["Awards"].value == f"'{SHEET_AWARD_DROPDOWNS}'!$A${min_row + 1}:$A${max_row}"
+    assert book.defined_names["Legacy"].value == "AwardListDropdowns!$B$2"
+    assert sorted(index.names_targeting(SHEET_AWARD_DROPDOWNS)) == ["Awards", "Legacy"]
+
+
+def test_names_referencing_award_list_anywhere_in_the_value(book):
+    # Baseline matched any value containing "AwardList!"; the index matches
+    # references to the AwardList sheet, wherever they are in the value
+    book.defined_names["Count"] = DefinedName("Count", attr_text="COUNTA(AwardList!$A:$A)")
+    book.defined_names["Mine"] = DefinedName("Mine", attr_text="MyAwardList!$A$1")
+    index = workbook_index(book)
+    assert index.names_referencing("AwardList") == ["Count"]
+
+    fix_named_ranges(book)
+    assert book.defined_names["Count"].value == "COUNTA(AwardListDropdowns!$A:$A)"
+    assert book.defined_names["Mine"].value == "MyAwardList!$A$1"
+    assert index.names_referencing("AwardList") == []
+    assert index.names_referencing(SHEET_AWARD_DROPDOWNS)[-1] == "Count"
+
+
+def test_bracketed_names_kept_current(book):
+    index = WorkbookIndex(book)
+    index.set_name(DefinedName("Linked", attr_text="[1]Sheet1!$A$1"))
+    assert index.bracketed_names()[-1] == "Linked"
+    index.retarget_name("Linked", "Sheet1!$A$1")
+    index.remove_name("AllData")
+    assert sorted(index.bracketed_names()) == ["Awards"]
+
+
+def test_remove_external_links_fixes_indexed_cf_formulas(book):
+    ws = book[SHEET_RESULTS]
+    ws.conditional_formatting.add(
+        "A3:A5", FormulaRule(formula=["COUNTIF(AwardList!$A:$A,$A3)>0"], fill=PatternFill(bgColor="FFFF00"))
+    )
+    index = workbook_index(book)
+    assert len(index.cf_formulas_referencing("AwardList")) == 1
+
+    remove_external_links(book)
+    formulas = [f for rules in ws.conditional_formatting._cf_rules.values() for rule in rules for f in rule.formula]
+    assert "COUNTIF(AwardListDropdowns!$A:$A,$A3)>0" in formulas
+    assert not any("AwardList!" in f for f in formulas)
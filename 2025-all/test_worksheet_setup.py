@@ -0,0 +1,129 @@
+"""Tests for table resizing helpers in modules/worksheet_setup.py.
+
+Run with: python -m pytest test_worksheet_setup.py
+"""
+import io
+import itertools
+import os
+import warnings
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from modules.constants import (
+    COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME, COL_SHORT_NAME, COL_OJS_FILENAME,
+)
+from modules.prepared_template import PreparedTemplate
+from modules.worksheet_setup import (
+    RESIZED_TABLES, clip_rows, truncate_rows, set_up_tapi_worksheet, resize_worksheets,
+    formula_column, SharedFormula,
+)
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(HERE, "2025-Qualifier-Template.xlsm")
+
+
+@pytest.mark.parametrize("ranges, expected", [
+    ("A1:C4", "A1:C4"),
+    ("A3:C8", "A3:C4"),
+    ("A8:C9", ""),
+    ("A3:C8 E1:E2", "A3:C4 E1:E2"),
+    ("A6:A12", "A11:A12"),
+    ("B2:B15", "B2:B4 B11:B15"),
+])
+def test_clip_rows(ranges, expected):
+    assert str(clip_rows(ranges, 5, 10)) == expected
+
+
+def test_truncate_rows_leaves_rows_below_in_place():
+    ws = Workbook().active
+    for row in range(1, 13):
+        ws.cell(row=row, column=1, value=row)
+        ws.row_dimensions[row].height = 20
+    ws.merge_cells("B6:C7")
+    ws.merge_cells("B12:C12")
+    ws.conditional_formatting.add("A2:A12", CellIsRule(operator="equal", formula=["1"]))
+    ws.conditional_formatting.add("B5:B8", CellIsRule(operator="equal", formula=["2"]))
+    dv = DataValidation(type="list", formula1='"a,b"', sqref="A3:A8")
+    ws.add_data_validation(dv)
+    ws.add_data_validation(DataValidation(type="list", formula1='"c"', sqref="D6"))
+
+    truncate_rows(ws, 5, 10)
+
+    assert [ws.cell(row=row, column=1).value for row in range(1, 13)] == (
+        [1, 2, 3, 4] + [None] * 6 + [11, 12]
+    )
+    assert 7 not in ws.row_dimensions and ws.row_dimensions[11].height == 20
+    assert [str(r) for r in ws.merged_cells.ranges] == ["B12:C12"]
+    assert [str(cf.sqref) for cf in ws.conditional_formatting] == ["A2:A4 A11:A12"]
+    assert [str(dv.sqref) for dv in ws.data_validations.dataValidation] == ["A3:A4"]
+
+
+def _resized_book(num_teams, shared_formulas=False):
+    book = PreparedTemplate(TEMPLATE_FILE, pd.DataFrame({"ColumnName": []})).clone()
+    tournament = pd.Series({COL_SHORT_NAME: "Norfolk", COL_OJS_FILENAME: "norfolk.xlsm"})
+    assignees = pd.DataFrame({
+        COL_TEAM_NUMBER: range(1001, 1001 + num_teams),
+        COL_TEAM_NAME: [f"Team {i}" for i in range(num_teams)],
+        COL_COACH_NAME: [f"Coach {i}" for i in range(num_teams)],
+    })
+    assert set_up_tapi_worksheet(tournament, book, assignees, False)
+    resize_worksheets(tournament, book, assignees, shared_formulas=shared_formulas)
+    return book
+
+
+def test_resize_past_template_capacity():
+    """More teams than the template tables hold: nothing is truncated or lost."""
+    num_teams = 250
+    book = _resized_book(num_teams)
+
+    for sheet, table, start_row in RESIZED_TABLES:
+        ws = book[sheet]
+        assert ws.tables[table].ref.endswith(str(start_row - 1 + num_teams))
+        assert ws.cell(row=start_row - 1 + num_teams, column=1).value == 1000 + num_teams
+
+
+def test_formula_column_shares_row_invariant_formulas():
+    formula = "=SUM(T[[#This Row],[A]:[B]])"
+    assert formula_column(formula, 3, 2, 4) == [formula] * 3
+
+    values = formula_column(formula, 3, 2, 4, itertools.count(5))
+    assert [dict(value) for value in values] == [
+        {"t": "shared", "ref": "C2:C4", "si": "5"}, {"t": "shared", "si": "5"}, {"t": "shared", "si": "5"},
+    ]
+    assert values[0].text == formula and all(isinstance(v, SharedFormula) for v in values)
+
+
+def test_formula_column_keeps_shifting_formulas_whole():
+    """Sharing =SUM(N2:Q2) would make Excel shift it to N3:Q3 on the next row."""
+    ids = itertools.count()
+    assert formula_column("=SUM(N2:Q2)", 18, 2, 4, ids) == ["=SUM(N2:Q2)"] * 3
+    assert formula_column("='Sheet'!#REF!", 18, 2, 4, ids) == ["='Sheet'!#REF!"] * 3
+    assert next(ids) == 0
+
+
+def test_shared_formulas_load_like_copies():
+    """Excel (and openpyxl) expand the shared formulas back into the per-row copies."""
+    def saved(book):
+        buffer = io.BytesIO()
+        book.save(buffer)
+        return buffer
+
+    copies = load_workbook(saved(_resized_book(12)))
+    shared_file = saved(_resized_book(12, shared_formulas=True))
+    shared = load_workbook(shared_file)
+    for sheet, _, _ in RESIZED_TABLES:
+        assert [[c.value for c in row] for row in shared[sheet].iter_rows()] == (
+            [[c.value for c in row] for row in copies[sheet].iter_rows()]
+        )
+    with ZipFile(shared_file) as archive:
+        assert any(
+            b't="shared"' in archive.read(name)
+            for name in archive.namelist() if name.startswith("xl/worksheets/sheet")
+        )
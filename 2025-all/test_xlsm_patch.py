@@ -0,0 +1,180 @@
+"""Tests for modules/xlsm_patch.py.
+
+The openpyxl writer is the oracle: both writers build the same tournament and
+the two files, loaded with openpyxl, must match.
+
+Run with: python -m pytest test_xlsm_patch.py
+"""
+import io
+import os
+import warnings
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from modules import worksheet_setup, xlsm_patch
+from modules.constants import (
+    COL_TEAM_NUMBER, COL_TEAM_NAME, COL_COACH_NAME, COL_SHORT_NAME, COL_LONG_NAME, COL_OJS_FILENAME,
+    OJS_WRITER_OPENPYXL, OJS_WRITER_PATCH, SHEET_RESULTS, SHEET_TEAM_INFO,
+)
+from modules.prepared_template import PreparedTemplate
+
+warnings.simplefilter(action="ignore", category=UserWarning)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(HERE, "2025-Qualifier-Template.xlsm")
+
+# Structured names openpyxl deletes (and fix_named_ranges rebuilds as Awards)
+STRUCTURED_NAMES = {"AllData", "Awards"}
+
+
+@pytest.fixture(scope="module")
+def award_def():
+    return pd.DataFrame({
+        "ColumnName": ["J_Champ", "J_RD", "P_AWD_RG"],
+        "Label1": ["Champion's", "Robot Design", "1st Place"],
+        "Label2": [0, 0, "2nd Place"],
+        "LabelFull": ["Champion's Award", "Robot Design Award", "Robot Game Award"],
+        "DivAward": [1, 1, 0],
+    })
+
+
+@pytest.fixture(scope="module")
+def templates(award_def):
+    return {
+        writer: PreparedTemplate(TEMPLATE_FILE, award_def, writer)
+        for writer in (OJS_WRITER_OPENPYXL, OJS_WRITER_PATCH)
+    }
+
+
+def _build(template, award_def, num_teams) -> bytes:
+    """Run fll-maestro's per-tournament steps and return the saved file."""
+    setup = xlsm_patch if template.writer == OJS_WRITER_PATCH else worksheet_setup
+    tournament = pd.Series({
+        COL_SHORT_NAME: "Norfolk", COL_LONG_NAME: "Norfolk & Chesapeake <Qualifier>",
+        COL_OJS_FILENAME: "norfolk.xlsm", "J_Champ": 1, "J_RD": 1, "P_AWD_RG": 2, "ADV": 2,
+    })
+    assignees = pd.DataFrame({
+        COL_TEAM_NUMBER: range(1001, 1001 + num_teams),
+        COL_TEAM_NAME: [f"Team {i} & Friends" for i in range(num_teams)],
+        COL_COACH_NAME: [f"Coach {i}" for i in range(num_teams)],
+    })
+    config = {"season_yr": 2025, "season_name": "UNEARTHED"}
+
+    book = template.clone()
+    assert setup.set_up_tapi_worksheet(tournament, book, assignees, False)
+    setup.set_up_award_worksheet(tournament, book, award_def, False)
+    setup.set_up_meta_worksheet(tournament, book, config, "tournaments", False)
+    setup.copy_award_def(tournament, book, template.award_def)
+    setup.resize_worksheets(tournament, book, assignees)
+    setup.add_essential_conditional_formats(book, num_teams)
+    setup.fix_named_ranges(book)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    book.close()
+    return buffer.getvalue()
+
+
+def _cell_style(cell) -> tuple:
+    return (
+        repr(cell.font), repr(cell.fill), repr(cell.border), repr(cell.alignment),
+        repr(cell.protection), cell.number_format,
+    )
+
+
+def _describe(data: bytes) -> dict:
+    """Everything a user sees in a workbook, keyed for comparison."""
+    book = load_workbook(io.BytesIO(data), keep_vba=True)
+    described = {
+        "sheets": book.sheetnames,
+        "names": {
+            name: defined.attr_text for name, defined in book.defined_names.items()
+            if name not in STRUCTURED_NAMES
+        },
+    }
+    for ws in book.worksheets:
+        described[ws.title] = {
+            "state": ws.sheet_state,
+            "protection": repr(ws.protection),
+            "tables": {table.name: table.ref for table in ws.tables.values()},
+            "cf": [
+                (str(cf.sqref), rule.type, rule.priority, rule.formula, repr(rule.dxf))
+                for cf in ws.conditional_formatting for rule in cf.rules
+            ],
+            "dv": [
+                (str(dv.sqref), dv.type, dv.formula1, dv.allow_blank)
+                for dv in ws.data_validations.dataValidation
+            ],
+            "cells": {
+                cell.coordinate: (cell.value, _cell_style(cell))
+                for row in ws.iter_rows() for cell in row
+                if cell.value is not None or cell.has_style
+            },
+            "heights": {r: d.height for r, d in ws.row_dimensions.items() if d.height},
+        }
+    book.close()
+    return described
+
+
+@pytest.mark.parametrize("num_teams", [3, 40])
+def test_patch_matches_openpyxl(templates, award_def, num_teams):
+    expected = _describe(_build(templates[OJS_WRITER_OPENPYXL], award_def, num_teams))
+    actual = _describe(_build(templates[OJS_WRITER_PATCH], award_def, num_teams))
+    for key in expected:
+        assert actual[key] == expected[key], key
+
+
+def test_structured_names_are_kept(templates, award_def):
+    book = load_workbook(io.BytesIO(_build(templates[OJS_WRITER_PATCH], award_def, 3)), keep_vba=True)
+    assert book.defined_names["Awards"].attr_text == "AwardListDropdowns[Award]"
+    assert book.defined_names["AllData"].attr_text == "TournamentData[#All]"
+    book.close()
+
+
+def test_untouched_parts_are_copied(templates, award_def):
+    patched = ZipFile(io.BytesIO(_build(templates[OJS_WRITER_PATCH], award_def, 40)))
+    with ZipFile(TEMPLATE_FILE) as template:
+        names = template.namelist()
+        assert patched.namelist() == [name for name in names if name != "xl/calcChain.xml"]
+        for name in ("xl/vbaProject.bin", "xl/sharedStrings.xml", "customUI/customUI.xml",
+                     "xl/printerSettings/printerSettings1.bin", "docProps/app.xml"):
+            if name in names:
+                assert patched.read(name) == template.read(name), name
+                assert patched.getinfo(name).compress_type == template.getinfo(name).compress_type
+    workbook = patched.read("xl/workbook.xml").decode("utf-8")
+    assert 'fullCalcOnLoad="1"' in workbook
+    assert "calcChain" not in patched.read("[Content_Types].xml").decode("utf-8")
+
+
+def test_clones_are_independent(templates):
+    template = templates[OJS_WRITER_PATCH]
+    first = template.clone()
+    xlsm_patch.append_table_rows(
+        first, SHEET_TEAM_INFO, "OfficialTeamList",
+        pd.DataFrame({"Team #": [1], "Team Name": ["A"], "Coach Name": ["B"], "Pod Number": [0]}),
+    )
+    assert first.table_ref("OfficialTeamList") == "A2:D3"
+    first.set_table_ref("OfficialTeamList", "A2:D9")
+    second = template.clone()
+    assert second.table_ref("OfficialTeamList") == "A2:D3"
+    assert second.sheet(SHEET_TEAM_INFO).value(3, 1) is None
+
+
+def test_sheet_cell_round_trip(templates):
+    book = templates[OJS_WRITER_PATCH].clone()
+    sheet = book.sheet(SHEET_RESULTS)
+    sheet.set_value(10, 2, "Robots <&> \"Rule\"")
+    sheet.set_value(11, 2, 2.5)
+    sheet.set_value(12, 2, "=SUM(A1:A2)")
+    sheet.set_value(13, 2, True)
+    sheet.truncate_rows(11, 11)
+    assert sheet.value(10, 2) == "Robots <&> \"Rule\""
+    assert sheet.value(11, 2) is None
+
+    reopened = load_workbook(io.BytesIO(book.to_bytes()), keep_vba=True)[SHEET_RESULTS]
+    assert reopened["B10"].value == "Robots <&> \"Rule\""
+    assert reopened["B11"].value is None
+    assert reopened["B12"].value == "=SUM(A1:A2)"
+    assert reopened["B13"].value is True